@@ -15,13 +15,13 @@ jest.mock('@clerk/nextjs/server', () => ({
   getAuth: jest.fn(),
 }));
 
-jest.mock('@vercel/postgres', () => ({
+jest.mock('@/lib/dbPool/dbPool', () => ({
   sql: jest.fn(),
 }));
 
 describe('Favorite Team API Routes', () => {
   const { getAuth } = require('@clerk/nextjs/server');
-  const { sql } = require('@vercel/postgres');
+  const { sql } = require('@/lib/dbPool/dbPool');
   const { NextResponse } = require('next/server');
   
   const mockUserId = 'test_123';
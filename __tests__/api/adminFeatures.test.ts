@@ -10,7 +10,7 @@ import sgMail from "@sendgrid/mail";
 jest.mock("@clerk/nextjs/server", () => ({
   auth: jest.fn(),
 }));
-jest.mock("@vercel/postgres", () => ({
+jest.mock("@/lib/dbPool/dbPool", () => ({
   sql: jest.fn(),
 }));
 jest.mock("@sendgrid/mail", () => ({
@@ -1,6 +1,7 @@
 import { GET } from '../../src/app/api/all-espn-games/route';
 import { NextResponse } from 'next/server';
 import { BASE_URLS } from '../../src/app/api/all-espn-games/baseUrls';
+import { clearEspnCache } from '@/lib/espnCache/espnCache';
 
 // Mock fetch globally
 global.fetch = jest.fn();
@@ -9,6 +10,7 @@ describe('all-espn-games API', () => {
   beforeEach(() => {
     // Clear all mocks before each test
     jest.clearAllMocks();
+    clearEspnCache();
   });
 
   it('should return 400 for invalid sport', async () => {
@@ -0,0 +1,91 @@
+import { GET } from '../../src/app/api/all-espn-games/leagues/route';
+import { clearEspnCache } from '@/lib/espnCache/espnCache';
+
+// One game per league, starting at a different hour so the combined order is checkable
+const scoreboard = (league: string, hour: number) => ({
+  events: [{
+    id: `${league}-1`,
+    date: `2025-04-12T${String(hour).padStart(2, '0')}:00:00Z`,
+    competitions: [{
+      status: { type: { name: 'STATUS_SCHEDULED' } },
+      competitors: [
+        { homeAway: 'home', team: { name: `${league} Home` }, score: '0' },
+        { homeAway: 'away', team: { name: `${league} Away` }, score: '0' },
+      ],
+    }],
+  }],
+});
+
+const SCOREBOARDS: Record<string, { events: unknown[] }> = {
+  'usa.1': scoreboard('usa.1', 23),
+  'eng.1': scoreboard('eng.1', 14),
+  'esp.1': scoreboard('esp.1', 19),
+};
+
+describe('GET /api/all-espn-games/leagues', () => {
+  let mockFetch: jest.SpyInstance;
+
+  beforeEach(() => {
+    clearEspnCache();
+    mockFetch = jest.spyOn(global, 'fetch').mockImplementation(async (input) => {
+      const url = String(input);
+      const league = Object.keys(SCOREBOARDS).find((key) => url.includes(`/soccer/${key}/scoreboard`));
+      if (!league) return { ok: false, status: 404 } as Response;
+      return { ok: true, status: 200, json: () => Promise.resolve(SCOREBOARDS[league]) } as Response;
+    });
+  });
+
+  afterEach(() => {
+    mockFetch.mockRestore();
+  });
+
+  const scoreboardCalls = () => mockFetch.mock.calls.filter(([url]) => String(url).includes('/scoreboard'));
+
+  it('returns every requested league in one response, in start time order', async () => {
+    const response = await GET(new Request('http://localhost:3000/api/all-espn-games/leagues?sports=MLS,EPL,LALIGA&day=today'));
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.games.map((g: { id: string }) => g.id)).toEqual(['eng.1-1', 'esp.1-1', 'usa.1-1']);
+    expect(data.leagues).toEqual({
+      MLS: { count: 1, message: 'Games retrieved successfully for today' },
+      EPL: { count: 1, message: 'Games retrieved successfully for today' },
+      LALIGA: { count: 1, message: 'Games retrieved successfully for today' },
+    });
+    expect(scoreboardCalls()).toHaveLength(3);
+  });
+
+  it('loads duplicate leagues once and serves repeat requests from the cache', async () => {
+    await GET(new Request('http://localhost:3000/api/all-espn-games/leagues?sports=mls,MLS,epl'));
+    await GET(new Request('http://localhost:3000/api/all-espn-games/leagues?sports=MLS,EPL'));
+
+    expect(scoreboardCalls()).toHaveLength(2);
+  });
+
+  it('keeps the leagues that loaded when another one fails', async () => {
+    const response = await GET(new Request('http://localhost:3000/api/all-espn-games/leagues?sports=MLS,SERIE_A'));
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.games).toHaveLength(1);
+    expect(data.leagues.SERIE_A).toEqual({ count: 0, message: 'No games found for today' });
+  });
+
+  it('rejects unknown leagues and bad dates', async () => {
+    const badSport = await GET(new Request('http://localhost:3000/api/all-espn-games/leagues?sports=MLS,XFL'));
+    const noSports = await GET(new Request('http://localhost:3000/api/all-espn-games/leagues'));
+    const badDate = await GET(new Request('http://localhost:3000/api/all-espn-games/leagues?sports=MLS&specificDate=04-12-2025'));
+
+    expect([badSport.status, noSports.status, badDate.status]).toEqual([400, 400, 400]);
+    expect(mockFetch).not.toHaveBeenCalled();
+  });
+
+  it('streams one NDJSON line per league with stream=1', async () => {
+    const response = await GET(new Request('http://localhost:3000/api/all-espn-games/leagues?sports=MLS,EPL,LALIGA&stream=1'));
+    const lines = (await response.text()).trim().split('\n').map((line) => JSON.parse(line));
+
+    expect(response.headers.get('Content-Type')).toContain('application/x-ndjson');
+    expect(lines.map((line) => line.sport).sort()).toEqual(['EPL', 'LALIGA', 'MLS']);
+    expect(lines.every((line) => line.games.length === 1)).toBe(true);
+  });
+});
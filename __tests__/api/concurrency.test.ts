@@ -0,0 +1,34 @@
+import { forEachWithConcurrency } from '@/lib/concurrency/concurrency';
+
+describe('forEachWithConcurrency', () => {
+  it('runs every item with at most `limit` in flight', async () => {
+    let running = 0;
+    let peak = 0;
+    const done: number[] = [];
+
+    await forEachWithConcurrency([1, 2, 3, 4, 5, 6, 7], 3, async (item) => {
+      running++;
+      peak = Math.max(peak, running);
+      await new Promise((resolve) => setTimeout(resolve, 10 - item));
+      done.push(item);
+      running--;
+    });
+
+    expect(done.sort()).toEqual([1, 2, 3, 4, 5, 6, 7]);
+    expect(peak).toBe(3);
+  });
+
+  it('does nothing for no items', async () => {
+    const task = jest.fn();
+
+    await forEachWithConcurrency([], 4, task);
+
+    expect(task).not.toHaveBeenCalled();
+  });
+
+  it('rejects with the first failing task', async () => {
+    await expect(forEachWithConcurrency([1, 2], 2, async (item) => {
+      if (item === 2) throw new Error('boom');
+    })).rejects.toThrow('boom');
+  });
+});
@@ -0,0 +1,105 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { Pool } from 'pg';
+import { db, dbPoolStats, dbSslConfig, resetDbPoolStats, sql } from '@/lib/dbPool/dbPool';
+
+const mockPool: any = { connect: jest.fn(), on: jest.fn(), totalCount: 0, idleCount: 0, waitingCount: 0 };
+
+jest.mock('pg', () => ({ Pool: jest.fn(() => mockPool) }));
+
+describe('shared database pool', () => {
+  let mockQuery: jest.Mock;
+  let mockRelease: jest.Mock;
+
+  beforeEach(() => {
+    resetDbPoolStats();
+    mockQuery = jest.fn().mockResolvedValue({ rows: [{ id: 1 }], rowCount: 1 });
+    mockRelease = jest.fn();
+    // A fresh client per test, so each one is instrumented again
+    mockPool.connect.mockResolvedValue({ query: mockQuery, release: mockRelease });
+    Object.assign(mockPool, { totalCount: 0, idleCount: 0, waitingCount: 0 });
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('creates one pool with the configured limits', async () => {
+    await sql`SELECT 1`;
+    await db.query('SELECT 2');
+
+    expect(Pool).toHaveBeenCalledTimes(1);
+    expect((Pool as unknown as jest.Mock).mock.calls[0][0]).toMatchObject({
+      max: 10,
+      idleTimeoutMillis: 10000,
+      statement_timeout: 15000,
+    });
+  });
+
+  it.each([
+    ['postgresql://localhost/tallysight?sslmode=disable', 'no-verify', undefined],
+    ['postgresql://db.example.com/tallysight', undefined, { rejectUnauthorized: true }],
+    ['postgresql://db.example.com/tallysight', 'no-verify', { rejectUnauthorized: false }],
+    ['postgresql://localhost/tallysight', 'disable', false],
+  ])('takes TLS for %s with DB_SSL=%s from the sslmode or the flag', (url, flag, expected) => {
+    expect(dbSslConfig(url, flag)).toEqual(expected);
+  });
+
+  it('turns sql template values into parameters and releases the client', async () => {
+    const { rows } = await sql`SELECT * FROM "Pick" WHERE "userId" = ${'user_1'} AND "gameId" = ANY(${['a', 'b']})`;
+
+    expect(rows).toEqual([{ id: 1 }]);
+    expect(mockQuery).toHaveBeenCalledWith('SELECT * FROM "Pick" WHERE "userId" = $1 AND "gameId" = ANY($2)', [
+      'user_1',
+      ['a', 'b'],
+    ]);
+    expect(mockRelease).toHaveBeenCalledTimes(1);
+  });
+
+  it('releases the client when a query fails', async () => {
+    mockQuery.mockRejectedValue(new Error('boom'));
+
+    await expect(sql`SELECT 1`).rejects.toThrow('boom');
+    expect(mockRelease).toHaveBeenCalledTimes(1);
+    expect(dbPoolStats().queries).toMatchObject({ count: 1, errors: 1 });
+  });
+
+  it('counts acquires and reports pool occupancy', async () => {
+    const client = await db.connect();
+    await client.query('BEGIN');
+    await client.query('COMMIT');
+    client.release();
+    Object.assign(mockPool, { totalCount: 4, idleCount: 1, waitingCount: 2 });
+
+    expect(dbPoolStats()).toMatchObject({
+      total: 4,
+      active: 3,
+      idle: 1,
+      waiting: 2,
+      acquire: { count: 1, errors: 0 },
+      queries: { count: 2, slow: 0 },
+    });
+  });
+
+  it('counts failed acquires', async () => {
+    mockPool.connect.mockRejectedValue(new Error('timeout exceeded when trying to connect'));
+
+    await expect(db.connect()).rejects.toThrow('timeout');
+    expect(dbPoolStats().acquire).toMatchObject({ count: 1, errors: 1 });
+  });
+
+  it('logs slow queries', async () => {
+    jest.useFakeTimers({ now: new Date('2025-03-10T18:00:00Z') });
+    const warn = jest.spyOn(console, 'warn').mockImplementation(() => {});
+    mockQuery.mockImplementation(async () => {
+      jest.setSystemTime(Date.now() + 800);
+      return { rows: [] };
+    });
+
+    await sql`SELECT   pg_sleep(0.8)`;
+
+    expect(dbPoolStats().queries.slow).toBe(1);
+    expect(dbPoolStats().slowQueries).toEqual([{ text: 'SELECT pg_sleep(0.8)', ms: 800, at: '2025-03-10T18:00:00.800Z' }]);
+    expect(warn).toHaveBeenCalledWith('Slow query (800 ms): SELECT pg_sleep(0.8)');
+    warn.mockRestore();
+  });
+});
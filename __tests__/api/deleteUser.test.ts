@@ -1,6 +1,6 @@
 import { DELETE } from "../../src/app/admin/delete-user/route";
 import { NextRequest } from "next/server";
-import { sql } from "@vercel/postgres";
+import { sql } from "@/lib/dbPool/dbPool";
 import { auth as mockAuth } from "@clerk/nextjs/server";
 
 // Mocks
@@ -8,7 +8,7 @@ jest.mock("@clerk/nextjs/server", () => ({
   auth: jest.fn(),
 }));
 
-jest.mock("@vercel/postgres", () => ({
+jest.mock("@/lib/dbPool/dbPool", () => ({
   sql: jest.fn(),
 }));
 
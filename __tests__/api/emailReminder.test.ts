@@ -1,7 +1,7 @@
 import { GET } from '../../src/app/api/send-pick-reminders/route';
+import { ReminderDispatcher } from '../../src/lib/pickReminders/pickReminders';
 import { NextRequest } from 'next/server';
 import sgMail from '@sendgrid/mail';
-import { Pool } from 'pg';
 
 // Mock modules
 jest.mock('@sendgrid/mail', () => ({
@@ -9,19 +9,35 @@ jest.mock('@sendgrid/mail', () => ({
   send: jest.fn(),
 }));
 
+jest.mock('@sendgrid/client', () => ({
+  setDefaultRequest: jest.fn(),
+}));
+
 // Create a mock query function that we can control
 const mockQuery = jest.fn();
 const mockRelease = jest.fn();
 
-jest.mock('pg', () => {
-  return {
-    Pool: jest.fn(() => ({
-      connect: () => Promise.resolve({
-        query: mockQuery,
-        release: mockRelease,
-      }),
-    })),
-  };
+jest.mock('@/lib/dbPool/dbPool', () => ({
+  db: {
+    connect: () => Promise.resolve({
+      query: mockQuery,
+      release: mockRelease,
+    }),
+  },
+}));
+
+const clerkUser = (i: number) => ({
+  id: `user${i}`,
+  email_addresses: [{ email_address: `test${i}@example.com` }],
+  first_name: 'Test',
+});
+
+// A game 90 minutes from now, inside the 1-2 hour reminder window
+const upcomingGame = (id = 'game1') => ({
+  id,
+  team1Name: 'Team A',
+  team2Name: 'Team B',
+  gameTime: new Date(Date.now() + 90 * 60 * 1000).toLocaleTimeString('en-US', { hour12: false }),
 });
 
 describe('Email Reminder System', () => {
@@ -30,18 +46,14 @@ describe('Email Reminder System', () => {
   beforeEach(() => {
     // Reset all mocks
     jest.clearAllMocks();
+    mockQuery.mockReset();
+    (sgMail.send as jest.Mock).mockReset();
 
-    // Mock Clerk API
+    // Mock Clerk API: one page with a single user
     mockFetch = jest.spyOn(global, 'fetch').mockImplementation(() =>
       Promise.resolve({
         ok: true,
-        json: () => Promise.resolve([
-          {
-            id: 'user1',
-            email_addresses: [{ email_address: 'test@example.com' }],
-            first_name: 'Test',
-          },
-        ]),
+        json: () => Promise.resolve([clerkUser(1)]),
       } as Response)
     );
 
@@ -69,25 +81,26 @@ describe('Email Reminder System', () => {
     expect(sgMail.send).not.toHaveBeenCalled();
   });
 
-  it('should send reminder emails for upcoming games', async () => {
-    const now = new Date();
-    const gameTime = new Date(now.getTime() + 90 * 60 * 1000)
-      .toLocaleTimeString('en-US', { hour12: false });
+  it('should not page through users when no game starts soon', async () => {
+    mockQuery.mockResolvedValueOnce({
+      rows: [{ ...upcomingGame(), gameTime: new Date(Date.now() + 5 * 60 * 60 * 1000).toLocaleTimeString('en-US', { hour12: false }) }],
+    });
 
-    // Mock: Games found
+    const req = new NextRequest('http://localhost:3000/api/send-pick-reminders');
+    const response = await GET(req);
+    const data = await response.json();
+
+    expect(data.message).toContain('0 reminder email');
+    expect(mockFetch).not.toHaveBeenCalled();
+  });
+
+  it('should send reminder emails for upcoming games', async () => {
     mockQuery
       // First query: Get games
+      .mockResolvedValueOnce({ rows: [upcomingGame()] })
+      // Second query: opt-outs and picks for the page
       .mockResolvedValueOnce({
-        rows: [{
-          id: 'game1',
-          team1Name: 'Team A',
-          team2Name: 'Team B',
-          gameTime,
-        }],
-      })
-      // Second query: Get picks
-      .mockResolvedValueOnce({
-        rows: [], // No picks made yet
+        rows: [{ userId: 'user1', emailNotifications: null, pickedGameIds: [] }],
       });
 
     // Mock SendGrid success
@@ -97,25 +110,55 @@ describe('Email Reminder System', () => {
     const response = await GET(req);
     const data = await response.json();
 
-    expect(data.message).toContain('reminder email');
+    expect(data.message).toContain('1 reminder email');
     expect(sgMail.send).toHaveBeenCalledWith(
       expect.objectContaining({
-        to: 'test@example.com',
         templateId: 'test-template',
+        personalizations: [expect.objectContaining({ to: 'test1@example.com' })],
       })
     );
   });
 
+  it('should page through every user with one query per page', async () => {
+    const pages = [
+      Array.from({ length: 500 }, (_, i) => clerkUser(i + 1)),
+      Array.from({ length: 500 }, (_, i) => clerkUser(i + 501)),
+      [clerkUser(1001)],
+    ];
+    mockFetch.mockImplementation((url: string) => {
+      const offset = Number(new URL(url).searchParams.get('offset'));
+      return Promise.resolve({ ok: true, json: () => Promise.resolve(pages[offset / 500]) } as Response);
+    });
+
+    mockQuery.mockImplementation(async (sql: string, params?: string[][]) => {
+      if (!params) return { rows: [upcomingGame()] };
+      // user1 opted out, user2 already picked
+      return {
+        rows: params[0].flatMap((userId) =>
+          userId === 'user1' ? [{ userId, emailNotifications: false, pickedGameIds: [] }]
+            : userId === 'user2' ? [{ userId, emailNotifications: true, pickedGameIds: ['game1'] }]
+              : []),
+      };
+    });
+    (sgMail.send as jest.Mock).mockResolvedValue({});
+
+    const req = new NextRequest('http://localhost:3000/api/send-pick-reminders');
+    const response = await GET(req);
+    const data = await response.json();
+
+    expect(mockFetch).toHaveBeenCalledTimes(3);
+    expect(mockQuery).toHaveBeenCalledTimes(4); // games + one per page
+    expect(data.details).toMatchObject({ totalUsers: 1001, pages: 3, emailsSent: 999, errors: 0 });
+
+    const recipients = (sgMail.send as jest.Mock).mock.calls.flatMap(([msg]) => msg.personalizations.map((p: { to: string }) => p.to));
+    expect(recipients).toHaveLength(999);
+    expect(recipients).not.toContain('test1@example.com');
+    expect(recipients).not.toContain('test2@example.com');
+  });
+
   it('should handle Clerk API errors', async () => {
     // Mock: Games exist but Clerk API fails
-    mockQuery.mockResolvedValueOnce({
-      rows: [{
-        id: 'game1',
-        team1Name: 'Team A',
-        team2Name: 'Team B',
-        gameTime: '14:00:00',
-      }],
-    });
+    mockQuery.mockResolvedValueOnce({ rows: [upcomingGame()] });
 
     // Mock Clerk API error
     mockFetch.mockImplementationOnce(() =>
@@ -135,26 +178,12 @@ describe('Email Reminder System', () => {
   });
 
   it('should handle SendGrid errors gracefully', async () => {
-    const now = new Date();
-    const gameTime = new Date(now.getTime() + 90 * 60 * 1000)
-      .toLocaleTimeString('en-US', { hour12: false });
-
-    // Mock: Games found
     mockQuery
-      .mockResolvedValueOnce({
-        rows: [{
-          id: 'game1',
-          team1Name: 'Team A',
-          team2Name: 'Team B',
-          gameTime,
-        }],
-      })
-      .mockResolvedValueOnce({
-        rows: [], // No picks
-      });
+      .mockResolvedValueOnce({ rows: [upcomingGame()] })
+      .mockResolvedValueOnce({ rows: [] }); // No preferences, no picks
 
-    // Mock SendGrid error
-    (sgMail.send as jest.Mock).mockRejectedValueOnce(new Error('Failed to send'));
+    // Mock SendGrid error that is not worth retrying
+    (sgMail.send as jest.Mock).mockRejectedValueOnce(Object.assign(new Error('Bad request'), { code: 400 }));
 
     const req = new NextRequest('http://localhost:3000/api/send-pick-reminders');
     const response = await GET(req);
@@ -162,5 +191,68 @@ describe('Email Reminder System', () => {
 
     // Should still return success but with 0 emails sent
     expect(data.message).toContain('0 reminder email');
+    expect(data.details.errors).toBe(1);
   });
-}); 
\ No newline at end of file
+});
+
+describe('ReminderDispatcher', () => {
+  const recipient = (i: number) => ({ userId: `user${i}`, email: `test${i}@example.com`, name: 'Test', games: ['A vs B'] });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('never has more than the concurrency limit of batches in flight', async () => {
+    let inFlight = 0;
+    let peak = 0;
+    (sgMail.send as jest.Mock).mockImplementation(async () => {
+      peak = Math.max(peak, ++inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      inFlight--;
+    });
+
+    const dispatcher = new ReminderDispatcher(10, 3);
+    for (let i = 0; i < 95; i++) await dispatcher.add(recipient(i));
+    await dispatcher.drain();
+
+    expect(dispatcher.batches).toBe(10);
+    expect(dispatcher.emailsSent).toBe(95);
+    expect(peak).toBe(3);
+  });
+
+  it('retries rate-limited batches and gives up on the rest after three attempts', async () => {
+    (sgMail.send as jest.Mock)
+      .mockRejectedValueOnce(Object.assign(new Error('Too many requests'), { code: 429, response: { headers: { 'retry-after': '0.01' } } }))
+      .mockResolvedValueOnce({})
+      .mockRejectedValue(Object.assign(new Error('Unavailable'), { code: 503, response: { headers: { 'retry-after': '0.01' } } }));
+
+    const dispatcher = new ReminderDispatcher(2, 1);
+    for (let i = 0; i < 4; i++) await dispatcher.add(recipient(i));
+    await dispatcher.drain();
+
+    expect(dispatcher.emailsSent).toBe(2);
+    expect(dispatcher.errors).toBe(2);
+    expect(dispatcher.retries).toBe(2);
+    expect(sgMail.send).toHaveBeenCalledTimes(4);
+  });
+
+  it('splits a rejected batch until only the bad address is lost', async () => {
+    (sgMail.send as jest.Mock).mockImplementation(async (message: any) => {
+      if (message.personalizations.some((p: any) => p.to === 'test5@example.com')) {
+        throw Object.assign(new Error('Bad Request'), { code: 400 });
+      }
+    });
+
+    const dispatcher = new ReminderDispatcher(8, 2);
+    for (let i = 0; i < 8; i++) await dispatcher.add(recipient(i));
+    await dispatcher.drain();
+
+    expect(dispatcher.emailsSent).toBe(7);
+    expect(dispatcher.errors).toBe(1);
+    expect(dispatcher.batches).toBe(1);
+    // 8 -> 4 + 4 -> 2 + 2 -> 1 + 1
+    expect(dispatcher.splits).toBe(3);
+    expect(dispatcher.retries).toBe(0);
+    expect(sgMail.send).toHaveBeenCalledTimes(7);
+  });
+});
@@ -0,0 +1,90 @@
+import { clearEspnCache, espnCacheStats, getScoreboard, getScoreboardEvent } from '@/lib/espnCache/espnCache';
+import { GET } from '../../src/app/api/all-espn-games/route';
+
+const scoreboard = (id: string) => ({
+  ok: true,
+  status: 200,
+  json: () => Promise.resolve({ events: [{ id }] }),
+});
+
+describe('ESPN scoreboard cache', () => {
+  let mockFetch: jest.SpyInstance;
+
+  beforeEach(() => {
+    clearEspnCache();
+    mockFetch = jest.spyOn(global, 'fetch').mockImplementation(() => Promise.resolve(scoreboard('1') as Response));
+  });
+
+  afterEach(() => {
+    mockFetch.mockRestore();
+    jest.useRealTimers();
+  });
+
+  it('serves repeat requests for the same sport and date from the cache', async () => {
+    const first = await getScoreboard('NBA', '20250101');
+    const second = await getScoreboard('NBA', '20250101');
+
+    expect(second).toBe(first);
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+    expect(mockFetch.mock.calls[0][0]).toContain('/basketball/nba/scoreboard?dates=20250101');
+    expect(espnCacheStats()).toMatchObject({ hits: 1, misses: 1, upstream: { calls: 1 } });
+  });
+
+  it('coalesces concurrent misses into one upstream request', async () => {
+    let resolveFetch: (value: unknown) => void = () => {};
+    mockFetch.mockImplementation(() => new Promise((resolve) => { resolveFetch = resolve; }));
+
+    const requests = Array.from({ length: 50 }, () => getScoreboard('NHL', '20990101'));
+    resolveFetch(scoreboard('7'));
+    const results = await Promise.all(requests);
+
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+    expect(results.every((r) => r.data.events[0].id === '7')).toBe(true);
+    expect(espnCacheStats()).toMatchObject({ misses: 1, coalesced: 49, inFlight: 0 });
+  });
+
+  it('keys by sport and date', async () => {
+    await getScoreboard('NBA', '20250101');
+    await getScoreboard('NBA', '20250102');
+    await getScoreboard('NFL', '20250101');
+    await getScoreboard('NFL');
+
+    expect(mockFetch).toHaveBeenCalledTimes(4);
+    expect(espnCacheStats().bySport).toMatchObject({ NBA: { misses: 2 }, NFL: { misses: 2 } });
+  });
+
+  it('expires live days quickly and past days much later', async () => {
+    jest.useFakeTimers({ now: new Date('2025-03-10T18:00:00Z') });
+
+    await getScoreboard('MLB', '20250310'); // today
+    await getScoreboard('MLB', '20250301'); // past
+    jest.advanceTimersByTime(60 * 1000);
+    await getScoreboard('MLB', '20250310');
+    await getScoreboard('MLB', '20250301');
+
+    expect(mockFetch).toHaveBeenCalledTimes(3);
+    expect(mockFetch.mock.calls[2][0]).toContain('dates=20250310');
+  });
+
+  it('does not cache failed responses', async () => {
+    mockFetch
+      .mockResolvedValueOnce({ ok: false, status: 503 } as Response)
+      .mockRejectedValueOnce(new Error('Network error'));
+
+    expect(await getScoreboardEvent('NBA', '42')).toMatchObject({ ok: false, status: 503 });
+    await expect(getScoreboardEvent('NBA', '42')).rejects.toThrow('Network error');
+    expect(await getScoreboardEvent('NBA', '42')).toMatchObject({ ok: true });
+
+    expect(mockFetch).toHaveBeenCalledTimes(3);
+    expect(espnCacheStats().upstream.errors).toBe(2);
+  });
+
+  it('lets a burst of all-espn-games requests share one scoreboard fetch', async () => {
+    const requests = Array.from({ length: 20 }, () =>
+      GET(new Request('http://localhost:3000/api/all-espn-games?sport=EPL&specificDate=2025-01-01')));
+    await Promise.all(requests);
+
+    const scoreboardCalls = mockFetch.mock.calls.filter(([url]) => String(url).includes('/scoreboard'));
+    expect(scoreboardCalls).toHaveLength(1);
+  });
+});
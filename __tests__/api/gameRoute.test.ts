@@ -1,5 +1,6 @@
 import { GET } from "../../src/app/api/all-espn-games/route";
 import { NextRequest } from 'next/server';
+import { clearEspnCache } from '@/lib/espnCache/espnCache';
 
 jest.mock('next/server', () => ({
   NextResponse: {
@@ -14,6 +15,7 @@ jest.mock('next/server', () => ({
 describe('GET /api/all-espn-games/ (unit tests)', () => {
   beforeEach(() => {
     global.fetch = jest.fn();
+    clearEspnCache();
   });
 
   afterEach(() => {
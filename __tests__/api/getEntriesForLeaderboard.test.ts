@@ -1,9 +1,9 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
 import { clerkClient } from '@clerk/clerk-sdk-node';
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { GET } from '../../src/app/api/leaderboard-entries/getEntriesForLeaderboard/route';
 
-jest.mock('@vercel/postgres', () => ({
+jest.mock('@/lib/dbPool/dbPool', () => ({
   db: {
     connect: jest.fn().mockResolvedValue({
       query: jest.fn(),
@@ -1,9 +1,9 @@
 import { clerkClient } from '@clerk/clerk-sdk-node';
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { GET } from '@/app/api/user/getUsersLeaderboard/route';
 
 // Mock the database and Clerk client
-jest.mock('@vercel/postgres', () => ({
+jest.mock('@/lib/dbPool/dbPool', () => ({
   db: {
     connect: jest.fn(),
   },
@@ -1,10 +1,10 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
 import { clerkClient } from '@clerk/clerk-sdk-node';
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { GET } from '../../src/app/api/user/getUsersLeaderboard/route';
 import { NextRequest } from 'next/server';
 
-jest.mock('@vercel/postgres', () => ({
+jest.mock('@/lib/dbPool/dbPool', () => ({
   db: {
     connect: jest.fn().mockResolvedValue({
       query: jest.fn(),
@@ -0,0 +1,88 @@
+import { handleAllGamesDone, weekOf } from '../../src/lib/handleAllGamesDone/handleAllGamesDone';
+
+global.fetch = jest.fn();
+
+const jsonResponse = (body: object, status = 200) => ({
+  ok: status < 400,
+  status,
+  json: async () => body,
+});
+
+// Bodies of the updateEntryPoints calls
+const scoredBoards = () => (fetch as jest.Mock).mock.calls
+  .filter(([url]) => url.endsWith('/updateEntryPoints'))
+  .map(([, init]) => JSON.parse(init.body));
+
+describe('handleAllGamesDone', () => {
+  beforeEach(() => {
+    // 1:30am on Wednesday 2025-03-12, the first day of week 11 (2025-03-12..18)
+    jest.useFakeTimers({ doNotFake: ['nextTick', 'setImmediate'] }).setSystemTime(new Date(2025, 2, 12, 1, 30));
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+    jest.clearAllMocks();
+  });
+
+  it('verifies entries with one request per sport and skips sports nobody picked', async () => {
+    (fetch as jest.Mock).mockImplementation(async (url: string, init: { body: string }) => {
+      const { sport } = JSON.parse(init.body);
+      if (url.endsWith('/verifyEntries')) {
+        return jsonResponse({ success: true, pickers: sport === 'NBA' ? 25000 : 0 }, 201);
+      }
+      return jsonResponse({ success: true });
+    });
+
+    await handleAllGamesDone();
+
+    const urls = (fetch as jest.Mock).mock.calls.map(([url]) => url);
+    expect(urls.filter((url: string) => url.endsWith('/verifyEntries'))).toHaveLength(10);
+    expect(urls.filter((url: string) => url.endsWith('/verifyEntry'))).toHaveLength(0);
+    const current = scoredBoards().filter((body) => body.week === 11);
+    expect(current).toEqual([{ sport: 'NBA', week: 11, year: 2025, incremental: true }]);
+  });
+
+  it('keeps scoring last week\'s board so games decided after the rollover still count', async () => {
+    (fetch as jest.Mock).mockImplementation(async (url: string, init: { body: string }) => {
+      const { sport } = JSON.parse(init.body);
+      if (url.endsWith('/verifyEntries')) return jsonResponse({ success: true, pickers: 0 }, 201);
+      // NFL had no board last week
+      if (sport === 'NFL') return jsonResponse({ success: false, message: 'Leaderboard not found for given NFL  10' }, 404);
+      return jsonResponse({ success: true, games: sport === 'NBA' ? 1 : 0 });
+    });
+    const error = jest.spyOn(console, 'error').mockImplementation(() => {});
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+
+    await handleAllGamesDone();
+
+    // Nobody has picked for the new week yet, but week 10's late games (ending 2025-03-11,
+    // decided after midnight) are scored for every sport
+    const boards = scoredBoards();
+    expect(boards).toHaveLength(10);
+    expect(boards.every((body) => body.week === 10 && body.year === 2025 && body.incremental)).toBe(true);
+    expect(error).not.toHaveBeenCalled();
+  });
+
+  it('finds last year\'s last board across New Year', () => {
+    const current = weekOf(new Date(2026, 0, 1, 0, 30));
+    expect(current).toEqual({ week: 1, year: 2026 });
+    // 2025-12-31 is week 53 of 2025, a board of its own
+    expect(weekOf(new Date(current.year, 0, (current.week - 1) * 7))).toEqual({ week: 53, year: 2025 });
+    expect(weekOf(new Date(2025, 2, 11))).toEqual({ week: 10, year: 2025 });
+  });
+
+  it('keeps going with the other sports when one fails', async () => {
+    (fetch as jest.Mock).mockImplementation(async (url: string, init: { body: string }) => {
+      const { sport } = JSON.parse(init.body);
+      if (sport === 'NFL') throw new Error('connection reset');
+      return jsonResponse({ success: true, pickers: 1 }, url.endsWith('/verifyEntries') ? 201 : 200);
+    });
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    await handleAllGamesDone();
+
+    const updated = scoredBoards().filter((body) => body.week === 11).map((body) => body.sport);
+    expect(updated).toHaveLength(9);
+    expect(updated).not.toContain('NFL');
+  });
+});
@@ -14,7 +14,7 @@ jest.mock('@clerk/nextjs/server', () => ({
   getAuth: jest.fn(),
 }));
 
-jest.mock('@vercel/postgres', () => ({
+jest.mock('@/lib/dbPool/dbPool', () => ({
   sql: jest.fn(),
 }));
 
@@ -31,7 +31,7 @@ const mockUserId = 'test-user-123';
 
 describe('API Route: GET /api/userPicks', () => {
   const { getAuth } = require('@clerk/nextjs/server');
-  const { sql } = require('@vercel/postgres');
+  const { sql } = require('@/lib/dbPool/dbPool');
   const { NextResponse } = require('next/server');
 
   
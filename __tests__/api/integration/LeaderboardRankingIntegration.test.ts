@@ -1,4 +1,4 @@
-import { sql } from "@vercel/postgres";
+import { sql } from "@/lib/dbPool/dbPool";
 import { GET } from "../../../src/app/api/leaderboard-entries/getEntriesForLeaderboard/route";
 import dotenv from "dotenv";
 
@@ -1,5 +1,6 @@
 import { GET } from "../../../src/app/api/all-espn-games/route";
 import { NextRequest } from "next/server";
+import { clearEspnCache } from "@/lib/espnCache/espnCache";
 
 // 🎯 Supported sports and endpoints
 const sportsToTest = {
@@ -16,6 +17,11 @@ const sportsToTest = {
 };
 
 describe("Integration (Live): GET /api/all-espn-games", () => {
+  // Every test should reach ESPN, not a slate cached by an earlier one
+  beforeEach(() => {
+    clearEspnCache();
+  });
+
   const formatDate = (d: Date) =>
     `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, "0")}-${String(
       d.getDate()
@@ -1,5 +1,5 @@
 import { POST } from "../../../src/app/api/admin/syncSportsRadarData/route";
-import { sql } from "@vercel/postgres";
+import { sql } from "@/lib/dbPool/dbPool";
 import dotenv from "dotenv";
 
 dotenv.config({ path: ".env.local" });
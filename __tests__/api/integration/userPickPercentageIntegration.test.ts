@@ -1,5 +1,5 @@
-import { sql } from "@vercel/postgres";
-import * as postgres from "@vercel/postgres";
+import { sql } from "@/lib/dbPool/dbPool";
+import * as postgres from "@/lib/dbPool/dbPool";
 import { GET } from "../../../src/app/api/userPickPercentage/route";
 import { POST as POSTSelectionUpdate } from "../../../src/app/api/pusher/route";
 import dotenv from "dotenv";
@@ -12,7 +12,7 @@ jest.mock("pusher", () => {
     }));
 });
 
-const originalSql = postgres.sql; // Save the real sql function
+const originalConnect = postgres.db.connect; // Save the real connect function
 
 describe("Integration: User Pick Percentages (Real or Mock Games)", () => {
     let gameIdsToUse: string[] = [];
@@ -109,9 +109,19 @@ describe("Integration: User Pick Percentages (Real or Mock Games)", () => {
         }
     });
 
+    it("should return only the requested games when given gameIds", async () => {
+        const res = await GET(
+            new Request(`http://localhost/api/userPickPercentage?gameIds=${gameIdsToUse.join(",")},no_such_game`)
+        );
+        const json = await res.json();
+
+        expect(res.status).toBe(200);
+        expect(json.data.map((g: any) => g.gameId).sort()).toEqual([...gameIdsToUse].sort());
+    });
+
     it("❌ should return 500 if database cannot be accessed", async () => {
-        // Temporarily mock sql to simulate a database failure
-        (postgres.sql as any) = jest.fn(async () => {
+        // Temporarily mock the pool to simulate a database failure
+        (postgres.db as any).connect = jest.fn(async () => {
             throw new Error("Simulated database failure");
         });
     
@@ -123,8 +133,8 @@ describe("Integration: User Pick Percentages (Real or Mock Games)", () => {
         expect(res.status).toBe(500);
         expect(json).toHaveProperty("error", "Failed to retrieve pick percentages");
     
-        // Restore the real sql after the test
-        (postgres.sql as any) = originalSql;
+        // Restore the real connect after the test
+        (postgres.db as any).connect = originalConnect;
     });
     
 
@@ -0,0 +1,156 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { clerkClient } from '@clerk/clerk-sdk-node';
+import { db } from '@/lib/dbPool/dbPool';
+import { GET as getPage } from '../../src/app/api/leaderboard/page/route';
+import { GET as getRanks } from '../../src/app/api/leaderboard/rank/route';
+import { decodeCursor, encodeCursor } from '../../src/lib/leaderboardPage/leaderboardPage';
+
+jest.mock('@/lib/dbPool/dbPool', () => ({
+  db: {
+    connect: jest.fn(),
+  },
+}));
+
+jest.mock('@clerk/clerk-sdk-node', () => ({
+  clerkClient: {
+    users: {
+      getUserList: jest.fn().mockResolvedValue({ data: [] }),
+    },
+  },
+}));
+
+const row = (userId: number, points: number, rank: number) => ({
+  user_id: userId,
+  clerk_id: `clerk_${userId}`,
+  username: `user${userId}`,
+  points,
+  rank,
+  performance: 50,
+  bio: null,
+  fav_team: null,
+  max_points: points,
+});
+
+describe('Leaderboard pages', () => {
+  let mockDbClient: any;
+
+  beforeEach(() => {
+    mockDbClient = {
+      query: jest.fn(),
+      release: jest.fn(),
+    };
+    (db.connect as jest.Mock).mockResolvedValue(mockDbClient);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it.each([
+    ['sport=NBA&week=0'],
+    ['sport=SELECT&week=3'],
+    ['sport=NBA'],
+    ['sport=SELECT&week=0&limit=0'],
+    ['sport=SELECT&week=0&limit=101'],
+    ['sport=SELECT&week=0&cursor=not-a-cursor'],
+  ])('should reject %s without querying the database', async (query) => {
+    const response = await getPage(new Request(`http://localhost/api/leaderboard/page?${query}`));
+
+    expect(response.status).toBe(400);
+    expect((await response.json()).success).toBe(false);
+    expect(db.connect).not.toHaveBeenCalled();
+  });
+
+  it('should return a page and a cursor for the next one', async () => {
+    mockDbClient.query.mockResolvedValue({ rows: [row(1, 30, 1), row(2, 20, 2), row(3, 20, 2)] });
+    (clerkClient.users.getUserList as jest.Mock).mockResolvedValue({
+      data: [{ id: 'clerk_1', imageUrl: 'https://test.com/1.jpg' }],
+    });
+
+    const response = await getPage(new Request('http://localhost/api/leaderboard/page?sport=SELECT&week=0&limit=2'));
+    const body = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(body.data.map((entry: any) => [entry.user_id, entry.rank, entry.imageUrl])).toEqual([
+      [1, 1, 'https://test.com/1.jpg'],
+      [2, 2, '/default-profile.png'],
+    ]);
+    expect(decodeCursor(body.nextCursor)).toEqual({ points: 20, userId: 2, rank: 2 });
+    // limit + 1 rows, no cursor yet
+    expect(mockDbClient.query).toHaveBeenCalledWith(expect.stringContaining('DENSE_RANK()'), [null, null, 0, 3]);
+    expect(clerkClient.users.getUserList).toHaveBeenCalledTimes(1);
+    expect(mockDbClient.release).toHaveBeenCalled();
+  });
+
+  it('should continue a leaderboard from the cursor and stop at the last page', async () => {
+    mockDbClient.query.mockResolvedValue({ rows: [row(3, 20, 2)] });
+    const cursor = encodeCursor({ points: 20, userId: 2, rank: 2 });
+
+    const response = await getPage(new Request(`http://localhost/api/leaderboard/page?sport=NBA&week=12&cursor=${cursor}`));
+    const body = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(body.data).toHaveLength(1);
+    expect(body.nextCursor).toBeNull();
+    expect(mockDbClient.query).toHaveBeenCalledWith(
+      expect.stringContaining('FROM leaderboard_entries le'),
+      ['NBA', 12, 20, 2, 2, 51]
+    );
+  });
+
+  it('should return 500 when the query fails', async () => {
+    mockDbClient.query.mockRejectedValue(new Error('Database error'));
+
+    const response = await getPage(new Request('http://localhost/api/leaderboard/page?sport=SELECT&week=0'));
+
+    expect(response.status).toBe(500);
+    expect(mockDbClient.release).toHaveBeenCalled();
+  });
+});
+
+describe('Leaderboard ranks', () => {
+  let mockDbClient: any;
+
+  beforeEach(() => {
+    mockDbClient = {
+      query: jest.fn(),
+      release: jest.fn(),
+    };
+    (db.connect as jest.Mock).mockResolvedValue(mockDbClient);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it.each([
+    ['sport=SELECT&week=0'],
+    ['sport=SELECT&week=0&user_id=abc'],
+    ['sport=NFL&week=0&user_id=1'],
+  ])('should reject %s', async (query) => {
+    const response = await getRanks(new Request(`http://localhost/api/leaderboard/rank?${query}`));
+
+    expect(response.status).toBe(400);
+    expect(db.connect).not.toHaveBeenCalled();
+  });
+
+  it('should look up each distinct user once', async () => {
+    mockDbClient.query.mockResolvedValue({ rows: [row(7, 12, 40)] });
+
+    const response = await getRanks(new Request('http://localhost/api/leaderboard/rank?sport=NFL&week=2&user_id=7,9,7'));
+    const body = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(body.data).toEqual([{ ...row(7, 12, 40), imageUrl: '/default-profile.png' }]);
+    expect(mockDbClient.query).toHaveBeenCalledWith(expect.stringContaining('COUNT(DISTINCT o.points)'), ['NFL', 2, [7, 9], []]);
+  });
+
+  it('should find the signed-in user by clerk_id', async () => {
+    mockDbClient.query.mockResolvedValue({ rows: [row(7, 12, 40)] });
+
+    const response = await getRanks(new Request('http://localhost/api/leaderboard/rank?sport=SELECT&week=0&clerk_id=clerk_7'));
+
+    expect(response.status).toBe(200);
+    expect(mockDbClient.query).toHaveBeenCalledWith(expect.stringContaining('u.clerk_id = ANY($2::text[])'), [[], ['clerk_7']]);
+  });
+});
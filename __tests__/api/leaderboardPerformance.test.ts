@@ -1,7 +1,7 @@
 import { GET } from '../../src/app/api/leaderboard/get/route';
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 
-jest.mock('@vercel/postgres', () => ({
+jest.mock('@/lib/dbPool/dbPool', () => ({
   db: {
     connect: jest.fn(),
   },
@@ -0,0 +1,105 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import Pusher from 'pusher';
+import { pushScoreDiff, scoreDiffEvents } from '../../src/lib/leaderboardPush/leaderboardPush';
+import {
+  ENTRIES_PER_EVENT, EntryChange, MAX_PATCH_ENTRIES, applyEntriesPatch, chunkEntries,
+} from '../../src/lib/leaderboardPatch/leaderboardPatch';
+
+const mockTriggerBatch = jest.fn().mockResolvedValue({});
+
+jest.mock('pusher', () => jest.fn().mockImplementation(() => ({ triggerBatch: mockTriggerBatch })));
+
+const changes = (count: number): EntryChange[] =>
+  Array.from({ length: count }, (_, i) => [i + 1, 100 - (i % 50), 3]);
+
+const diff = (entries: EntryChange[], changed = entries.length) => ({
+  sport: 'NBA',
+  week: 12,
+  entries,
+  users: entries,
+  changedEntries: changed,
+  changedUsers: changed,
+  games: [],
+});
+
+describe('leaderboard diff events', () => {
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('splits a run into small patches for the week and the overall board', () => {
+    const events = scoreDiffEvents(diff(changes(ENTRIES_PER_EVENT + 1)), 1000);
+
+    expect(events.map((e) => [e.channel, e.name])).toEqual([
+      ['leaderboard-NBA-12', 'entries-patch'],
+      ['leaderboard-NBA-12', 'entries-patch'],
+      ['leaderboard-overall', 'entries-patch'],
+      ['leaderboard-overall', 'entries-patch'],
+    ]);
+    expect(events[1].data).toMatchObject({ part: 1, parts: 2, sentAt: 1000 });
+    // Pusher's limit is 10KB per event
+    events.forEach((e) => expect(JSON.stringify(e.data).length).toBeLessThan(10 * 1024));
+  });
+
+  it('tells pages to reload instead of patching a huge run', () => {
+    const events = scoreDiffEvents(diff(changes(10), MAX_PATCH_ENTRIES + 1));
+
+    expect(events.map((e) => e.name)).toEqual(['entries-reset', 'entries-reset']);
+    expect(events[0].data).toMatchObject({ changed: MAX_PATCH_ENTRIES + 1 });
+  });
+
+  it('sends finished games first and nothing for an empty run', () => {
+    const games = [{ id: 'g1', winner: true, final_score: '3-1' }];
+
+    expect(scoreDiffEvents({ ...diff([]), games }).map((e) => e.channel)).toEqual(['game-results']);
+    expect(scoreDiffEvents(diff([]))).toEqual([]);
+  });
+
+  it('triggers at most ten events per request and survives Pusher errors', async () => {
+    const entries = changes(ENTRIES_PER_EVENT * 6);
+
+    expect(await pushScoreDiff(diff(entries))).toBe(12);
+    expect(Pusher).toHaveBeenCalledTimes(1);
+    expect(mockTriggerBatch.mock.calls.map(([events]) => events.length)).toEqual([10, 2]);
+
+    mockTriggerBatch.mockRejectedValueOnce(new Error('Pusher down'));
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    expect(await pushScoreDiff(diff(entries))).toBe(0);
+  });
+});
+
+describe('applying a patch', () => {
+  const rows = [
+    { user_id: 1, username: 'a', points: 10, rank: 1 },
+    { user_id: 2, username: 'b', points: 8, rank: 2 },
+    { user_id: 3, username: 'c', points: 5, rank: 3 },
+  ];
+
+  it('sets the points of the patched board and re-ranks densely, ties sharing a rank', () => {
+    const { rows: patched, missing } = applyEntriesPatch(rows, [[3, 10, 5]], 'set');
+
+    expect(patched.map((r) => [r.user_id, r.points, r.rank])).toEqual([[1, 10, 1], [3, 10, 1], [2, 8, 2]]);
+    expect(missing).toEqual([]);
+    // Unchanged rows keep their identity
+    expect(patched[0]).toBe(rows[0]);
+  });
+
+  it('adds the gains to a summed board and reports users it does not show', () => {
+    const { rows: patched, missing } = applyEntriesPatch(rows, [[2, 40, 4], [9, 3, 3]], 'add');
+
+    expect(patched.map((r) => [r.user_id, r.points, r.rank])).toEqual([[2, 12, 1], [1, 10, 2], [3, 5, 3]]);
+    expect(missing).toEqual([9]);
+  });
+
+  it('numbers the rows below a tie on a summed board the way DENSE_RANK() does', () => {
+    const summed = [...rows, { user_id: 4, username: 'd', points: 2, rank: 4 }];
+    const { rows: patched } = applyEntriesPatch(summed, [[2, 30, 2]], 'add');
+
+    expect(patched.map((r) => [r.user_id, r.points, r.rank])).toEqual([[1, 10, 1], [2, 10, 1], [3, 5, 2], [4, 2, 3]]);
+  });
+
+  it('chunks without losing entries', () => {
+    const chunks = chunkEntries(changes(7), 3);
+    expect(chunks.map((c) => c.length)).toEqual([3, 3, 1]);
+  });
+});
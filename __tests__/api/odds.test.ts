@@ -1,5 +1,6 @@
 import { GET } from '../../src/app/api/odds/route';
 import { NextResponse } from 'next/server';
+import { clearEspnCache } from '@/lib/espnCache/espnCache';
 
 // Mock next/server
 jest.mock('next/server', () => ({
@@ -18,6 +19,7 @@ global.fetch = jest.fn();
 describe('Odds API Route', () => {
   beforeEach(() => {
     jest.clearAllMocks();
+    clearEspnCache();
   });
 
   it('should handle a specific game request', async () => {
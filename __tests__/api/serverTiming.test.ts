@@ -0,0 +1,118 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { NextResponse } from 'next/server';
+import { recordSpan, serverTimingHeader, timed, timedJson, withServerTiming } from '@/lib/serverTiming/serverTiming';
+import { GET as espnCacheStats } from '../../src/app/api/espn-cache/route';
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// "name;dur=12.3;desc=..." entries as {name: dur}
+const parse = (header: string | null) =>
+  Object.fromEntries((header ?? '').split(', ').map((entry) => {
+    const [name, ...params] = entry.split(';');
+    return [name, Number(params.find((p) => p.startsWith('dur='))?.slice(4))];
+  }));
+
+describe('Server-Timing instrumentation', () => {
+  beforeEach(() => {
+    process.env.SERVER_TIMING = '1';
+  });
+
+  afterEach(() => {
+    delete process.env.SERVER_TIMING;
+  });
+
+  it('reports the spans a route recorded and its total time', async () => {
+    const GET = withServerTiming(async () => {
+      await timed('db', () => sleep(20));
+      await Promise.all([timed('clerk', () => sleep(30)), timed('clerk', () => sleep(30))]);
+      return timedJson({ ok: true });
+    });
+
+    const res = await GET();
+    const header = res.headers.get('Server-Timing');
+    const spans = parse(header);
+
+    expect(await res.json()).toEqual({ ok: true });
+    expect(Object.keys(spans)).toEqual(['db', 'clerk', 'json', 'total']);
+    expect(header).toContain('clerk;dur=');
+    expect(header).toContain(';desc="2 calls"');
+    expect(spans.db).toBeGreaterThanOrEqual(15);
+    expect(spans.clerk).toBeGreaterThanOrEqual(50);
+    expect(spans.total).toBeGreaterThanOrEqual(spans.db + 25);
+  });
+
+  it('keeps concurrent requests apart', async () => {
+    const GET = withServerTiming(async (name: string) => {
+      await timed(name, () => sleep(10));
+      return NextResponse.json({});
+    });
+
+    const [a, b] = await Promise.all([GET('espn'), GET('odds')]);
+
+    expect(Object.keys(parse(a.headers.get('Server-Timing')))).toEqual(['espn', 'total']);
+    expect(Object.keys(parse(b.headers.get('Server-Timing')))).toEqual(['odds', 'total']);
+  });
+
+  it('ignores spans outside a request and passes errors through', async () => {
+    recordSpan('db', performance.now());
+    await expect(timed('espn', async () => 7)).resolves.toBe(7);
+
+    const GET = withServerTiming(async () => {
+      throw new Error('boom');
+    });
+    await expect(GET()).rejects.toThrow('boom');
+  });
+
+  it('formats one entry per span name', () => {
+    const header = serverTimingHeader(
+      [{ name: 'db', start: 0, end: 1.25 }, { name: 'db', start: 2, end: 4 }, { name: 'espn', start: 0, end: 10 }],
+      12.34
+    );
+    expect(header).toBe('db;dur=3.3;desc="2 calls", espn;dur=10.0, total;dur=12.3');
+  });
+
+  it('is applied to the API routes', async () => {
+    const res = await espnCacheStats();
+    expect(res.headers.get('Server-Timing')).toMatch(/^total;dur=\d+\.\d$/);
+  });
+
+  it('sends no header unless SERVER_TIMING is set', async () => {
+    delete process.env.SERVER_TIMING;
+    const GET = withServerTiming(async () => {
+      await timed('db', () => sleep(1));
+      return NextResponse.json({});
+    });
+
+    expect((await GET()).headers.get('Server-Timing')).toBeNull();
+    process.env.SERVER_TIMING = '0';
+    expect((await GET()).headers.get('Server-Timing')).toBeNull();
+  });
+
+  it('appends an OTLP trace per request to SERVER_TIMING_OTLP_FILE', async () => {
+    const file = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'server-timing-')), 'traces.jsonl');
+    process.env.SERVER_TIMING_OTLP_FILE = file;
+    try {
+      let lib: typeof import('@/lib/serverTiming/serverTiming') | undefined;
+      jest.isolateModules(() => {
+        lib = require('@/lib/serverTiming/serverTiming');
+      });
+      const GET = lib!.withServerTiming(async (req: Request) => {
+        await lib!.timed('db', () => req.text().then(() => sleep(5)));
+        return NextResponse.json({}, { status: 201 });
+      });
+      await GET(new Request('http://localhost/api/savePicks', { method: 'POST' }));
+
+      for (let i = 0; i < 50 && !fs.existsSync(file); i++) await sleep(10);
+      const trace = JSON.parse(fs.readFileSync(file, 'utf8').trim());
+      const [root, db] = trace.resourceSpans[0].scopeSpans[0].spans;
+      expect(root.name).toBe('POST /api/savePicks');
+      expect(root.attributes).toContainEqual({ key: 'http.response.status_code', value: { intValue: 201 } });
+      expect(db).toMatchObject({ name: 'db', traceId: root.traceId, parentSpanId: root.spanId });
+      expect(Number(db.endTimeUnixNano)).toBeGreaterThan(Number(db.startTimeUnixNano));
+    } finally {
+      delete process.env.SERVER_TIMING_OTLP_FILE;
+    }
+  });
+});
@@ -1,14 +1,27 @@
 import { POST } from "../../src/app/api/admin/syncSportsRadarData/route";
 import { NextRequest } from "next/server";
-import { sql } from "@vercel/postgres";
+import { db, sql } from "@/lib/dbPool/dbPool";
+import { readEvent } from "../../src/lib/espnSync/espnSync";
 
-jest.mock("@vercel/postgres", () => ({
+jest.mock("@/lib/dbPool/dbPool", () => ({
   sql: jest.fn(),
+  db: {
+    connect: jest.fn(),
+  },
 }));
 
 global.fetch = jest.fn();
 
 describe("Unit: POST /api/admin/syncSportsRadarData", () => {
+  const mockDbClient = {
+    query: jest.fn(),
+    release: jest.fn(),
+  };
+
+  beforeEach(() => {
+    (db.connect as jest.Mock).mockResolvedValue(mockDbClient);
+  });
+
   afterEach(() => {
     jest.clearAllMocks();
   });
@@ -35,40 +48,37 @@ describe("Unit: POST /api/admin/syncSportsRadarData", () => {
       json: async () => ({ events: [mockESPNGame] }),
     });
 
-    (sql as unknown as jest.Mock).mockImplementation((query: any, ...args: any[]) => {
-      const text = query?.text ?? query?.sql ?? query;
-
-      if (/SELECT \*/i.test(text)) {
-        // Select existing game from DB
-        return Promise.resolve({
-          rows: [{
-            id: "db123",
-            espnId: mockGameId,
-            team1Name: "Lakers",
-            team2Name: "Celtics",
-            gameDate: new Date(),
-            sport: "NBA",
-          }],
-        });
+    const dbGame = {
+      id: "db123",
+      team1Name: "Lakers",
+      team2Name: "Celtics",
+      gameDate: new Date(),
+      sport: "NBA",
+    };
+    mockDbClient.query.mockImplementation((text: string) => {
+      if (/FROM "Game"/i.test(text)) {
+        // Candidate games for the ESPN events
+        return Promise.resolve({ rows: [dbGame] });
       }
       if (/UPDATE "Game"/i.test(text)) {
         // Simulate update succeeded
-        return Promise.resolve({ rowCount: 1 });
-      }
-      if (/SELECT id, "team1Name"/i.test(text)) {
-        // Select updated game
-        return Promise.resolve({
-          rows: [{
-            id: "db123",
-            team1Name: "Lakers",
-            team2Name: "Celtics",
-            final_score: "100-98",
-            winner: true,
-            won: 1,
-          }],
-        });
+        return Promise.resolve({ rows: [{ id: "db123" }], rowCount: 1 });
       }
-      return Promise.resolve({ rows: [] });
+      return Promise.resolve({ rows: [], rowCount: 0 });
+    });
+
+    (sql as unknown as jest.Mock).mockImplementation(() => {
+      // Select updated game
+      return Promise.resolve({
+        rows: [{
+          id: "db123",
+          team1Name: "Lakers",
+          team2Name: "Celtics",
+          final_score: "100-98",
+          winner: true,
+          won: 1,
+        }],
+      });
     });
 
     const req = {
@@ -98,6 +108,101 @@ describe("Unit: POST /api/admin/syncSportsRadarData", () => {
     expect(typeof updatedGame.winner).toBe("boolean");
   });
 
+  it("skips events that have not changed since the last sync", async () => {
+    const event = {
+      id: "401",
+      date: "2025-04-12T23:30Z",
+      status: { type: { state: "post", completed: true } },
+      competitions: [{
+        competitors: [
+          { homeAway: "home", team: { displayName: "Boston Celtics" }, score: "101" },
+          { homeAway: "away", team: { displayName: "Miami Heat" }, score: "99" },
+        ],
+      }],
+    };
+    (fetch as jest.Mock).mockResolvedValue({ ok: true, json: async () => ({ events: [event] }) });
+    const hash = readEvent(event, "NBA")!.hash;
+    mockDbClient.query.mockImplementation((text: string) =>
+      Promise.resolve({ rows: /FROM espn_sync_state/.test(text) ? [{ sport: "NBA", event_id: "401", content_hash: hash }] : [] })
+    );
+
+    const req = { json: async () => ({ gameIds: [], sports: ["NBA"], dates: "20250412" }) } as unknown as NextRequest;
+    const json = await (await POST(req)).json();
+
+    expect(json.results).toEqual([]);
+    expect(json.stats).toMatchObject({ events: 1, unchanged: 1, writes: { games: 0, state: 0 } });
+    // Nothing to match or write: no "Game" query at all
+    expect(mockDbClient.query.mock.calls.some(([text]) => /(FROM|UPDATE) "Game"/.test(text))).toBe(false);
+    // The sync state table comes from the schema, never from the request
+    expect(mockDbClient.query.mock.calls.some(([text]) => /CREATE/.test(text))).toBe(false);
+    expect(fetch).toHaveBeenCalledTimes(1);
+    expect((fetch as jest.Mock).mock.calls[0][0]).toMatch(/basketball\/nba\/scoreboard\?dates=20250412$/);
+  });
+
+  it("matches games by team names and writes them in one batch", async () => {
+    const event = (id: string, home: string, away: string, homeScore: string, awayScore: string) => ({
+      id,
+      date: "2025-04-12T23:30Z",
+      status: { type: { state: "post", completed: true } },
+      competitions: [{
+        competitors: [
+          { homeAway: "home", team: { displayName: home }, score: homeScore },
+          { homeAway: "away", team: { displayName: away }, score: awayScore },
+        ],
+      }],
+    });
+    (fetch as jest.Mock).mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        events: [
+          event("401", "Los Angeles Lakers", "Boston Celtics", "100", "110"),
+          event("402", "Chicago Bulls", "Miami Heat", "90", "80"),
+          event("403", "Utah Jazz", "Phoenix Suns", "", "80"),
+        ],
+      }),
+    });
+    mockDbClient.query.mockImplementation((text: string) => {
+      if (/FROM "Game"/.test(text)) {
+        return Promise.resolve({
+          rows: [
+            // Stored away team first, under another ID
+            { id: "g1", team1Name: "Celtics", team2Name: "LA Lakers", gameDate: "2025-04-12", sport: "NBA" },
+            { id: "g2", team1Name: "Chicago Bulls", team2Name: "Miami Heat", gameDate: "2025-04-12", sport: "NBA" },
+            { id: "g3", team1Name: "Utah Jazz", team2Name: "Phoenix Suns", gameDate: "2025-04-12", sport: "NBA" },
+          ],
+        });
+      }
+      if (/UPDATE "Game"/.test(text)) return Promise.resolve({ rows: [{ id: "g1" }] });
+      if (/INSERT INTO espn_sync_state/.test(text)) return Promise.resolve({ rows: [], rowCount: 2 });
+      return Promise.resolve({ rows: [] });
+    });
+
+    const req = { json: async () => ({ sports: ["NBA"], dates: "20250410-20250420" }) } as unknown as NextRequest;
+    const json = await (await POST(req)).json();
+
+    expect(json.results.map((r: any) => [r.id, r.status])).toEqual([
+      ["g1", "updated"], ["g2", "current"], ["g3", "invalid_data"],
+    ]);
+    expect(json.stats).toMatchObject({ events: 3, updated: 1, current: 1, invalid_data: 1, writes: { games: 1, state: 2 } });
+    expect((fetch as jest.Mock).mock.calls.map(([url]) => url.split("dates=")[1])).toEqual([
+      "20250410-20250416&limit=1000", "20250417-20250420&limit=1000",
+    ]);
+
+    const update = mockDbClient.query.mock.calls.find(([text]) => /UPDATE "Game"/.test(text));
+    // team1 is Boston, who won 110-100
+    expect(update[1]).toEqual([["g1", "g2"], [false, false], ["110-100", "90-80"]]);
+    expect(mockDbClient.query.mock.calls.map(([text]) => text)).toContain("COMMIT");
+    expect(mockDbClient.release).toHaveBeenCalled();
+  });
+
+  it("rejects a malformed date range", async () => {
+    const req = { json: async () => ({ dates: "2025-04-12" }) } as unknown as NextRequest;
+    const res = await POST(req);
+
+    expect(res.status).toBe(400);
+    expect(fetch).not.toHaveBeenCalled();
+  });
+
 it("should return 500 if ESPN fetch fails", async () => {
   (fetch as jest.Mock).mockResolvedValue({
     ok: false,
@@ -0,0 +1,84 @@
+import { getTeamAbbreviation, getTeamLogo } from '../../src/app/api/all-espn-games/fetchTeamData';
+import { clearEspnCache } from '@/lib/espnCache/espnCache';
+import { DEFAULT_TEAM_LOGO, teamMetadataInfo } from '@/lib/teamMetadata/teamMetadata';
+
+jest.mock('@/lib/teamMetadata/teams.json', () => ({
+  version: '3f2a9c1b7d4e',
+  generatedAt: '2025-03-10T18:00:00+00:00',
+  leagues: {
+    NBA: {
+      teams: [
+        {
+          id: '25',
+          name: 'Thunder',
+          displayName: 'Oklahoma City Thunder',
+          shortDisplayName: 'Thunder',
+          abbreviation: 'OKC',
+          logo: '/team-logos/nba/okc.9a1f3e07bc.png',
+        },
+        {
+          id: '22',
+          name: 'Trail Blazers',
+          displayName: 'Portland Trail Blazers',
+          shortDisplayName: 'Blazers',
+          abbreviation: 'POR',
+          logo: null,
+        },
+      ],
+    },
+  },
+}));
+
+global.fetch = jest.fn();
+
+const nhlTeams = {
+  sports: [{
+    leagues: [{
+      teams: [
+        { team: { id: '1', name: 'Bruins', displayName: 'Boston Bruins', shortDisplayName: 'Bruins', abbreviation: 'BOS', logos: [{ href: 'https://a.espncdn.com/i/teamlogos/nhl/500/bos.png' }] } },
+      ],
+    }],
+  }],
+};
+
+describe('team metadata', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+    clearEspnCache();
+  });
+
+  it('answers prebuilt leagues from the table without calling ESPN', async () => {
+    expect(await getTeamLogo('Thunder', 'NBA')).toBe('/team-logos/nba/okc.9a1f3e07bc.png');
+    expect(await getTeamLogo('Oklahoma City Thunder', 'NBA')).toBe('/team-logos/nba/okc.9a1f3e07bc.png');
+    expect(await getTeamAbbreviation('Trail Blazers', 'NBA')).toBe('POR');
+    expect(await getTeamAbbreviation('Blazers', 'NBA')).toBe('POR');
+    expect(await getTeamLogo('Trail Blazers', 'NBA')).toBe(DEFAULT_TEAM_LOGO);
+    expect(global.fetch).not.toHaveBeenCalled();
+  });
+
+  it('falls back to one cached ESPN fetch per league for anything else', async () => {
+    (global.fetch as jest.Mock).mockResolvedValue({ ok: true, status: 200, json: () => Promise.resolve(nhlTeams) });
+
+    expect(await getTeamAbbreviation('Bruins', 'NHL')).toBe('BOS');
+    expect(await getTeamLogo('Boston Bruins', 'NHL')).toBe('https://a.espncdn.com/i/teamlogos/nhl/500/bos.png');
+    expect(await getTeamAbbreviation('Kraken', 'NHL')).toBe('unk');
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('uses defaults when neither has the team', async () => {
+    (global.fetch as jest.Mock).mockRejectedValue(new Error('offline'));
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    expect(await getTeamLogo('Mystery', 'NFL')).toBe(DEFAULT_TEAM_LOGO);
+    expect(await getTeamAbbreviation('Mystery', 'NFL')).toBe('unk');
+    expect(await getTeamLogo(undefined, 'NBA')).toBe(DEFAULT_TEAM_LOGO);
+  });
+
+  it('reports the loaded table', () => {
+    expect(teamMetadataInfo()).toEqual({
+      version: '3f2a9c1b7d4e',
+      generatedAt: '2025-03-10T18:00:00+00:00',
+      leagues: ['NBA'],
+    });
+  });
+});
@@ -0,0 +1,135 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { db } from '@/lib/dbPool/dbPool';
+import { POST } from '../../src/app/api/leaderboard-entries/updateEntryPoints/route';
+import { pushScoreDiff } from '../../src/lib/leaderboardPush/leaderboardPush';
+
+jest.mock('@/lib/dbPool/dbPool', () => ({
+  db: {
+    connect: jest.fn(),
+  },
+}));
+
+jest.mock('../../src/lib/leaderboardPush/leaderboardPush', () => ({
+  pushScoreDiff: jest.fn().mockResolvedValue(0),
+}));
+
+const post = (body: object) =>
+  new Request('http://localhost/api/leaderboard-entries/updateEntryPoints', {
+    method: 'POST',
+    body: JSON.stringify(body),
+  });
+
+// Queries other than BEGIN/COMMIT/ROLLBACK, in order
+const statements = (client: any) =>
+  client.query.mock.calls.filter(([sql]: [string]) => !['BEGIN', 'COMMIT', 'ROLLBACK'].includes(sql));
+
+describe('POST /api/leaderboard-entries/updateEntryPoints', () => {
+  let mockDbClient: any;
+
+  beforeEach(() => {
+    mockDbClient = {
+      query: jest.fn().mockResolvedValue({ rows: [] }),
+      release: jest.fn(),
+    };
+    (db.connect as jest.Mock).mockResolvedValue(mockDbClient);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('returns 400 when sport or week is missing', async () => {
+    const response = await POST(post({ sport: 'NBA' }));
+    expect(response.status).toBe(400);
+    expect(mockDbClient.query).toHaveBeenCalledWith('ROLLBACK');
+  });
+
+  it('returns 404 when the week has no leaderboard', async () => {
+    const response = await POST(post({ sport: 'NBA', week: 12 }));
+    expect(response.status).toBe(404);
+    expect(statements(mockDbClient)).toHaveLength(1);
+  });
+
+  it('scores every entry with one statement, whatever the number of users', async () => {
+    mockDbClient.query.mockImplementation(async (sql: string) => {
+      if (sql.includes('FOR UPDATE')) return { rows: [{ leaderboard_id: 7 }] };
+      if (sql.includes('leaderboard_scored_games')) return { rows: [{ games: 4, completed_days: 1, entries: 20000 }] };
+      return { rows: [] };
+    });
+
+    const response = await POST(post({ sport: 'NBA', week: 12, incremental: true }));
+    const json = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(json).toMatchObject({ success: true, games: 4, completed_days: 1, entries: 20000 });
+    expect(statements(mockDbClient)).toHaveLength(2);
+    expect(statements(mockDbClient)[1][1]).toEqual(['NBA', 7, true]);
+    expect(mockDbClient.query).toHaveBeenLastCalledWith('COMMIT');
+  });
+
+  it('finds the board of an explicit year, for last week\'s board across New Year', async () => {
+    mockDbClient.query.mockImplementation(async (sql: string) => {
+      if (sql.includes('FOR UPDATE')) return { rows: [{ leaderboard_id: 6 }] };
+      if (sql.includes('leaderboard_scored_games')) return { rows: [{ games: 1, completed_days: 1, entries: 12 }] };
+      return { rows: [] };
+    });
+
+    const response = await POST(post({ sport: 'NBA', week: 53, year: 2025, incremental: true }));
+
+    expect(response.status).toBe(200);
+    expect(statements(mockDbClient)[0][1]).toEqual(['NBA', 53, 2025]);
+    expect(statements(mockDbClient)[1][1]).toEqual(['NBA', 6, true]);
+  });
+
+  it('pushes what changed once the scores are committed', async () => {
+    mockDbClient.query.mockImplementation(async (sql: string) => {
+      if (sql.includes('FOR UPDATE')) return { rows: [{ leaderboard_id: 7 }] };
+      if (sql.includes('leaderboard_scored_games')) {
+        return {
+          rows: [{
+            games: 1, completed_days: 0, entries: 3, changed_entries: 2, changed_users: 2,
+            entry_changes: [[1, 5, 2], [2, 4, 1]], user_changes: [[1, 40, 2], [2, 31, 1]],
+            game_results: [{ id: 'g1', winner: false, final_score: '101-99' }],
+          }],
+        };
+      }
+      return { rows: [] };
+    });
+    (pushScoreDiff as jest.Mock).mockImplementation(async () => {
+      expect(mockDbClient.query).toHaveBeenLastCalledWith('COMMIT');
+      return 3;
+    });
+
+    const response = await POST(post({ sport: 'NBA', week: '12', incremental: true }));
+
+    expect(response.status).toBe(200);
+    expect(pushScoreDiff).toHaveBeenCalledWith({
+      sport: 'NBA',
+      week: 12,
+      entries: [[1, 5, 2], [2, 4, 1]],
+      users: [[1, 40, 2], [2, 31, 1]],
+      changedEntries: 2,
+      changedUsers: 2,
+      games: [{ id: 'g1', winner: false, final_score: '101-99' }],
+    });
+  });
+
+  it('pushes nothing when the run is rolled back', async () => {
+    const response = await POST(post({ sport: 'NBA', week: 12 }));
+
+    expect(response.status).toBe(404);
+    expect(pushScoreDiff).not.toHaveBeenCalled();
+  });
+
+  it('keeps the 404 for a day without finished games outside incremental mode', async () => {
+    mockDbClient.query.mockImplementation(async (sql: string) => {
+      if (sql.includes('FOR UPDATE')) return { rows: [{ leaderboard_id: 7 }] };
+      if (sql.includes('leaderboard_scored_games')) return { rows: [{ games: 0, completed_days: 0, entries: 0 }] };
+      return { rows: [] };
+    });
+
+    const response = await POST(post({ sport: 'NBA', week: 12 }));
+    expect(response.status).toBe(404);
+    expect(mockDbClient.query).toHaveBeenLastCalledWith('ROLLBACK');
+  });
+});
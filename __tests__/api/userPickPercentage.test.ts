@@ -0,0 +1,158 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { db } from '@/lib/dbPool/dbPool';
+import { GET } from '../../src/app/api/userPickPercentage/route';
+import { installPickCounts } from '../../src/lib/pickCounts/pickCounts';
+import { NextRequest } from 'next/server';
+
+jest.mock('@/lib/dbPool/dbPool', () => ({
+  db: {
+    connect: jest.fn(),
+  },
+}));
+
+const counts = (gameId: string, homePicks: number, awayPicks: number) => ({ gameId, homePicks, awayPicks });
+
+describe('User Pick Percentage', () => {
+  let mockDbClient: any;
+  let countRows: any[];
+  let distinctUsers: number;
+  let triggers: number;
+
+  beforeEach(() => {
+    countRows = [];
+    distinctUsers = 0;
+    triggers = 3;
+    mockDbClient = {
+      query: jest.fn(async (sql: string) => {
+        if (sql.includes('COUNT(DISTINCT')) return { rows: [{ users: distinctUsers }] };
+        if (sql.includes('pg_trigger')) return { rows: [{ triggers }] };
+        if (sql.includes('"GamePickCounts" c')) return { rows: countRows };
+        return { rows: [] };
+      }),
+      release: jest.fn(),
+    };
+    (db.connect as jest.Mock).mockResolvedValue(mockDbClient);
+  });
+
+  const queries = () => mockDbClient.query.mock.calls.map(([sql]: [string]) => sql);
+
+  it('turns the maintained counts into percentages without aggregating picks', async () => {
+    countRows = [counts('g1', 3, 1), counts('g2', 0, 2)];
+
+    const response = await GET(new NextRequest('http://localhost/api/userPickPercentage'));
+    const json = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(json.data).toEqual([
+      { gameId: 'g1', homeTeamPercentage: '75.00%', awayTeamPercentage: '25.00%' },
+      { gameId: 'g2', homeTeamPercentage: '0.00%', awayTeamPercentage: '100.00%' },
+    ]);
+    expect(queries().some((sql: string) => sql.includes('FROM "Pick"'))).toBe(false);
+    expect(mockDbClient.release).toHaveBeenCalled();
+  });
+
+  it('still answers when called without a request', async () => {
+    countRows = [counts('g1', 1, 1)];
+
+    const json = await (await GET()).json();
+
+    expect(json.data).toHaveLength(1);
+    const [, params] = mockDbClient.query.mock.calls.find(([sql]: [string]) => sql.includes('"gameDate" IN'));
+    expect(params).toHaveLength(2);
+  });
+
+  it('needs picks from two different users', async () => {
+    countRows = [counts('g1', 1, 0)];
+    expect((await (await GET()).json()).message).toBe('There is not enough data');
+
+    // One pick on each of two games: only the picks themselves can tell
+    countRows = [counts('g1', 1, 0), counts('g2', 0, 1)];
+    distinctUsers = 1;
+    expect((await (await GET()).json()).data).toEqual([]);
+
+    distinctUsers = 2;
+    expect((await (await GET()).json()).data).toHaveLength(2);
+  });
+
+  it('logs an error when the counting triggers are missing', async () => {
+    const consoleError = jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    expect((await (await GET()).json()).message).toBe('There is not enough data');
+    expect(consoleError).not.toHaveBeenCalled();
+
+    // A deploy that never ran `npm run db:setup`
+    triggers = 0;
+    expect((await (await GET()).json()).message).toBe('There is not enough data');
+    expect(consoleError).toHaveBeenCalledWith(expect.stringContaining('npm run db:setup'));
+
+    consoleError.mockRestore();
+  });
+
+  it('looks up many games in one query with gameIds', async () => {
+    countRows = [counts('g1', 2, 2), counts('g3', 1, 3)];
+
+    const response = await GET(new NextRequest('http://localhost/api/userPickPercentage?gameIds=g1,g2,g3,g1'));
+    const json = await response.json();
+
+    expect(json.data.map((row: any) => row.gameId)).toEqual(['g1', 'g3']);
+    const lookups = mockDbClient.query.mock.calls.filter(([sql]: [string]) => sql.includes('ANY($1::text[])'));
+    expect(lookups).toEqual([[expect.any(String), [['g1', 'g2', 'g3']]]]);
+  });
+
+  it('rejects too many game IDs', async () => {
+    const ids = Array.from({ length: 201 }, (_, i) => `g${i}`).join(',');
+
+    const response = await GET(new NextRequest(`http://localhost/api/userPickPercentage?gameIds=${ids}`));
+
+    expect(response.status).toBe(400);
+    expect(db.connect).not.toHaveBeenCalled();
+  });
+
+  it('only reads the counts, never creating or backfilling them', async () => {
+    countRows = [counts('g1', 3, 1)];
+    distinctUsers = 2;
+
+    await GET();
+
+    const sqls = queries();
+    expect(sqls.some((sql: string) => /CREATE|LOCK TABLE|DELETE|INSERT/.test(sql))).toBe(false);
+    expect(sqls.some((sql: string) => sql.includes('"GamePickCounts" c'))).toBe(true);
+  });
+
+  it('returns 500 when the database fails', async () => {
+    mockDbClient.query.mockRejectedValue(new Error('connection lost'));
+
+    const response = await GET();
+
+    expect(response.status).toBe(500);
+    expect(await response.json()).toEqual({ error: 'Failed to retrieve pick percentages' });
+    expect(mockDbClient.release).toHaveBeenCalled();
+  });
+});
+
+describe('installPickCounts (npm run db:setup)', () => {
+  it('installs the triggers and recounts every game while pick writes wait', async () => {
+    const client: any = { query: jest.fn().mockResolvedValue({ rows: [] }) };
+
+    await installPickCounts(client);
+
+    const sqls = client.query.mock.calls.map(([sql]: [string]) => sql);
+    expect(sqls[0]).toBe('BEGIN');
+    expect(sqls[1]).toBe('LOCK TABLE "Pick" IN SHARE ROW EXCLUSIVE MODE');
+    expect(sqls[2]).toContain('CREATE TRIGGER game_pick_counts_update');
+    expect(sqls[3]).toContain('DELETE FROM "GamePickCounts"');
+    expect(sqls[4]).toBe('COMMIT');
+  });
+
+  it('rolls back when the recount fails', async () => {
+    const client: any = {
+      query: jest.fn(async (sql: string) => {
+        if (sql.includes('DELETE FROM "GamePickCounts"')) throw new Error('permission denied');
+        return { rows: [] };
+      }),
+    };
+
+    await expect(installPickCounts(client)).rejects.toThrow('permission denied');
+    expect(client.query).toHaveBeenLastCalledWith('ROLLBACK');
+  });
+});
@@ -0,0 +1,38 @@
+import { sql } from '@/lib/dbPool/dbPool';
+import { GET as getUsers } from '../../src/app/users/route';
+import { GET as getAdmins } from '../../src/app/admins/route';
+
+jest.mock('@/lib/dbPool/dbPool', () => ({
+  sql: jest.fn(),
+}));
+
+describe('/users and /admins lookups', () => {
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('looks a user up by username through the shared pool', async () => {
+    (sql as jest.Mock).mockResolvedValue({ rows: [{ user_id: 1, username: 'John' }] });
+
+    const res = await getUsers(new Request('http://localhost/users?username=John'));
+
+    expect(res.status).toBe(200);
+    expect(await res.json()).toEqual([{ user_id: 1, username: 'John' }]);
+    expect((sql as jest.Mock).mock.calls[0][0].join('$')).toBe('SELECT * FROM Users WHERE username = $');
+    expect((sql as jest.Mock).mock.calls[0][1]).toBe('John');
+  });
+
+  it('looks an admin up by admin_id and reports database errors', async () => {
+    (sql as jest.Mock).mockResolvedValueOnce({ rows: [{ admin_id: 3 }] });
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    const ok = await getAdmins(new Request('http://localhost/admins?admin_id=3'));
+    expect(await ok.json()).toEqual([{ admin_id: 3 }]);
+    expect((sql as jest.Mock).mock.calls[0][1]).toBe('3');
+
+    (sql as jest.Mock).mockRejectedValueOnce(new Error('boom'));
+    const failed = await getAdmins(new Request('http://localhost/admins?admin_id=3'));
+    expect(failed.status).toBe(500);
+    expect(await failed.json()).toEqual({ error: 'Database error' });
+  });
+});
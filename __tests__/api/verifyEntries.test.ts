@@ -0,0 +1,71 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { db } from '@/lib/dbPool/dbPool';
+import { POST } from '../../src/app/api/leaderboard-entries/verifyEntries/route';
+
+jest.mock('@/lib/dbPool/dbPool', () => ({
+  db: {
+    connect: jest.fn(),
+  },
+}));
+
+const post = (body: object) =>
+  new Request('http://localhost/api/leaderboard-entries/verifyEntries', {
+    method: 'POST',
+    body: JSON.stringify(body),
+  });
+
+describe('POST /api/leaderboard-entries/verifyEntries', () => {
+  let mockDbClient: any;
+
+  beforeEach(() => {
+    mockDbClient = {
+      query: jest.fn(),
+      release: jest.fn(),
+    };
+    (db.connect as jest.Mock).mockResolvedValue(mockDbClient);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('returns 400 when sport or week is missing', async () => {
+    const response = await POST(post({ sport: 'NBA' }));
+    expect(response.status).toBe(400);
+    expect(mockDbClient.query).not.toHaveBeenCalled();
+    expect(mockDbClient.release).toHaveBeenCalled();
+  });
+
+  it('returns 404 when the week has no leaderboard', async () => {
+    mockDbClient.query.mockResolvedValueOnce({ rows: [] });
+
+    const response = await POST(post({ sport: 'NBA', week: 12 }));
+    expect(response.status).toBe(404);
+  });
+
+  it('creates every missing entry with a single insert', async () => {
+    mockDbClient.query
+      .mockResolvedValueOnce({ rows: [{ leaderboard_id: 7 }] })
+      .mockResolvedValueOnce({ rows: [{ pickers: 1500, created: 1200 }] });
+
+    const response = await POST(post({ sport: 'NBA', week: 12 }));
+    const json = await response.json();
+
+    expect(response.status).toBe(201);
+    expect(json).toMatchObject({ success: true, leaderboard_id: 7, pickers: 1500, created: 1200 });
+    expect(mockDbClient.query).toHaveBeenCalledTimes(2);
+
+    const [insertSql, params] = mockDbClient.query.mock.calls[1];
+    expect(insertSql).toContain('ON CONFLICT (user_id, leaderboard_id) DO NOTHING');
+    expect(params).toEqual(['NBA', 7, null]);
+  });
+
+  it('limits the insert to the given clerk ids', async () => {
+    mockDbClient.query
+      .mockResolvedValueOnce({ rows: [{ leaderboard_id: 7 }] })
+      .mockResolvedValueOnce({ rows: [{ pickers: 2, created: 2 }] });
+
+    await POST(post({ sport: 'NBA', week: 12, clerk_ids: ['user_a', 'user_b'] }));
+    expect(mockDbClient.query.mock.calls[1][1]).toEqual(['NBA', 7, ['user_a', 'user_b']]);
+  });
+});
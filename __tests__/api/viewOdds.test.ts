@@ -1,4 +1,5 @@
 import { GET } from '@/app/api/odds/route';
+import { clearEspnCache } from '@/lib/espnCache/espnCache';
 
 // Mock fetch globally
 global.fetch = jest.fn();
@@ -7,6 +8,7 @@ describe('GET /api/odds', () => {
   beforeEach(() => {
     // Reset all mocks before each test
     jest.clearAllMocks();
+    clearEspnCache();
     // Reset process.env
     process.env.ODDS_API_KEY = 'test-api-key';
   });
@@ -0,0 +1,197 @@
+"""Benchmark history, baselines and regression gating shared by the perf suites.
+
+Every benchmark reduces a run to a flat {metric: number} dict, e.g.
+  {"/daily-picks.lcp_ms": 812.4, "/daily-picks.api./api/all-espn-games.ms": 143.0}
+and then:
+  append_history()  adds the run to a JSON-lines history file (one run per line)
+  compare()         checks it against the stored baseline with per-metric thresholds
+  save_baseline()   promotes a run to the new baseline
+
+Inspect a history file with:
+  python __tests__/perf/benchstore.py __tests__/perf/results/web-vitals.jsonl --metric "*.lcp_ms" --last 10
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+RESULTS_DIR = Path(os.environ.get("BENCHMARK_RESULTS_DIR") or Path(__file__).resolve().parent / "results")
+BASELINES_DIR = Path(os.environ.get("BENCHMARK_BASELINES_DIR") or Path(__file__).resolve().parent / "baselines")
+
+
+class Threshold:
+    """How far a metric may drift from its baseline before it counts as a regression.
+
+    A value regresses when it is worse than the baseline by more than `relative`
+    (a fraction of the baseline) AND by more than `absolute` (in the metric's unit),
+    so tiny metrics don't flap on noise and large ones still catch real slowdowns.
+    """
+
+    def __init__(self, relative=0.2, absolute=0.0, higher_is_better=False):
+        self.relative = relative
+        self.absolute = absolute
+        self.higher_is_better = higher_is_better
+
+    def limit(self, baseline):
+        slack = max(abs(baseline) * self.relative, self.absolute)
+        return baseline - slack if self.higher_is_better else baseline + slack
+
+    def regressed(self, baseline, value):
+        limit = self.limit(baseline)
+        return value < limit if self.higher_is_better else value > limit
+
+
+DEFAULT_THRESHOLD = Threshold()
+
+
+def threshold_for(thresholds, metric):
+    """First threshold whose fnmatch pattern matches `metric`; `thresholds` is an ordered dict.
+
+    A pattern mapped to None records matching metrics without gating them.
+    """
+    for pattern, threshold in (thresholds or {}).items():
+        if fnmatch.fnmatchcase(metric, pattern):
+            return threshold
+    return DEFAULT_THRESHOLD
+
+
+class Regression:
+    def __init__(self, metric, baseline, value, limit):
+        self.metric = metric
+        self.baseline = baseline
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        change = (self.value - self.baseline) / self.baseline * 100 if self.baseline else float("inf")
+        return (f"{self.metric}: {self.value:.2f} vs baseline {self.baseline:.2f} "
+                f"({change:+.1f}%, limit {self.limit:.2f})")
+
+
+def compare(metrics, baseline, thresholds=None):
+    """Regressions of `metrics` against `baseline`; metrics missing from either side are ignored."""
+    regressions = []
+    for metric, value in sorted(metrics.items()):
+        base = baseline.get(metric)
+        if base is None or value is None:
+            continue
+        threshold = threshold_for(thresholds, metric)
+        if threshold is not None and threshold.regressed(base, value):
+            regressions.append(Regression(metric, base, value, threshold.limit(base)))
+    return regressions
+
+
+def median_metrics(runs):
+    """Per-metric median across repeated runs, ignoring runs where a metric was missing."""
+    keys = sorted({key for run in runs for key in run})
+    merged = {}
+    for key in keys:
+        values = [run[key] for run in runs if run.get(key) is not None]
+        if values:
+            merged[key] = round(statistics.median(values), 3)
+    return merged
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              timeout=5, cwd=Path(__file__).resolve().parent).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def append_history(path, suite, metrics, extra=None):
+    entry = {
+        "suite": suite,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": os.environ.get("GIT_COMMIT") or git_commit(),
+        "host": platform.node(),
+        "metrics": metrics,
+    }
+    if extra:
+        entry.update(extra)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+    return entry
+
+
+def load_history(path, suite=None):
+    path = Path(path)
+    if not path.exists():
+        return []
+    entries = [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+    return [e for e in entries if suite is None or e.get("suite") == suite]
+
+
+def load_baseline(path):
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text()).get("metrics")
+
+
+def save_baseline(path, suite, metrics):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "suite": suite,
+        "commit": os.environ.get("GIT_COMMIT") or git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "metrics": metrics,
+    }, indent=2, sort_keys=True) + "\n")
+
+
+def gate(suite, metrics, baseline_path, history_path=None, thresholds=None, update=False, scope=None):
+    """Record a run and check it against the baseline; returns the list of regressions.
+
+    `scope` is a metric-name prefix when several tests share one baseline file (one
+    per page, say): only that part of the baseline is compared or replaced. With no
+    baseline yet for the scope (or `update`), the run becomes the baseline and nothing fails.
+    """
+    if history_path:
+        append_history(history_path, suite, metrics, extra={"scope": scope} if scope else None)
+    baseline = load_baseline(baseline_path) or {}
+    in_scope = {k: v for k, v in baseline.items() if scope is None or k.startswith(scope)}
+    if not in_scope or update:
+        kept = {k: v for k, v in baseline.items() if k not in in_scope}
+        save_baseline(baseline_path, suite, {**kept, **metrics})
+        return []
+    return compare(metrics, in_scope, thresholds)
+
+
+def format_history(entries, pattern="*", last=10):
+    entries = entries[-last:]
+    metrics = sorted({k for e in entries for k in e["metrics"] if fnmatch.fnmatchcase(k, pattern)})
+    if not metrics:
+        return "no matching metrics"
+    width = max(len(m) for m in metrics)
+    header = f"{'metric':<{width}} " + " ".join(f"{(e.get('commit') or '?')[:9]:>10}" for e in entries)
+    lines = [header, "-" * len(header)]
+    for metric in metrics:
+        cells = []
+        for e in entries:
+            value = e["metrics"].get(metric)
+            cells.append(f"{'-':>10}" if value is None else f"{value:>10.1f}")
+        lines.append(f"{metric:<{width}} " + " ".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show benchmark history")
+    parser.add_argument("history", help="JSON-lines history file")
+    parser.add_argument("--suite")
+    parser.add_argument("--metric", default="*", help="fnmatch pattern, e.g. '*.lcp_ms'")
+    parser.add_argument("--last", type=int, default=10)
+    args = parser.parse_args()
+    print(format_history(load_history(args.history, args.suite), args.metric, args.last))
+
+
+if __name__ == "__main__":
+    main()
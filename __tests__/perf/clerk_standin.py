@@ -0,0 +1,199 @@
+"""Local stand-in for Clerk: session tokens for synthetic users plus the Backend API bits the app reads.
+
+The app authenticates API calls with getAuth()/auth() from @clerk/nextjs, which accepts a
+session token in `Authorization: Bearer <jwt>` and verifies its RS256 signature either
+against CLERK_JWT_KEY (no network) or the JWKS at {CLERK_API_URL}/v1/jwks. This stand-in
+owns a signing key, so it can mint a valid session for any synthetic user:
+
+  python __tests__/perf/clerk_standin.py --port 4020 --users 5000
+  # prints the env for the app, e.g.
+  CLERK_API_URL=http://127.0.0.1:4020 CLERK_JWT_KEY="..." CLERK_SECRET_KEY=sk_test_standin npm start
+
+Endpoints:
+  GET /v1/jwks                      public signing key (networked verification)
+  GET /v1/users[?limit&offset]      synthetic users, shaped like Clerk's user objects
+  GET /v1/users/{id}
+  GET /__clerk/identities?count=N[&offset=0]
+                                    [{user_id, headers}] with a fresh session token each,
+                                    the --identities format of loadgen.py
+  POST /__clerk/users {"count": N}  resize the directory, e.g. between benchmark sizes
+
+Users are seed_db.clerk_id(1..N), so they line up with a database seeded by seed_db.py.
+Needs `pip install cryptography`. The key is kept in --key (created on first run) so the
+app's CLERK_JWT_KEY stays valid across restarts.
+"""
+import argparse
+import base64
+import json
+import time
+import urllib.request
+import uuid
+from pathlib import Path
+
+from seed_db import SEED_CLERK_PREFIX, clerk_id
+from standin import Response, Standin
+
+DEFAULT_KEY = Path(__file__).resolve().parent / "results" / "clerk-standin-key.pem"
+ISSUER = "https://clerk.standin.localhost"
+SECRET_KEY = "sk_test_standin"
+KEY_ID = "ins_standin"
+# Long-lived so one batch of identities lasts a whole benchmark (real Clerk tokens live 60s)
+TOKEN_TTL = 24 * 3600
+
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _int_b64url(value):
+    return _b64url(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+def load_or_create_key(path):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    path = Path(path)
+    if path.exists():
+        return serialization.load_pem_private_key(path.read_bytes(), password=None)
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                       serialization.NoEncryption()))
+    return key
+
+
+def publishable_key(frontend_api=ISSUER):
+    """pk_test_ key the Clerk SDK accepts; it only encodes the frontend API host."""
+    host = frontend_api.split("://", 1)[-1]
+    return "pk_test_" + base64.b64encode(f"{host}$".encode()).decode()
+
+
+class ClerkStandin(Standin):
+    def __init__(self, users=1000, key_path=DEFAULT_KEY, token_ttl=TOKEN_TTL, **kwargs):
+        super().__init__("clerk", **kwargs)
+        self.users = users
+        self.key = load_or_create_key(key_path)
+        self.token_ttl = token_ttl
+
+        self.route("GET", "/v1/jwks")(self.jwks)
+        self.route("GET", "/v1/users")(self.list_users)
+        self.route("GET", "/v1/users/(?P<user_id>[A-Za-z0-9_]+)")(self.get_user)
+        self.route("GET", "/__clerk/identities")(self.list_identities)
+        self.route("POST", "/__clerk/users")(self.set_users)
+
+    def public_key_pem(self):
+        from cryptography.hazmat.primitives import serialization
+
+        return self.key.public_key().public_bytes(serialization.Encoding.PEM,
+                                                  serialization.PublicFormat.SubjectPublicKeyInfo).decode()
+
+    def session_token(self, user_id, now=None):
+        """RS256 session JWT with the claims Clerk's verifyToken() checks."""
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        now = int(now if now is not None else time.time())
+        header = {"alg": "RS256", "kid": KEY_ID, "typ": "JWT"}
+        claims = {
+            "sub": user_id,
+            "sid": f"sess_{uuid.uuid4().hex}",
+            "iss": ISSUER,
+            "iat": now,
+            "nbf": now - 10,
+            "exp": now + self.token_ttl,
+        }
+        signing_input = f"{_b64url(json.dumps(header).encode())}.{_b64url(json.dumps(claims).encode())}"
+        signature = self.key.sign(signing_input.encode(), padding.PKCS1v15(), hashes.SHA256())
+        return f"{signing_input}.{_b64url(signature)}"
+
+    def identities(self, count, offset=0):
+        return [
+            {"user_id": user_id, "headers": {"Authorization": f"Bearer {self.session_token(user_id)}"}}
+            for user_id in (clerk_id(i) for i in range(offset + 1, offset + count + 1))
+        ]
+
+    def user(self, index):
+        return {
+            "object": "user",
+            "id": clerk_id(index),
+            "username": f"seed_user_{index}",
+            "first_name": f"Seed{index}",
+            "last_name": "User",
+            "email_addresses": [{"id": f"idn_seed_{index}", "email_address": f"seed_user_{index}@example.test"}],
+            "image_url": "",
+            "public_metadata": {},
+            "created_at": 1700000000000 + index,
+        }
+
+    def jwks(self, req):
+        numbers = self.key.public_key().public_numbers()
+        return {"keys": [{"kty": "RSA", "use": "sig", "alg": "RS256", "kid": KEY_ID,
+                          "n": _int_b64url(numbers.n), "e": _int_b64url(numbers.e)}]}
+
+    def list_users(self, req):
+        # Clerk caps pages at 500 (default 10)
+        limit = min(int(req.arg("limit", 10)), 500)
+        offset = int(req.arg("offset", 0))
+        return [self.user(i) for i in range(offset + 1, min(offset + limit, self.users) + 1)]
+
+    def get_user(self, req):
+        user_id = req.params["user_id"]
+        index = user_id[len(SEED_CLERK_PREFIX):]
+        if not user_id.startswith(SEED_CLERK_PREFIX) or not index.isdigit() or not 1 <= int(index) <= self.users:
+            return Response({"errors": [{"code": "resource_not_found", "message": "not found"}]}, status=404)
+        return self.user(int(index))
+
+    def list_identities(self, req):
+        return self.identities(int(req.arg("count", 1)), int(req.arg("offset", 0)))
+
+    def set_users(self, req):
+        self.users = int(req.json()["count"])
+        return {"users": self.users}
+
+
+def resize_directory(standin_url, count):
+    request = urllib.request.Request(f"{standin_url.rstrip('/')}/__clerk/users", method="POST",
+                                     data=json.dumps({"count": count}).encode(),
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return json.loads(response.read())
+
+
+def fetch_identities(standin_url, count, offset=0):
+    url = f"{standin_url.rstrip('/')}/__clerk/identities?count={count}&offset={offset}"
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return json.loads(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Clerk stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4020)
+    parser.add_argument("--users", type=int, default=1000, help="synthetic users (seed_db clerk ids 1..N)")
+    parser.add_argument("--key", default=str(DEFAULT_KEY), help="PEM signing key, created if missing")
+    parser.add_argument("--write-identities", type=int, default=0,
+                        help="write this many identities to --identities-out and exit instead of serving")
+    parser.add_argument("--identities-out", default="identities.json")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    standin = ClerkStandin(users=args.users, key_path=args.key, latency_ms=args.latency_ms,
+                           jitter_ms=args.jitter_ms)
+    if args.write_identities:
+        with open(args.identities_out, "w") as f:
+            json.dump(standin.identities(args.write_identities), f)
+        print(f"📝 {args.write_identities} identities written to {args.identities_out}")
+        return
+
+    jwt_key = standin.public_key_pem().replace("\n", "")
+    print("Run the app with:")
+    print(f"  CLERK_API_URL=http://{args.host}:{args.port} CLERK_SECRET_KEY={SECRET_KEY} \\")
+    print(f"  NEXT_PUBLIC_CLERK_PUBLISHABLE_KEY={publishable_key()} \\")
+    print(f"  CLERK_JWT_KEY=\"{jwt_key}\"")
+    standin.serve_forever(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Points cron benchmark: one run of /api/automated-updatePoints at growing picker counts.
+
+For each size the database is reseeded (seed_db.seed) with that many users picking the
+current week's games, and the week's leaderboard entries are deleted, so the cron has to
+create and score every entry itself, as if all of the week's results came in at once.
+The cron is then called once and timed end to end:
+
+  python __tests__/perf/cron_bench.py --sizes 1000,10000,100000 \\
+      --base-url http://localhost:3000 --dsn postgresql://localhost/tallysight
+
+Reported per size: users who picked this week, entries created, cron wall time and time
+per picker. The scaling table fits each metric to size^k like leaderboard_scale.py, so
+a per-user round trip shows up as k≈1 on seconds. Run it on the commit before a change
+to the cron to get the number to compare against.
+"""
+import argparse
+import json
+import os
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate
+from leaderboard_scale import format_scaling, timed_get
+from seed_db import SEED_CLERK_PREFIX, SeedConfig, check_local, seed, week_of
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_SPORTS = ["NBA", "NFL", "MLB", "NHL"]
+SUITE = "points-cron"
+
+THRESHOLDS = {
+    "*.pickers": None,
+    "*.entries_created": Threshold(relative=0, absolute=0),
+    "*.status": Threshold(relative=0, absolute=0),
+    "*.seconds": Threshold(relative=0.25, absolute=1),
+    "*.ms_per_picker": Threshold(relative=0.25, absolute=1),
+}
+
+# Same week the cron's verifyEntries uses: games from this Monday up to next Monday
+WEEK_STATE_SQL = """
+SELECT
+    (SELECT COUNT(DISTINCT p."userId")
+     FROM "Pick" p JOIN "Game" g ON g.id = p."gameId"
+     WHERE p.sport = ANY(%(sports)s)
+       AND g."gameDate" >= date_trunc('week', CURRENT_DATE)
+       AND g."gameDate" < date_trunc('week', CURRENT_DATE) + INTERVAL '7 days') AS pickers,
+    (SELECT COUNT(*)
+     FROM leaderboard_entries le JOIN leaderboards l ON l.leaderboard_id = le.leaderboard_id
+     WHERE l.sport = ANY(%(sports)s) AND l.week = %(week)s) AS entries
+"""
+
+DELETE_WEEK_ENTRIES_SQL = """
+DELETE FROM leaderboard_entries le
+USING leaderboards l, users u
+WHERE l.leaderboard_id = le.leaderboard_id AND u.user_id = le.user_id
+  AND l.sport = ANY(%(sports)s) AND l.week = %(week)s AND u.clerk_id LIKE %(prefix)s
+"""
+
+# The seeder scores every decided game; forgetting that makes the cron score the week again
+FORGET_WEEK_GAMES_SQL = """
+DELETE FROM leaderboard_scored_games s
+USING leaderboards l
+WHERE l.leaderboard_id = s.leaderboard_id AND l.sport = ANY(%(sports)s) AND l.week = %(week)s
+"""
+
+
+def week_state(dsn, sports, week):
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        pickers, entries = conn.execute(WEEK_STATE_SQL, {"sports": sports, "week": week}).fetchone()
+    return {"pickers": pickers, "entries": entries}
+
+
+def delete_week_entries(dsn, sports, week):
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        deleted = conn.execute(DELETE_WEEK_ENTRIES_SQL, {"sports": sports, "week": week,
+                                                         "prefix": f"{SEED_CLERK_PREFIX}%"}).rowcount
+        conn.execute(FORGET_WEEK_GAMES_SQL, {"sports": sports, "week": week})
+        conn.execute("ANALYZE leaderboard_entries")
+    return deleted
+
+
+def run_cron(base_url, read_state, timeout=1800):
+    """Call the cron once; `read_state()` returns {"pickers", "entries"} before and after."""
+    before = read_state()
+    response = timed_get(f"{base_url}/api/automated-updatePoints", timeout)
+    after = read_state()
+    seconds = response["total_ms"] / 1000
+    pickers = after["pickers"]
+    return {
+        "status": response["status"],
+        "pickers": pickers,
+        "entries_created": after["entries"] - before["entries"],
+        "seconds": round(seconds, 3),
+        "ms_per_picker": round(response["total_ms"] / pickers, 3) if pickers else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the points cron at growing numbers of weekly pickers")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES), help="seeded users per run")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--dsn", required=True, help="local Postgres the app under test reads")
+    parser.add_argument("--sports", default=",".join(DEFAULT_SPORTS))
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="parallel COPY connections for picks")
+    parser.add_argument("--keep-entries", action="store_true",
+                        help="leave the seeded entries in place (time a repeat run instead of a week's first)")
+    parser.add_argument("--timeout", type=float, default=1800)
+    parser.add_argument("--allow-remote", action="store_true")
+    parser.add_argument("--json", dest="json_path", help="write {size: metrics} to this file")
+    parser.add_argument("--gate", action="store_true", help="record history and fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    if not args.allow_remote:
+        check_local(args.dsn)
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    sports = [s.strip().upper() for s in args.sports.split(",") if s.strip()]
+    results = {}
+    for size in sizes:
+        config = SeedConfig(users=size, sports=sports)
+        week = week_of(config.today)
+        config.weeks = [week]
+        print(f"🌱 Seeding {size:,} users")
+        seed(args.dsn, config, truncate=True, jobs=args.jobs, log=lambda *_: None)
+        if not args.keep_entries:
+            delete_week_entries(args.dsn, sports, week)
+        print(f"⏱️  Running the points cron at {size:,}")
+        results[size] = run_cron(args.base_url.rstrip("/"), lambda: week_state(args.dsn, sports, week),
+                                 args.timeout)
+        r = results[size]
+        print(f"   {r['pickers']:,} pickers, {r['entries_created']:,} entries created in {r['seconds']:.1f}s "
+              f"(HTTP {r['status']})")
+
+    print(format_scaling(results))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.json_path}")
+
+    if args.gate or args.update_baseline:
+        metrics = {f"{size}.{name}": value for size, m in results.items() for name, value in m.items()}
+        regressions = gate(SUITE, metrics, BASELINES_DIR / f"{SUITE}.json", RESULTS_DIR / f"{SUITE}.jsonl",
+                           THRESHOLDS, update=args.update_baseline)
+        if regressions:
+            print("❌ Regressions:")
+            for regression in regressions:
+                print(f"   {regression}")
+            raise SystemExit(1)
+        print("✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
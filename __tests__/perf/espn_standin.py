@@ -0,0 +1,463 @@
+"""Local stand-in for the ESPN site API and The Odds API.
+
+Serves the endpoints the app calls (see src/app/api/all-espn-games/baseUrls.ts):
+  GET /apis/site/v2/sports/{sport}/{league}/scoreboard[?dates=YYYYMMDD or YYYYMMDD-YYYYMMDD[&limit=N]]
+  GET /apis/site/v2/sports/{sport}/{league}/scoreboard/events/{id}
+  GET /apis/site/v2/sports/{sport}/{league}/teams
+  GET /v4/sports/{sport_key}/odds/
+plus tiny placeholder logos under /logos/ so pages render without touching the network.
+
+Modes:
+  synthetic  deterministic generated slates (same league + date -> same games)
+  replay     serve recorded payloads from --fixtures, falling back to synthetic data
+  record     proxy to the real upstream and save every payload into --fixtures
+
+Point the app at it with:
+  python __tests__/perf/espn_standin.py --port 4010 --latency-ms 80
+  ESPN_API_BASE_URL=http://127.0.0.1:4010 ODDS_API_BASE_URL=http://127.0.0.1:4010 npm run dev
+"""
+import argparse
+import base64
+import json
+import random
+import urllib.request
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from standin import Response, Standin
+
+# League keys match BASE_URLS in src/app/api/all-espn-games/baseUrls.ts
+LEAGUES = {
+    "MLB": "baseball/mlb",
+    "NBA": "basketball/nba",
+    "NFL": "football/nfl",
+    "NHL": "hockey/nhl",
+    "MLS": "soccer/usa.1",
+    "EPL": "soccer/eng.1",
+    "LALIGA": "soccer/esp.1",
+    "BUNDESLIGA": "soccer/ger.1",
+    "SERIE_A": "soccer/ita.1",
+    "LIGUE_1": "soccer/fra.1",
+}
+LEAGUE_BY_PATH = {path: key for key, path in LEAGUES.items()}
+LEAGUE_INDEX = {key: i for i, key in enumerate(LEAGUES)}
+SOCCER = {"MLS", "EPL", "LALIGA", "BUNDESLIGA", "SERIE_A", "LIGUE_1"}
+
+ODDS_SPORT_KEYS = {
+    "basketball_nba": "NBA",
+    "americanfootball_nfl": "NFL",
+    "baseball_mlb": "MLB",
+    "icehockey_nhl": "NHL",
+}
+
+CITIES = [
+    ("Atlanta", "ATL"), ("Boston", "BOS"), ("Brooklyn", "BKN"), ("Charlotte", "CHA"),
+    ("Chicago", "CHI"), ("Cleveland", "CLE"), ("Dallas", "DAL"), ("Denver", "DEN"),
+    ("Detroit", "DET"), ("Houston", "HOU"), ("Indiana", "IND"), ("Kansas City", "KC"),
+    ("Las Vegas", "LV"), ("Memphis", "MEM"), ("Miami", "MIA"), ("Milwaukee", "MIL"),
+    ("Minnesota", "MIN"), ("Nashville", "NSH"), ("New Orleans", "NO"), ("Oakland", "OAK"),
+    ("Orlando", "ORL"), ("Philadelphia", "PHI"), ("Phoenix", "PHX"), ("Pittsburgh", "PIT"),
+    ("Portland", "POR"), ("Sacramento", "SAC"), ("San Diego", "SD"), ("Seattle", "SEA"),
+    ("St. Louis", "STL"), ("Tampa Bay", "TB"), ("Toronto", "TOR"), ("Utah", "UTA"),
+]
+NICKNAMES = [
+    "Comets", "Foxes", "Harbors", "Ironmen", "Jaguars", "Knights", "Lynx", "Mariners",
+    "Monarchs", "Nighthawks", "Outlaws", "Pioneers", "Quakes", "Rangers", "Rockets", "Sentinels",
+    "Stallions", "Storm", "Thunderbirds", "Titans", "Vipers", "Voyagers", "Wolves", "Zephyrs",
+    "Anchors", "Bison", "Cyclones", "Dragons", "Eagles", "Falcons", "Giants", "Hornets",
+]
+
+# 1x1 transparent PNG served for every logo
+LOGO_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent / "fixtures" / "espn"
+
+
+def today_str():
+    return datetime.now(timezone.utc).astimezone().strftime("%Y%m%d")
+
+
+def parse_date(value):
+    return datetime.strptime(value, "%Y%m%d").date()
+
+
+def date_range(value):
+    """The days of a scoreboard `dates` value: YYYYMMDD or a YYYYMMDD-YYYYMMDD range."""
+    first, _, last = value.partition("-")
+    start, end = parse_date(first), parse_date(last or first)
+    return [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range((end - start).days + 1)]
+
+
+# Synthetic data
+
+def league_teams(league):
+    count = 20 if league in SOCCER else 30
+    offset = LEAGUE_INDEX[league] * 3
+    teams = []
+    for i in range(count):
+        city, abbreviation = CITIES[i]
+        nickname = NICKNAMES[(i + offset) % len(NICKNAMES)]
+        teams.append({
+            "id": str(LEAGUE_INDEX[league] * 100 + i + 1),
+            "name": nickname,
+            "displayName": f"{city} {nickname}",
+            "shortDisplayName": nickname,
+            "abbreviation": abbreviation,
+            "location": city,
+        })
+    return teams
+
+
+def _logo(base_url, league, team):
+    return f"{base_url}/logos/{league.lower()}/{team['abbreviation'].lower()}.png"
+
+
+def _event_id(league, day, index):
+    return f"{day}{LEAGUE_INDEX[league]:02d}{index:02d}"
+
+
+def slate_size(league, day, games):
+    if games is not None:
+        return games
+    rng = random.Random(f"size:{league}:{day}")
+    return rng.randint(2, 8) if league in SOCCER else rng.randint(4, 12)
+
+
+def synthetic_event(league, day, index, base_url, now=None):
+    now = now or datetime.now(timezone.utc)
+    rng = random.Random(f"event:{league}:{day}:{index}")
+    teams = league_teams(league)
+    home, away = rng.sample(teams, 2)
+
+    start = datetime.combine(parse_date(day), datetime.min.time(), tzinfo=timezone.utc)
+    start += timedelta(hours=23, minutes=30 * index)
+
+    if now >= start + timedelta(hours=3):
+        status = {"name": "STATUS_FULL_TIME" if league in SOCCER else "STATUS_FINAL",
+                  "state": "post", "completed": True}
+    elif now >= start:
+        status = {"name": "STATUS_IN_PROGRESS", "state": "in", "completed": False}
+    else:
+        status = {"name": "STATUS_SCHEDULED", "state": "pre", "completed": False}
+
+    scoring = {"NBA": (90, 130), "NFL": (3, 42), "MLB": (0, 11), "NHL": (0, 7)}.get(league, (0, 4))
+    started = status["state"] != "pre"
+    home_score = rng.randint(*scoring) if started else 0
+    away_score = rng.randint(*scoring) if started else 0
+    if status["completed"] and league not in SOCCER and home_score == away_score:
+        home_score += 1
+
+    home_favorite = rng.random() < 0.55
+    favorite = home if home_favorite else away
+    spread = {"NBA": rng.choice([1.5, 2.5, 3.5, 4.5, 6.5, 8.5, 11.5]),
+              "NFL": rng.choice([1.5, 2.5, 3, 3.5, 6.5, 7, 9.5]),
+              "MLB": 1.5, "NHL": 1.5}.get(league, 0.5)
+
+    def competitor(team, home_away, score, winner):
+        wins, losses = rng.randint(0, 60), rng.randint(0, 60)
+        return {
+            "id": team["id"],
+            "homeAway": home_away,
+            "winner": winner,
+            "score": str(score),
+            "form": "".join(rng.choice("WDL") for _ in range(5)) if league in SOCCER else "",
+            "records": [{"name": "overall", "summary": f"{wins}-{losses}"}],
+            "stats": [{"name": "rank", "value": str(rng.randint(1, len(teams)))}],
+            "team": {**team, "logo": _logo(base_url, league, team)},
+        }
+
+    competition_status = {"type": status, "period": 4 if status["completed"] else (2 if started else 0),
+                          "displayClock": "0:00" if status["state"] != "in" else "5:32"}
+    return {
+        "id": _event_id(league, day, index),
+        "date": start.strftime("%Y-%m-%dT%H:%MZ"),
+        "name": f"{away['displayName']} at {home['displayName']}",
+        "shortName": f"{away['abbreviation']} @ {home['abbreviation']}",
+        "status": competition_status,
+        "competitions": [{
+            "id": _event_id(league, day, index),
+            "date": start.strftime("%Y-%m-%dT%H:%MZ"),
+            "venue": {"fullName": f"{home['location']} Arena", "address": {"city": home["location"], "state": ""}},
+            "broadcasts": [{"market": "national", "names": [rng.choice(["ESPN", "ABC", "TNT", "FOX", "Peacock"])]}],
+            "status": competition_status,
+            "competitors": [
+                competitor(home, "home", home_score, status["completed"] and home_score > away_score),
+                competitor(away, "away", away_score, status["completed"] and away_score > home_score),
+            ],
+            "odds": [] if league in SOCCER else [{
+                "provider": {"name": "Stand-in"},
+                "details": f"{favorite['abbreviation']} -{spread}",
+                "spread": -spread if home_favorite else spread,
+                "overUnder": float(scoring[1]),
+                "homeTeamOdds": {"favorite": home_favorite, "underdog": not home_favorite},
+                "awayTeamOdds": {"favorite": not home_favorite, "underdog": home_favorite},
+            }],
+        }],
+    }
+
+
+def synthetic_scoreboard(league, day, base_url, games=None):
+    return {
+        "leagues": [{"abbreviation": league}],
+        "day": {"date": parse_date(day).isoformat()},
+        "events": [synthetic_event(league, day, i, base_url) for i in range(slate_size(league, day, games))],
+    }
+
+
+def synthetic_teams(league, base_url):
+    teams = [{"team": {**team, "logos": [{"href": _logo(base_url, league, team)}]}}
+             for team in league_teams(league)]
+    return {"sports": [{"leagues": [{"abbreviation": league, "teams": teams}]}]}
+
+
+def synthetic_odds(league, base_url, games=None, days=7):
+    events = []
+    start = date.today()
+    for offset in range(days):
+        day = (start + timedelta(days=offset)).strftime("%Y%m%d")
+        for event in synthetic_scoreboard(league, day, base_url, games)["events"]:
+            competitors = event["competitions"][0]["competitors"]
+            home = next(c for c in competitors if c["homeAway"] == "home")
+            away = next(c for c in competitors if c["homeAway"] == "away")
+            odds = event["competitions"][0]["odds"][0]
+            home_point = odds["spread"]
+            events.append({
+                "id": f"standin-{event['id']}",
+                "sport_key": next(k for k, v in ODDS_SPORT_KEYS.items() if v == league),
+                "commence_time": event["date"].replace("Z", ":00Z"),
+                "home_team": home["team"]["displayName"],
+                "away_team": away["team"]["displayName"],
+                "bookmakers": [{
+                    "key": "fanduel",
+                    "title": "FanDuel",
+                    "markets": [{"key": "spreads", "outcomes": [
+                        {"name": home["team"]["displayName"], "price": -110, "point": home_point},
+                        {"name": away["team"]["displayName"], "price": -110, "point": -home_point},
+                    ]}],
+                }],
+            })
+    return events
+
+
+# Recorded payloads
+
+class FixtureStore:
+    """Recorded payloads on disk, laid out like the upstream URL space:
+
+        <root>/basketball/nba/scoreboard/20250412.json
+        <root>/basketball/nba/events/401705000.json
+        <root>/basketball/nba/teams.json
+        <root>/odds/basketball_nba.json
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def _file(self, *parts):
+        return self.root.joinpath(*parts[:-1], f"{parts[-1]}.json")
+
+    def load(self, *parts):
+        path = self._file(*parts)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def save(self, payload, *parts):
+        path = self._file(*parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=1))
+
+    def recorded_dates(self, league_path):
+        folder = self.root / league_path / "scoreboard"
+        if not folder.is_dir():
+            return []
+        return sorted(p.stem for p in folder.glob("*.json"))
+
+    def closest_scoreboard(self, league_path, day):
+        dates = self.recorded_dates(league_path)
+        if not dates:
+            return None
+        target = parse_date(day)
+        closest = min(dates, key=lambda d: (abs((parse_date(d) - target).days), d))
+        return self.load(league_path, "scoreboard", closest)
+
+
+class EspnStandin(Standin):
+    def __init__(self, mode="synthetic", fixtures=DEFAULT_FIXTURES, upstream="https://site.api.espn.com",
+                 odds_upstream="https://api.the-odds-api.com", games=None, strict=False, **kwargs):
+        super().__init__("espn", **kwargs)
+        if mode not in ("synthetic", "replay", "record"):
+            raise ValueError(f"Unknown mode: {mode}")
+        self.mode = mode
+        self.store = FixtureStore(fixtures)
+        self.upstream = upstream.rstrip("/")
+        self.odds_upstream = odds_upstream.rstrip("/")
+        self.games = games
+        self.strict = strict
+
+        sports = r"/apis/site/v2/sports/(?P<sport>[a-z]+)/(?P<league>[a-z0-9.]+)"
+        self.route("GET", f"{sports}/scoreboard")(self.scoreboard)
+        self.route("GET", rf"{sports}/scoreboard/events/(?P<event_id>\d+)")(self.event)
+        self.route("GET", f"{sports}/teams")(self.teams)
+        self.route("GET", r"/v4/sports/(?P<sport_key>[a-z_]+)/odds/?")(self.odds)
+        self.route("GET", r"/logos/(?P<league>[a-z0-9_]+)/(?P<name>[a-z0-9]+)\.png")(self.logo)
+
+    @staticmethod
+    def _base_url(req):
+        return f"http://{req.headers.get('Host', '127.0.0.1')}"
+
+    @staticmethod
+    def _league(req):
+        league_path = f"{req.params['sport']}/{req.params['league']}"
+        return league_path, LEAGUE_BY_PATH.get(league_path)
+
+    def _fetch_upstream(self, base, req):
+        query = "&".join(f"{k}={v}" for k, values in req.query.items() for v in values)
+        url = f"{base}{req.path}" + (f"?{query}" if query else "")
+        request = urllib.request.Request(url, headers={"Accept": "application/json"})
+        with urllib.request.urlopen(request, timeout=15) as response:
+            return json.loads(response.read())
+
+    def _not_found(self, what):
+        return Response({"code": 404, "message": f"{what} not recorded"}, status=404)
+
+    def scoreboard(self, req):
+        league_path, league = self._league(req)
+        dates = req.arg("dates") or today_str()
+
+        if self.mode == "record":
+            payload = self._fetch_upstream(self.upstream, req)
+            self.store.save(payload, league_path, "scoreboard", dates)
+            return payload
+
+        try:
+            days = date_range(dates)
+        except ValueError:
+            return Response({"code": 400, "message": f"Invalid dates: {dates}"}, status=400)
+        if len(days) > 1:
+            return self._range_scoreboard(req, league_path, league, dates, days)
+
+        day = days[0]
+        if self.mode == "replay":
+            payload = self.store.load(league_path, "scoreboard", day) or self.store.closest_scoreboard(league_path, day)
+            if payload is not None:
+                return payload
+            if self.strict or league is None:
+                return {"events": []}
+
+        if league is None:
+            return self._not_found(league_path)
+        return synthetic_scoreboard(league, day, self._base_url(req), self.games)
+
+    def _range_scoreboard(self, req, league_path, league, dates, days):
+        # A recorded range as it came, else the recorded (or synthetic) days it covers; no
+        # closest-day fallback here, it would repeat a day's events across the range
+        if self.mode == "replay":
+            payload = self.store.load(league_path, "scoreboard", dates)
+            if payload is not None:
+                return payload
+        if league is None and not (self.mode == "replay" and self.strict):
+            return self._not_found(league_path)
+
+        events = []
+        for day in days:
+            payload = self.store.load(league_path, "scoreboard", day) if self.mode == "replay" else None
+            if payload is None and not (self.mode == "replay" and self.strict):
+                payload = synthetic_scoreboard(league, day, self._base_url(req), self.games)
+            events.extend((payload or {}).get("events", []))
+        limit = req.arg("limit")
+        if limit is not None:
+            events = events[:int(limit)]
+        return {"leagues": [{"abbreviation": league}], "events": events}
+
+    def event(self, req):
+        league_path, league = self._league(req)
+        event_id = req.params["event_id"]
+
+        if self.mode == "record":
+            payload = self._fetch_upstream(self.upstream, req)
+            self.store.save(payload, league_path, "events", event_id)
+            return payload
+
+        if self.mode == "replay":
+            payload = self.store.load(league_path, "events", event_id)
+            if payload is not None:
+                return payload
+            if self.strict:
+                return self._not_found(f"event {event_id}")
+
+        # Synthetic ids are <YYYYMMDD><league index><game index>
+        if league is None or len(event_id) != 12 or int(event_id[8:10]) != LEAGUE_INDEX[league]:
+            return self._not_found(f"event {event_id}")
+        return synthetic_event(league, event_id[:8], int(event_id[10:]), self._base_url(req))
+
+    def teams(self, req):
+        league_path, league = self._league(req)
+
+        if self.mode == "record":
+            payload = self._fetch_upstream(self.upstream, req)
+            self.store.save(payload, league_path, "teams")
+            return payload
+
+        if self.mode == "replay":
+            payload = self.store.load(league_path, "teams")
+            if payload is not None:
+                return payload
+            if self.strict:
+                return self._not_found(f"{league_path} teams")
+
+        if league is None:
+            return self._not_found(league_path)
+        return synthetic_teams(league, self._base_url(req))
+
+    def odds(self, req):
+        sport_key = req.params["sport_key"]
+
+        if self.mode == "record":
+            payload = self._fetch_upstream(self.odds_upstream, req)
+            self.store.save(payload, "odds", sport_key)
+            return payload
+
+        if self.mode == "replay":
+            payload = self.store.load("odds", sport_key)
+            if payload is not None:
+                return payload
+            if self.strict:
+                return []
+
+        league = ODDS_SPORT_KEYS.get(sport_key)
+        if league is None:
+            return Response({"message": f"Unknown sport: {sport_key}"}, status=404)
+        return synthetic_odds(league, self._base_url(req), self.games)
+
+    def logo(self, req):
+        return Response(body=LOGO_PNG, content_type="image/png",
+                        headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ESPN / odds API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4010)
+    parser.add_argument("--mode", choices=["synthetic", "replay", "record"], default="synthetic")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="directory of recorded payloads")
+    parser.add_argument("--upstream", default="https://site.api.espn.com")
+    parser.add_argument("--odds-upstream", default="https://api.the-odds-api.com")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="+/- random spread around --latency-ms")
+    parser.add_argument("--games", type=int, default=None, help="fixed number of games per synthetic slate")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the latency jitter")
+    parser.add_argument("--strict", action="store_true", help="replay only recorded payloads, never synthesize")
+    args = parser.parse_args()
+
+    standin = EspnStandin(
+        mode=args.mode, fixtures=args.fixtures, upstream=args.upstream, odds_upstream=args.odds_upstream,
+        games=args.games, strict=args.strict, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, seed=args.seed,
+    )
+    standin.serve_forever(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
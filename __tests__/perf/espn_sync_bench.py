@@ -0,0 +1,326 @@
+"""ESPN sync benchmark: /api/admin/syncSportsRadarData over a recorded season.
+
+The sync hashes every completed ESPN event and only matches and writes the ones that
+changed since the last run (src/lib/espnSync/espnSync.ts). This replays a whole season
+through it and counts what it does:
+
+  python __tests__/perf/espn_sync_bench.py --dsn postgresql://localhost/tallysight \\
+      --base-url http://localhost:3000 --leagues NBA,NHL --season 20241022-20250413
+
+ESPN is served by an espn_standin.py replaying --fixtures on --standin-port, so start the
+app with ESPN_API_BASE_URL=http://127.0.0.1:4010. Fixtures are laid out the way the
+stand-in records them (<league path>/scoreboard/<YYYYMMDD>.json). Record a real season by
+fetching each day's scoreboard through `espn_standin.py --mode record`, or let this script
+fill the missing days with synthetic ones (in __tests__/perf/results/espn-season by
+default), so every run replays the same season.
+
+Every completed event gets a "Game" row like savePicks makes (home team first, East Coast
+date); --by-name of them are stored under another ID with short team names, so the sync
+has to match them by teams and day. Then the season is synced three times:
+  cold      the season's first sync: every game gets its result
+  repeat    nothing changed upstream: no writes at all
+  amended   --amend events get a corrected score
+Reported per run: events, unchanged, updated, not found, games and sync-state rows written,
+seconds and events per second. Games whose result differs from the payload afterwards are
+reported as mismatches and fail the run.
+"""
+import argparse
+import functools
+import json
+import random
+import re
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate
+from espn_standin import LEAGUES, EspnStandin, FixtureStore, date_range, synthetic_scoreboard
+from seed_db import EST, check_local
+
+ESPN_SYNC_TS = Path(__file__).resolve().parents[2] / "src/lib/espnSync/espnSync.ts"
+SUITE = "espn-sync"
+GAME_PREFIX = "espn_sync_bench_"
+DEFAULT_SEASON = "20241022-20250413"
+RUNS = ("cold", "repeat", "amended")
+
+THRESHOLDS = {
+    "*.events_per_sec": Threshold(relative=0.3, absolute=50, higher_is_better=True),
+    "*.seconds": Threshold(relative=0.3, absolute=0.5),
+    "repeat.writes": Threshold(relative=0, absolute=0),
+    "amended.writes": Threshold(relative=0, absolute=0),
+    "*.not_found": Threshold(relative=0, absolute=0),
+    "mismatches": Threshold(relative=0, absolute=0),
+    "*": None,
+}
+
+# savePicks' columns; results are cleared so the first sync has every game to write
+SEED_GAMES_SQL = """
+INSERT INTO "Game" (id, "team1Name", "team2Name", "gameDate", "gameTime", sport)
+SELECT * FROM unnest(%(ids)s::text[], %(team1)s::text[], %(team2)s::text[], %(dates)s::date[],
+                     %(times)s::time[], %(sports)s::text[])
+ON CONFLICT (id) DO UPDATE
+SET "team1Name" = EXCLUDED."team1Name", "team2Name" = EXCLUDED."team2Name", "gameDate" = EXCLUDED."gameDate",
+    "gameTime" = EXCLUDED."gameTime", sport = EXCLUDED.sport, winner = NULL, won = NULL, final_score = NULL
+"""
+
+CLEAR_STATE_SQL = "DELETE FROM espn_sync_state WHERE game_id = ANY(%(ids)s) OR game_id LIKE %(prefix)s"
+
+RESULTS_SQL = 'SELECT id, winner, final_score FROM "Game" WHERE id = ANY(%(ids)s)'
+
+
+@functools.lru_cache(maxsize=None)
+def app_sql(name):
+    """The body of `export const NAME = `...`;` in espnSync.ts, with $n made into %(pn)s."""
+    match = re.search(rf"export const {name} = `(.*?)`;", ESPN_SYNC_TS.read_text(), re.S)
+    if not match:
+        raise ValueError(f"{name} not found in {ESPN_SYNC_TS.name}")
+    body = match.group(1)
+    if not re.search(r"\$\d", body):
+        return body
+    return re.sub(r"\$(\d+)", r"%(p\1)s", body.replace("%", "%%"))
+
+
+def write_season(store, leagues, days, base_url="http://127.0.0.1:4010"):
+    """Fill the days `store` has no scoreboard for with synthetic ones; returns how many."""
+    written = 0
+    for league in leagues:
+        for day in days:
+            if store.load(LEAGUES[league], "scoreboard", day) is None:
+                store.save(synthetic_scoreboard(league, day, base_url), LEAGUES[league], "scoreboard", day)
+                written += 1
+    return written
+
+
+def _competitors(event):
+    competitors = event["competitions"][0]["competitors"]
+    home = next(c for c in competitors if c["homeAway"] == "home")
+    away = next(c for c in competitors if c["homeAway"] == "away")
+    return home, away
+
+
+def season_events(store, leagues, days):
+    """{league: completed events} of the recorded season, in day order."""
+    events = {}
+    for league in leagues:
+        events[league] = [
+            event
+            for day in days
+            for event in (store.load(LEAGUES[league], "scoreboard", day) or {}).get("events", [])
+            if event.get("status", {}).get("type", {}).get("completed")
+        ]
+    return events
+
+
+def expected_result(event):
+    """(winner, final_score) of a game stored home team first: winner is true when team2 won."""
+    home, away = _competitors(event)
+    return int(away["score"]) > int(home["score"]), f"{int(home['score'])}-{int(away['score'])}"
+
+
+def season_games(events, by_name=0.2, seed=7):
+    """"Game" rows for the season's events and, for each row, the event it belongs to."""
+    rng = random.Random(seed)
+    rows, owners = [], {}
+    for league, league_events in events.items():
+        for event in league_events:
+            home, away = _competitors(event)
+            start = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(EST)
+            if rng.random() < by_name:
+                game_id = f"{GAME_PREFIX}{event['id']}"
+                names = [c["team"].get("shortDisplayName") or c["team"]["displayName"] for c in (home, away)]
+            else:
+                game_id = event["id"]
+                names = [home["team"]["displayName"], away["team"]["displayName"]]
+            rows.append((game_id, names[0], names[1], start.date(), start.time(), league))
+            owners[game_id] = event
+    return rows, owners
+
+
+def seed_games(dsn, rows):
+    import psycopg
+
+    ids = [row[0] for row in rows]
+    with psycopg.connect(dsn) as conn:
+        conn.execute(app_sql("SYNC_STATE_SCHEMA_SQL"))
+        conn.execute(CLEAR_STATE_SQL, {"ids": ids, "prefix": f"{GAME_PREFIX}%"})
+        conn.execute(SEED_GAMES_SQL, {
+            "ids": ids,
+            "team1": [row[1] for row in rows],
+            "team2": [row[2] for row in rows],
+            "dates": [row[3] for row in rows],
+            "times": [row[4] for row in rows],
+            "sports": [row[5] for row in rows],
+        })
+        conn.execute('ANALYZE "Game"')
+
+
+def amend_scores(store, leagues, days, count, seed=11):
+    """Give one completed event on each of `count` days one more home point, in place.
+
+    Returns the scoreboards as they were, for restore_scoreboards.
+    """
+    rng = random.Random(seed)
+    slots = [(league, day) for league in leagues for day in days]
+    originals = {}
+    for league, day in rng.sample(slots, len(slots)):
+        if len(originals) >= count:
+            break
+        payload = store.load(LEAGUES[league], "scoreboard", day)
+        completed = [e for e in (payload or {}).get("events", []) if e["status"]["type"].get("completed")]
+        if not completed:
+            continue
+        originals[(league, day)] = json.loads(json.dumps(payload))
+        home, _ = _competitors(rng.choice(completed))
+        home["score"] = str(int(home["score"]) + 1)
+        store.save(payload, LEAGUES[league], "scoreboard", day)
+    return originals
+
+
+def restore_scoreboards(store, originals):
+    for (league, day), payload in originals.items():
+        store.save(payload, LEAGUES[league], "scoreboard", day)
+
+
+def mismatches(dsn, owners):
+    """Games whose winner or final score is not what their event says."""
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        rows = conn.execute(RESULTS_SQL, {"ids": list(owners)}).fetchall()
+    return sorted(game_id for game_id, winner, final_score in rows
+                  if (winner, final_score) != expected_result(owners[game_id]))
+
+
+def sync(base_url, body, timeout=1800):
+    """POST the sync once; returns its metrics."""
+    request = urllib.request.Request(f"{base_url}/api/admin/syncSportsRadarData", data=json.dumps(body).encode(),
+                                     headers={"Content-Type": "application/json"}, method="POST")
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status, payload = response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        status, payload = e.code, {}
+    seconds = time.perf_counter() - started
+
+    stats = payload.get("stats") or {}
+    writes = stats.get("writes") or {}
+    events = stats.get("events", 0)
+    return {
+        "status": status,
+        "events": events,
+        "unchanged": stats.get("unchanged", 0),
+        "updated": stats.get("updated", 0),
+        "not_found": stats.get("not_found", 0),
+        "game_writes": writes.get("games", 0),
+        "state_writes": writes.get("state", 0),
+        "writes": writes.get("games", 0) + writes.get("state", 0),
+        "seconds": round(seconds, 3),
+        "events_per_sec": round(events / seconds, 1) if seconds else 0.0,
+    }
+
+
+def run(base_url, dsn, store, leagues, season, by_name=0.2, amend=25, timeout=1800, log=print):
+    days = date_range(season)
+    body = {"dates": season, "sports": leagues}
+    events = season_events(store, leagues, days)
+    rows, _ = season_games(events, by_name)
+    log(f"🌱 Seeding {len(rows):,} games for {', '.join(leagues)} {season}")
+    seed_games(dsn, rows)
+
+    results = {}
+    originals = {}
+    try:
+        for name in RUNS:
+            if name == "amended":
+                originals = amend_scores(store, leagues, days, amend)
+            results[name] = r = sync(base_url, body, timeout)
+            log(f"   {name:<8} {r['events']:,} events, {r['unchanged']:,} unchanged, {r['updated']:,} updated, "
+                f"{r['not_found']:,} not found, {r['writes']:,} writes in {r['seconds']:.2f}s "
+                f"({r['events_per_sec']:,.0f} events/s, HTTP {r['status']})")
+        # Same seed, same rows: only the amended events' scores differ from the seeded ones
+        _, owners = season_games(season_events(store, leagues, days), by_name)
+    finally:
+        # Leave the recorded season as it was
+        restore_scoreboards(store, originals)
+    results["games"] = len(rows)
+    results["mismatches"] = len(mismatches(dsn, owners))
+    return results
+
+
+def flatten(results):
+    metrics = {}
+    for name, value in results.items():
+        if isinstance(value, dict):
+            metrics.update({f"{name}.{metric}": v for metric, v in value.items()})
+        else:
+            metrics[name] = value
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the incremental ESPN sync over a recorded season")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--dsn", required=True, help="local Postgres the app under test reads")
+    parser.add_argument("--leagues", default="NBA", help="comma-separated sport keys")
+    parser.add_argument("--season", default=DEFAULT_SEASON, help="YYYYMMDD-YYYYMMDD")
+    parser.add_argument("--fixtures", default=str(RESULTS_DIR / "espn-season"), help="recorded season payloads")
+    parser.add_argument("--standin-port", type=int, default=4010, help="where the app's ESPN_API_BASE_URL points")
+    parser.add_argument("--by-name", type=float, default=0.2, help="share of games the sync must match by teams")
+    parser.add_argument("--amend", type=int, default=25, help="events corrected before the last run")
+    parser.add_argument("--timeout", type=float, default=1800)
+    parser.add_argument("--allow-remote", action="store_true")
+    parser.add_argument("--json", dest="json_path", help="write the results to this file")
+    parser.add_argument("--gate", action="store_true", help="record history and fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    if not args.allow_remote:
+        check_local(args.dsn)
+    leagues = [league.strip().upper() for league in args.leagues.split(",") if league.strip()]
+    unknown = [league for league in leagues if league not in LEAGUES]
+    if unknown:
+        parser.error(f"unknown leagues: {', '.join(unknown)}")
+
+    store = FixtureStore(args.fixtures)
+    written = write_season(store, leagues, date_range(args.season), f"http://127.0.0.1:{args.standin_port}")
+    if written:
+        print(f"📼 Wrote {written:,} synthetic scoreboards to {args.fixtures}")
+
+    server, standin_url = EspnStandin(mode="replay", fixtures=args.fixtures, strict=True).start(port=args.standin_port)
+    print(f"🟢 ESPN stand-in replaying {args.fixtures} on {standin_url}")
+    try:
+        results = run(args.base_url.rstrip("/"), args.dsn, store, leagues, args.season, args.by_name, args.amend,
+                      args.timeout)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"   {results['mismatches']} of {results['games']:,} games differ from the payload")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.json_path}")
+
+    failed = results["mismatches"] > 0 or results["repeat"]["writes"] > 0
+    if args.gate or args.update_baseline:
+        regressions = gate(SUITE, flatten(results), BASELINES_DIR / f"{SUITE}.json", RESULTS_DIR / f"{SUITE}.jsonl",
+                           THRESHOLDS, update=args.update_baseline)
+        if regressions:
+            print("❌ Regressions:")
+            for regression in regressions:
+                print(f"   {regression}")
+            failed = True
+        else:
+            print("✅ No regressions against the baseline")
+
+    if failed:
+        raise SystemExit(1)
+    print("✅ The repeat run wrote nothing and every game matches the season's payload")
+
+
+if __name__ == "__main__":
+    main()
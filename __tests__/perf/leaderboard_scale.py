@@ -0,0 +1,215 @@
+"""Leaderboard scale benchmark: how the leaderboard routes grow with the number of entries.
+
+For each size the database is reseeded with that many users, each holding an entry in
+the current week's leaderboard (seed_db.seed_leaderboard), and every route that
+components/leaderboard.tsx and leaderboardProfiles.tsx call is timed:
+
+  python __tests__/perf/leaderboard_scale.py --sizes 1000,10000,100000,1000000 \\
+      --base-url http://localhost:3000 --dsn postgresql://localhost/tallysight
+
+Reported per route and size: time to first byte (server latency), total time, response
+size and row count, plus the URL size of a getMultiUserPoints call naming every user id.
+The whole-board routes are what the client used before it paged; the summed views (all
+sports in a week, one sport all time) still use them. The paginated routes the overall
+and per-sport boards now load (/api/leaderboard/page and /rank) are measured next to them:
+the first page, the page after it and the rank of the last user of the all-time board,
+which should all stay flat as the board grows. The last table fits each metric to size^k on a log-log scale, so
+k≈1 is O(n) growth and k≈0 is flat. The browser half (time to first row, scroll jank)
+is __tests__/selenium/benchmark/test_leaderboard_browser_scale.py.
+"""
+import argparse
+import json
+import math
+import statistics
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate
+from seed_db import SeedConfig, seed_leaderboard, week_of
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+PAGE_SIZE = 50
+SUITE = "leaderboard-scale"
+
+THRESHOLDS = {
+    "*.rows": None,
+    "*.status": Threshold(relative=0, absolute=0),
+    "*.kb": Threshold(relative=0.1, absolute=1),
+    "*_ms": Threshold(relative=0.25, absolute=50),
+}
+
+
+def leaderboard_routes(sport, week):
+    return {
+        # Default view: "All sports", all time
+        "all_time": "/api/leaderboard-entries/getEntriesForLeaderboard?sport=SELECT&week=0",
+        "all_sports_week": f"/api/leaderboard-entries/getEntriesForLeaderboard?sport=SELECT&week={week}",
+        "sport_week": f"/api/user/getSportPoints?sport={sport}&week={week}",
+        "sport_all_time": f"/api/user/getSportPoints?sport={sport}&week=0",
+        "users": "/api/user/getUsersLeaderboard",
+        "page_all_time": f"/api/leaderboard/page?sport=SELECT&week=0&limit={PAGE_SIZE}",
+        "page_sport_week": f"/api/leaderboard/page?sport={sport}&week={week}&limit={PAGE_SIZE}",
+    }
+
+
+def timed_get(url, timeout=300):
+    """GET `url`; urlopen returns once the headers are in, which is the server's latency."""
+    started = time.perf_counter()
+    try:
+        response = urllib.request.urlopen(url, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        response = e
+    ttfb = time.perf_counter() - started
+    body = response.read()
+    total = time.perf_counter() - started
+    return {"status": response.status, "ttfb_ms": ttfb * 1000, "total_ms": total * 1000, "body": body}
+
+
+def _rows(body):
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    rows = data.get("data") if isinstance(data, dict) else data
+    return rows if isinstance(rows, list) else None
+
+
+def measure_route(url, runs=3, timeout=300):
+    samples = [timed_get(url, timeout) for _ in range(runs)]
+    last = samples[-1]
+    rows = _rows(last["body"])
+    return {
+        "status": last["status"],
+        "ttfb_ms": round(statistics.median(s["ttfb_ms"] for s in samples), 2),
+        "total_ms": round(statistics.median(s["total_ms"] for s in samples), 2),
+        "kb": round(len(last["body"]) / 1024, 2),
+        "rows": len(rows) if rows is not None else 0,
+    }, rows
+
+
+def _next_cursor(url, timeout):
+    try:
+        return json.loads(timed_get(url, timeout)["body"]).get("nextCursor")
+    except (ValueError, AttributeError):
+        return None
+
+
+def measure_routes(base_url, sport, week, runs=3, timeout=300):
+    """Flat {route.metric: value} for every leaderboard route at the currently seeded size."""
+    metrics = {}
+    all_time_rows = []
+    next_cursor = None
+    for name, path in leaderboard_routes(sport, week).items():
+        result, rows = measure_route(f"{base_url}{path}", runs, timeout)
+        metrics.update({f"{name}.{k}": v for k, v in result.items()})
+        if name == "all_time":
+            all_time_rows = rows or []
+        if name == "page_all_time":
+            next_cursor = _next_cursor(f"{base_url}{path}", timeout)
+
+    paged = {}
+    if next_cursor:
+        paged["page_all_time_next"] = (f"/api/leaderboard/page?sport=SELECT&week=0&limit={PAGE_SIZE}"
+                                       f"&cursor={urllib.parse.quote(next_cursor)}")
+    # The lowest user has the most rows above them to count
+    if all_time_rows and "user_id" in all_time_rows[-1]:
+        paged["rank_last"] = f"/api/leaderboard/rank?sport=SELECT&week=0&user_id={all_time_rows[-1]['user_id']}"
+    for name, path in paged.items():
+        result, _ = measure_route(f"{base_url}{path}", runs, timeout)
+        metrics.update({f"{name}.{k}": v for k, v in result.items()})
+
+    # leaderboardProfiles.linkTotalPoints() sends every listed user id in the query string
+    ids = ",".join(str(row["user_id"]) for row in all_time_rows if "user_id" in row)
+    if ids:
+        path = f"/api/user/getMultiUserPoints?user_id={ids}"
+        metrics["multi_user_points.url_kb"] = round(len(path) / 1024, 2)
+        try:
+            result, _ = measure_route(f"{base_url}{path}", 1, timeout)
+        except (urllib.error.URLError, ConnectionError) as e:
+            result = {"status": 0, "error": str(e)}
+        metrics.update({f"multi_user_points.{k}": v for k, v in result.items() if k != "error"})
+    return metrics
+
+
+def scaling_exponents(results):
+    """Least-squares slope of log(metric) against log(size) for every metric with 2+ positive points."""
+    sizes = sorted(results)
+    metrics = sorted({m for size in sizes for m in results[size]})
+    exponents = {}
+    for metric in metrics:
+        points = [(math.log(size), math.log(results[size][metric])) for size in sizes
+                  if isinstance(results[size].get(metric), (int, float)) and results[size][metric] > 0]
+        if len(points) < 2:
+            continue
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        var = sum((x - mean_x) ** 2 for x, _ in points)
+        if var:
+            exponents[metric] = sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+    return exponents
+
+
+def format_scaling(results, exponents=None):
+    sizes = sorted(results)
+    exponents = exponents if exponents is not None else scaling_exponents(results)
+    metrics = sorted({m for size in sizes for m in results[size]})
+    width = max([len(m) for m in metrics] + [6])
+    header = f"{'metric':<{width}} " + " ".join(f"{size:>12,}" for size in sizes) + f" {'~size^k':>8}"
+    lines = [header, "-" * len(header)]
+    for metric in metrics:
+        cells = []
+        for size in sizes:
+            value = results[size].get(metric)
+            cells.append(f"{'-':>12}" if value is None else f"{value:>12,.1f}")
+        k = exponents.get(metric)
+        lines.append(f"{metric:<{width}} " + " ".join(cells) + (f" {k:>8.2f}" if k is not None else f" {'':>8}"))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure leaderboard routes at growing entry counts")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--dsn", required=True, help="local Postgres the app under test reads")
+    parser.add_argument("--sport", default="NBA")
+    parser.add_argument("--runs", type=int, default=3, help="requests per route and size (median)")
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--json", dest="json_path", help="write {size: metrics} to this file")
+    parser.add_argument("--gate", action="store_true", help="record history and fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    results = {}
+    for size in sizes:
+        config = SeedConfig(users=size, sports=[args.sport])
+        config.weeks = [week_of(config.today)]  # just the current week's leaderboard
+        print(f"🌱 Seeding {size:,} entries")
+        seed_leaderboard(args.dsn, config)
+        print(f"⏱️  Measuring routes at {size:,}")
+        results[size] = measure_routes(args.base_url.rstrip("/"), args.sport, config.weeks[0], args.runs,
+                                       args.timeout)
+
+    print(format_scaling(results))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.json_path}")
+
+    if args.gate or args.update_baseline:
+        metrics = {f"{size}.{name}": value for size, m in results.items() for name, value in m.items()}
+        regressions = gate(SUITE, metrics, BASELINES_DIR / f"{SUITE}.json", RESULTS_DIR / f"{SUITE}.jsonl",
+                           THRESHOLDS, update=args.update_baseline)
+        if regressions:
+            print("❌ Regressions:")
+            for regression in regressions:
+                print(f"   {regression}")
+            raise SystemExit(1)
+        print("✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""Asyncio HTTP load generator for the app's API routes.
+
+Drives many concurrent virtual users (VUs) through a scenario from scenarios.py and
+reports per-route latency percentiles, throughput and error rates, plus where the server
+spent that time when routes return Server-Timing headers (see server_timing.py):
+
+  python __tests__/perf/loadgen.py --scenario pick_deadline --users 2000 --duration 60 \\
+      --ramp-up 15 --base-url http://localhost:3000 --standin http://127.0.0.1:4010
+
+Needs aiohttp (pip install aiohttp). Run the app with `next start` pointed at the ESPN
+stand-in (ESPN_API_BASE_URL) and a local Postgres so results don't depend on upstream APIs,
+and with SERVER_TIMING=1 for the per-span breakdown.
+"""
+import argparse
+import asyncio
+import json
+import random
+import resource
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from server_timing import parse_server_timing
+
+
+def percentile(sorted_samples, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return None
+    rank = max(1, int(round(q / 100 * len(sorted_samples) + 0.5 - 1e-9)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class RouteStats:
+    def __init__(self):
+        self.samples = []
+        self.statuses = Counter()
+        self.errors = 0
+        self.bytes = 0
+        # Responses that carried a Server-Timing header, their client-side latency and
+        # per span name the duration reported in each of them
+        self.timed = 0
+        self.timed_ms = 0.0
+        self.spans = {}
+
+    def record(self, latency_ms, status, nbytes, ok, server_timing=None):
+        self.samples.append(latency_ms)
+        self.statuses[str(status)] += 1
+        self.bytes += nbytes
+        if not ok:
+            self.errors += 1
+        if server_timing:
+            self.timed += 1
+            self.timed_ms += latency_ms
+            for name, span in server_timing.items():
+                self.spans.setdefault(name, []).append(span["ms"])
+
+    def merge(self, other):
+        self.samples.extend(other.samples)
+        self.statuses.update(other.statuses)
+        self.errors += other.errors
+        self.bytes += other.bytes
+        self.timed += other.timed
+        self.timed_ms += other.timed_ms
+        for name, samples in other.spans.items():
+            self.spans.setdefault(name, []).extend(samples)
+
+    def server_timing(self):
+        """Per span: mean over the timed responses (0 where a response lacked it), p95 where
+        present, and its share of the client-side latency of those responses."""
+        spans = {}
+        for name, samples in self.spans.items():
+            samples = sorted(samples)
+            spans[name] = {
+                "count": len(samples),
+                "mean_ms": _round(sum(samples) / self.timed),
+                "p95_ms": _round(percentile(samples, 95)),
+                "share": round(sum(samples) / self.timed_ms, 4) if self.timed_ms else 0.0,
+            }
+        return dict(sorted(spans.items(), key=lambda item: (item[0] == "total", -item[1]["mean_ms"])))
+
+    def summary(self, duration):
+        samples = sorted(self.samples)
+        count = len(samples)
+        return {
+            "count": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "rps": round(count / duration, 2) if duration else 0.0,
+            "p50_ms": _round(percentile(samples, 50)),
+            "p95_ms": _round(percentile(samples, 95)),
+            "p99_ms": _round(percentile(samples, 99)),
+            "max_ms": _round(samples[-1] if samples else None),
+            "mean_ms": _round(sum(samples) / count if count else None),
+            "bytes": self.bytes,
+            "statuses": dict(self.statuses),
+            **({"server_timing": self.server_timing()} if self.timed else {}),
+        }
+
+
+def _round(value):
+    return None if value is None else round(value, 2)
+
+
+class LoadStats:
+    def __init__(self):
+        self.routes = {}
+        self.started = None
+        self.finished = None
+        self.iterations = 0
+
+    def route(self, label):
+        stats = self.routes.get(label)
+        if stats is None:
+            stats = self.routes[label] = RouteStats()
+        return stats
+
+    @property
+    def duration(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def report(self):
+        duration = self.duration
+        routes = {label: stats.summary(duration) for label, stats in sorted(self.routes.items())}
+        total = RouteStats()
+        for stats in self.routes.values():
+            total.merge(stats)
+        return {
+            "duration_s": round(duration, 2),
+            "iterations": self.iterations,
+            "total": total.summary(duration),
+            "routes": routes,
+        }
+
+
+def format_report(report):
+    header = f"{'route':<58} {'count':>7} {'rps':>8} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8}"
+    lines = [header, "-" * len(header)]
+    rows = list(report["routes"].items()) + [("TOTAL", report["total"])]
+    for label, s in rows:
+        lines.append(
+            f"{label[:58]:<58} {s['count']:>7} {s['rps']:>8} {s['error_rate'] * 100:>5.1f}% "
+            f"{_fmt(s['p50_ms'])} {_fmt(s['p95_ms'])} {_fmt(s['p99_ms'])}"
+        )
+    lines.append(f"duration {report['duration_s']}s, {report['iterations']} scenario iterations")
+    return "\n".join(lines)
+
+
+def format_server_timing(report):
+    """Where each route's time went on the server, from its Server-Timing spans."""
+    header = f"{'route':<58} {'span':<12} {'mean':>8} {'p95':>8} {'share':>6}"
+    lines = [header, "-" * len(header)]
+    for label, s in report["routes"].items():
+        for name, span in s.get("server_timing", {}).items():
+            lines.append(f"{label[:58]:<58} {name[:12]:<12} {_fmt(span['mean_ms'])} {_fmt(span['p95_ms'])} "
+                         f"{span['share'] * 100:>5.1f}%")
+            label = ""
+    return "\n".join(lines)
+
+
+def _fmt(value):
+    return f"{'-':>8}" if value is None else f"{value:>8.1f}"
+
+
+def default_label(method, path):
+    return f"{method} {urlsplit(path).path}"
+
+
+class VirtualUser:
+    """One simulated user. Scenarios issue requests through `request()` so they are timed."""
+
+    def __init__(self, index, session, base_url, stats, identity=None, seed=None, timeout=30, think_scale=1.0):
+        self.index = index
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.stats = stats
+        self.identity = identity
+        self.rng = random.Random(seed if seed is not None else index)
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.think_scale = think_scale
+
+    @property
+    def user_id(self):
+        return self.identity.get("user_id") if self.identity else None
+
+    async def request(self, method, path, label=None, json_body=None, headers=None, ok_statuses=()):
+        """Issue a timed request; returns (status, parsed JSON or text, response headers).
+
+        Statuses below 400 and anything in `ok_statuses` count as successes. Connection
+        failures and timeouts are recorded with status "error" and return (None, None, {}).
+        """
+        label = label or default_label(method, path)
+        request_headers = dict(self.identity.get("headers", {})) if self.identity else {}
+        request_headers.update(headers or {})
+
+        started = time.perf_counter()
+        try:
+            async with self.session.request(method, f"{self.base_url}{path}", json=json_body,
+                                            headers=request_headers, timeout=self.timeout) as response:
+                body = await response.read()
+                latency_ms = (time.perf_counter() - started) * 1000
+                ok = response.status < 400 or response.status in ok_statuses
+                server_timing = parse_server_timing(response.headers.get("Server-Timing"))
+                self.stats.route(label).record(latency_ms, response.status, len(body), ok, server_timing)
+                return response.status, _decode(body, response.content_type), dict(response.headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self.stats.route(label).record(latency_ms, f"error:{type(e).__name__}", 0, False)
+            return None, None, {}
+
+    async def think(self, low=0.0, high=0.0):
+        """Pause like a user reading the page; scaled by --think-scale (0 disables)."""
+        if high > 0 and self.think_scale > 0:
+            await asyncio.sleep(self.rng.uniform(low, high) * self.think_scale)
+
+
+def _decode(body, content_type):
+    if content_type == "application/json":
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+    return body.decode(errors="replace")
+
+
+def raise_fd_limit():
+    # Thousands of VUs need thousands of sockets
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        target = hard if hard != resource.RLIM_INFINITY else 65536
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass
+
+
+async def run_load(scenario, base_url, users, duration=None, iterations=None, ramp_up=0.0,
+                   connections=None, identities=None, timeout=30, think_time=(0.0, 0.0), think_scale=1.0,
+                   seed=0):
+    """Run `scenario(vu)` in a loop on `users` concurrent VUs.
+
+    Each VU stops after `iterations` runs or once `duration` seconds have passed since the
+    load started, whichever comes first. VUs start evenly spread across `ramp_up` seconds.
+    """
+    if duration is None and iterations is None:
+        iterations = 1
+
+    stats = LoadStats()
+    connector = aiohttp.TCPConnector(limit=connections or users, ttl_dns_cache=300)
+    # DummyCookieJar: cookies must not leak between VUs, identities carry their own
+    async with aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar()) as session:
+        stats.started = time.perf_counter()
+        deadline = stats.started + duration if duration else None
+
+        async def run_vu(index):
+            if ramp_up:
+                await asyncio.sleep(ramp_up * index / users)
+            identity = identities[index % len(identities)] if identities else None
+            vu = VirtualUser(index, session, base_url, stats, identity, seed=seed * 1_000_003 + index,
+                             timeout=timeout, think_scale=think_scale)
+            runs = 0
+            while (iterations is None or runs < iterations) and (deadline is None or time.perf_counter() < deadline):
+                await scenario(vu)
+                stats.iterations += 1
+                runs += 1
+                await vu.think(*think_time)
+
+        await asyncio.gather(*(run_vu(i) for i in range(users)))
+        stats.finished = time.perf_counter()
+    return stats
+
+
+def fetch_standin_stats(standin_url):
+    with urllib.request.urlopen(f"{standin_url.rstrip('/')}/__standin/stats", timeout=5) as response:
+        return json.loads(response.read())
+
+
+def fetch_app_cache_stats(base_url):
+    """The app's ESPN cache counters (/api/espn-cache), or None if it doesn't serve them."""
+    try:
+        with urllib.request.urlopen(f"{base_url.rstrip('/')}/api/espn-cache", timeout=5) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, ValueError):
+        return None
+
+
+def upstream_report(before, after, app_requests, cache_before=None, cache_after=None):
+    """Upstream calls the run caused, per stand-in route and per app request.
+
+    With the app's cache counters from before and after the run, also reports how many
+    scoreboard lookups were cache hits, misses, or coalesced onto an in-flight fetch.
+    """
+    routes = {route: n - before["routes"].get(route, 0) for route, n in sorted(after["routes"].items())}
+    calls = after["total"] - before["total"]
+    report = {
+        "calls": calls,
+        "per_app_request": round(calls / app_requests, 4) if app_requests else 0.0,
+        "routes": {route: n for route, n in routes.items() if n},
+    }
+    if cache_before is not None and cache_after is not None:
+        cache = {key: cache_after[key] - cache_before[key] for key in ("hits", "misses", "coalesced")}
+        lookups = sum(cache.values())
+        cache["hit_rate"] = round((cache["hits"] + cache["coalesced"]) / lookups, 4) if lookups else 0.0
+        report["app_cache"] = cache
+    return report
+
+
+def main():
+    from scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description="Load test the Tallysight API routes")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="pick_deadline")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--users", type=int, default=100, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=None, help="seconds to run (default: one iteration)")
+    parser.add_argument("--iterations", type=int, default=None, help="scenario runs per VU")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds over which VUs start")
+    parser.add_argument("--connections", type=int, default=None, help="max open connections (default: --users)")
+    parser.add_argument("--think-min", type=float, default=0.0)
+    parser.add_argument("--think-max", type=float, default=0.0)
+    parser.add_argument("--think-scale", type=float, default=1.0, help="multiplier for in-scenario think times")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--identities", help="JSON file of [{user_id, headers}] used by authenticated scenarios")
+    parser.add_argument("--standin", help="ESPN stand-in URL; reports upstream calls made during the run")
+    parser.add_argument("--json", dest="json_path", help="write the full report to this file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    identities = None
+    if args.identities:
+        with open(args.identities) as f:
+            identities = json.load(f)
+
+    raise_fd_limit()
+    before = fetch_standin_stats(args.standin) if args.standin else None
+    cache_before = fetch_app_cache_stats(args.base_url) if args.standin else None
+
+    stats = asyncio.run(run_load(
+        SCENARIOS[args.scenario], args.base_url, args.users, duration=args.duration,
+        iterations=args.iterations, ramp_up=args.ramp_up, connections=args.connections,
+        identities=identities, timeout=args.timeout, think_time=(args.think_min, args.think_max),
+        think_scale=args.think_scale, seed=args.seed,
+    ))
+    report = stats.report()
+    report["scenario"] = args.scenario
+    report["users"] = args.users
+
+    if before is not None:
+        after = fetch_standin_stats(args.standin)
+        cache_after = fetch_app_cache_stats(args.base_url) if cache_before is not None else None
+        report["upstream"] = upstream_report(before, after, report["total"]["count"], cache_before, cache_after)
+        report["upstream_calls"] = report["upstream"]["calls"]
+
+    print(format_report(report))
+    if any("server_timing" in s for s in report["routes"].values()):
+        print()
+        print(format_server_timing(report))
+    if "upstream" in report:
+        upstream = report["upstream"]
+        print(f"upstream calls to stand-in: {upstream['calls']} ({upstream['per_app_request']} per app request)")
+        for route, n in upstream["routes"].items():
+            print(f"   {n:>7}  {route}")
+        if "app_cache" in upstream:
+            cache = upstream["app_cache"]
+            print(f"app ESPN cache: {cache['hits']} hits, {cache['misses']} misses, "
+                  f"{cache['coalesced']} coalesced ({cache['hit_rate'] * 100:.1f}% served without a new fetch)")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Report written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
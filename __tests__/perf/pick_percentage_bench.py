@@ -0,0 +1,322 @@
+"""Pick percentage benchmark: the old per-request aggregation against the maintained counts.
+
+/api/userPickPercentage used to count distinct pickers and aggregate every pick of today's
+and tomorrow's games on each request. It now reads "GamePickCounts", which triggers on
+"Pick" keep current (src/lib/pickCounts/pickCounts.ts). Both are timed straight against
+Postgres on the same data:
+
+  python __tests__/perf/pick_percentage_bench.py --picks 1000000 --dsn postgresql://localhost/tallysight
+
+--games games are added for today and tomorrow (EST, like the route) and --picks picks
+spread over them, on top of whatever the database already holds; the old query also
+scans every other pick in "Pick". The app's DDL and lookups are read from pickCounts.ts,
+so the benchmark always measures what the route runs. Reported:
+  legacy       the old route's two queries, p50/p95 ms over --runs runs
+  lookup       today's and tomorrow's counts through the "Game"("gameDate") index
+  batched      the counts of every benchmark game by ID (?gameIds=...)
+  writes       savePicks-style upserts per second with and without the counting triggers
+  mismatches   games whose counts differ from the old aggregation, checked after loading
+               and again after the writes (must be 0)
+"""
+import argparse
+import functools
+import json
+import re
+import statistics
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate
+from seed_db import EST, ENSURE_SCHEMA_SQL, check_local
+
+PICK_COUNTS_TS = Path(__file__).resolve().parents[2] / "src/lib/pickCounts/pickCounts.ts"
+SUITE = "pick-percentage"
+GAME_PREFIX = "pct_bench_"
+USER_PREFIX = "pct_user_"
+
+THRESHOLDS = {
+    "legacy.*": None,
+    "lookup.*": Threshold(relative=0.5, absolute=2),
+    "batched.*": Threshold(relative=0.5, absolute=2),
+    "writes.with_triggers_per_sec": Threshold(relative=0.3, absolute=200, higher_is_better=True),
+    "writes.*": None,
+    "mismatches": Threshold(relative=0, absolute=0),
+    "*": None,
+}
+
+# The route before the counts table, verbatim apart from the parameters
+LEGACY_USERS_SQL = """
+SELECT COUNT(DISTINCT p."userId") AS uniqueUsers
+FROM "Pick" p
+JOIN "Game" g ON p."gameId" = g.id
+WHERE DATE(g."gameDate") = %(today)s
+OR DATE(g."gameDate") = %(tomorrow)s
+"""
+
+LEGACY_PICKS_SQL = """
+SELECT
+  g.id AS gameId,
+  g."team1Name" AS homeTeamId,
+  g."team2Name" AS awayTeamId,
+  COUNT(CASE WHEN recent_picks."teamIndex" = 0 THEN 1 END) AS homePicks,
+  COUNT(CASE WHEN recent_picks."teamIndex" = 1 THEN 1 END) AS awayPicks,
+  COUNT(recent_picks.id) AS totalPicks
+FROM "Game" g
+JOIN (
+    SELECT DISTINCT ON (p."userId", p."gameId")
+        p.id, p."gameId", p."userId", p."teamIndex", p."createdAt"
+    FROM "Pick" p
+    ORDER BY p."userId", p."gameId", p."createdAt" DESC
+) AS recent_picks ON g.id = recent_picks."gameId"
+WHERE DATE(g."gameDate") = %(today)s
+    OR DATE(g."gameDate") = %(tomorrow)s
+GROUP BY g.id, g."team1Name", g."team2Name"
+"""
+
+# Run with triggers on, so the deletes cascade and keep the counts right
+CLEANUP_SQL = [
+    'DELETE FROM "Pick" WHERE "gameId" LIKE %(game_prefix)s',
+    'DELETE FROM "Game" WHERE id LIKE %(game_prefix)s',
+]
+
+LOAD_SQL = [
+    """
+    INSERT INTO "Game" (id, "team1Name", "team2Name", "gameDate", "gameTime", sport)
+    SELECT %(game_id)s || g, 'Home ' || g, 'Away ' || g,
+           CASE WHEN g %% 2 = 0 THEN %(today)s::date ELSE %(tomorrow)s::date END, '19:00', 'NBA'
+    FROM generate_series(1, %(games)s) AS g
+    """,
+    # Every user picks every game; how far a game leans home varies from game to game
+    """
+    INSERT INTO "Pick" (id, "userId", "gameId", "teamIndex", sport)
+    SELECT %(game_id)s || g || '_' || u, %(user_id)s || u, %(game_id)s || g,
+           CASE WHEN (u * 7919 + g * 104729) %% 100 < 30 + (g * 37) %% 40 THEN 0 ELSE 1 END, 'NBA'
+    FROM generate_series(1, %(users)s) AS u, generate_series(1, %(games)s) AS g
+    """,
+]
+
+# savePicks' upsert: the second pass flips every written pick to the other side
+UPSERT_SQL = """
+INSERT INTO "Pick" (id, "userId", "gameId", "teamIndex", sport)
+VALUES (%(id)s, %(user_id)s, %(game_id)s, %(team)s, 'NBA')
+ON CONFLICT ("userId", "gameId") DO UPDATE SET "teamIndex" = EXCLUDED."teamIndex"
+"""
+
+TRIGGERS = ("game_pick_counts_insert", "game_pick_counts_delete", "game_pick_counts_update")
+
+
+@functools.lru_cache(maxsize=None)
+def _app_source():
+    return PICK_COUNTS_TS.read_text()
+
+
+def app_sql(name, source=None):
+    """The body of `export const NAME = `...`;` in pickCounts.ts, with $n made into %(pn)s."""
+    source = source if source is not None else _app_source()
+    match = re.search(rf"export const {name} = `(.*?)`;", source, re.S)
+    if not match:
+        raise ValueError(f"{name} not found in {PICK_COUNTS_TS.name}")
+    body = match.group(1)
+    if not re.search(r"\$\d", body):
+        return body
+    # psycopg wants literal percent signs doubled once a statement has parameters
+    return re.sub(r"\$(\d+)", r"%(p\1)s", body.replace("%", "%%"))
+
+
+def bench_days(now=None):
+    today = (now or datetime.now(EST)).date()
+    return today, today + timedelta(days=1)
+
+
+def ensure_counts(conn):
+    """Install the "GamePickCounts" triggers like installPickCounts (npm run db:setup) and recount every game."""
+    with conn.transaction():
+        conn.execute('LOCK TABLE "Pick" IN SHARE ROW EXCLUSIVE MODE')
+        conn.execute(app_sql("PICK_COUNTS_SCHEMA_SQL"))
+        conn.execute(app_sql("PICK_COUNTS_BACKFILL_SQL"))
+
+
+def prepare_database(dsn, picks, games, today):
+    """Benchmark games for `today` and the day after and about `picks` picks on them."""
+    import psycopg
+
+    users = max(1, picks // games)
+    params = {"game_prefix": f"{GAME_PREFIX}%", "game_id": GAME_PREFIX, "user_id": USER_PREFIX,
+              "today": today, "tomorrow": today + timedelta(days=1), "games": games, "users": users}
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute(ENSURE_SCHEMA_SQL)
+        for statement in CLEANUP_SQL:
+            conn.execute(statement, params)
+        # Bulk loads skip the counting triggers; ensure_counts recounts afterwards
+        try:
+            conn.execute("SET session_replication_role = replica")
+        except psycopg.errors.InsufficientPrivilege:
+            pass
+        with conn.transaction():
+            for statement in LOAD_SQL:
+                conn.execute(statement, params)
+        conn.execute("RESET session_replication_role")
+        ensure_counts(conn)
+        conn.execute('ANALYZE "Pick"')
+        conn.execute('ANALYZE "Game"')
+        conn.execute('ANALYZE "GamePickCounts"')
+    return users * games
+
+
+def legacy_counts(conn, today):
+    params = {"today": today, "tomorrow": today + timedelta(days=1)}
+    users = conn.execute(LEGACY_USERS_SQL, params).fetchone()[0]
+    rows = conn.execute(LEGACY_PICKS_SQL, params).fetchall()
+    return users, {game_id: (home, away) for game_id, _, _, home, away, _ in rows}
+
+
+def lookup_counts(conn, today):
+    rows = conn.execute(app_sql("COUNTS_BY_DATE_SQL"), {"p1": today, "p2": today + timedelta(days=1)}).fetchall()
+    return {game_id: (home, away) for game_id, home, away in rows}
+
+
+def batched_counts(conn, game_ids):
+    rows = conn.execute(app_sql("COUNTS_BY_ID_SQL"), {"p1": game_ids}).fetchall()
+    return {game_id: (home, away) for game_id, home, away in rows}
+
+
+def mismatches(conn, today):
+    """Benchmark games whose maintained counts differ from the old aggregation."""
+    _, legacy = legacy_counts(conn, today)
+    lookup = lookup_counts(conn, today)
+    return sorted(g for g in set(legacy) | set(lookup)
+                  if g.startswith(GAME_PREFIX) and legacy.get(g) != lookup.get(g))
+
+
+def timed(func, runs):
+    """{p50_ms, p95_ms} of `runs` calls after one warm-up call."""
+    func()
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {"p50_ms": round(statistics.median(samples), 3),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3)}
+
+
+def write_rate(conn, writes, games, users, flip):
+    """savePicks-style upserts per second over existing picks, one statement each."""
+    started = time.perf_counter()
+    for i in range(writes):
+        user, game = i // games + 1, i % games + 1
+        if user > users:
+            break
+        conn.execute(UPSERT_SQL, {"id": f"{GAME_PREFIX}{game}_{user}", "user_id": f"{USER_PREFIX}{user}",
+                                  "game_id": f"{GAME_PREFIX}{game}", "team": (user + game + flip) % 2})
+    seconds = time.perf_counter() - started
+    return round(min(writes, users * games) / seconds, 1) if seconds else 0.0
+
+
+def measure_writes(conn, writes, games, users, today):
+    """Upsert rate with the counting triggers and without.
+
+    The writes through the triggers must leave the counts matching the old aggregation;
+    the counts are recounted after the ones without. Returns (rates, mismatched games).
+    """
+    with_triggers = write_rate(conn, writes, games, users, flip=0)
+    wrong = mismatches(conn, today)
+    for trigger in TRIGGERS:
+        conn.execute(f'ALTER TABLE "Pick" DISABLE TRIGGER {trigger}')
+    try:
+        without = write_rate(conn, writes, games, users, flip=1)
+    finally:
+        for trigger in TRIGGERS:
+            conn.execute(f'ALTER TABLE "Pick" ENABLE TRIGGER {trigger}')
+        ensure_counts(conn)
+    return {"with_triggers_per_sec": with_triggers, "without_triggers_per_sec": without}, wrong
+
+
+def run(dsn, picks, games, runs, writes, today=None):
+    import psycopg
+
+    today = today or bench_days()[0]
+    loaded = prepare_database(dsn, picks, games, today)
+    users = loaded // games
+    game_ids = [f"{GAME_PREFIX}{g}" for g in range(1, games + 1)]
+
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        wrong = mismatches(conn, today)
+        results = {
+            "picks": loaded,
+            "legacy": timed(lambda: legacy_counts(conn, today), runs),
+            "lookup": timed(lambda: lookup_counts(conn, today), runs),
+            "batched": timed(lambda: batched_counts(conn, game_ids), runs),
+        }
+        results["writes"], after_writes = measure_writes(conn, writes, games, users, today)
+    wrong += after_writes
+    results["speedup"] = round(results["legacy"]["p50_ms"] / max(results["lookup"]["p50_ms"], 0.001), 1)
+    results["mismatches"] = len(wrong)
+    return results, wrong[:5]
+
+
+def flatten(results):
+    metrics = {}
+    for name, value in results.items():
+        if isinstance(value, dict):
+            metrics.update({f"{name}.{k}": v for k, v in value.items()})
+        else:
+            metrics[name] = value
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pick percentages: per-request aggregation vs maintained counts")
+    parser.add_argument("--picks", type=int, default=1_000_000)
+    parser.add_argument("--games", type=int, default=40, help="games split over today and tomorrow")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--writes", type=int, default=5000, help="savePicks-style upserts to time")
+    parser.add_argument("--dsn", required=True, help="disposable local Postgres")
+    parser.add_argument("--allow-remote", action="store_true")
+    parser.add_argument("--json", dest="json_path", help="write the results to this file")
+    parser.add_argument("--gate", action="store_true", help="record history and fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    if not args.allow_remote:
+        check_local(args.dsn)
+
+    print(f"🗳️  {args.picks:,} picks over {args.games} games")
+    results, examples = run(args.dsn, args.picks, args.games, args.runs, args.writes)
+    for name in ("legacy", "lookup", "batched"):
+        print(f"   {name:<8} p50 {results[name]['p50_ms']:>9.2f} ms   p95 {results[name]['p95_ms']:>9.2f} ms")
+    writes = results["writes"]
+    print(f"   lookup is {results['speedup']:,}x faster than the old aggregation")
+    print(f"   upserts: {writes['with_triggers_per_sec']:,.0f}/s with counting triggers, "
+          f"{writes['without_triggers_per_sec']:,.0f}/s without")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.json_path}")
+
+    failed = False
+    if results["mismatches"]:
+        failed = True
+        print(f"❌ {results['mismatches']} games disagree with the old aggregation, e.g. {examples}")
+
+    if args.gate or args.update_baseline:
+        regressions = gate(SUITE, flatten(results), BASELINES_DIR / f"{SUITE}.json", RESULTS_DIR / f"{SUITE}.jsonl",
+                           THRESHOLDS, update=args.update_baseline)
+        if regressions:
+            print("❌ Regressions:")
+            for regression in regressions:
+                print(f"   {regression}")
+            failed = True
+        else:
+            print("✅ No regressions against the baseline")
+
+    if failed:
+        raise SystemExit(1)
+    print("✅ Maintained counts match the old aggregation")
+
+
+if __name__ == "__main__":
+    main()
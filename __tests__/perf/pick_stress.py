@@ -0,0 +1,316 @@
+"""Concurrent pick-submission stress test for /api/savePicks.
+
+Models the burst right before games lock: every synthetic user submits a full slate of
+picks at once (and optionally changes their mind with more submissions), then reads
+them back through /api/userPicks. Afterwards the database is checked so every pick a
+user made is stored exactly once with the side they picked last:
+
+  python __tests__/perf/clerk_standin.py --users 5000 &          # auth for synthetic users
+  python __tests__/perf/pick_stress.py --users 5000 --submits 2 --sport NBA \\
+      --clerk-standin http://127.0.0.1:4020 --dsn postgresql://localhost/tallysight
+
+Reported: throughput (submissions and picks per second), latency percentiles per route,
+lock waits sampled from pg_stat_activity during the burst (plus deadlock and rollback
+counts from pg_stat_database), and the verification result:
+  lost        a pick whose submission returned 201 is missing
+  stale       the stored side is not the user's last submitted one
+  duplicates  more than one row for the same (user, game)
+  stale_reads /api/userPicks right after a 201 does not show that submission
+
+Exits non-zero when any pick was lost, duplicated or stale. The existing picks of the
+synthetic users on the stressed games are deleted first, so only use a local database.
+Needs aiohttp and psycopg.
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+import urllib.request
+from datetime import date
+
+from clerk_standin import fetch_identities
+from loadgen import format_report, raise_fd_limit, run_load
+from scenarios import build_picks
+from seed_db import check_local
+
+ABSENT = None
+
+LOCK_SAMPLE_SQL = """
+SELECT count(*) FILTER (WHERE wait_event_type = 'Lock'),
+       coalesce(max(extract(epoch FROM now() - state_change)) FILTER (WHERE wait_event_type = 'Lock'), 0),
+       count(*) FILTER (WHERE state = 'active'),
+       count(*)
+FROM pg_stat_activity
+WHERE datname = current_database() AND pid <> pg_backend_pid()
+"""
+
+DATABASE_COUNTERS_SQL = """
+SELECT xact_commit, xact_rollback, deadlocks, conflicts
+FROM pg_stat_database WHERE datname = current_database()
+"""
+
+STORED_PICKS_SQL = """
+SELECT "userId", "gameId", count(*), max("teamIndex"), bool_or(coalesce("bestPick", false))
+FROM "Pick"
+WHERE "userId" = ANY(%(users)s) AND "gameId" = ANY(%(games)s)
+GROUP BY 1, 2
+"""
+
+
+class LockSampler:
+    """Polls pg_stat_activity on a background thread while the burst runs."""
+
+    def __init__(self, dsn, interval=0.1):
+        self.dsn = dsn
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._counters_before = None
+        self.counters = {}
+
+    def _counters(self, conn):
+        names = ("xact_commit", "xact_rollback", "deadlocks", "conflicts")
+        return dict(zip(names, conn.execute(DATABASE_COUNTERS_SQL).fetchone()))
+
+    def _run(self):
+        import psycopg
+
+        with psycopg.connect(self.dsn, autocommit=True) as conn:
+            while not self._stop.is_set():
+                waiting, longest, active, connections = conn.execute(LOCK_SAMPLE_SQL).fetchone()
+                self.samples.append((waiting, float(longest), active, connections))
+                self._stop.wait(self.interval)
+
+    def __enter__(self):
+        import psycopg
+
+        with psycopg.connect(self.dsn, autocommit=True) as conn:
+            self._counters_before = self._counters(conn)
+        self._thread = threading.Thread(target=self._run, name="lock-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        import psycopg
+
+        self._stop.set()
+        self._thread.join()
+        # pg_stat_database is updated when backends report, which can lag a moment
+        time.sleep(0.5)
+        with psycopg.connect(self.dsn, autocommit=True) as conn:
+            after = self._counters(conn)
+        self.counters = {k: after[k] - self._counters_before[k] for k in after}
+
+    def report(self):
+        waiting = [s[0] for s in self.samples]
+        return {
+            "samples": len(self.samples),
+            "max_lock_waiters": max(waiting, default=0),
+            "mean_lock_waiters": round(sum(waiting) / len(waiting), 2) if waiting else 0.0,
+            "samples_with_lock_waits": sum(1 for w in waiting if w),
+            "max_lock_wait_ms": round(max((s[1] for s in self.samples), default=0.0) * 1000, 1),
+            "max_active_queries": max((s[2] for s in self.samples), default=0),
+            "max_connections": max((s[3] for s in self.samples), default=0),
+            **self.counters,
+        }
+
+
+class PickLedger:
+    """What each (user, game) may legitimately hold after the run.
+
+    A 201 pins the stored value to that submission. A failed or timed-out submission
+    may or may not have been applied (savePicks writes pick by pick, outside a
+    transaction), so it only widens the set of acceptable values.
+    """
+
+    def __init__(self):
+        self.acceptable = {}
+        self.confirmed = 0
+        self.failed = 0
+        self.stale_reads = 0
+
+    @staticmethod
+    def value(pick):
+        return pick["teamIndex"], bool(pick["bestPick"])
+
+    def record(self, user_id, picks, confirmed):
+        for pick in picks:
+            key = (user_id, pick["gameId"])
+            if confirmed:
+                self.acceptable[key] = {self.value(pick)}
+            else:
+                self.acceptable.setdefault(key, {ABSENT}).add(self.value(pick))
+        if confirmed:
+            self.confirmed += len(picks)
+        else:
+            self.failed += len(picks)
+
+    def check_read(self, user_id, picks, stored):
+        """Compare a /api/userPicks response against the user's last confirmed submission."""
+        seen = {row.get("gameId"): (row.get("teamIndex"), bool(row.get("bestPick")))
+                for row in stored if isinstance(row, dict)}
+        if any(seen.get(pick["gameId"]) != self.value(pick) for pick in picks):
+            self.stale_reads += 1
+
+    def verify(self, rows):
+        """`rows` are (user, game, count, teamIndex, bestPick) from STORED_PICKS_SQL."""
+        stored = {(user, game): (count, (team, best)) for user, game, count, team, best in rows}
+        lost, stale, unexpected = [], [], []
+        for key, acceptable in self.acceptable.items():
+            count, value = stored.get(key, (0, ABSENT))
+            if value in acceptable:
+                continue
+            (lost if value is ABSENT else stale).append(key)
+        for key in stored:
+            if key not in self.acceptable:
+                unexpected.append(key)
+        duplicates = [key for key, (count, _) in stored.items() if count > 1]
+        return {
+            "expected_picks": len(self.acceptable),
+            "stored_picks": len(stored),
+            "confirmed_picks": self.confirmed,
+            "failed_picks": self.failed,
+            "lost": len(lost),
+            "stale": len(stale),
+            "duplicates": len(duplicates),
+            "unexpected": len(unexpected),
+            "stale_reads": self.stale_reads,
+            "examples": [list(k) for k in (lost + stale + duplicates + unexpected)[:10]],
+        }
+
+
+def fetch_games(base_url, sport, timeout=60):
+    url = f"{base_url.rstrip('/')}/api/all-espn-games?sport={sport.lower()}"
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        data = json.loads(response.read())
+    return data.get("games", []) if isinstance(data, dict) else []
+
+
+def make_scenario(games, sport, submits, ledger, read_back=True):
+    async def submit_picks(vu):
+        pick_date = date.today().isoformat()
+        for _ in range(submits):
+            picks = build_picks(games, sport, vu.rng)
+            status, _, _ = await vu.request("POST", "/api/savePicks",
+                                            json_body={"picks": picks, "pickDate": pick_date})
+            ledger.record(vu.user_id, picks, confirmed=status == 201)
+            if status == 201 and read_back:
+                status, stored, _ = await vu.request("GET", f"/api/userPicks?sport={sport}")
+                if status == 200 and isinstance(stored, list):
+                    ledger.check_read(vu.user_id, picks, stored)
+    return submit_picks
+
+
+def stored_picks(dsn, user_ids, game_ids):
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        return conn.execute(STORED_PICKS_SQL, {"users": user_ids, "games": game_ids}).fetchall()
+
+
+def clear_picks(dsn, user_ids, game_ids):
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        deleted = conn.execute('DELETE FROM "Pick" WHERE "userId" = ANY(%(users)s) AND "gameId" = ANY(%(games)s)',
+                               {"users": user_ids, "games": game_ids}).rowcount
+        conn.commit()
+    return deleted
+
+
+def run_stress(base_url, dsn, identities, games, sport, submits=1, connections=None, timeout=60,
+               read_back=True, seed=0, lock_interval=0.1):
+    user_ids = [identity["user_id"] for identity in identities]
+    game_ids = [game["id"] for game in games]
+    clear_picks(dsn, user_ids, game_ids)
+
+    ledger = PickLedger()
+    scenario = make_scenario(games, sport, submits, ledger, read_back)
+    with LockSampler(dsn, lock_interval) as locks:
+        stats = asyncio.run(run_load(scenario, base_url, users=len(identities), iterations=1,
+                                     connections=connections, identities=identities, timeout=timeout,
+                                     seed=seed))
+
+    report = stats.report()
+    duration = report["duration_s"] or 1
+    saves = report["routes"].get("POST /api/savePicks", {})
+    report["throughput"] = {
+        "submissions_per_s": round((saves.get("count", 0) - saves.get("errors", 0)) / duration, 2),
+        "picks_per_s": round(ledger.confirmed / duration, 2),
+    }
+    report["locks"] = locks.report()
+    report["verification"] = ledger.verify(stored_picks(dsn, user_ids, game_ids))
+    return report
+
+
+def format_stress(report):
+    lines = [format_report(report), ""]
+    throughput = report["throughput"]
+    lines.append(f"throughput  {throughput['submissions_per_s']} submissions/s, {throughput['picks_per_s']} picks/s")
+    locks = report["locks"]
+    lines.append(f"locks       max {locks['max_lock_waiters']} waiting (mean {locks['mean_lock_waiters']}), "
+                 f"longest wait {locks['max_lock_wait_ms']} ms, {locks.get('deadlocks', 0)} deadlocks, "
+                 f"{locks.get('xact_rollback', 0)} rollbacks, max {locks['max_connections']} connections")
+    v = report["verification"]
+    lines.append(f"picks       {v['stored_picks']} stored / {v['expected_picks']} expected "
+                 f"({v['confirmed_picks']} confirmed, {v['failed_picks']} in failed submissions)")
+    lines.append(f"integrity   lost {v['lost']}, stale {v['stale']}, duplicates {v['duplicates']}, "
+                 f"unexpected {v['unexpected']}, stale reads {v['stale_reads']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress /api/savePicks with concurrent submissions")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--dsn", required=True, help="local Postgres the app under test writes to")
+    parser.add_argument("--allow-remote", action="store_true", help="allow a non-local --dsn")
+    parser.add_argument("--users", type=int, default=500, help="concurrent users, all submitting at once")
+    parser.add_argument("--submits", type=int, default=1, help="submissions per user (later ones re-pick)")
+    parser.add_argument("--sport", default="NBA")
+    parser.add_argument("--clerk-standin", default="http://127.0.0.1:4020",
+                        help="Clerk stand-in URL to mint sessions from")
+    parser.add_argument("--identities", help="JSON file of [{user_id, headers}] instead of --clerk-standin")
+    parser.add_argument("--connections", type=int, default=None, help="max open connections (default: --users)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--no-read-back", action="store_true", help="skip GET /api/userPicks after each save")
+    parser.add_argument("--json", dest="json_path", help="write the full report to this file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.allow_remote:
+        check_local(args.dsn)
+
+    if args.identities:
+        with open(args.identities) as f:
+            identities = json.load(f)[:args.users]
+    else:
+        identities = fetch_identities(args.clerk_standin, args.users)
+
+    games = fetch_games(args.base_url, args.sport)
+    if not games:
+        raise SystemExit(f"No {args.sport} games today; pick a sport with a slate or point the app at the stand-in")
+
+    raise_fd_limit()
+    print(f"🔥 {len(identities)} users x {args.submits} submissions of {len(games)} {args.sport} picks")
+    report = run_stress(args.base_url, args.dsn, identities, games, args.sport, submits=args.submits,
+                        connections=args.connections, timeout=args.timeout, read_back=not args.no_read_back,
+                        seed=args.seed)
+    report["users"] = len(identities)
+    print(format_stress(report))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Report written to {args.json_path}")
+
+    v = report["verification"]
+    if v["lost"] or v["stale"] or v["duplicates"]:
+        print(f"❌ Pick integrity check failed, e.g. {v['examples']}")
+        raise SystemExit(1)
+    print("✅ Every confirmed pick stored exactly once")
+
+
+if __name__ == "__main__":
+    main()
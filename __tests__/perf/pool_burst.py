@@ -0,0 +1,267 @@
+"""Database connections during a pick-deadline burst.
+
+Every user submits a full slate to /api/savePicks at once (like pick_stress.py), then
+browses the pick_deadline mix. Meanwhile pg_stat_activity is sampled for the backends each
+client holds (by application_name and state), alongside the app's shared pool counters
+from GET /api/db-pool:
+
+  python __tests__/perf/clerk_standin.py --users 2000 &
+  DB_POOL_MAX=10 npm start
+  python __tests__/perf/pool_burst.py --users 2000 --sport NBA --dsn postgresql://localhost/tallysight
+
+Reported: peak backends overall and per application, how many sat idle in a transaction,
+Postgres' max_connections, and from the app's pool: connections in use, requests waiting
+for one, acquire latency and slow queries. The app's backends are the ones named
+"tallysight" (src/lib/dbPool); anything else the app opens shows up as another
+application. Exits non-zero when the app held more backends than --instances times its
+pool size, or when the database ran out of connections. Picks submitted during the burst
+stay in the database, so only use a local one. Needs aiohttp and psycopg.
+"""
+import argparse
+import asyncio
+import json
+import threading
+import urllib.error
+import urllib.request
+
+from clerk_standin import fetch_identities
+from loadgen import format_report, raise_fd_limit, run_load
+from pick_stress import PickLedger, fetch_games, make_scenario
+from scenarios import SCENARIOS
+from seed_db import check_local
+
+APP_NAME = "tallysight"
+
+CONNECTIONS_SQL = """
+SELECT coalesce(nullif(application_name, ''), '(unnamed)'), coalesce(state, 'unknown'), count(*)
+FROM pg_stat_activity
+WHERE datname = current_database() AND backend_type = 'client backend' AND pid <> pg_backend_pid()
+GROUP BY 1, 2
+"""
+
+
+def fetch_pool_stats(base_url):
+    """The app's shared pool counters (/api/db-pool), or None if it doesn't serve them."""
+    try:
+        with urllib.request.urlopen(f"{base_url.rstrip('/')}/api/db-pool", timeout=5) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, ValueError):
+        return None
+
+
+class ConnectionSampler:
+    """Polls pg_stat_activity (and the app's pool counters) on a background thread."""
+
+    def __init__(self, dsn, base_url=None, interval=0.1):
+        self.dsn = dsn
+        self.base_url = base_url
+        self.interval = interval
+        self.samples = []
+        self.pool_samples = []
+        self.max_connections = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        import psycopg
+
+        with psycopg.connect(self.dsn, autocommit=True) as conn:
+            self.max_connections = int(conn.execute("SHOW max_connections").fetchone()[0])
+            while not self._stop.is_set():
+                self.samples.append(conn.execute(CONNECTIONS_SQL).fetchall())
+                if self.base_url:
+                    pool = fetch_pool_stats(self.base_url)
+                    if pool is not None:
+                        self.pool_samples.append(pool)
+                self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, name="connection-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def report(self):
+        return connection_report(self.samples, self.max_connections, self.pool_samples)
+
+
+def connection_report(samples, max_connections, pool_samples=()):
+    """Peaks over `samples`, each a list of (application, state, count) rows."""
+    totals, apps, idle_in_transaction = [], {}, []
+    for rows in samples:
+        totals.append(sum(count for _, _, count in rows))
+        idle_in_transaction.append(sum(count for _, state, count in rows if state.startswith("idle in transaction")))
+        per_app = {}
+        for app, state, count in rows:
+            per_app.setdefault(app, {"total": 0, "active": 0})
+            per_app[app]["total"] += count
+            if state == "active":
+                per_app[app]["active"] += count
+        for app, counts in per_app.items():
+            peak = apps.setdefault(app, {"peak": 0, "peak_active": 0})
+            peak["peak"] = max(peak["peak"], counts["total"])
+            peak["peak_active"] = max(peak["peak_active"], counts["active"])
+
+    app = apps.get(APP_NAME, {"peak": 0, "peak_active": 0})
+    report = {
+        "samples": len(samples),
+        "max_connections": max_connections,
+        "peak_total": max(totals, default=0),
+        "mean_total": round(sum(totals) / len(totals), 2) if totals else 0.0,
+        "peak_app": app["peak"],
+        "peak_app_active": app["peak_active"],
+        "peak_other": max((sum(c for a, _, c in rows if a != APP_NAME) for rows in samples), default=0),
+        "peak_idle_in_transaction": max(idle_in_transaction, default=0),
+        "applications": dict(sorted(apps.items())),
+    }
+    if pool_samples:
+        report["pool"] = {
+            "max": pool_samples[-1]["config"]["max"],
+            "peak_active": max(p["active"] for p in pool_samples),
+            "peak_waiting": max(p["waiting"] for p in pool_samples),
+        }
+    return report
+
+
+def pool_delta(before, after):
+    """Acquires, queries and slow queries the app's pool saw between two /api/db-pool reads."""
+    acquires = after["acquire"]["count"] - before["acquire"]["count"]
+    queries = after["queries"]["count"] - before["queries"]["count"]
+    slow = after["queries"]["slow"] - before["queries"]["slow"]
+    return {
+        "acquires": acquires,
+        "acquire_errors": after["acquire"]["errors"] - before["acquire"]["errors"],
+        # Averages and maxima are kept since the app started; these are the run's share
+        "acquire_max_ms": after["acquire"]["maxMs"],
+        "queries": queries,
+        "query_errors": after["queries"]["errors"] - before["queries"]["errors"],
+        "slow_queries": slow,
+        "slowest": sorted(after["slowQueries"][-slow:] if slow else [], key=lambda q: -q["ms"])[:5],
+    }
+
+
+def make_burst(games, sport, submits, ledger, browse=True):
+    submit_picks = make_scenario(games, sport, submits, ledger, read_back=False)
+
+    async def burst(vu):
+        await submit_picks(vu)
+        if browse:
+            await SCENARIOS["pick_deadline"](vu)
+    return burst
+
+
+def run_burst(base_url, dsn, identities, games, sport, submits=1, browse=True, connections=None, timeout=60,
+              seed=0, interval=0.1):
+    ledger = PickLedger()
+    before = fetch_pool_stats(base_url)
+    with ConnectionSampler(dsn, base_url if before is not None else None, interval) as sampler:
+        stats = asyncio.run(run_load(make_burst(games, sport, submits, ledger, browse), base_url,
+                                     users=len(identities), iterations=1, connections=connections,
+                                     identities=identities, timeout=timeout, seed=seed))
+
+    report = stats.report()
+    report["connections"] = sampler.report()
+    report["picks"] = {"confirmed": ledger.confirmed, "failed": ledger.failed}
+    if before is not None:
+        after = fetch_pool_stats(base_url)
+        report["connections"].setdefault("pool", {"max": after["config"]["max"]})
+        report["connections"]["pool"].update(pool_delta(before, after))
+    return report
+
+
+def check_connections(connections, instances=1):
+    """Problems with how the burst used connections; empty when it stayed within its limits."""
+    problems = []
+    pool = connections.get("pool")
+    if pool and connections["peak_app"] > pool["max"] * instances:
+        problems.append(f"the app held {connections['peak_app']} backends, more than {instances} x its pool "
+                        f"of {pool['max']}")
+    if connections["max_connections"] and connections["peak_total"] >= connections["max_connections"]:
+        problems.append(f"{connections['peak_total']} backends reached max_connections "
+                        f"({connections['max_connections']})")
+    return problems
+
+
+def format_burst(report):
+    lines = [format_report(report), ""]
+    c = report["connections"]
+    lines.append(f"backends    peak {c['peak_total']} of max_connections {c['max_connections']} "
+                 f"(mean {c['mean_total']}), {c['peak_idle_in_transaction']} idle in transaction at most")
+    for app, peak in c["applications"].items():
+        lines.append(f"   {peak['peak']:>6} peak ({peak['peak_active']} active)  {app}")
+    pool = c.get("pool")
+    if pool:
+        line = f"app pool    max {pool['max']}"
+        if "peak_active" in pool:
+            line += f", peak {pool['peak_active']} in use, peak {pool['peak_waiting']} waiting"
+        lines.append(line)
+        lines.append(f"            {pool['acquires']} acquires ({pool['acquire_errors']} failed, slowest "
+                     f"{pool['acquire_max_ms']} ms), {pool['queries']} queries, {pool['slow_queries']} slow")
+        for query in pool["slowest"]:
+            lines.append(f"   {query['ms']:>6} ms  {query['text'][:100]}")
+    else:
+        lines.append("app pool    no /api/db-pool; connection counts come from pg_stat_activity only")
+    picks = report["picks"]
+    lines.append(f"picks       {picks['confirmed']} confirmed, {picks['failed']} in failed submissions")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sample database connections during a pick-deadline burst")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--dsn", required=True, help="local Postgres the app under test uses")
+    parser.add_argument("--allow-remote", action="store_true", help="allow a non-local --dsn")
+    parser.add_argument("--users", type=int, default=500, help="concurrent users, all submitting at once")
+    parser.add_argument("--submits", type=int, default=1, help="submissions per user (later ones re-pick)")
+    parser.add_argument("--sport", default="NBA")
+    parser.add_argument("--no-browse", action="store_true", help="only submit picks, skip the pick_deadline pages")
+    parser.add_argument("--instances", type=int, default=1, help="app server processes sharing the database")
+    parser.add_argument("--clerk-standin", default="http://127.0.0.1:4020",
+                        help="Clerk stand-in URL to mint sessions from")
+    parser.add_argument("--identities", help="JSON file of [{user_id, headers}] instead of --clerk-standin")
+    parser.add_argument("--connections", type=int, default=None, help="max open HTTP connections (default: --users)")
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between samples")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--json", dest="json_path", help="write the full report to this file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.allow_remote:
+        check_local(args.dsn)
+
+    if args.identities:
+        with open(args.identities) as f:
+            identities = json.load(f)[:args.users]
+    else:
+        identities = fetch_identities(args.clerk_standin, args.users)
+
+    games = fetch_games(args.base_url, args.sport)
+    if not games:
+        raise SystemExit(f"No {args.sport} games today; pick a sport with a slate or point the app at the stand-in")
+
+    raise_fd_limit()
+    print(f"🔥 {len(identities)} users submitting {len(games)} {args.sport} picks at once")
+    report = run_burst(args.base_url, args.dsn, identities, games, args.sport, submits=args.submits,
+                       browse=not args.no_browse, connections=args.connections, timeout=args.timeout,
+                       seed=args.seed, interval=args.interval)
+    report["users"] = len(identities)
+    print(format_burst(report))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Report written to {args.json_path}")
+
+    problems = check_connections(report["connections"], args.instances)
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        raise SystemExit(1)
+    print("✅ Connections stayed within the pool and the database limit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Pusher fan-out benchmark: how fast pushed leaderboard patches reach thousands of open pages.
+
+After each scoring run updateEntryPoints pushes only the changed entries to the week's
+leaderboard channel (src/lib/leaderboardPush), split into events of ENTRIES_PER_EVENT
+entries. This benchmark plays that traffic against the Pusher stand-in, fully offline:
+
+  python __tests__/perf/pusher_fanout_bench.py --clients 10000 --runs 5 --changed 3000
+
+--clients WebSocket connections, spread over --workers processes, subscribe to one weekly
+leaderboard channel like /leaderboards does. Then --runs scoring runs of --changed entries
+each are triggered through the signed HTTP API, --interval seconds apart, with batches of
+10 events like the app. Each client times every event from the moment it was triggered
+(its sentAt) to the moment it was read. Reported:
+  connect_seconds     opening and subscribing every client
+  publish_per_sec     events accepted per second by the HTTP API
+  delivery_per_sec    messages per second reaching clients, first trigger to last receipt
+  latency_*_ms        trigger to receipt, over every delivered message
+  lost, out_of_order  messages a client never got or got after a later part
+  patch_kb_per_client / refetch_kb_per_client
+                      what a page downloads for the runs with patches, and what it would
+                      download refetching a --board-size board after every run
+
+Use --standin to measure a stand-in (or anything Pusher-compatible) started elsewhere;
+by default one is started in this process. Needs aiohttp.
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import re
+import time
+import urllib.request
+from pathlib import Path
+
+import aiohttp
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate
+from loadgen import percentile, raise_fd_limit
+from pusher_standin import APP_ID, KEY, SECRET, PusherStandin, signed_query
+
+PATCH_TS = Path(__file__).resolve().parents[2] / "src/lib/leaderboardPatch/leaderboardPatch.ts"
+SUITE = "pusher-fanout"
+CHANNEL = "leaderboard-NBA-12"
+EVENTS_PER_BATCH = 10
+
+THRESHOLDS = {
+    "delivery_per_sec": Threshold(relative=0.25, absolute=1000, higher_is_better=True),
+    "latency_p50_ms": Threshold(relative=0.5, absolute=25),
+    "latency_p99_ms": Threshold(relative=0.5, absolute=100),
+    "lost": Threshold(relative=0, absolute=0),
+    "out_of_order": Threshold(relative=0, absolute=0),
+    "*": None,
+}
+
+
+def entries_per_event():
+    """ENTRIES_PER_EVENT from the app, so events have the size the app sends."""
+    return int(re.search(r"export const ENTRIES_PER_EVENT = (\d+);", PATCH_TS.read_text()).group(1))
+
+
+def run_events(run, changed, per_event, seed=0):
+    """The entries-patch events of one scoring run (sentAt is set when they are sent)."""
+    rng = random.Random(seed * 1_000_003 + run)
+    entries = [[user_id, rng.randint(1, 400), rng.randint(1, 9)] for user_id in sorted(rng.sample(range(1, 10**6), changed))]
+    parts = math.ceil(changed / per_event)
+    return [{"channel": CHANNEL, "entries": entries[p * per_event:(p + 1) * per_event], "part": p, "parts": parts}
+            for p in range(parts)]
+
+
+def board_bytes(board_size):
+    """Size of the response a page downloads when it refetches a board of `board_size` rows."""
+    row = {"user_id": 123456, "clerk_id": "user_2skB8AXewKeSxcztcy6SMctgENA", "username": "player123456",
+           "points": 123, "rank": 12345, "performance": 61.5, "bio": None, "fav_team": None, "max_points": 200,
+           "imageUrl": "/default-profile.png"}
+    return len(json.dumps({"success": True, "data": []})) + board_size * (len(json.dumps(row)) + 1)
+
+
+def trigger_batch(base_url, events, app_id=APP_ID, key=KEY, secret=SECRET, timeout=30):
+    path = f"/apps/{app_id}/batch_events"
+    batch = [{"channel": e["channel"], "name": "entries-patch", "data": json.dumps(e["data"])} for e in events]
+    body = json.dumps({"batch": batch}).encode()
+    request = urllib.request.Request(f"{base_url}{path}?{signed_query(key, secret, path, body)}", data=body,
+                                     headers={"Content-Type": "application/json"}, method="POST")
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+    return sum(len(b["data"]) for b in batch)
+
+
+async def _client(session, ws_url, expected, stats, subscribed):
+    counted = False
+    try:
+        async with session.ws_connect(ws_url, heartbeat=None, max_msg_size=0) as ws:
+            established = json.loads((await ws.receive()).data)
+            if established["event"] != "pusher:connection_established":
+                raise ConnectionError(established)
+            await ws.send_str(json.dumps({"event": "pusher:subscribe", "data": {"channel": CHANNEL}}))
+            reply = json.loads((await ws.receive()).data)
+            if reply["event"] != "pusher_internal:subscription_succeeded":
+                raise ConnectionError(reply)
+            stats["connected"] += 1
+            counted = True
+            subscribed.release()
+
+            received, last = 0, (-1, -1)
+            while received < expected:
+                msg = await ws.receive()
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    break
+                now = time.time() * 1000
+                frame = json.loads(msg.data)
+                if frame.get("event") != "entries-patch":
+                    continue
+                patch = json.loads(frame["data"])
+                received += 1
+                stats["received"] += 1
+                stats["latencies"].append(now - patch["sentAt"])
+                stats["bytes"] += len(frame["data"])
+                stats["last_receipt"] = max(stats["last_receipt"], now)
+                # "run" is only added by this benchmark, to check ordering
+                position = (patch["run"], patch["part"])
+                if position < last:
+                    stats["out_of_order"] += 1
+                last = max(last, position)
+    except (aiohttp.ClientError, ConnectionError, ValueError, KeyError):
+        stats["failed"] += 1
+        if not counted:
+            subscribed.release()
+
+
+async def _subscribers(ws_url, clients, expected, conn):
+    stats = {"connected": 0, "failed": 0, "received": 0, "bytes": 0, "out_of_order": 0, "latencies": [],
+             "last_receipt": 0.0}
+    subscribed = asyncio.Semaphore(0)
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0)) as session:
+        tasks = []
+        for _ in range(clients):
+            tasks.append(asyncio.create_task(_client(session, ws_url, expected, stats, subscribed)))
+            if len(tasks) % 200 == 0:
+                await asyncio.sleep(0)  # let the handshakes so far get going
+        for _ in range(clients):
+            await subscribed.acquire()
+        conn.send(("ready", stats["connected"], time.perf_counter() - started))
+
+        # The parent says when the last event was triggered and how long to wait for stragglers
+        grace = await loop.run_in_executor(None, conn.recv)
+        _, pending = await asyncio.wait(tasks, timeout=grace)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    conn.send(("done", stats))
+
+
+def _subscriber_worker(ws_url, clients, expected, conn):
+    raise_fd_limit()
+    asyncio.run(_subscribers(ws_url, clients, expected, conn))
+
+
+def run(base_url, clients, runs, changed, workers=None, interval=1.0, board_size=100_000, grace=30.0, seed=0):
+    per_event = entries_per_event()
+    events_per_run = math.ceil(changed / per_event)
+    expected = runs * events_per_run
+    workers = max(1, min(workers or os.cpu_count() or 1, clients))
+    ws_url = base_url.replace("http", "ws", 1) + f"/app/{KEY}?protocol=7&client=js&version=8.4.0"
+
+    context = multiprocessing.get_context("spawn")
+    pipes, processes = [], []
+    for w in range(workers):
+        share = clients // workers + (1 if w < clients % workers else 0)
+        parent, child = context.Pipe()
+        process = context.Process(target=_subscriber_worker, args=(ws_url, share, expected, child), daemon=True)
+        process.start()
+        pipes.append(parent)
+        processes.append(process)
+
+    ready = [pipe.recv() for pipe in pipes]
+    connected = sum(r[1] for r in ready)
+    connect_seconds = max(r[2] for r in ready)
+
+    publish_ms, event_bytes = [], 0
+    first_trigger = time.time() * 1000
+    for r in range(runs):
+        if r:
+            time.sleep(interval)
+        events = run_events(r, changed, per_event, seed)
+        for i in range(0, len(events), EVENTS_PER_BATCH):
+            sent_at = time.time() * 1000
+            batch = [{"channel": CHANNEL, "data": {**e, "run": r, "sentAt": sent_at}}
+                     for e in events[i:i + EVENTS_PER_BATCH]]
+            started = time.perf_counter()
+            event_bytes += trigger_batch(base_url, batch)
+            publish_ms.append((time.perf_counter() - started) * 1000)
+
+    for pipe in pipes:
+        pipe.send(grace)
+    totals = {"connected": 0, "failed": 0, "received": 0, "bytes": 0, "out_of_order": 0, "last_receipt": 0.0}
+    latencies = []
+    for pipe in pipes:
+        _, stats = pipe.recv()
+        latencies.extend(stats.pop("latencies"))
+        for name, value in stats.items():
+            totals[name] = max(totals[name], value) if name == "last_receipt" else totals[name] + value
+    for process in processes:
+        process.join(timeout=10)
+
+    latencies.sort()
+    delivery_seconds = max((totals["last_receipt"] - first_trigger) / 1000, 1e-6)
+    publish_seconds = sum(publish_ms) / 1000
+    return {
+        "clients": clients,
+        "connected": connected,
+        "connect_seconds": round(connect_seconds, 2),
+        "events": expected,
+        "entries_per_event": per_event,
+        "event_bytes": round(event_bytes / max(expected, 1)),
+        "publish_per_sec": round(expected / publish_seconds, 1) if publish_seconds else None,
+        "publish_p50_ms": round(percentile(sorted(publish_ms), 50), 2) if publish_ms else None,
+        "delivered": totals["received"],
+        "lost": connected * expected - totals["received"],
+        "out_of_order": totals["out_of_order"],
+        "delivery_per_sec": round(totals["received"] / delivery_seconds),
+        "latency_p50_ms": round(percentile(latencies, 50), 2) if latencies else None,
+        "latency_p95_ms": round(percentile(latencies, 95), 2) if latencies else None,
+        "latency_p99_ms": round(percentile(latencies, 99), 2) if latencies else None,
+        "latency_max_ms": round(latencies[-1], 2) if latencies else None,
+        "patch_kb_per_client": round(totals["bytes"] / max(connected, 1) / 1024, 1),
+        "refetch_kb_per_client": round(runs * board_bytes(board_size) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark leaderboard patch fan-out through a Pusher stand-in")
+    parser.add_argument("--clients", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None, help="client processes (default: one per CPU)")
+    parser.add_argument("--runs", type=int, default=5, help="scoring runs to push")
+    parser.add_argument("--changed", type=int, default=3000, help="changed entries per run")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between runs")
+    parser.add_argument("--board-size", type=int, default=100_000, help="entries a refetch would download")
+    parser.add_argument("--grace", type=float, default=60.0, help="seconds to wait for deliveries after the last run")
+    parser.add_argument("--standin", help="base URL of a running stand-in (default: start one here)")
+    parser.add_argument("--json", dest="json_path", help="write the results to this file")
+    parser.add_argument("--gate", action="store_true", help="record history and fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    raise_fd_limit()
+    stop = None
+    base_url = args.standin.rstrip("/") if args.standin else None
+    if base_url is None:
+        stop, base_url = PusherStandin().start()
+
+    print(f"📡 {args.clients:,} subscribers, {args.runs} runs of {args.changed:,} changed entries")
+    try:
+        results = run(base_url, args.clients, args.runs, args.changed, args.workers, args.interval,
+                      args.board_size, args.grace)
+    finally:
+        if stop:
+            stop()
+
+    r = results
+    print(f"   connected {r['connected']:,}/{r['clients']:,} in {r['connect_seconds']}s")
+    print(f"   {r['events']} events of {r['event_bytes']:,} bytes, {r['publish_per_sec']:,} events/s through the API")
+    print(f"   delivered {r['delivered']:,} messages at {r['delivery_per_sec']:,}/s, lost {r['lost']:,}, "
+          f"out of order {r['out_of_order']:,}")
+    print(f"   latency p50 {r['latency_p50_ms']} ms, p95 {r['latency_p95_ms']} ms, p99 {r['latency_p99_ms']} ms, "
+          f"max {r['latency_max_ms']} ms")
+    print(f"   per page: {r['patch_kb_per_client']:,} KB of patches vs {r['refetch_kb_per_client']:,} KB refetching")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.json_path}")
+
+    failed = bool(r["lost"] or r["out_of_order"] or r["connected"] < r["clients"])
+    if failed:
+        print("❌ Some clients missed messages or could not connect")
+
+    if args.gate or args.update_baseline:
+        regressions = gate(SUITE, results, BASELINES_DIR / f"{SUITE}.json", RESULTS_DIR / f"{SUITE}.jsonl",
+                           THRESHOLDS, update=args.update_baseline)
+        if regressions:
+            print("❌ Regressions:")
+            for regression in regressions:
+                print(f"   {regression}")
+            failed = True
+        else:
+            print("✅ No regressions against the baseline")
+
+    if failed:
+        raise SystemExit(1)
+    print("✅ Every subscriber got every patch, in order")
+
+
+if __name__ == "__main__":
+    main()
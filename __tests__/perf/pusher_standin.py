@@ -0,0 +1,311 @@
+"""Local stand-in for Pusher Channels, so real-time pushes can be tested and benchmarked offline.
+
+It speaks both halves of the protocol the app uses:
+  HTTP API   POST /apps/<app_id>/events and /apps/<app_id>/batch_events, signed the way the
+             pusher npm package signs them (auth_key, auth_timestamp, body_md5,
+             auth_signature). Bad signatures, events over 10KB and batches over 10 events
+             are rejected like the real API.
+  WebSocket  /app/<key>, protocol 7 as pusher-js speaks it: connection_established,
+             subscribing to public channels, ping/pong, and delivery of every triggered
+             event to the channel's subscribers, in the order they were triggered.
+
+  python __tests__/perf/pusher_standin.py --port 4040
+  PUSHER_HOST=127.0.0.1 PUSHER_PORT=4040 PUSHER_APP_ID=standin PUSHER_KEY=standin-key PUSHER_SECRET=standin-secret \\
+  NEXT_PUBLIC_PUSHER_HOST=127.0.0.1 NEXT_PUBLIC_PUSHER_PORT=4040 NEXT_PUBLIC_PUSHER_KEY=standin-key npm start
+
+GET /__standin/stats reports connections, subscriptions, events triggered and rejected,
+messages delivered and how long fan-out took; POST /__standin/reset zeroes the counters.
+Needs aiohttp (pip install aiohttp).
+"""
+import argparse
+import asyncio
+import hashlib
+import hmac
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from urllib.parse import urlencode
+
+from aiohttp import WSMsgType, web
+
+APP_ID = "standin"
+KEY = "standin-key"
+SECRET = "standin-secret"
+MAX_EVENT_BYTES = 10240
+MAX_BATCH = 10
+MAX_CHANNELS = 100
+TIMESTAMP_GRACE = 600
+
+
+def sign(secret, method, path, params):
+    """auth_signature for a request: HMAC-SHA256 over method, path and the sorted params."""
+    query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+    return hmac.new(secret.encode(), f"{method}\n{path}\n{query}".encode(), hashlib.sha256).hexdigest()
+
+
+def signed_query(key, secret, path, body, timestamp=None):
+    """Query string the pusher npm package would send with `body` (bytes)."""
+    params = {"auth_key": key, "auth_timestamp": int(timestamp or time.time()), "auth_version": "1.0",
+              "body_md5": hashlib.md5(body).hexdigest()}
+    params["auth_signature"] = sign(secret, "POST", path, params)
+    return urlencode(params)
+
+
+def _frame(event, data, channel=None):
+    message = {"event": event, "data": data if isinstance(data, str) else json.dumps(data)}
+    if channel is not None:
+        message["channel"] = channel
+    return json.dumps(message)
+
+
+class PusherStandin:
+    def __init__(self, app_id=APP_ID, key=KEY, secret=SECRET, latency_ms=0.0, seed=None):
+        self.app_id = app_id
+        self.key = key
+        self.secret = secret
+        self.latency_ms = latency_ms
+        self.channels = defaultdict(set)
+        self.counters = Counter()
+        self.fanout_ms = []
+        self._queue = None
+        self._rng = random.Random(seed)
+        self._socket_ids = itertools.count(1)
+
+    # --- HTTP API -------------------------------------------------------------------
+
+    def _check_auth(self, request, body):
+        params = dict(request.query)
+        signature = params.pop("auth_signature", "")
+        if params.get("auth_key") != self.key:
+            return "Unknown auth_key"
+        try:
+            if abs(time.time() - int(params.get("auth_timestamp", 0))) > TIMESTAMP_GRACE:
+                return "Timestamp expired"
+        except ValueError:
+            return "Invalid auth_timestamp"
+        if params.get("body_md5") != hashlib.md5(body).hexdigest():
+            return "Invalid body_md5"
+        if not hmac.compare_digest(signature, sign(self.secret, request.method, request.path, params)):
+            return "Invalid signature"
+        return None
+
+    def _error(self, status, message):
+        self.counters[f"rejected_{status}"] += 1
+        return web.Response(status=status, text=message)
+
+    def _validate(self, event):
+        channels = event.get("channels") or ([event["channel"]] if event.get("channel") else [])
+        if not event.get("name") or not channels:
+            return None, "name and channels are required"
+        if len(channels) > MAX_CHANNELS:
+            return None, f"At most {MAX_CHANNELS} channels per event"
+        data = event.get("data")
+        if not isinstance(data, str):
+            return None, "data must be a string"
+        if len(data.encode()) > MAX_EVENT_BYTES:
+            return None, "Event data is over 10KB"
+        return (channels, event["name"], data), None
+
+    async def _trigger(self, request, batch):
+        if request.match_info["app_id"] != self.app_id:
+            return self._error(404, "Unknown app")
+        body = await request.read()
+        problem = self._check_auth(request, body)
+        if problem:
+            return self._error(401, problem)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return self._error(400, "Invalid JSON")
+
+        events = payload.get("batch") if batch else [payload]
+        if not isinstance(events, list) or not events:
+            return self._error(400, "batch must be a non-empty list")
+        if len(events) > MAX_BATCH:
+            return self._error(400, f"At most {MAX_BATCH} events per batch")
+        validated = []
+        for event in events:
+            valid, problem = self._validate(event)
+            if problem:
+                return self._error(413 if "10KB" in problem else 400, problem)
+            validated.append(valid)
+
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        received = time.perf_counter()
+        for channels, name, data in validated:
+            self.counters["events"] += 1
+            self.counters["event_bytes"] += len(data)
+            await self._queue.put((received, channels, name, data))
+        return web.json_response({"batch": [{} for _ in validated]} if batch else {})
+
+    async def _events(self, request):
+        return await self._trigger(request, batch=False)
+
+    async def _batch_events(self, request):
+        return await self._trigger(request, batch=True)
+
+    async def _fanout(self):
+        # One consumer, so every subscriber gets a channel's events in the order they came in
+        while True:
+            received, channels, name, data = await self._queue.get()
+            for channel in channels:
+                frame = _frame(name, data, channel)
+                for ws in list(self.channels.get(channel, ())):
+                    if ws.closed:
+                        continue
+                    try:
+                        await ws.send_str(frame)
+                        self.counters["delivered"] += 1
+                    except (ConnectionError, RuntimeError):
+                        self.counters["send_errors"] += 1
+            self.fanout_ms.append((time.perf_counter() - received) * 1000)
+
+    # --- WebSocket ------------------------------------------------------------------
+
+    async def _socket(self, request):
+        ws = web.WebSocketResponse(heartbeat=None, max_msg_size=MAX_EVENT_BYTES * 4)
+        await ws.prepare(request)
+        if request.match_info["key"] != self.key:
+            await ws.send_str(_frame("pusher:error", {"message": "App key not in this cluster", "code": 4001}))
+            await ws.close()
+            return ws
+
+        socket_id = f"{next(self._socket_ids)}.{self._rng.randrange(10**9)}"
+        self.counters["connections"] += 1
+        subscribed = set()
+        await ws.send_str(_frame("pusher:connection_established",
+                                 {"socket_id": socket_id, "activity_timeout": 120}))
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    message = json.loads(msg.data)
+                except ValueError:
+                    continue
+                event, data = message.get("event"), message.get("data") or {}
+                if isinstance(data, str):
+                    data = json.loads(data or "{}")
+                if event == "pusher:ping":
+                    await ws.send_str(_frame("pusher:pong", {}))
+                elif event == "pusher:subscribe":
+                    channel = data.get("channel", "")
+                    if channel.startswith(("private-", "presence-")):
+                        await ws.send_str(_frame("pusher:subscription_error",
+                                                 {"type": "AuthError", "error": "Only public channels",
+                                                  "status": 401}, channel))
+                        continue
+                    self.channels[channel].add(ws)
+                    subscribed.add(channel)
+                    self.counters["subscriptions"] += 1
+                    await ws.send_str(_frame("pusher_internal:subscription_succeeded", {}, channel))
+                elif event == "pusher:unsubscribe":
+                    channel = data.get("channel", "")
+                    self.channels[channel].discard(ws)
+                    subscribed.discard(channel)
+        finally:
+            for channel in subscribed:
+                self.channels[channel].discard(ws)
+            self.counters["connections"] -= 1
+        return ws
+
+    # --- Control --------------------------------------------------------------------
+
+    def stats(self):
+        fanout = sorted(self.fanout_ms)
+        return {
+            "name": "pusher",
+            "connections": self.counters["connections"],
+            "subscribers": sum(len(s) for s in self.channels.values()),
+            "channels": sum(1 for s in self.channels.values() if s),
+            "subscriptions": self.counters["subscriptions"],
+            "events": self.counters["events"],
+            "event_bytes": self.counters["event_bytes"],
+            "delivered": self.counters["delivered"],
+            "send_errors": self.counters["send_errors"],
+            "rejected": {k[len("rejected_"):]: v for k, v in self.counters.items() if k.startswith("rejected_")},
+            "fanout_p50_ms": round(fanout[len(fanout) // 2], 3) if fanout else None,
+            "fanout_max_ms": round(fanout[-1], 3) if fanout else None,
+            "queued": self._queue.qsize() if self._queue else 0,
+        }
+
+    def reset(self):
+        for name in list(self.counters):
+            if name not in ("connections", "subscriptions"):
+                del self.counters[name]
+        self.fanout_ms.clear()
+
+    async def _stats(self, request):
+        return web.json_response(self.stats())
+
+    async def _reset(self, request):
+        self.reset()
+        return web.json_response({"ok": True})
+
+    def make_app(self):
+        app = web.Application(client_max_size=MAX_BATCH * MAX_EVENT_BYTES * 2)
+        app.add_routes([
+            web.post("/apps/{app_id}/events", self._events),
+            web.post("/apps/{app_id}/batch_events", self._batch_events),
+            web.get("/app/{key}", self._socket),
+            web.get("/__standin/stats", self._stats),
+            web.post("/__standin/reset", self._reset),
+        ])
+
+        async def fanout(app):
+            self._queue = asyncio.Queue()
+            task = asyncio.create_task(self._fanout())
+            yield
+            task.cancel()
+
+        app.cleanup_ctx.append(fanout)
+        return app
+
+    def start(self, host="127.0.0.1", port=0):
+        """Serve on a background thread; returns (stop, base_url)."""
+        loop = asyncio.new_event_loop()
+        runner = web.AppRunner(self.make_app(), handle_signals=False)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, host, port)
+        loop.run_until_complete(site.start())
+        bound_port = runner.addresses[0][1]
+        thread = threading.Thread(target=loop.run_forever, name="pusher-standin", daemon=True)
+        thread.start()
+
+        def stop():
+            asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result(timeout=10)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=10)
+
+        return stop, f"http://{host}:{bound_port}"
+
+    def serve_forever(self, host="127.0.0.1", port=4040):
+        print(f"🟢 pusher stand-in listening on http://{host}:{port}")
+        web.run_app(self.make_app(), host=host, port=port, print=None, backlog=4096)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Pusher Channels stand-in (HTTP API and WebSocket)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4040)
+    parser.add_argument("--app-id", default=APP_ID)
+    parser.add_argument("--key", default=KEY)
+    parser.add_argument("--secret", default=SECRET)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added to every HTTP API call")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    standin = PusherStandin(args.app_id, args.key, args.secret, latency_ms=args.latency_ms, seed=args.seed)
+    print("Run the app with:")
+    print(f"  PUSHER_HOST={args.host} PUSHER_PORT={args.port} PUSHER_APP_ID={args.app_id} PUSHER_KEY={args.key} "
+          f"PUSHER_SECRET={args.secret}")
+    print(f"  NEXT_PUBLIC_PUSHER_HOST={args.host} NEXT_PUBLIC_PUSHER_PORT={args.port} NEXT_PUBLIC_PUSHER_KEY={args.key}")
+    standin.serve_forever(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
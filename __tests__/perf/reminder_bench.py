@@ -0,0 +1,215 @@
+"""Pick reminder benchmark: users per second through /api/send-pick-reminders, fully offline.
+
+The route pages through the Clerk user directory, looks up opt-outs and picks, and sends
+reminders through SendGrid. Both services are replaced by stand-ins, so the directory
+can be any size and nobody gets mail:
+
+  python __tests__/perf/clerk_standin.py --port 4020 --latency-ms 120 &
+  python __tests__/perf/sendgrid_standin.py --port 4030 --rate-limit 10 --latency-ms 250 &
+  CLERK_API_URL=http://127.0.0.1:4020 CLERK_SECRET_KEY=sk_test_standin \\
+  SENDGRID_API_URL=http://127.0.0.1:4030 SENDGRID_API_KEY=SG.standin SENDGRID_TEMPLATE_ID=d-standin \\
+  POSTGRES_URL="postgresql://localhost/tallysight?sslmode=disable" npm start
+  python __tests__/perf/reminder_bench.py --sizes 1000,10000,100000 --dsn postgresql://localhost/tallysight
+
+For each size the Clerk directory is resized to that many users (seed_db clerk ids) and
+--games games starting 90 minutes from now are added for today. Every 10th user has
+opted out, every 7th already picked every game and every 5th picked only the first one,
+so the expected recipients are known exactly. Reported per size: wall time, users per
+second, SendGrid requests (and how many were throttled or failed) and the delivery check:
+  missing     expected recipients SendGrid never accepted mail for
+  unexpected  recipients that should not have been mailed
+  duplicates  recipients mailed more than once
+  wrong_games sampled recipients whose reminder lists the wrong number of games
+Exits non-zero when the delivery check fails.
+"""
+import argparse
+import json
+import urllib.request
+from datetime import datetime, timedelta
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate
+from clerk_standin import resize_directory
+from leaderboard_scale import format_scaling, timed_get
+from seed_db import ENSURE_SCHEMA_SQL, SEED_CLERK_PREFIX, check_local
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+SUITE = "pick-reminders"
+GAME_PREFIX = "reminder_bench_"
+
+THRESHOLDS = {
+    "*.users_per_sec": Threshold(relative=0.25, absolute=50, higher_is_better=True),
+    "*.seconds": Threshold(relative=0.25, absolute=1),
+    "*.sendgrid_requests": Threshold(relative=0.1, absolute=2),
+    "*.missing": Threshold(relative=0, absolute=0),
+    "*.unexpected": Threshold(relative=0, absolute=0),
+    "*.duplicates": Threshold(relative=0, absolute=0),
+    "*.status": Threshold(relative=0, absolute=0),
+    "*": None,
+}
+
+# The route reads a "status" column on "Game" and a "UserPreferences" table that live in
+# the production database but not in prisma/schema.prisma
+REMINDER_SCHEMA_SQL = ENSURE_SCHEMA_SQL + """
+ALTER TABLE "Game" ADD COLUMN IF NOT EXISTS "status" TEXT;
+CREATE TABLE IF NOT EXISTS "UserPreferences" (
+    "userId" TEXT PRIMARY KEY,
+    "emailNotifications" BOOLEAN NOT NULL DEFAULT true
+);
+"""
+
+PREPARE_SQL = [
+    'DELETE FROM "Game" WHERE id LIKE %(game_prefix)s',  # cascades to their picks
+    'DELETE FROM "UserPreferences" WHERE "userId" LIKE %(user_prefix)s',
+    """
+    INSERT INTO "Game" (id, "team1Name", "team2Name", "gameDate", "gameTime", sport, status)
+    SELECT %(game_id)s || g, 'Home ' || g, 'Away ' || g, CURRENT_DATE, %(game_time)s::time, 'NBA', 'SCHEDULED'
+    FROM generate_series(1, %(games)s) AS g
+    """,
+    """
+    INSERT INTO "UserPreferences" ("userId", "emailNotifications")
+    SELECT %(clerk_prefix)s || lpad(i::text, 7, '0'), false
+    FROM generate_series(1, %(users)s) AS i
+    WHERE i %% 10 = 0
+    """,
+    """
+    INSERT INTO "Pick" (id, "userId", "gameId", "teamIndex", sport)
+    SELECT gen_random_uuid()::text, %(clerk_prefix)s || lpad(i::text, 7, '0'), %(game_id)s || g, 0, 'NBA'
+    FROM generate_series(1, %(users)s) AS i, generate_series(1, %(games)s) AS g
+    WHERE i %% 7 = 0 OR (i %% 5 = 0 AND g = 1)
+    """,
+]
+
+
+def reminder_games(user, games):
+    """How many games user number `user` should be reminded of (0: no email at all)."""
+    if user % 10 == 0 or user % 7 == 0:
+        return 0
+    return games - 1 if user % 5 == 0 else games
+
+
+def expected_recipients(users, games):
+    return {f"seed_user_{i}@example.test": n for i in range(1, users + 1) if (n := reminder_games(i, games))}
+
+
+def prepare_database(dsn, users, games, start):
+    """Today's reminder games starting at `start` plus the opt-outs and picks described above.
+
+    Users are seed_db.clerk_id(1..users), the same ids the Clerk stand-in lists.
+    """
+    import psycopg
+
+    params = {"game_prefix": f"{GAME_PREFIX}%", "user_prefix": f"{SEED_CLERK_PREFIX}%", "game_id": GAME_PREFIX,
+              "clerk_prefix": SEED_CLERK_PREFIX, "game_time": start.strftime("%H:%M:%S"), "games": games,
+              "users": users}
+    with psycopg.connect(dsn) as conn:
+        conn.execute(REMINDER_SCHEMA_SQL)
+        for statement in PREPARE_SQL:
+            conn.execute(statement, params)
+
+
+def _json(url, method="GET"):
+    request = urllib.request.Request(url, method=method)
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return json.loads(response.read())
+
+
+def check_deliveries(sendgrid_url, expected, sample=25):
+    """Compare what the SendGrid stand-in accepted with `expected` {email: games}."""
+    delivered = _json(f"{sendgrid_url}/__sendgrid/recipients")
+    missing = [email for email in expected if email not in delivered]
+    unexpected = [email for email in delivered if email not in expected]
+    duplicates = [email for email, r in delivered.items() if r["deliveries"] > 1]
+    step = max(1, len(expected) // sample)
+    wrong_games = [email for email in list(expected)[::step]
+                   if email in delivered
+                   and len((delivered[email]["dynamic_template_data"] or {}).get("games", [])) != expected[email]]
+    return {"missing": len(missing), "unexpected": len(unexpected), "duplicates": len(duplicates),
+            "wrong_games": len(wrong_games), "examples": (missing + unexpected + duplicates + wrong_games)[:5]}
+
+
+def run_size(base_url, dsn, clerk_url, sendgrid_url, users, games, timeout=1800):
+    start = datetime.now() + timedelta(minutes=90)
+    if start.date() != datetime.now().date():
+        raise SystemExit("❌ Reminder games would start tomorrow; run the benchmark before 22:30")
+
+    resize_directory(clerk_url, users)
+    prepare_database(dsn, users, games, start)
+    _json(f"{sendgrid_url}/__standin/reset", method="POST")
+
+    response = timed_get(f"{base_url}/api/send-pick-reminders", timeout)
+    stats = _json(f"{sendgrid_url}/__sendgrid/stats")
+    check = check_deliveries(sendgrid_url, expected_recipients(users, games))
+    seconds = response["total_ms"] / 1000
+    return {
+        "status": response["status"],
+        "seconds": round(seconds, 3),
+        "users_per_sec": round(users / seconds, 1) if seconds else 0.0,
+        "emails": stats["deliveries"],
+        "sendgrid_requests": stats["requests"],
+        "throttled": stats["statuses"].get("429", 0),
+        "failed": stats["statuses"].get("500", 0),
+        "largest_batch": stats["largest_batch"],
+        **{k: v for k, v in check.items() if k != "examples"},
+    }, check["examples"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/send-pick-reminders against Clerk and SendGrid stand-ins")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES), help="Clerk directory sizes")
+    parser.add_argument("--games", type=int, default=3, help="games starting in 90 minutes (at least 2)")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--dsn", required=True, help="local Postgres the app under test reads")
+    parser.add_argument("--clerk-standin", default="http://127.0.0.1:4020")
+    parser.add_argument("--sendgrid-standin", default="http://127.0.0.1:4030")
+    parser.add_argument("--timeout", type=float, default=1800)
+    parser.add_argument("--allow-remote", action="store_true")
+    parser.add_argument("--json", dest="json_path", help="write {size: metrics} to this file")
+    parser.add_argument("--gate", action="store_true", help="record history and fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    if not args.allow_remote:
+        check_local(args.dsn)
+    if args.games < 2:
+        parser.error("--games must be at least 2")
+
+    results = {}
+    failed = False
+    for size in (int(s) for s in args.sizes.split(",")):
+        print(f"📨 Reminders for {size:,} users")
+        results[size], examples = run_size(args.base_url.rstrip("/"), args.dsn, args.clerk_standin.rstrip("/"),
+                                           args.sendgrid_standin.rstrip("/"), size, args.games, args.timeout)
+        r = results[size]
+        print(f"   {r['emails']:,} emails in {r['seconds']:.1f}s ({r['users_per_sec']:,.0f} users/s), "
+              f"{r['sendgrid_requests']} SendGrid requests, {r['throttled']} throttled (HTTP {r['status']})")
+        if r["status"] != 200 or r["missing"] or r["unexpected"] or r["duplicates"] or r["wrong_games"]:
+            failed = True
+            print(f"   ❌ missing {r['missing']}, unexpected {r['unexpected']}, duplicates {r['duplicates']}, "
+                  f"wrong games {r['wrong_games']}, e.g. {examples}")
+
+    print(format_scaling(results))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.json_path}")
+
+    if args.gate or args.update_baseline:
+        metrics = {f"{size}.{name}": value for size, m in results.items() for name, value in m.items()}
+        regressions = gate(SUITE, metrics, BASELINES_DIR / f"{SUITE}.json", RESULTS_DIR / f"{SUITE}.jsonl",
+                           THRESHOLDS, update=args.update_baseline)
+        if regressions:
+            print("❌ Regressions:")
+            for regression in regressions:
+                print(f"   {regression}")
+            failed = True
+        else:
+            print("✅ No regressions against the baseline")
+
+    if failed:
+        raise SystemExit(1)
+    print("✅ Every expected reminder delivered exactly once")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""HTTP-level user flows for loadgen.py.
+
+Each scenario is `async def name(vu)` and replays the requests a browser makes for one
+of the flows the Selenium suites drive:
+  today_contests      home page -> Play Now -> /daily-picks (test_todayContests.py)
+  my_picks_history    pick a team, submit, check /myPicks (Test_MyPicksHistory.py)
+  leaderboards        /leaderboards and its data routes
+  pick_deadline       weighted mix of the above, modelling the rush before games lock
+
+Authenticated steps only run when the VU has an identity (--identities); anonymous VUs
+still load the pages and read-only routes.
+"""
+import asyncio
+from datetime import date
+
+SPORTS = ["NBA", "MLB", "NFL", "NHL"]
+SOCCER_LEAGUES = ["MLS", "EPL", "LALIGA", "BUNDESLIGA", "SERIE_A", "LIGUE_1"]
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+def current_week(today=None):
+    # Mirrors getCurrentWeek() in DailyPicks.tsx / handleAllGamesDone.ts
+    today = today or date.today()
+    days = (today - date(today.year, 1, 1)).days
+    return -(-(days + 1) // 7)
+
+
+def build_picks(games, sport, rng, best_pick=True):
+    """Pick a side for every game, shaped like DailyPicks.tsx handleSubmitPicks()."""
+    best_game = rng.choice(games)["id"] if best_pick and games else None
+    picks = []
+    for game in games:
+        picks.append({
+            "gameId": game["id"],
+            "teamIndex": rng.randint(0, 1),
+            "homeTeam": game.get("homeTeam"),
+            "awayTeam": game.get("awayTeam"),
+            "dbDate": game.get("dbDate"),
+            "dbTime": game.get("dbTime"),
+            "estDate": game.get("estDate"),
+            "gameTime": game.get("gameTime"),
+            "status": game.get("status"),
+            "bestPick": game["id"] == best_game,
+            "sport": sport,
+        })
+    return picks
+
+
+async def home_page(vu):
+    # home/page.tsx fetches today's and tomorrow's slate for every league on mount
+    await vu.request("GET", "/", label="page /")
+    await asyncio.gather(*(
+        vu.request("GET", f"/api/all-espn-games?sport={sport}&day={day}")
+        for day in ("today", "tomorrow")
+        for sport in SPORTS + SOCCER_LEAGUES
+    ))
+
+
+@scenario("today_contests")
+async def today_contests(vu):
+    await home_page(vu)
+    await vu.think(0.5, 2.0)
+
+    sport = vu.rng.choice(SPORTS)
+    await vu.request("GET", "/daily-picks", label="page /daily-picks")
+    await asyncio.gather(
+        vu.request("GET", f"/api/all-espn-games?sport={sport.lower()}"),
+        vu.request("GET", "/api/userPickPercentage"),
+    )
+
+
+@scenario("my_picks_history")
+async def my_picks_history(vu):
+    sport = vu.rng.choice(SPORTS)
+    await vu.request("GET", "/daily-picks", label="page /daily-picks")
+    _, data, _ = await vu.request("GET", f"/api/all-espn-games?sport={sport.lower()}")
+    games = data.get("games", []) if isinstance(data, dict) else []
+
+    if vu.identity is not None:
+        # 404 means "no picks yet", which the page treats as a valid state
+        await vu.request("GET", "/api/userPicks", ok_statuses=(404,))
+
+        if games:
+            await vu.think(1.0, 5.0)
+            await vu.request("POST", "/api/savePicks", json_body={
+                "picks": build_picks(games, sport, vu.rng),
+                "pickDate": date.today().isoformat(),
+            })
+            await vu.request("POST", "/api/leaderboard-entries/verifyEntry", json_body={
+                "clerk_id": vu.user_id, "sport": sport, "week": current_week(),
+            })
+            await vu.request("GET", "/api/userPickPercentage")
+
+    await vu.request("GET", "/myPicks", label="page /myPicks")
+    if vu.identity is not None:
+        await vu.request("GET", "/api/userPicks", ok_statuses=(404,))
+
+
+@scenario("leaderboards")
+async def leaderboards(vu):
+    await vu.request("GET", "/leaderboards", label="page /leaderboards")
+    # What components/leaderboard.tsx asks for: the first page of the overall board and,
+    # for a signed-in user further down, their own rank
+    await vu.request("GET", "/api/leaderboard/page?sport=SELECT&week=0&limit=50")
+    if vu.identity is not None:
+        await vu.request("GET", f"/api/leaderboard/rank?sport=SELECT&week=0&clerk_id={vu.user_id}")
+
+
+@scenario("pick_deadline")
+async def pick_deadline(vu):
+    roll = vu.rng.random()
+    if roll < 0.6:
+        await my_picks_history(vu)
+    elif roll < 0.85:
+        await today_contests(vu)
+    else:
+        await leaderboards(vu)
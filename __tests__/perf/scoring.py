@@ -0,0 +1,212 @@
+"""Reference implementation of the leaderboard scoring rules, to cross-check updateEntryPoints.
+
+The route scores every entry with one SQL statement; this module applies the same rules
+(see the comment at the top of src/app/api/leaderboard-entries/updateEntryPoints/route.ts)
+one pick at a time in plain Python, so the two can be compared on seeded data:
+
+  python __tests__/perf/seed_db.py --users 10000 --sports NBA --weeks 1 --truncate
+  python __tests__/perf/scoring.py --sport NBA --incremental --rescore-week \\
+      --base-url http://localhost:3000 --dsn postgresql://localhost/tallysight
+
+The cross-check reads the games, picks and entries of the leaderboard, works out how many
+points and max points every entered user should gain, calls the route once and compares
+that with what actually changed in leaderboard_entries and users. --rescore-week forgets
+which games were already scored, so the whole week is scored again on top of the seeded
+points. Exits non-zero on any difference.
+"""
+import argparse
+import json
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from seed_db import EST, check_local, week_of
+
+MAX_POINTS_PER_GAME = 1
+BONUS_POINTS = 3
+BEST_PICK_POINTS = 3
+UNDERDOG_POINTS = 2
+
+
+def new_game_ids(games, scored, week_days, today, incremental=True):
+    """Decided games the route scores: unscored ones of the week, or all of today's."""
+    if incremental:
+        return {gid for gid, g in games.items() if g["won"] is not None and g["day"] in week_days and gid not in scored}
+    return {gid for gid, g in games.items() if g["won"] is not None and g["day"] == today}
+
+
+def score(games, picks, new_ids):
+    """{clerk_id: [points, max_points]} gained from scoring `new_ids`.
+
+    `games` maps game id -> {"day", "won", "is_underdog_win", "underdog_team_id"} and must
+    hold every game of the days involved; `picks` are (clerk_id, game_id, team_index, best_pick).
+    """
+    by_day = defaultdict(list)
+    for gid, game in games.items():
+        by_day[game["day"]].append(game)
+    completed = {games[gid]["day"] for gid in new_ids
+                 if all(g["won"] is not None for g in by_day[games[gid]["day"]])}
+
+    gained = defaultdict(lambda: [0, 0])
+    days = defaultdict(lambda: {"correct": 0, "best": False})
+    for clerk_id, game_id, team_index, best_pick in picks:
+        game = games.get(game_id)
+        if game is None:
+            continue
+        correct = game["won"] is not None and int(game["won"]) == team_index
+        if game_id in new_ids:
+            gained[clerk_id][1] += MAX_POINTS_PER_GAME
+            if correct:
+                gained[clerk_id][0] += MAX_POINTS_PER_GAME
+                if game["is_underdog_win"] and game["underdog_team_id"] == str(team_index):
+                    gained[clerk_id][0] += UNDERDOG_POINTS
+                if best_pick:
+                    gained[clerk_id][0] += BEST_PICK_POINTS
+        if game["day"] in completed:
+            day = days[(clerk_id, game["day"])]
+            day["correct"] += correct
+            day["best"] = day["best"] or bool(best_pick)
+
+    for (clerk_id, day), result in days.items():
+        gained[clerk_id][1] += BONUS_POINTS + (BEST_PICK_POINTS if result["best"] else 0)
+        if result["correct"] == len(by_day[day]):
+            gained[clerk_id][0] += BONUS_POINTS
+    return dict(gained)
+
+
+LEADERBOARD_SQL = """
+SELECT leaderboard_id, make_date(year, 1, 1) + (week - 1) * 7,
+       CASE WHEN EXTRACT(HOUR FROM NOW()) BETWEEN 0 AND 6 THEN CURRENT_DATE - 1 ELSE CURRENT_DATE END
+FROM leaderboards WHERE sport = %(sport)s AND week = %(week)s AND year = EXTRACT(YEAR FROM NOW())
+"""
+
+GAMES_SQL = """
+SELECT id, "gameDate", won::int, is_underdog_win, underdog_team_id
+FROM "Game"
+WHERE sport = %(sport)s AND ("gameDate" = ANY(%(days)s))
+"""
+
+PICKS_SQL = """
+SELECT "userId", "gameId", "teamIndex", COALESCE("bestPick", false)
+FROM "Pick" WHERE "gameId" = ANY(%(games)s)
+"""
+
+ENTRIES_SQL = """
+SELECT u.clerk_id, COALESCE(le.points, 0), COALESCE(u.points, 0), u.max_points
+FROM leaderboard_entries le JOIN users u ON u.user_id = le.user_id
+WHERE le.leaderboard_id = %(leaderboard_id)s
+"""
+
+
+def load_state(dsn, sport, week):
+    """Everything `score` needs for the leaderboard, plus the entered users' current totals."""
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        row = conn.execute(LEADERBOARD_SQL, {"sport": sport, "week": week}).fetchone()
+        if row is None:
+            raise SystemExit(f"❌ No {sport} leaderboard for week {week}")
+        leaderboard_id, first_day, today = row
+        week_days = {first_day + timedelta(days=i) for i in range(7)}
+        games = {gid: {"day": day, "won": won, "is_underdog_win": underdog_win, "underdog_team_id": underdog}
+                 for gid, day, won, underdog_win, underdog
+                 in conn.execute(GAMES_SQL, {"sport": sport, "days": sorted(week_days | {today})})}
+        picks = conn.execute(PICKS_SQL, {"games": list(games)}).fetchall()
+        scored = {gid for (gid,) in conn.execute(
+            "SELECT game_id FROM leaderboard_scored_games WHERE leaderboard_id = %s", (leaderboard_id,))}
+        entries = {clerk_id: (entry, points, max_points) for clerk_id, entry, points, max_points
+                   in conn.execute(ENTRIES_SQL, {"leaderboard_id": leaderboard_id})}
+    return {"leaderboard_id": leaderboard_id, "week_days": week_days, "today": today, "games": games,
+            "picks": picks, "scored": scored, "entries": entries}
+
+
+def expected_changes(state, incremental=True):
+    new_ids = new_game_ids(state["games"], state["scored"], state["week_days"], state["today"], incremental)
+    gained = score(state["games"], state["picks"], new_ids)
+    return new_ids, {clerk_id: tuple(gained.get(clerk_id, (0, 0))) for clerk_id in state["entries"]}
+
+
+def compare(before, after, expected):
+    """Entries whose points, or whose user's points / max points, did not change as expected."""
+    mismatches = []
+    for clerk_id, (points, max_points) in expected.items():
+        entry_0, user_0, max_0 = before[clerk_id]
+        entry_1, user_1, max_1 = after[clerk_id]
+        actual = (entry_1 - entry_0, user_1 - user_0, max_1 - max_0)
+        if actual != (points, points, max_points):
+            mismatches.append({"clerk_id": clerk_id, "expected": [points, points, max_points],
+                               "actual": list(actual)})
+    return mismatches
+
+
+def forget_scored_games(dsn, leaderboard_id):
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        return conn.execute("DELETE FROM leaderboard_scored_games WHERE leaderboard_id = %s",
+                            (leaderboard_id,)).rowcount
+
+
+def call_route(base_url, sport, week, incremental=True, timeout=600):
+    request = urllib.request.Request(
+        f"{base_url}/api/leaderboard-entries/updateEntryPoints", method="POST",
+        data=json.dumps({"sport": sport, "week": week, "incremental": incremental}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"{}")
+
+
+def crosscheck(base_url, dsn, sport, week, incremental=True, rescore_week=False, timeout=600):
+    if rescore_week:
+        forget_scored_games(dsn, load_state(dsn, sport, week)["leaderboard_id"])
+    before = load_state(dsn, sport, week)
+    new_ids, expected = expected_changes(before, incremental)
+    status, body = call_route(base_url, sport, week, incremental, timeout)
+    after = load_state(dsn, sport, week)
+    return {
+        "status": status,
+        "response": body,
+        "games": len(new_ids),
+        "entries": len(expected),
+        "entries_gaining": sum(1 for points, max_points in expected.values() if points or max_points),
+        "unscored_after": sorted(new_ids - after["scored"]),
+        "mismatches": compare(before["entries"], after["entries"], expected),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-check updateEntryPoints against the reference scoring")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--dsn", required=True, help="local Postgres the app under test writes to")
+    parser.add_argument("--allow-remote", action="store_true")
+    parser.add_argument("--sport", default="NBA")
+    parser.add_argument("--week", type=int, help="default: the current week")
+    parser.add_argument("--incremental", action="store_true", help="score like the points cron does")
+    parser.add_argument("--rescore-week", action="store_true", help="forget which games were scored first")
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args()
+
+    if not args.allow_remote:
+        check_local(args.dsn)
+
+    week = args.week or week_of(datetime.now(EST).date())
+    report = crosscheck(args.base_url.rstrip("/"), args.dsn, args.sport, week, args.incremental,
+                        args.rescore_week, args.timeout)
+    print(f"HTTP {report['status']}: {report['games']} games scored, "
+          f"{report['entries_gaining']:,} of {report['entries']:,} entries gaining points")
+    if report["status"] != 200 or report["mismatches"] or report["unscored_after"]:
+        for mismatch in report["mismatches"][:10]:
+            print(f"   {mismatch['clerk_id']}: expected (entry, user, max) +{mismatch['expected']}, "
+                  f"got +{mismatch['actual']}")
+        print(f"❌ {len(report['mismatches'])} entries differ from the reference scoring")
+        raise SystemExit(1)
+    print("✅ Every entry matches the reference scoring")
+
+
+if __name__ == "__main__":
+    main()
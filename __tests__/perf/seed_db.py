@@ -0,0 +1,612 @@
+"""Bulk-load a local Postgres with a synthetic, internally consistent Tallysight dataset.
+
+  npm run db:setup                                     # create the tables and triggers
+  python __tests__/perf/seed_db.py --users 100000 --sports NBA,NFL,MLB,NHL --weeks 8 --truncate
+
+Rows are streamed with COPY (psycopg 3: pip install "psycopg[binary]"):
+  "Game"               the ESPN stand-in's synthetic slates for every day of the seeded weeks,
+                       so games the load generator picks from already exist
+  users                --users accounts, clerk ids user_seed_0000001...
+  "Pick"               every active user picks each game of a day for their sports
+  leaderboards         one per sport and week, like verifyEntry expects
+  leaderboard_entries  derived in SQL from the picks, with points already scored
+  contests             one per sport and week
+
+Seeded users are marked by their clerk id prefix, so a run can be repeated after
+--truncate or inspected with `WHERE clerk_id LIKE 'user_seed_%'`. Only local databases
+are touched unless --allow-remote is passed.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo
+
+from espn_standin import LEAGUES, parse_date, slate_size, synthetic_event
+
+EST = ZoneInfo("America/New_York")
+SEED_CLERK_PREFIX = "user_seed_"
+COPY_CHUNK_BYTES = 1 << 20
+
+SEEDED_TABLES = ['"Pick"', '"Game"', "leaderboard_entries", "leaderboard_scored_games", "leaderboards", "contests",
+                 "users"]
+TRUNCATE_SQL = f"TRUNCATE {', '.join(SEEDED_TABLES)} RESTART IDENTITY CASCADE"
+
+USER_COLUMNS = ["username", "email", "clerk_id", "start_date", "bio", "fav_team"]
+GAME_COLUMNS = ["id", "team1Name", "team2Name", "team1Logo", "team2Logo", "gameDate", "gameTime", "sport",
+                "won", "final_score", "winner", "underdog_team_id", "is_underdog_win"]
+PICK_COLUMNS = ["id", "userId", "gameId", "teamIndex", "createdAt", "sport", "bestPick"]
+CONTEST_COLUMNS = ["title", "start_date", "end_date", "prize", "status", "description", "category",
+                   "participants", "max_participants", "max_entries", "current_entries"]
+
+
+def week_of(day):
+    # Mirrors getCurrentWeek() in DailyPicks.tsx / handleAllGamesDone.ts
+    return (day.timetuple().tm_yday + 6) // 7
+
+
+def week_days(year, week):
+    first = date(year, 1, 1) + timedelta(days=(week - 1) * 7)
+    return [first + timedelta(days=i) for i in range(7) if (first + timedelta(days=i)).year == year]
+
+
+def parse_weeks(value, today):
+    """`8` -> the 8 weeks up to and including the current one; `3-10` -> weeks 3..10."""
+    if "-" in value:
+        start, end = (int(part) for part in value.split("-", 1))
+    else:
+        end = week_of(today)
+        start = max(1, end - int(value) + 1)
+    if start < 1 or end < start:
+        raise ValueError(f"invalid week range: {value}")
+    return list(range(start, end + 1))
+
+
+class SeedConfig:
+    def __init__(self, users=10000, sports=("NBA", "NFL", "MLB", "NHL"), weeks=None, today=None, seed=0,
+                 logo_base_url="http://127.0.0.1:4010", now=None):
+        self.users = users
+        self.sports = list(sports)
+        self.today = today or datetime.now(EST).date()
+        self.weeks = weeks or parse_weeks("8", self.today)
+        self.year = self.today.year
+        self.seed = seed
+        self.logo_base_url = logo_base_url
+        # Decides which games are final; fixed so every pick worker sees the same results
+        if now is None:
+            now = datetime(self.today.year, self.today.month, self.today.day, 12, tzinfo=EST) if today else datetime.now(timezone.utc)
+        self.now = now
+
+        unknown = [s for s in self.sports if s not in LEAGUES]
+        if unknown:
+            raise ValueError(f"unknown sports: {', '.join(unknown)} (choose from {', '.join(LEAGUES)})")
+
+    @property
+    def days(self):
+        days = [day for week in self.weeks for day in week_days(self.year, week)]
+        # userPickPercentage reads today's and tomorrow's games
+        tomorrow = self.today + timedelta(days=1)
+        if days and days[-1] >= self.today and tomorrow not in days:
+            days.append(tomorrow)
+        return days
+
+
+class SeedGame:
+    __slots__ = ("id", "sport", "day", "start_est", "home_share", "row")
+
+    def __init__(self, id, sport, day, start_est, home_share, row):
+        self.id = id
+        self.sport = sport
+        self.day = day
+        self.start_est = start_est  # naive EST, like "Pick"."createdAt"
+        self.home_share = home_share
+        self.row = row
+
+
+def build_games(config):
+    """Game rows for every seeded day, taken from the ESPN stand-in's synthetic slates.
+
+    Games are returned grouped as {(sport, day): [SeedGame, ...]}. `won` follows
+    syncSportsRadarData: 0 when team1 (home) won, 1 when team2 (away) won.
+    """
+    slates = {}
+    for sport in config.sports:
+        for day in config.days:
+            key = day.strftime("%Y%m%d")
+            games = []
+            for index in range(slate_size(sport, key, None)):
+                event = synthetic_event(sport, key, index, config.logo_base_url, now=config.now)
+                competition = event["competitions"][0]
+                home = next(c for c in competition["competitors"] if c["homeAway"] == "home")
+                away = next(c for c in competition["competitors"] if c["homeAway"] == "away")
+                start = datetime.strptime(event["date"], "%Y-%m-%dT%H:%MZ").replace(tzinfo=timezone.utc)
+                start_est = start.astimezone(EST)
+
+                won = None
+                if home["winner"]:
+                    won = 0
+                elif away["winner"]:
+                    won = 1
+
+                underdog = None
+                if competition["odds"]:
+                    underdog = 1 if competition["odds"][0]["homeTeamOdds"]["favorite"] else 0
+                finished = competition["status"]["type"]["completed"]
+
+                row = (
+                    event["id"], home["team"]["name"], away["team"]["name"], home["team"]["logo"],
+                    away["team"]["logo"], start_est.date().isoformat(), start_est.strftime("%H:%M:%S"), sport,
+                    won, f"{home['score']}-{away['score']}" if finished else None,
+                    None if won is None else bool(won),
+                    None if underdog is None else str(underdog),
+                    None if underdog is None or won is None else won == underdog,
+                )
+                share = random.Random(f"share:{event['id']}").uniform(0.2, 0.8)
+                games.append(SeedGame(event["id"], sport, day, start_est.replace(tzinfo=None), share, row))
+            slates[(sport, day)] = games
+    return slates
+
+
+def clerk_id(index):
+    return f"{SEED_CLERK_PREFIX}{index:07d}"
+
+
+def user_rows(config):
+    rng = random.Random(f"users:{config.seed}")
+    first_day = date(config.year, 1, 1)
+    span = max(1, (config.today - first_day).days)
+    for i in range(1, config.users + 1):
+        sport = rng.choice(config.sports)
+        yield (
+            f"seed_user_{i}", f"seed_user_{i}@example.test", clerk_id(i),
+            (first_day + timedelta(days=rng.randrange(span))).isoformat(),
+            None, sport if rng.random() < 0.4 else None,
+        )
+
+
+def pick_rows(config, slates, first_user=1, last_user=None):
+    """Picks for users first_user..last_user (default: all), deterministic per (seed, user).
+
+    Activity is heavy-tailed: most users play a few days, a handful play every day. An
+    active user picks every game of the day's slate and marks one as their best pick,
+    which is what DailyPicks submits. Nobody picks games more than a day ahead.
+    """
+    latest_pick_day = config.today + timedelta(days=1)
+    days = [day for day in config.days if day <= latest_pick_day]
+    sport_count_weights = [0.55, 0.3, 0.15][:len(config.sports)]
+
+    minute = timedelta(minutes=1)
+    for i in range(first_user, (last_user or config.users) + 1):
+        rng = random.Random(config.seed * 1_000_003 + i)
+        rand = rng.random
+        user = clerk_id(i)
+        activity = rng.betavariate(0.6, 2.0)
+        count = rng.choices(range(1, len(sport_count_weights) + 1), weights=sport_count_weights)[0]
+        for sport in rng.sample(config.sports, count):
+            for day in days:
+                if rand() >= activity:
+                    continue
+                games = slates[(sport, day)]
+                if not games:
+                    continue
+                best = rng.randrange(len(games))
+                for index, game in enumerate(games):
+                    # Hot loop: millions of rows, so no uuid module and no strftime
+                    h = "%032x" % rng.getrandbits(128)
+                    created = game.start_est - minute * int(30 + rand() * 1770)
+                    yield (
+                        f"{h[:8]}-{h[8:12]}-4{h[13:16]}-a{h[17:20]}-{h[20:]}",
+                        user, game.id, 0 if rand() < game.home_share else 1,
+                        created.isoformat(" "), sport, index == best,
+                    )
+
+
+def leaderboard_rows(config):
+    for sport in config.sports:
+        for week in config.weeks:
+            start = week_days(config.year, week)[0]
+            # Same naming as /api/leaderboard/newLeaderboard
+            yield (f"{sport} - Week {week}", sport, week, f"{start.isoformat()} 00:00:00",
+                   f"Leaderboard for {sport} - Week {week}")
+
+
+def contest_rows(config):
+    rng = random.Random(f"contests:{config.seed}")
+    for sport in config.sports:
+        for week in config.weeks:
+            days = week_days(config.year, week)
+            start, end = days[0], days[-1]
+            if end < config.today:
+                status = "completed"
+            elif start <= config.today:
+                status = "active"
+            else:
+                status = "upcoming"
+            max_participants = rng.choice([1000, 5000, 10000, 50000])
+            participants = rng.randint(0, max_participants) if status != "upcoming" else 0
+            yield (
+                f"{sport} Week {week} Challenge", f"{start.isoformat()} 00:00:00+00",
+                f"{end.isoformat()} 23:59:59+00", rng.choice([0, 50, 100, 500]), status,
+                f"Pick every {sport} game this week", sport, participants, max_participants,
+                rng.choice([1, 3, 5]), participants,
+            )
+
+
+def copy_value(value):
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def copy_rows(cursor, table, columns, rows):
+    """Stream rows into `table` with COPY ... FROM STDIN in text format; returns the row count."""
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    count = 0
+    buffer = []
+    size = 0
+    with cursor.copy(f"COPY {table} ({column_list}) FROM STDIN") as copy:
+        for row in rows:
+            line = "\t".join(copy_value(v) for v in row) + "\n"
+            buffer.append(line)
+            size += len(line)
+            count += 1
+            if size >= COPY_CHUNK_BYTES:
+                copy.write("".join(buffer))
+                buffer.clear()
+                size = 0
+        if buffer:
+            copy.write("".join(buffer))
+    return count
+
+
+# "bestPick" lives in the production database but not in prisma/schema.prisma;
+# leaderboard_scored_games and the leaderboard page indexes are created here too for
+# databases pushed before they existed
+ENSURE_SCHEMA_SQL = """
+ALTER TABLE "Pick" ADD COLUMN IF NOT EXISTS "bestPick" BOOLEAN NOT NULL DEFAULT false;
+CREATE TABLE IF NOT EXISTS leaderboard_scored_games (
+    leaderboard_id INTEGER NOT NULL,
+    game_id TEXT NOT NULL,
+    scored_at TIMESTAMPTZ(6) NOT NULL DEFAULT now(),
+    PRIMARY KEY (leaderboard_id, game_id)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_board_points ON leaderboard_entries (leaderboard_id, points DESC, user_id);
+CREATE INDEX IF NOT EXISTS idx_users_points ON users (points DESC, user_id);
+"""
+
+# Approximates updateEntryPoints: a point per correct pick, +3 for a correct best pick,
+# +2 for a correct underdog pick. won::int works whether "won" is stored as int or boolean.
+# Games are mapped to their leaderboard first and picks aggregated before the users join,
+# which keeps the plan to hash joins over the picks instead of per-row index lookups.
+ENTRIES_SQL = """
+INSERT INTO leaderboard_entries (user_id, leaderboard_id, rank, points, start_date)
+WITH game_board AS (
+    SELECT g.id, l.leaderboard_id, g.won::int AS won, g.is_underdog_win, g.underdog_team_id
+    FROM "Game" g
+    JOIN leaderboards l ON l.sport = g.sport
+                       AND l.week = CEIL(EXTRACT(DOY FROM g."gameDate") / 7.0)
+                       AND l.year = EXTRACT(YEAR FROM g."gameDate")
+), scored AS (
+    SELECT p."userId", gb.leaderboard_id,
+           SUM(CASE WHEN gb.won = p."teamIndex"
+                    THEN 1
+                         + CASE WHEN p."bestPick" THEN 3 ELSE 0 END
+                         + CASE WHEN gb.is_underdog_win AND gb.underdog_team_id = p."teamIndex"::text THEN 2 ELSE 0 END
+                    ELSE 0 END) AS points,
+           MIN(p."createdAt") AS start_date
+    FROM "Pick" p
+    JOIN game_board gb ON gb.id = p."gameId"
+    WHERE p."userId" LIKE %(prefix)s
+    GROUP BY p."userId", gb.leaderboard_id
+)
+SELECT u.user_id, s.leaderboard_id, 0, s.points, s.start_date
+FROM scored s
+JOIN users u ON u.clerk_id = s."userId"
+ON CONFLICT (user_id, leaderboard_id) DO NOTHING
+"""
+
+# The entries above already hold the points of every decided game, so the points cron
+# (incremental updateEntryPoints) must not score them again
+SCORED_GAMES_SQL = """
+INSERT INTO leaderboard_scored_games (leaderboard_id, game_id)
+SELECT l.leaderboard_id, g.id
+FROM "Game" g
+JOIN leaderboards l ON l.sport = g.sport
+                   AND l.week = CEIL(EXTRACT(DOY FROM g."gameDate") / 7.0)
+                   AND l.year = EXTRACT(YEAR FROM g."gameDate")
+WHERE g.won IS NOT NULL
+ON CONFLICT DO NOTHING
+"""
+
+USER_TOTALS_SQL = """
+UPDATE users u
+SET points = totals.points,
+    max_points = totals.max_points,
+    rank = totals.rank
+FROM (
+    SELECT le.user_id, SUM(le.points) AS points, MAX(le.points) AS max_points,
+           DENSE_RANK() OVER (ORDER BY SUM(le.points) DESC) AS rank
+    FROM leaderboard_entries le
+    GROUP BY le.user_id
+) AS totals
+WHERE u.user_id = totals.user_id AND u.clerk_id LIKE %(prefix)s
+"""
+
+
+# Mirrors PICK_COUNTS_BACKFILL_SQL in src/lib/pickCounts/pickCounts.ts. Picks are copied
+# with triggers off (session_replication_role), so once the app has created
+# "GamePickCounts" it has to be recounted after every load.
+PICK_COUNTS_SQL = """
+DELETE FROM "GamePickCounts";
+INSERT INTO "GamePickCounts" ("gameId", "homePicks", "awayPicks")
+SELECT "gameId", COUNT(*) FILTER (WHERE "teamIndex" = 0), COUNT(*) FILTER (WHERE "teamIndex" = 1)
+FROM "Pick"
+GROUP BY "gameId"
+"""
+
+
+def refresh_pick_counts(cur):
+    """Recount "GamePickCounts" when it exists; returns the games counted (0 when it does not)."""
+    cur.execute("""SELECT to_regclass('"GamePickCounts"')""")
+    if cur.fetchone()[0] is None:
+        return 0
+    cur.execute(PICK_COUNTS_SQL)
+    return cur.rowcount
+
+
+def check_local(dsn):
+    host = urlsplit(dsn).hostname or "localhost"
+    if host not in ("localhost", "127.0.0.1", "::1") and not host.startswith("/"):
+        raise SystemExit(f"❌ Refusing to seed {host}; pass --allow-remote if you really mean it")
+
+
+def _copy_picks(job):
+    import psycopg
+
+    dsn, config, slates, first_user, last_user = job
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        # Skips the per-row pick_gameid_fkey check; every gameId comes from the games just loaded
+        try:
+            conn.execute("SET session_replication_role = replica")
+        except psycopg.errors.InsufficientPrivilege:
+            pass
+        with conn.transaction(), conn.cursor() as cur:
+            return copy_rows(cur, '"Pick"', PICK_COLUMNS, pick_rows(config, slates, first_user, last_user))
+
+
+def drop_pick_indexes(cur):
+    """Drop the keys and indexes on "Pick"; returns the statements that recreate them.
+
+    Building them once after the load is much cheaper than maintaining them per row.
+    """
+    cur.execute("""
+        SELECT format('ALTER TABLE "Pick" DROP CONSTRAINT %I', conname),
+               format('ALTER TABLE "Pick" ADD CONSTRAINT %I %s', conname, pg_get_constraintdef(oid))
+        FROM pg_constraint
+        WHERE conrelid = '"Pick"'::regclass AND contype IN ('p', 'u')
+        UNION ALL
+        SELECT format('DROP INDEX %I.%I', schemaname, indexname), indexdef
+        FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename = 'Pick'
+          AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = '"Pick"'::regclass)
+    """)
+    statements = cur.fetchall()
+    for drop, _ in statements:
+        cur.execute(drop)
+    return [create for _, create in statements]
+
+
+def load_picks(dsn, config, slates, jobs):
+    """COPY picks over `jobs` connections; generating rows is the bottleneck, not Postgres."""
+    jobs = max(1, min(jobs, config.users))
+    bounds = [config.users * j // jobs for j in range(jobs + 1)]
+    work = [(dsn, config, slates, bounds[j] + 1, bounds[j + 1]) for j in range(jobs)]
+    if jobs == 1:
+        return _copy_picks(work[0])
+    with multiprocessing.Pool(jobs) as pool:
+        return sum(pool.map(_copy_picks, work))
+
+
+def seed(dsn, config, truncate=False, jobs=1, log=print):
+    import psycopg
+
+    counts = {}
+
+    def step(name, func):
+        started = time.perf_counter()
+        counts[name] = func()
+        log(f"  {name:<20} {counts[name]:>10,} rows in {time.perf_counter() - started:.1f}s")
+
+    slates = build_games(config)
+
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute(ENSURE_SCHEMA_SQL)
+            if truncate:
+                cur.execute(TRUNCATE_SQL)
+            else:
+                cur.execute("SELECT COUNT(*) FROM users WHERE clerk_id LIKE %s", (f"{SEED_CLERK_PREFIX}%",))
+                if cur.fetchone()[0]:
+                    raise SystemExit("❌ Database already holds seeded users; rerun with --truncate")
+
+            def load_games():
+                # Games may already exist from earlier runs or real syncs
+                cur.execute('CREATE TEMP TABLE seed_game (LIKE "Game" INCLUDING DEFAULTS) ON COMMIT DROP')
+                loaded = copy_rows(cur, "seed_game", GAME_COLUMNS,
+                                   (g.row for games in slates.values() for g in games))
+                cur.execute('INSERT INTO "Game" SELECT * FROM seed_game ON CONFLICT (id) DO NOTHING')
+                return loaded
+
+            step("Game", load_games)
+            step("users", lambda: copy_rows(cur, "users", USER_COLUMNS, user_rows(config)))
+            # An empty table can be loaded without indexes
+            recreate = drop_pick_indexes(cur) if truncate else []
+        # Pick workers use their own connections and must see the games
+        conn.commit()
+
+        try:
+            step("Pick", lambda: load_picks(dsn, config, slates, jobs))
+        except BaseException:
+            # Never leave "Pick" without its keys
+            conn.rollback()
+            conn.execute('TRUNCATE "Pick"')
+            raise
+        finally:
+            started = time.perf_counter()
+            for statement in recreate:
+                conn.execute(statement)
+            conn.commit()
+            if recreate:
+                log(f"  {'Pick indexes':<20} {len(recreate):>10,} rebuilt in {time.perf_counter() - started:.1f}s")
+
+        with conn.cursor() as cur:
+            cur.execute('ANALYZE "Pick"')
+            step("GamePickCounts", lambda: refresh_pick_counts(cur))
+
+            def derive_entries():
+                cur.execute(ENTRIES_SQL, {"prefix": f"{SEED_CLERK_PREFIX}%"})
+                entries = cur.rowcount
+                cur.execute(USER_TOTALS_SQL, {"prefix": f"{SEED_CLERK_PREFIX}%"})
+                cur.execute(SCORED_GAMES_SQL)
+                return entries
+
+            step("leaderboards", lambda: insert_leaderboards(cur, config))
+            cur.execute("ANALYZE leaderboards")
+            step("contests", lambda: copy_rows(cur, "contests", CONTEST_COLUMNS, contest_rows(config)))
+            step("leaderboard_entries", derive_entries)
+        conn.commit()
+
+        # Fresh statistics so benchmarks see the plans production would
+        conn.autocommit = True
+        for table in SEEDED_TABLES:
+            conn.execute(f"ANALYZE {table}")
+    return counts
+
+
+def insert_leaderboards(cur, config):
+    rows = list(leaderboard_rows(config))
+    cur.executemany(
+        "INSERT INTO leaderboards (name, sport, week, start_date, description) VALUES (%s, %s, %s, %s, %s) "
+        'ON CONFLICT ON CONSTRAINT "1_leaderboard_per_sport&week" DO NOTHING', rows)
+    return len(rows)
+
+
+# Scale-only entries: every seeded user in every seeded leaderboard, with points spread
+# deterministically over 0-99 (a few users at 0, like real weeks)
+SCALE_ENTRIES_SQL = """
+INSERT INTO leaderboard_entries (user_id, leaderboard_id, rank, points, start_date)
+SELECT u.user_id, l.leaderboard_id, 0, abs(hashtext(u.clerk_id || l.sport || l.week::text)) %% 100, l.start_date
+FROM users u
+CROSS JOIN leaderboards l
+WHERE u.clerk_id LIKE %(prefix)s AND l.sport = ANY(%(sports)s) AND l.week = ANY(%(weeks)s)
+"""
+
+
+def seed_leaderboard(dsn, config, log=print):
+    """Seed `config.users` users straight into the leaderboards of `config.sports` x `config.weeks`.
+
+    No games or picks are generated, so sizes up to millions of entries load in seconds;
+    meant for benchmarks that only read leaderboards. Always starts from empty tables.
+    """
+    import psycopg
+
+    counts = {}
+    started = time.perf_counter()
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute(ENSURE_SCHEMA_SQL)
+            cur.execute(TRUNCATE_SQL)
+            counts["users"] = copy_rows(cur, "users", USER_COLUMNS, user_rows(config))
+            counts["leaderboards"] = insert_leaderboards(cur, config)
+            cur.execute(SCALE_ENTRIES_SQL, {"prefix": f"{SEED_CLERK_PREFIX}%", "sports": config.sports,
+                                            "weeks": config.weeks})
+            counts["leaderboard_entries"] = cur.rowcount
+            cur.execute(USER_TOTALS_SQL, {"prefix": f"{SEED_CLERK_PREFIX}%"})
+        conn.commit()
+        conn.autocommit = True
+        for table in ("users", "leaderboards", "leaderboard_entries"):
+            conn.execute(f"ANALYZE {table}")
+    log(f"  {counts['leaderboard_entries']:,} leaderboard entries for {counts['users']:,} users "
+        f"in {time.perf_counter() - started:.1f}s")
+    return counts
+
+
+def dry_run(config, log=print):
+    slates = build_games(config)
+    counts = {
+        "Game": sum(len(games) for games in slates.values()),
+        "users": config.users,
+        "Pick": sum(1 for _ in pick_rows(config, slates)),
+        "leaderboards": len(config.sports) * len(config.weeks),
+        "contests": len(config.sports) * len(config.weeks),
+    }
+    for name, count in counts.items():
+        log(f"  {name:<20} {count:>10,} rows")
+    return counts
+
+
+def manifest(config, counts, sample=1000):
+    """What the load generator and benchmarks need to know about a seeded database."""
+    return {
+        "year": config.year,
+        "sports": config.sports,
+        "weeks": config.weeks,
+        "days": [d.isoformat() for d in config.days],
+        "counts": counts,
+        "clerk_ids": [clerk_id(i) for i in range(1, min(config.users, sample) + 1)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a local Postgres with synthetic Tallysight data")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL") or os.environ.get("POSTGRES_URL"),
+                        help="Postgres connection string (default: $DATABASE_URL, then $POSTGRES_URL)")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--sports", default="NBA,NFL,MLB,NHL", help=f"comma separated, from {','.join(LEAGUES)}")
+    parser.add_argument("--weeks", default="8", help="N weeks up to the current one, or a range like 3-10")
+    parser.add_argument("--today", help="pretend today is YYYYMMDD")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--logo-base-url", default="http://127.0.0.1:4010", help="where the ESPN stand-in serves logos")
+    parser.add_argument("--truncate", action="store_true", help="empty the seeded tables first")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="parallel COPY connections for picks")
+    parser.add_argument("--allow-remote", action="store_true")
+    parser.add_argument("--dry-run", action="store_true", help="generate rows and report counts without a database")
+    parser.add_argument("--manifest", help="write seeded sports/weeks/clerk ids to this JSON file")
+    args = parser.parse_args()
+
+    today = parse_date(args.today) if args.today else None
+    config = SeedConfig(
+        users=args.users, sports=[s.strip().upper() for s in args.sports.split(",") if s.strip()],
+        weeks=parse_weeks(args.weeks, today or datetime.now(EST).date()), today=today, seed=args.seed,
+        logo_base_url=args.logo_base_url,
+    )
+
+    started = time.perf_counter()
+    print(f"🌱 Seeding {config.users:,} users, {', '.join(config.sports)}, weeks {config.weeks[0]}-{config.weeks[-1]}")
+    if args.dry_run:
+        counts = dry_run(config)
+    else:
+        if not args.dsn:
+            sys.exit("❌ No database: pass --dsn or set DATABASE_URL")
+        if not args.allow_remote:
+            check_local(args.dsn)
+        counts = seed(args.dsn, config, truncate=args.truncate, jobs=args.jobs)
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+
+    if args.manifest:
+        with open(args.manifest, "w") as f:
+            json.dump(manifest(config, counts), f, indent=2)
+        print(f"📝 Manifest written to {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
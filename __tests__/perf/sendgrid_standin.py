@@ -0,0 +1,164 @@
+"""Local stand-in for SendGrid's v3 mail send API, so email pipelines can be benchmarked offline.
+
+The app sends through @sendgrid/mail, whose base URL follows SENDGRID_API_URL:
+
+  python __tests__/perf/sendgrid_standin.py --port 4030 --rate-limit 50
+  SENDGRID_API_URL=http://127.0.0.1:4030 SENDGRID_API_KEY=SG.standin SENDGRID_TEMPLATE_ID=d-standin npm start
+
+POST /v3/mail/send is validated like the real endpoint as far as a batch send goes: a
+Bearer key, a sender, content or a template, and 1-1000 personalizations with at least
+one recipient each. Accepted requests get 202 and every recipient is recorded.
+Throttling and failures can be injected:
+  --rate-limit N    requests per second before answering 429 (with Retry-After and
+                    X-RateLimit-* headers, like SendGrid)
+  --error-rate P    fraction of requests answered with a 500
+
+GET /__sendgrid/stats reports requests by status, recipients, the largest batch and
+recipients delivered more than once; GET /__sendgrid/recipients lists every recipient
+with their delivery count and last dynamic_template_data. POST /__standin/reset clears both.
+"""
+import argparse
+import math
+import threading
+import time
+from collections import Counter
+
+from standin import Response, Standin
+
+MAX_PERSONALIZATIONS = 1000
+
+
+def _error(status, message, field=None):
+    return Response({"errors": [{"message": message, "field": field, "help": None}]}, status=status)
+
+
+class SendgridStandin(Standin):
+    def __init__(self, rate_limit=None, error_rate=0.0, **kwargs):
+        super().__init__("sendgrid", **kwargs)
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self._mail_lock = threading.Lock()
+        self._window = (0, 0)  # (second, requests in it)
+        self.reset()
+
+        self.route("POST", "/v3/mail/send")(self.send)
+        self.route("GET", "/__sendgrid/stats")(lambda req: self.mail_stats())
+        self.route("GET", "/__sendgrid/recipients")(lambda req: self.recipient_log())
+
+    def reset(self):
+        super().reset()
+        with self._mail_lock:
+            self.statuses = Counter()
+            self.recipients = Counter()
+            self.template_data = {}
+            self.largest_batch = 0
+
+    def _throttled(self, now):
+        """Seconds until the next window when this request is over --rate-limit, else 0."""
+        if not self.rate_limit:
+            return 0
+        second = math.floor(now)
+        with self._mail_lock:
+            window, count = self._window
+            count = count + 1 if window == second else 1
+            self._window = (second, count)
+        return second + 1 - now if count > self.rate_limit else 0
+
+    def _record(self, status):
+        with self._mail_lock:
+            self.statuses[status] += 1
+
+    def send(self, req):
+        now = time.time()
+        wait = self._throttled(now)
+        if wait:
+            self._record(429)
+            response = _error(429, "too many requests")
+            response.headers.update({
+                "Retry-After": f"{wait:.3f}",
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(math.floor(now) + 1),
+            })
+            return response
+        if self.error_rate:
+            with self._lock:
+                failed = self._rng.random() < self.error_rate
+            if failed:
+                self._record(500)
+                return _error(500, "internal server error")
+
+        rejection = self.validate(req)
+        if rejection:
+            self._record(rejection.status)
+            return rejection
+
+        mail = req.json()
+        with self._mail_lock:
+            self.statuses[202] += 1
+            self.largest_batch = max(self.largest_batch, len(mail["personalizations"]))
+            for personalization in mail["personalizations"]:
+                for to in personalization["to"]:
+                    self.recipients[to["email"]] += 1
+                    self.template_data[to["email"]] = personalization.get("dynamic_template_data")
+        return Response(status=202, body=b"")
+
+    def validate(self, req):
+        if not req.headers.get("Authorization", "").startswith("Bearer "):
+            return _error(401, "The provided authorization grant is invalid, expired, or revoked")
+        try:
+            mail = req.json()
+        except ValueError:
+            return _error(400, "Bad Request")
+        personalizations = (mail or {}).get("personalizations") or []
+        if not personalizations:
+            return _error(400, "The personalizations field is required", "personalizations")
+        if len(personalizations) > MAX_PERSONALIZATIONS:
+            return _error(400, f"The personalizations field can have at most {MAX_PERSONALIZATIONS} items",
+                          "personalizations")
+        if any(not p.get("to") or any("email" not in to for to in p["to"]) for p in personalizations):
+            return _error(400, "Each personalization needs at least one recipient", "personalizations.to")
+        if not (mail.get("from") or {}).get("email"):
+            return _error(400, "The from email is required", "from.email")
+        if not mail.get("template_id") and not mail.get("content"):
+            return _error(400, "Either content or a template_id is required", "content")
+        return None
+
+    def mail_stats(self):
+        with self._mail_lock:
+            return {
+                "requests": sum(self.statuses.values()),
+                "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+                "recipients": len(self.recipients),
+                "deliveries": sum(self.recipients.values()),
+                "duplicates": sum(1 for n in self.recipients.values() if n > 1),
+                "largest_batch": self.largest_batch,
+            }
+
+    def recipient_log(self):
+        with self._mail_lock:
+            return {email: {"deliveries": n, "dynamic_template_data": self.template_data[email]}
+                    for email, n in self.recipients.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SendGrid mail send stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4030)
+    parser.add_argument("--rate-limit", type=int, default=None, help="requests per second before 429s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with 500")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    standin = SendgridStandin(rate_limit=args.rate_limit, error_rate=args.error_rate, latency_ms=args.latency_ms,
+                              jitter_ms=args.jitter_ms, seed=args.seed)
+    print("Run the app with:")
+    print(f"  SENDGRID_API_URL=http://{args.host}:{args.port} SENDGRID_API_KEY=SG.standin "
+          f"SENDGRID_TEMPLATE_ID=d-standin")
+    standin.serve_forever(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
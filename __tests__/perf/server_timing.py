@@ -0,0 +1,40 @@
+"""Server-Timing headers from the app's API routes.
+
+Every route handler is wrapped in withServerTiming (src/lib/serverTiming), which returns
+where the request spent its time as one header entry per span name:
+
+  Server-Timing: db;dur=41.2;desc="3 calls", clerk;dur=120.4, json;dur=2.1, total;dur=170.3
+
+"db" is time in Postgres queries, "db-acquire" waiting for a pooled connection, "espn",
+"odds", "clerk", "sendgrid" and "pusher" calls to those services, "json" serializing the
+response, and "total" the whole handler. Spans of one name that ran concurrently are
+summed, so they can add up to more than "total"; whatever isn't covered by a span is
+the route's own code plus anything not instrumented.
+"""
+import re
+
+_DESC_CALLS = re.compile(r"(\d+) calls?")
+
+
+def parse_server_timing(header):
+    """{span: {"ms": duration, "count": calls}} from a Server-Timing header ({} if absent)."""
+    spans = {}
+    for entry in (header or "").split(","):
+        name, *params = [part.strip() for part in entry.split(";")]
+        if not name:
+            continue
+        ms, count = 0.0, 1
+        for param in params:
+            key, _, value = param.partition("=")
+            value = value.strip().strip('"')
+            if key.strip() == "dur":
+                try:
+                    ms = float(value)
+                except ValueError:
+                    pass
+            elif key.strip() == "desc" and (match := _DESC_CALLS.fullmatch(value)):
+                count = int(match.group(1))
+        span = spans.setdefault(name, {"ms": 0.0, "count": 0})
+        span["ms"] += ms
+        span["count"] += count
+    return spans
@@ -0,0 +1,172 @@
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Minimal framework for the local stand-ins of third-party APIs (ESPN, odds, ...).
+#
+# A Standin holds a route table plus knobs every stand-in needs for benchmarking:
+# injected latency (with jitter) and per-route hit counters. Counters are served at
+#   GET  /__standin/stats
+#   POST /__standin/reset
+# so a benchmark can read how many upstream calls the app actually made.
+
+
+class Request:
+    def __init__(self, method, path, query, headers, body, params):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.params = params
+
+    def arg(self, name, default=None):
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def json(self):
+        return json.loads(self.body or b"null")
+
+
+class Response:
+    def __init__(self, payload=None, status=200, headers=None, body=None, content_type="application/json"):
+        self.status = status
+        self.headers = headers or {}
+        if body is None:
+            body = json.dumps(payload).encode()
+        self.body = body
+        self.content_type = content_type
+
+
+class Standin:
+    def __init__(self, name, latency_ms=0.0, jitter_ms=0.0, seed=None):
+        self.name = name
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.routes = []
+        self.hits = Counter()
+        self.paths = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+
+    def route(self, method, pattern):
+        """Register a handler; `pattern` is a regex matched against the full path."""
+        compiled = re.compile(f"^{pattern}$")
+
+        def register(func):
+            self.routes.append((method, compiled, pattern, func))
+            return func
+        return register
+
+    def delay(self):
+        if not self.latency_ms and not self.jitter_ms:
+            return 0.0
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        seconds = max(0.0, self.latency_ms + jitter) / 1000
+        time.sleep(seconds)
+        return seconds
+
+    def stats(self):
+        with self._lock:
+            return {
+                "name": self.name,
+                "total": sum(self.hits.values()),
+                "routes": dict(self.hits),
+                "paths": dict(self.paths),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.hits.clear()
+            self.paths.clear()
+
+    def handle(self, method, raw_path, headers, body):
+        parts = urlsplit(raw_path)
+        path = parts.path
+        query = parse_qs(parts.query)
+
+        if path == "/__standin/stats" and method == "GET":
+            return Response(self.stats())
+        if path == "/__standin/reset" and method == "POST":
+            self.reset()
+            return Response({"ok": True})
+
+        for route_method, compiled, pattern, func in self.routes:
+            if route_method != method:
+                continue
+            match = compiled.match(path)
+            if not match:
+                continue
+            with self._lock:
+                self.hits[f"{method} {pattern}"] += 1
+                self.paths[f"{method} {path}"] += 1
+            self.delay()
+            result = func(Request(method, path, query, headers, body, match.groupdict()))
+            return result if isinstance(result, Response) else Response(result)
+
+        return Response({"error": f"{self.name}: no route for {method} {path}"}, status=404)
+
+    def make_server(self, host="127.0.0.1", port=0):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                try:
+                    response = standin.handle(method, self.path, dict(self.headers), body)
+                except Exception as e:  # surface handler bugs as 500s instead of dropped sockets
+                    response = Response({"error": f"{type(e).__name__}: {e}"}, status=500)
+                self.send_response(response.status)
+                self.send_header("Content-Type", response.content_type)
+                self.send_header("Content-Length", str(len(response.body)))
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PATCH(self):
+                self._dispatch("PATCH")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+    def start(self, host="127.0.0.1", port=0):
+        """Serve on a background thread; returns (server, base_url). Stop with server.shutdown()."""
+        server = self.make_server(host, port)
+        thread = threading.Thread(target=server.serve_forever, name=f"{self.name}-standin", daemon=True)
+        thread.start()
+        bound_host, bound_port = server.server_address[:2]
+        return server, f"http://{bound_host}:{bound_port}"
+
+    def serve_forever(self, host="127.0.0.1", port=0):
+        server = self.make_server(host, port)
+        bound_host, bound_port = server.server_address[:2]
+        print(f"🟢 {self.name} stand-in listening on http://{bound_host}:{bound_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,147 @@
+"""Build the prebuilt team metadata table and static logos the app serves.
+
+Reads each league's ESPN teams payload from recorded fixtures (the espn_standin.py
+FixtureStore layout, <fixtures>/basketball/nba/teams.json, ...), downloads every team's
+logo into public/team-logos/<league>/<abbreviation>.<hash>.png and writes the table
+src/lib/teamMetadata/teams.json reads at startup:
+
+  python __tests__/perf/team_metadata.py --fetch
+  python __tests__/perf/team_metadata.py --fixtures path/to/recorded/espn --no-logos
+
+--fetch records the teams payloads from --upstream first (like the stand-in's record
+mode), so a plain run needs no network for leagues already recorded. Logo file names carry
+a hash of their content, so next.config.mjs can serve them as immutable and a changed logo
+gets a new URL. The table's version is a hash of its contents; rerun once a season, or
+when a league's teams change, and commit both the table and the logos.
+"""
+import argparse
+import hashlib
+import json
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+from espn_standin import DEFAULT_FIXTURES, LEAGUES, FixtureStore
+
+ROOT = Path(__file__).resolve().parents[2]
+TABLE = ROOT / "src" / "lib" / "teamMetadata" / "teams.json"
+LOGOS = ROOT / "public" / "team-logos"
+LOGOS_URL = "/team-logos"
+
+
+def team_entries(payload):
+    """The fields the app looks teams up by, from an ESPN /teams payload."""
+    teams = []
+    for item in payload["sports"][0]["leagues"][0]["teams"]:
+        team = item["team"]
+        teams.append({
+            "id": team["id"],
+            "name": team.get("name"),
+            "displayName": team["displayName"],
+            "shortDisplayName": team.get("shortDisplayName"),
+            "abbreviation": team.get("abbreviation") or team["id"],
+            "logo": (team.get("logos") or [{}])[0].get("href"),
+        })
+    return sorted(teams, key=lambda t: t["displayName"])
+
+
+def fetch_bytes(url, timeout=15):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+def save_logo(league, team, logos_dir, fetch=fetch_bytes):
+    """Downloads a team's logo to <logos_dir>/<league>/<abbr>.<hash>.png; returns its file name."""
+    content = fetch(team["logo"])
+    digest = hashlib.sha256(content).hexdigest()[:10]
+    name = f"{team['abbreviation'].lower()}.{digest}.png"
+    path = logos_dir / league.lower() / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        path.write_bytes(content)
+    return name
+
+
+def build_table(payloads, logos_dir=None, fetch=fetch_bytes, logos_url=LOGOS_URL):
+    """{league: teams payload} -> the table; logos are kept remote when logos_dir is None or they fail."""
+    leagues, failed = {}, []
+    for league, payload in sorted(payloads.items()):
+        teams = team_entries(payload)
+        if logos_dir is not None:
+            kept = set()
+            for team in teams:
+                if not team["logo"]:
+                    continue
+                try:
+                    name = save_logo(league, team, logos_dir, fetch)
+                except (urllib.error.URLError, OSError, ValueError) as e:
+                    failed.append(f"{league} {team['abbreviation']}: {e}")
+                    continue
+                kept.add(name)
+                team["logo"] = f"{logos_url}/{league.lower()}/{name}"
+            # Logos of earlier builds no longer referenced by the table
+            for stale in (logos_dir / league.lower()).glob("*.png"):
+                if stale.name not in kept:
+                    stale.unlink()
+        leagues[league] = {"teams": teams}
+
+    body = json.dumps(leagues, sort_keys=True).encode()
+    table = {
+        "version": hashlib.sha256(body).hexdigest()[:12],
+        "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "leagues": leagues,
+    }
+    return table, failed
+
+
+def load_payloads(store, leagues=LEAGUES):
+    payloads, missing = {}, []
+    for league, league_path in leagues.items():
+        payload = store.load(league_path, "teams")
+        if payload is None:
+            missing.append(league)
+        else:
+            payloads[league] = payload
+    return payloads, missing
+
+
+def record_payloads(store, upstream, leagues=LEAGUES):
+    for league, league_path in leagues.items():
+        url = f"{upstream.rstrip('/')}/apis/site/v2/sports/{league_path}/teams"
+        store.save(json.loads(fetch_bytes(url)), league_path, "teams")
+        print(f"📥 {league} teams recorded from {url}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the prebuilt team metadata table and static logos")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="recorded ESPN payloads")
+    parser.add_argument("--fetch", action="store_true", help="record the teams payloads from --upstream first")
+    parser.add_argument("--upstream", default="https://site.api.espn.com")
+    parser.add_argument("--out", default=str(TABLE))
+    parser.add_argument("--logos", default=str(LOGOS), help="where the static logos go")
+    parser.add_argument("--no-logos", action="store_true", help="keep ESPN's logo URLs instead of downloading")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    if args.fetch:
+        record_payloads(store, args.upstream)
+    payloads, missing = load_payloads(store)
+    if not payloads:
+        raise SystemExit(f"No teams payloads under {args.fixtures}; record them with --fetch")
+
+    table, failed = build_table(payloads, None if args.no_logos else Path(args.logos))
+    with open(args.out, "w") as f:
+        json.dump(table, f, indent=1)
+        f.write("\n")
+
+    teams = sum(len(league["teams"]) for league in table["leagues"].values())
+    print(f"📝 {teams} teams in {len(table['leagues'])} leagues written to {args.out} (version {table['version']})")
+    for league in missing:
+        print(f"⚠️  {league} not recorded; the app looks its teams up on ESPN")
+    for failure in failed:
+        print(f"⚠️  logo kept remote, {failure}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import json
+
+from benchstore import (Threshold, compare, format_history, gate, load_baseline, load_history, median_metrics,
+                        threshold_for)
+
+
+def test_threshold_needs_both_relative_and_absolute_slack():
+    threshold = Threshold(relative=0.2, absolute=100)
+    assert threshold.limit(1000) == 1200
+    assert threshold.limit(50) == 150
+    assert not threshold.regressed(50, 140)
+    assert threshold.regressed(1000, 1201)
+
+    throughput = Threshold(relative=0.1, higher_is_better=True)
+    assert throughput.regressed(100, 89)
+    assert not throughput.regressed(100, 120)
+
+
+def test_first_matching_pattern_wins_and_none_disables():
+    thresholds = {"*.api.*.count": Threshold(relative=0), "*.noise": None, "*_ms": Threshold(relative=0.5)}
+    assert threshold_for(thresholds, "/.api./api/x.count").relative == 0
+    assert threshold_for(thresholds, "/.lcp_ms").relative == 0.5
+    assert threshold_for(thresholds, "/.other").relative == 0.2
+
+    regressions = compare({"/.noise": 100, "/.lcp_ms": 200, "/.new": 1}, {"/.noise": 1, "/.lcp_ms": 100}, thresholds)
+    assert [r.metric for r in regressions] == ["/.lcp_ms"]
+    assert "+100.0%" in str(regressions[0])
+
+
+def test_median_ignores_missing_values():
+    runs = [{"a": 1, "b": 10}, {"a": 3}, {"a": 2, "b": None}]
+    assert median_metrics(runs) == {"a": 2, "b": 10}
+
+
+def test_gate_scoped_baselines_and_history(tmp_path):
+    baseline, history = tmp_path / "b.json", tmp_path / "h.jsonl"
+
+    assert gate("s", {"/a.x_ms": 100}, baseline, history, scope="/a.") == []
+    assert gate("s", {"/b.x_ms": 500}, baseline, history, scope="/b.") == []
+    assert load_baseline(baseline) == {"/a.x_ms": 100, "/b.x_ms": 500}
+
+    regressions = gate("s", {"/a.x_ms": 300}, baseline, history, scope="/a.")
+    assert [r.metric for r in regressions] == ["/a.x_ms"]
+    assert load_baseline(baseline)["/a.x_ms"] == 100
+
+    gate("s", {"/a.x_ms": 300}, baseline, history, scope="/a.", update=True)
+    assert load_baseline(baseline) == {"/a.x_ms": 300, "/b.x_ms": 500}
+
+    entries = load_history(history, "s")
+    assert len(entries) == 4 and entries[0]["scope"] == "/a."
+    assert json.loads(history.read_text().splitlines()[-1])["metrics"] == {"/a.x_ms": 300}
+    assert "/a.x_ms" in format_history(entries, "/a.*")
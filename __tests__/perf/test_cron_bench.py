@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+from cron_bench import delete_week_entries, run_cron, week_state
+from seed_db import SeedConfig, seed, week_of
+from standin import Standin
+
+
+def test_cron_run_reports_created_entries_and_time_per_picker():
+    state = {"pickers": 400, "entries": 10}
+    app = Standin("app")
+
+    @app.route("GET", "/api/automated-updatePoints")
+    def cron(request):
+        state["entries"] += 390
+        return {"message": "Points updated successfully"}
+
+    server, base_url = app.start()
+    try:
+        result = run_cron(base_url, lambda: dict(state))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert result["status"] == 200
+    assert result["pickers"] == 400
+    assert result["entries_created"] == 390
+    assert result["ms_per_picker"] == pytest.approx(result["seconds"] * 1000 / 400, abs=0.01)
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_week_state_counts_this_weeks_pickers_and_entries():
+    pytest.importorskip("psycopg")
+    dsn = os.environ["TEST_DATABASE_URL"]
+    config = SeedConfig(users=200, sports=["NBA"])
+    week = week_of(config.today)
+    config.weeks = [week]
+    seed(dsn, config, truncate=True, jobs=1, log=lambda *_: None)
+
+    seeded = week_state(dsn, ["NBA"], week)
+    assert 0 < seeded["pickers"] <= 200
+
+    delete_week_entries(dsn, ["NBA"], week)
+    assert week_state(dsn, ["NBA"], week) == {"pickers": seeded["pickers"], "entries": 0}
@@ -0,0 +1,109 @@
+import json
+import time
+import urllib.request
+
+import pytest
+
+from espn_standin import EspnStandin, LEAGUES
+
+
+def get(base_url, path):
+    with urllib.request.urlopen(f"{base_url}{path}", timeout=5) as response:
+        return json.loads(response.read())
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(standin):
+        server, base_url = standin.start()
+        servers.append(server)
+        return base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_synthetic_scoreboard_is_deterministic(serve):
+    base_url = serve(EspnStandin())
+    path = f"/apis/site/v2/sports/{LEAGUES['NBA']}/scoreboard?dates=20250412"
+
+    first = get(base_url, path)
+    second = get(base_url, path)
+
+    assert first == second
+    assert 4 <= len(first["events"]) <= 12
+    competitors = first["events"][0]["competitions"][0]["competitors"]
+    assert {c["homeAway"] for c in competitors} == {"home", "away"}
+
+
+def test_fixed_game_count_and_event_lookup(serve):
+    base_url = serve(EspnStandin(games=3))
+    league = LEAGUES["EPL"]
+
+    scoreboard = get(base_url, f"/apis/site/v2/sports/{league}/scoreboard?dates=20250412")
+    assert len(scoreboard["events"]) == 3
+
+    event = scoreboard["events"][1]
+    assert get(base_url, f"/apis/site/v2/sports/{league}/scoreboard/events/{event['id']}") == event
+
+
+def test_scoreboard_teams_resolve_through_teams_endpoint(serve):
+    base_url = serve(EspnStandin())
+    league = LEAGUES["NFL"]
+
+    teams = get(base_url, f"/apis/site/v2/sports/{league}/teams")["sports"][0]["leagues"][0]["teams"]
+    names = {t["team"]["displayName"] for t in teams} | {t["team"]["shortDisplayName"] for t in teams}
+
+    scoreboard = get(base_url, f"/apis/site/v2/sports/{league}/scoreboard?dates=20250105")
+    for event in scoreboard["events"]:
+        for competitor in event["competitions"][0]["competitors"]:
+            assert competitor["team"]["name"] in names
+
+
+def test_record_then_replay(serve, tmp_path):
+    upstream_url = serve(EspnStandin(games=2))
+    path = f"/apis/site/v2/sports/{LEAGUES['MLB']}/scoreboard?dates=20250601"
+
+    recorder_url = serve(EspnStandin(mode="record", fixtures=tmp_path, upstream=upstream_url))
+    recorded = get(recorder_url, path)
+    assert (tmp_path / "baseball" / "mlb" / "scoreboard" / "20250601.json").exists()
+
+    replay_url = serve(EspnStandin(mode="replay", fixtures=tmp_path, strict=True))
+    assert get(replay_url, path) == recorded
+    # Unrecorded dates replay the closest recorded slate
+    assert get(replay_url, path.replace("20250601", "20250603")) == recorded
+
+
+def test_date_ranges_join_the_days_they_cover(serve, tmp_path):
+    base = f"/apis/site/v2/sports/{LEAGUES['NBA']}/scoreboard?dates="
+    synthetic_url = serve(EspnStandin())
+    days = [get(synthetic_url, f"{base}2025040{d}")["events"] for d in range(1, 4)]
+
+    joined = get(synthetic_url, f"{base}20250401-20250403")["events"]
+    assert joined == days[0] + days[1] + days[2]
+    assert len(get(synthetic_url, f"{base}20250401-20250403&limit=5")["events"]) == 5
+
+    # Strict replay only joins the days that were recorded
+    recorder_url = serve(EspnStandin(mode="record", fixtures=tmp_path, upstream=synthetic_url))
+    get(recorder_url, f"{base}20250402")
+    replay_url = serve(EspnStandin(mode="replay", fixtures=tmp_path, strict=True))
+    assert get(replay_url, f"{base}20250401-20250403")["events"] == days[1]
+
+
+def test_injected_latency_and_stats(serve):
+    standin = EspnStandin(latency_ms=60)
+    base_url = serve(standin)
+    path = f"/apis/site/v2/sports/{LEAGUES['NHL']}/scoreboard?dates=20250301"
+
+    started = time.perf_counter()
+    get(base_url, path)
+    assert time.perf_counter() - started >= 0.06
+
+    get(base_url, path)
+    stats = get(base_url, "/__standin/stats")
+    assert stats["total"] == 2
+    assert stats["paths"][f"GET /apis/site/v2/sports/{LEAGUES['NHL']}/scoreboard"] == 2
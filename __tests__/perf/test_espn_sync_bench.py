@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from espn_standin import LEAGUES, FixtureStore, date_range
+from espn_sync_bench import (
+    GAME_PREFIX, amend_scores, app_sql, expected_result, mismatches, restore_scoreboards, season_events,
+    season_games, seed_games, sync, write_season,
+)
+from standin import Standin
+
+DAYS = date_range("20250301-20250310")
+
+
+@pytest.fixture
+def season(tmp_path):
+    store = FixtureStore(tmp_path)
+    assert write_season(store, ["NBA", "NHL"], DAYS) == 20
+    return store
+
+
+def test_season_is_written_once_and_games_follow_savepicks(season):
+    assert write_season(season, ["NBA", "NHL"], DAYS) == 0
+
+    events = season_events(season, ["NBA", "NHL"], DAYS)
+    rows, owners = season_games(events, by_name=0.5)
+
+    assert len(rows) == len(owners) == len(events["NBA"]) + len(events["NHL"])
+    by_name = [row for row in rows if row[0].startswith(GAME_PREFIX)]
+    assert 0 < len(by_name) < len(rows)
+    game_id, team1, _, game_day, _, sport = by_name[0]
+    home = next(c for c in owners[game_id]["competitions"][0]["competitors"] if c["homeAway"] == "home")
+    # Short names, home team first, East Coast date (synthetic games start 23:30 UTC)
+    assert team1 == home["team"]["shortDisplayName"]
+    assert game_day.strftime("%Y%m%d") == owners[game_id]["id"][:8]
+    assert sport in ("NBA", "NHL")
+
+
+def test_amended_scores_change_results_and_are_restored(season):
+    before = season_events(season, ["NBA"], DAYS)["NBA"]
+    originals = amend_scores(season, ["NBA"], DAYS, 3)
+
+    after = season_events(season, ["NBA"], DAYS)["NBA"]
+    changed = [a for b, a in zip(before, after) if expected_result(a) != expected_result(b)]
+    assert len(originals) == 3 and len(changed) == 3
+
+    restore_scoreboards(season, originals)
+    assert season_events(season, ["NBA"], DAYS)["NBA"] == before
+
+
+def test_sync_reports_writes_and_events_per_second():
+    app = Standin("app")
+    bodies = []
+
+    @app.route("POST", "/api/admin/syncSportsRadarData")
+    def route(request):
+        bodies.append(request.json())
+        return {"success": True, "results": [], "stats": {
+            "events": 1200, "unchanged": 1150, "updated": 50, "current": 0, "not_found": 0, "invalid_data": 0,
+            "writes": {"games": 50, "state": 50}}}
+
+    server, base_url = app.start()
+    try:
+        result = sync(base_url, {"dates": "20250301-20250310", "sports": ["NBA"]})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert bodies == [{"dates": "20250301-20250310", "sports": ["NBA"]}]
+    assert result["status"] == 200
+    assert result["writes"] == 100 and result["unchanged"] == 1150
+    # seconds is rounded to the millisecond, events_per_sec is not
+    assert result["events_per_sec"] >= 1200 / (result["seconds"] + 0.001)
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_app_sql_writes_each_change_once(season):
+    psycopg = pytest.importorskip("psycopg")
+    dsn = os.environ["TEST_DATABASE_URL"]
+    events = season_events(season, ["NBA"], DAYS)
+    rows, owners = season_games(events)
+    seed_games(dsn, rows)
+    ids = [row[0] for row in rows]
+    results = [expected_result(owners[game_id]) for game_id in ids]
+    update = {"p1": ids, "p2": [winner for winner, _ in results], "p3": [score for _, score in results]}
+    hashes = {"p1": ["NBA"] * len(ids), "p2": [owners[i]["id"] for i in ids], "p3": ["h1"] * len(ids), "p4": ids}
+
+    with psycopg.connect(dsn) as conn:
+        candidates = conn.execute(app_sql("CANDIDATE_GAMES_SQL"), {
+            "p1": [], "p2": sorted({row[3] for row in rows}), "p3": ["NBA"]}).fetchall()
+        assert set(ids) <= {game_id for game_id, *_ in candidates}
+
+        assert conn.execute(app_sql("UPDATE_GAMES_SQL"), update).rowcount == len(ids)
+        assert conn.execute(app_sql("UPDATE_GAMES_SQL"), update).rowcount == 0
+        assert conn.execute(app_sql("SAVE_HASHES_SQL"), hashes).rowcount == len(ids)
+        assert conn.execute(app_sql("SAVE_HASHES_SQL"), hashes).rowcount == 0
+        known = conn.execute(app_sql("SYNCED_HASHES_SQL"), {"p1": hashes["p1"], "p2": hashes["p2"]}).fetchall()
+        assert len(known) == len(ids)
+        conn.commit()
+
+        # A game deleted and made again is synced again
+        conn.execute('DELETE FROM "Game" WHERE id = %s', (ids[0],))
+        assert conn.execute("SELECT 1 FROM espn_sync_state WHERE game_id = %s", (ids[0],)).fetchone() is None
+        conn.rollback()
+
+    assert mismatches(dsn, owners) == []
@@ -0,0 +1,155 @@
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from leaderboard_scale import format_scaling, measure_routes, scaling_exponents, timed_get
+from seed_db import SeedConfig, seed_leaderboard, week_of
+from standin import Response, Standin
+
+
+@pytest.fixture
+def app():
+    """Leaderboard routes whose payload grows with the number of seeded users."""
+    app = Standin("app")
+    users = [{"user_id": i, "username": f"u{i}", "points": 100 - i} for i in range(40)]
+
+    @app.route("GET", "/api/leaderboard-entries/getEntriesForLeaderboard")
+    def entries(request):
+        return {"data": users}
+
+    @app.route("GET", "/api/user/getSportPoints")
+    def sport_points(request):
+        return users[:10]
+
+    @app.route("GET", "/api/user/getUsersLeaderboard")
+    def users_leaderboard(request):
+        return Response({"error": "boom"}, status=500)
+
+    @app.route("GET", "/api/user/getMultiUserPoints")
+    def multi_user_points(request):
+        return {"ids": request.arg("user_id").split(",")}
+
+    @app.route("GET", "/api/leaderboard/page")
+    def page(request):
+        start = 5 if request.arg("cursor") == "c/5" else 0
+        rows = users[start:start + int(request.arg("limit"))]
+        return {"data": rows, "nextCursor": None if start else "c/5"}
+
+    @app.route("GET", "/api/leaderboard/rank")
+    def rank(request):
+        return {"data": [u for u in users if str(u["user_id"]) == request.arg("user_id")]}
+
+    server, base_url = app.start()
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+def test_scaling_exponent_is_the_log_log_slope():
+    results = {size: {"linear": size * 0.5, "flat": 12.0, "quadratic": size ** 2, "zero": 0} for size in
+               (1000, 10000, 100000)}
+    exponents = scaling_exponents(results)
+    assert exponents["linear"] == pytest.approx(1)
+    assert exponents["flat"] == pytest.approx(0)
+    assert exponents["quadratic"] == pytest.approx(2)
+    assert "zero" not in exponents
+
+    table = format_scaling(results, exponents)
+    assert "100,000" in table and "1.00" in table
+
+
+def test_routes_report_size_rows_and_errors(app):
+    metrics = measure_routes(app, "NBA", 3, runs=2)
+
+    assert metrics["all_time.rows"] == 40
+    assert metrics["sport_week.rows"] == 10
+    assert metrics["all_time.kb"] > metrics["sport_week.kb"]
+    assert metrics["all_time.ttfb_ms"] <= metrics["all_time.total_ms"]
+    assert metrics["users.status"] == 500
+    # One id per leaderboard row ends up in the getMultiUserPoints query string
+    assert metrics["multi_user_points.status"] == 200
+    assert metrics["multi_user_points.url_kb"] > 0
+    # Pages hold at most PAGE_SIZE rows, and the next page and last user's rank are measured too
+    assert metrics["page_all_time.rows"] == metrics["page_sport_week.rows"] == 40
+    assert metrics["page_all_time_next.rows"] == 35
+    assert metrics["rank_last.rows"] == 1
+
+
+def test_timed_get_keeps_error_bodies(app):
+    result = timed_get(f"{app}/api/user/getUsersLeaderboard")
+    assert result["status"] == 500
+    assert b"boom" in result["body"]
+
+
+PAGE_TS = Path(__file__).resolve().parents[2] / "src/lib/leaderboardPage/leaderboardPage.ts"
+
+
+def page_sql(name):
+    """A statement from leaderboardPage.ts with its ${...} parts filled in and $n as %(pn)s."""
+    source = PAGE_TS.read_text()
+    parts = dict(re.findall(r"const (\w+) = `(.*?)`;", source, re.S))
+    sql = re.sub(r"\$\{(\w+)\}", lambda m: parts[m.group(1)], parts[name])
+    return re.sub(r"\$(\d+)", r"%(p\1)s", sql)
+
+
+def dense_ranks(points):
+    """DENSE_RANK() of each score in `points`, highest first."""
+    ordered = sorted(set(points), reverse=True)
+    return {p: ordered.index(p) + 1 for p in points}
+
+
+def walk(conn, name, board_params, limit):
+    """Every row of a board, fetched page by page the way fetchPage does."""
+    rows, cursor = [], None
+    while True:
+        offset = len(board_params)
+        values = {f"p{offset + 1}": cursor and cursor["points"], f"p{offset + 2}": cursor and cursor["user_id"],
+                  f"p{offset + 3}": cursor["rank"] if cursor else 0, f"p{offset + 4}": limit + 1}
+        params = {**board_params, **values}
+        page = conn.execute(page_sql(name), params).fetchall()
+        rows += page[:limit]
+        if len(page) <= limit:
+            return rows
+        last = rows[-1]
+        cursor = {"points": last["points"], "user_id": last["user_id"], "rank": last["rank"]}
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_keyset_pages_cover_the_board_once_with_database_ranks():
+    psycopg = pytest.importorskip("psycopg")
+    from psycopg.rows import dict_row
+
+    dsn = os.environ["TEST_DATABASE_URL"]
+    config = SeedConfig(users=300, sports=["NBA"])
+    config.weeks = [week_of(config.today)]
+    seed_leaderboard(dsn, config, log=lambda *_: None)
+
+    with psycopg.connect(dsn, row_factory=dict_row) as conn:
+        boards = {
+            "OVERALL": ({}, conn.execute("SELECT user_id, points FROM users WHERE points > 0").fetchall()),
+            "LEADERBOARD": ({"p1": "NBA", "p2": config.weeks[0]}, conn.execute(
+                """SELECT le.user_id, le.points FROM leaderboard_entries le
+                   JOIN leaderboards l ON l.leaderboard_id = le.leaderboard_id
+                   WHERE l.sport = 'NBA' AND l.week = %s AND le.points > 0""", (config.weeks[0],)).fetchall()),
+        }
+        for board, (params, expected) in boards.items():
+            rows = walk(conn, f"{board}_PAGE_SQL", params, limit=7)
+
+            assert sorted(r["user_id"] for r in rows) == sorted(r["user_id"] for r in expected)
+            assert [(r["points"], r["user_id"]) for r in rows] == sorted(
+                ((r["points"], r["user_id"]) for r in rows), key=lambda k: (-k[0], k[1]))
+            ranks = dense_ranks([r["points"] for r in expected])
+            assert all(r["rank"] == ranks[r["points"]] for r in rows), board
+
+            # "My rank" agrees with the pages, for the top, the bottom and anyone in between
+            picked = [rows[0], rows[len(rows) // 2], rows[-1]]
+            want = {r["user_id"]: r["rank"] for r in picked}
+            by_user_id = ([r["user_id"] for r in picked], [])
+            by_clerk_id = ([], [r["clerk_id"] for r in picked])
+            for user_ids, clerk_ids in (by_user_id, by_clerk_id):
+                ids = ({"p1": user_ids, "p2": clerk_ids} if board == "OVERALL"
+                       else {**params, "p3": user_ids, "p4": clerk_ids})
+                ranked = conn.execute(page_sql(f"{board}_RANK_SQL"), ids).fetchall()
+                assert {r["user_id"]: r["rank"] for r in ranked} == want, board
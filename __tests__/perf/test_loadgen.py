@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from loadgen import format_server_timing, percentile, run_load, upstream_report
+from scenarios import SCENARIOS, build_picks, current_week
+from standin import Response, Standin
+
+IDENTITIES = [{"user_id": f"user_{i}", "headers": {"Authorization": f"Bearer token_{i}"}} for i in range(3)]
+
+
+def fake_app():
+    """Just enough of the app's routes for the scenarios to run end to end."""
+    app = Standin("app")
+    games = [{"id": f"g{i}", "homeTeam": {"name": "Home"}, "awayTeam": {"name": "Away"}} for i in range(3)]
+    saved = []
+
+    @app.route("GET", r"/(daily-picks|myPicks|leaderboards)?")
+    def page(request):
+        return Response(body=b"<html></html>", content_type="text/html")
+
+    @app.route("GET", "/api/all-espn-games")
+    def all_games(request):
+        return {"games": games}
+
+    @app.route("GET", "/api/userPicks")
+    def user_picks(request):
+        if not request.headers.get("Authorization"):
+            return Response({"error": "Unauthorized"}, status=401)
+        return Response({"error": "No picks found"}, status=404)
+
+    @app.route("POST", "/api/savePicks")
+    def save_picks(request):
+        saved.append(request.json())
+        return {"success": True}
+
+    @app.route("POST", "/api/leaderboard-entries/verifyEntry")
+    def verify_entry(request):
+        return {"success": True}
+
+    @app.route("GET", "/api/userPickPercentage")
+    def pick_percentage(request):
+        return {"percentages": []}
+
+    @app.route("GET", "/api/leaderboard/page")
+    def leaderboard_page(request):
+        return Response({"error": "boom"}, status=500)
+
+    @app.route("GET", "/api/leaderboard/rank")
+    def leaderboard_rank(request):
+        return Response([], headers={"Server-Timing": 'db;dur=4.0;desc="2 calls", clerk;dur=12.5, total;dur=20.0'})
+
+    return app, saved
+
+
+@pytest.fixture
+def app():
+    standin, saved = fake_app()
+    server, base_url = standin.start()
+    yield standin, saved, base_url
+    server.shutdown()
+    server.server_close()
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) is None
+
+
+def test_today_contests_fans_out_like_the_home_page(app):
+    standin, _, base_url = app
+
+    stats = asyncio.run(run_load(SCENARIOS["today_contests"], base_url, users=5, iterations=2,
+                                 think_scale=0))
+    report = stats.report()
+
+    assert report["iterations"] == 10
+    # 20 home page fetches + 1 daily-picks fetch per iteration
+    assert report["routes"]["GET /api/all-espn-games"]["count"] == 10 * 21
+    assert report["total"]["errors"] == 0
+    assert standin.stats()["paths"]["GET /api/all-espn-games"] == 10 * 21
+
+
+def test_authenticated_vus_save_picks_and_allowed_statuses(app):
+    _, saved, base_url = app
+
+    stats = asyncio.run(run_load(SCENARIOS["my_picks_history"], base_url, users=3, iterations=1,
+                                 identities=IDENTITIES, think_scale=0))
+    report = stats.report()
+
+    assert len(saved) == 3
+    assert all(len(body["picks"]) == 3 for body in saved)
+    # 404 from /api/userPicks means "no picks yet" and is not an error
+    assert report["routes"]["GET /api/userPicks"]["statuses"] == {"404": 6}
+    assert report["total"]["errors"] == 0
+
+
+def test_server_and_connection_errors_are_counted(app):
+    _, _, base_url = app
+
+    report = asyncio.run(run_load(SCENARIOS["leaderboards"], base_url, users=4, iterations=1,
+                                  identities=IDENTITIES)).report()
+    pages = report["routes"]["GET /api/leaderboard/page"]
+    assert pages["errors"] == 4
+    assert pages["error_rate"] == 1.0
+    assert report["routes"]["GET /api/leaderboard/rank"]["errors"] == 0
+
+    refused = asyncio.run(run_load(SCENARIOS["leaderboards"], "http://127.0.0.1:9", users=2, iterations=1,
+                                   timeout=2)).report()
+    assert refused["total"]["error_rate"] == 1.0
+    assert all(status.startswith("error:") for status in refused["total"]["statuses"])
+
+
+def test_server_timing_spans_are_reported_per_route(app):
+    _, _, base_url = app
+
+    report = asyncio.run(run_load(SCENARIOS["leaderboards"], base_url, users=3, iterations=1,
+                                  identities=IDENTITIES)).report()
+    spans = report["routes"]["GET /api/leaderboard/rank"]["server_timing"]
+
+    assert list(spans) == ["clerk", "db", "total"]
+    assert spans["db"]["mean_ms"] == 4.0
+    assert spans["clerk"]["p95_ms"] == 12.5
+    # Spans are a share of what the client waited, so never all of it
+    assert 0 < spans["clerk"]["share"] < spans["total"]["share"] <= 1
+    assert "server_timing" not in report["routes"]["GET /api/leaderboard/page"]
+    assert report["total"]["server_timing"]["total"]["count"] == 3
+    assert "/api/leaderboard/rank" in format_server_timing(report)
+
+
+def test_build_picks_marks_one_best_pick():
+    import random
+
+    games = [{"id": f"g{i}"} for i in range(5)]
+    picks = build_picks(games, "NBA", random.Random(1))
+    assert [p["gameId"] for p in picks] == [g["id"] for g in games]
+    assert sum(p["bestPick"] for p in picks) == 1
+    assert {p["teamIndex"] for p in picks} <= {0, 1}
+
+
+def test_current_week_matches_app():
+    from datetime import date
+
+    assert current_week(date(2025, 1, 1)) == 1
+    assert current_week(date(2025, 1, 7)) == 1
+    assert current_week(date(2025, 1, 8)) == 2
+
+
+def test_upstream_report_counts_calls_per_app_request_and_cache_outcomes():
+    before = {"total": 5, "routes": {"GET /scoreboard": 5}}
+    after = {"total": 25, "routes": {"GET /scoreboard": 20, "GET /teams": 5}}
+    cache_before = {"hits": 10, "misses": 5, "coalesced": 0}
+    cache_after = {"hits": 370, "misses": 20, "coalesced": 10}
+
+    report = upstream_report(before, after, 400, cache_before, cache_after)
+
+    assert report["calls"] == 20
+    assert report["per_app_request"] == 0.05
+    assert report["routes"] == {"GET /scoreboard": 15, "GET /teams": 5}
+    assert report["app_cache"] == {"hits": 360, "misses": 15, "coalesced": 10, "hit_rate": 0.961}
+    assert "app_cache" not in upstream_report(before, after, 0)
@@ -0,0 +1,74 @@
+import os
+import re
+from datetime import date
+
+import pytest
+
+from pick_percentage_bench import (GAME_PREFIX, USER_PREFIX, app_sql, ensure_counts, flatten, lookup_counts,
+                                   mismatches, prepare_database, run)
+from seed_db import PICK_COUNTS_SQL
+
+TODAY = date(2025, 3, 3)
+
+needs_db = pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"),
+                              reason="set TEST_DATABASE_URL to a disposable Postgres")
+
+
+def squash(sql):
+    return re.sub(r"\s+", " ", sql).strip().rstrip(";")
+
+
+def test_app_sql_turns_placeholders_into_named_parameters():
+    source = 'export const LOOKUP_SQL = `SELECT $1::date, $2 LIKE \'a%\'`;\nexport const DDL = `SELECT 100 % 7`;'
+
+    assert app_sql("LOOKUP_SQL", source) == "SELECT %(p1)s::date, %(p2)s LIKE 'a%%'"
+    assert app_sql("DDL", source) == "SELECT 100 % 7"
+    with pytest.raises(ValueError):
+        app_sql("MISSING", source)
+
+
+def test_seeder_recounts_like_the_app():
+    assert squash(PICK_COUNTS_SQL) == squash(app_sql("PICK_COUNTS_BACKFILL_SQL"))
+
+
+def test_flatten_nests_one_level():
+    assert flatten({"picks": 10, "lookup": {"p50_ms": 1.5}}) == {"picks": 10, "lookup.p50_ms": 1.5}
+
+
+@needs_db
+def test_triggers_keep_counts_in_step_with_every_kind_of_pick_write():
+    psycopg = pytest.importorskip("psycopg")
+    dsn = os.environ["TEST_DATABASE_URL"]
+    prepare_database(dsn, picks=600, games=6, today=TODAY)
+
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        ensure_counts(conn)  # repeatable
+        assert mismatches(conn, TODAY) == []
+        counts = lookup_counts(conn, TODAY)
+        assert sum(h + a for g, (h, a) in counts.items() if g.startswith(GAME_PREFIX)) == 600
+
+        game = f"{GAME_PREFIX}1"
+        home, away = lookup_counts(conn, TODAY)[game]
+        # A new pick, a change of side, an unchanged re-save and a deletion
+        conn.execute("""INSERT INTO "Pick" (id, "userId", "gameId", "teamIndex", sport)
+                        VALUES ('pct_new', 'pct_new_user', %s, 0, 'NBA')""", (game,))
+        conn.execute("""UPDATE "Pick" SET "teamIndex" = 1 - "teamIndex" WHERE id = %s""", (f"{game}_1",))
+        conn.execute("""UPDATE "Pick" SET "teamIndex" = "teamIndex" WHERE id = %s""", (f"{game}_2",))
+        conn.execute("""DELETE FROM "Pick" WHERE "userId" = %s""", (f"{USER_PREFIX}3",))
+        assert mismatches(conn, TODAY) == []
+        assert sum(lookup_counts(conn, TODAY)[game]) == home + away
+
+        # Deleting a game takes its counts along
+        conn.execute('DELETE FROM "Game" WHERE id = %s', (game,))
+        assert game not in lookup_counts(conn, TODAY)
+        assert conn.execute('SELECT COUNT(*) FROM "GamePickCounts" WHERE "gameId" = %s', (game,)).fetchone()[0] == 0
+
+
+@needs_db
+def test_benchmark_reports_both_approaches_and_no_mismatches():
+    results, examples = run(os.environ["TEST_DATABASE_URL"], picks=2000, games=4, runs=3, writes=40, today=TODAY)
+
+    assert results["picks"] == 2000
+    assert results["mismatches"] == 0, examples
+    assert results["lookup"]["p50_ms"] > 0 and results["legacy"]["p50_ms"] > 0
+    assert results["writes"]["with_triggers_per_sec"] > 0 and results["writes"]["without_triggers_per_sec"] > 0
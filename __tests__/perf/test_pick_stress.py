@@ -0,0 +1,176 @@
+import base64
+import json
+import os
+import urllib.error
+import urllib.request
+import uuid
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("cryptography")
+
+from clerk_standin import ClerkStandin, publishable_key
+from pick_stress import ABSENT, PickLedger, run_stress
+from standin import Response, Standin
+
+
+def _unb64(segment):
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def verify_token(jwks, token):
+    """What Clerk's verifyToken() does with a JWKS: check the RS256 signature, return the claims."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+    header, claims, signature = token.split(".")
+    key = next(k for k in jwks["keys"] if k["kid"] == json.loads(_unb64(header))["kid"])
+    public_key = rsa.RSAPublicNumbers(int.from_bytes(_unb64(key["e"]), "big"),
+                                      int.from_bytes(_unb64(key["n"]), "big")).public_key()
+    public_key.verify(_unb64(signature), f"{header}.{claims}".encode(), padding.PKCS1v15(), hashes.SHA256())
+    return json.loads(_unb64(claims))
+
+
+@pytest.fixture(scope="module")
+def clerk(tmp_path_factory):
+    standin = ClerkStandin(users=25, key_path=tmp_path_factory.mktemp("clerk") / "key.pem")
+    server, base_url = standin.start()
+    yield standin, base_url
+    server.shutdown()
+    server.server_close()
+
+
+def get_json(url):
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_session_tokens_verify_against_the_jwks(clerk):
+    standin, base_url = clerk
+    _, jwks = get_json(f"{base_url}/v1/jwks")
+    _, identities = get_json(f"{base_url}/__clerk/identities?count=3&offset=10")
+
+    assert [i["user_id"] for i in identities] == ["user_seed_0000011", "user_seed_0000012", "user_seed_0000013"]
+    claims = verify_token(jwks, identities[0]["headers"]["Authorization"].removeprefix("Bearer "))
+    assert claims["sub"] == "user_seed_0000011"
+    assert claims["nbf"] <= claims["iat"] < claims["exp"]
+    assert "BEGIN PUBLIC KEY" in standin.public_key_pem()
+    assert base64.b64decode(publishable_key()[len("pk_test_"):]).endswith(b"$")
+
+
+def test_users_api_pages_and_404s(clerk):
+    _, base_url = clerk
+    status, page = get_json(f"{base_url}/v1/users?limit=10&offset=20")
+    assert status == 200
+    assert [u["id"] for u in page] == [f"user_seed_{i:07d}" for i in range(21, 26)]
+    assert page[0]["email_addresses"][0]["email_address"] == "seed_user_21@example.test"
+
+    assert get_json(f"{base_url}/v1/users/user_seed_0000003")[1]["username"] == "seed_user_3"
+    assert get_json(f"{base_url}/v1/users/user_seed_0000099")[0] == 404
+
+
+def test_ledger_flags_lost_stale_and_duplicate_picks():
+    ledger = PickLedger()
+    pick = {"gameId": "g1", "teamIndex": 1, "bestPick": True}
+    ledger.record("u1", [pick], confirmed=True)
+    ledger.record("u2", [pick], confirmed=True)
+    ledger.record("u3", [pick], confirmed=True)
+    # A failed re-pick may or may not have landed
+    ledger.record("u3", [{**pick, "teamIndex": 0}], confirmed=False)
+    ledger.record("u4", [pick], confirmed=False)
+    assert ledger.acceptable[("u4", "g1")] == {ABSENT, (1, True)}
+
+    result = ledger.verify([
+        ("u1", "g1", 1, 1, True),
+        ("u2", "g1", 1, 0, True),    # stale side
+        ("u3", "g1", 1, 0, True),    # failed re-pick applied: fine
+        ("u5", "g1", 2, 1, False),   # never submitted, and twice
+    ])
+    assert (result["lost"], result["stale"], result["duplicates"], result["unexpected"]) == (0, 1, 1, 1)
+
+    assert ledger.verify([])["lost"] == 3
+    ledger.check_read("u1", [pick], [{"gameId": "g1", "teamIndex": 0, "bestPick": True}])
+    assert ledger.stale_reads == 1
+
+
+def fake_app(clerk_standin, dsn, games, drop_user=None):
+    """savePicks/userPicks over the real Pick table, authenticating like getAuth(); can drop one user's writes."""
+    import psycopg
+
+    app = Standin("app")
+    jwks = clerk_standin.jwks(None)
+
+    def user_id(request):
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        try:
+            return verify_token(jwks, token)["sub"]
+        except Exception:
+            return None
+
+    @app.route("GET", "/api/all-espn-games")
+    def all_games(request):
+        return {"games": games}
+
+    @app.route("POST", "/api/savePicks")
+    def save_picks(request):
+        user = user_id(request)
+        if not user:
+            return Response({"message": "Not authenticated"}, status=401)
+        if user == drop_user:
+            return Response({"success": True}, status=201)
+        with psycopg.connect(dsn, autocommit=True) as conn:
+            for pick in request.json()["picks"]:
+                conn.execute(
+                    'INSERT INTO "Pick" (id, "userId", "gameId", "teamIndex", "createdAt", sport, "bestPick") '
+                    "VALUES (%s, %s, %s, %s, now(), %s, %s) "
+                    'ON CONFLICT ("userId", "gameId") DO UPDATE SET "teamIndex" = EXCLUDED."teamIndex", '
+                    '"bestPick" = EXCLUDED."bestPick"',
+                    (str(uuid.uuid4()), user, pick["gameId"], pick["teamIndex"], pick["sport"], pick["bestPick"]))
+        return Response({"success": True}, status=201)
+
+    @app.route("GET", "/api/userPicks")
+    def user_picks(request):
+        with psycopg.connect(dsn) as conn:
+            rows = conn.execute('SELECT "gameId", "teamIndex", "bestPick" FROM "Pick" WHERE "userId" = %s',
+                                (user_id(request),)).fetchall()
+        return [{"gameId": g, "teamIndex": t, "bestPick": b} for g, t, b in rows]
+
+    return app
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_stress_round_trip_catches_dropped_writes(clerk):
+    psycopg = pytest.importorskip("psycopg")
+    dsn = os.environ["TEST_DATABASE_URL"]
+    standin, _ = clerk
+    games = [{"id": f"stress_{i}", "homeTeam": {"name": "Home"}, "awayTeam": {"name": "Away"}} for i in range(4)]
+    with psycopg.connect(dsn) as conn:
+        conn.execute('ALTER TABLE "Pick" ADD COLUMN IF NOT EXISTS "bestPick" boolean')
+        for game in games:
+            conn.execute('INSERT INTO "Game" (id, "team1Name", "team2Name", "gameDate", "gameTime", sport) '
+                         "VALUES (%s, 'Home', 'Away', current_date, '19:00', 'NBA') ON CONFLICT DO NOTHING",
+                         (game["id"],))
+
+    identities = standin.identities(12)
+    server, base_url = fake_app(standin, dsn, games).start()
+    try:
+        report = run_stress(base_url, dsn, identities, games, "NBA", submits=2, lock_interval=0.02)
+    finally:
+        server.shutdown()
+        server.server_close()
+    v = report["verification"]
+    assert (v["stored_picks"], v["lost"], v["stale"], v["duplicates"], v["stale_reads"]) == (48, 0, 0, 0, 0)
+    assert report["routes"]["POST /api/savePicks"]["count"] == 24
+    assert report["locks"]["samples"] > 0
+
+    server, base_url = fake_app(standin, dsn, games, drop_user=identities[5]["user_id"]).start()
+    try:
+        report = run_stress(base_url, dsn, identities, games, "NBA", submits=1, read_back=False)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert report["verification"]["lost"] == 4
@@ -0,0 +1,138 @@
+import os
+import queue
+import threading
+import uuid
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pool_burst import APP_NAME, check_connections, connection_report, pool_delta, run_burst
+from standin import Response, Standin
+
+
+def pool_stats(acquires, queries, slow, slow_queries=()):
+    return {
+        "total": 3, "active": 1, "idle": 2, "waiting": 0,
+        "acquire": {"count": acquires, "errors": 0, "avgMs": 1, "maxMs": 40, "peakWaiting": 2},
+        "queries": {"count": queries, "errors": 0, "avgMs": 2, "slow": slow},
+        "slowQueries": list(slow_queries),
+        "config": {"max": 3},
+    }
+
+
+def test_report_peaks_per_application_and_state():
+    samples = [
+        [(APP_NAME, "active", 2), (APP_NAME, "idle", 1), ("(unnamed)", "idle", 4)],
+        [(APP_NAME, "active", 3), ("(unnamed)", "idle in transaction", 1), ("psql", "active", 1)],
+        [],
+    ]
+    report = connection_report(samples, max_connections=100)
+
+    assert report["samples"] == 3
+    assert (report["peak_total"], report["peak_app"], report["peak_app_active"]) == (7, 3, 3)
+    assert report["peak_other"] == 4
+    assert report["peak_idle_in_transaction"] == 1
+    assert report["applications"]["(unnamed)"] == {"peak": 4, "peak_active": 0}
+    assert "pool" not in report
+
+
+def test_checks_flag_connections_outside_the_pool_and_exhaustion():
+    report = connection_report([[(APP_NAME, "active", 6)]], max_connections=100)
+    report["pool"] = {"max": 3}
+
+    assert check_connections(report) == ["the app held 6 backends, more than 1 x its pool of 3"]
+    assert check_connections(report, instances=2) == []
+
+    exhausted = connection_report([[("(unnamed)", "idle", 100)]], max_connections=100)
+    assert check_connections(exhausted) == ["100 backends reached max_connections (100)"]
+
+
+def test_pool_delta_counts_only_the_run():
+    slow = [{"text": "SELECT 1", "ms": 700, "at": ""}, {"text": "SELECT 2", "ms": 900, "at": ""}]
+    delta = pool_delta(pool_stats(10, 30, 1, slow[:1]), pool_stats(25, 70, 2, slow))
+
+    assert (delta["acquires"], delta["queries"], delta["slow_queries"]) == (15, 40, 1)
+    assert delta["slowest"] == slow[1:]
+
+
+def fake_app(dsn, games, size=3):
+    """savePicks over a bounded pool of connections named like the app's, plus /api/db-pool."""
+    import psycopg
+
+    app = Standin("app")
+    idle = queue.LifoQueue()
+    lock = threading.Lock()
+    counts = {"total": 0, "waiting": 0, "acquires": 0}
+
+    def acquire():
+        with lock:
+            counts["acquires"] += 1
+            if idle.empty() and counts["total"] < size:
+                counts["total"] += 1
+                return psycopg.connect(dsn, autocommit=True, application_name=APP_NAME)
+            counts["waiting"] += 1
+        conn = idle.get()
+        with lock:
+            counts["waiting"] -= 1
+        return conn
+
+    @app.route("GET", "/api/db-pool")
+    def db_pool(request):
+        with lock:
+            stats = pool_stats(counts["acquires"], counts["acquires"], 0)
+            return {**stats, "total": counts["total"], "idle": idle.qsize(), "waiting": counts["waiting"],
+                    "active": counts["total"] - idle.qsize()}
+
+    @app.route("POST", "/api/savePicks")
+    def save_picks(request):
+        user = request.headers.get("X-User")
+        conn = acquire()
+        try:
+            for pick in request.json()["picks"]:
+                conn.execute(
+                    'INSERT INTO "Pick" (id, "userId", "gameId", "teamIndex", "createdAt", sport) '
+                    "VALUES (%s, %s, %s, %s, now(), %s) "
+                    'ON CONFLICT ("userId", "gameId") DO UPDATE SET "teamIndex" = EXCLUDED."teamIndex"',
+                    (str(uuid.uuid4()), user, pick["gameId"], pick["teamIndex"], pick["sport"]))
+            conn.execute("SELECT pg_sleep(0.02)")
+        finally:
+            idle.put(conn)
+        return Response({"success": True}, status=201)
+
+    def close():
+        while not idle.empty():
+            idle.get().close()
+    return app, close
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_burst_sees_the_apps_backends_stay_within_its_pool():
+    psycopg = pytest.importorskip("psycopg")
+    dsn = os.environ["TEST_DATABASE_URL"]
+    games = [{"id": f"pool_burst_{i}", "homeTeam": {"name": "Home"}, "awayTeam": {"name": "Away"}} for i in range(3)]
+    with psycopg.connect(dsn) as conn:
+        for game in games:
+            conn.execute('INSERT INTO "Game" (id, "team1Name", "team2Name", "gameDate", "gameTime", sport) '
+                         "VALUES (%s, 'Home', 'Away', current_date, '19:00', 'NBA') ON CONFLICT DO NOTHING",
+                         (game["id"],))
+    identities = [{"user_id": f"pool_burst_user_{i}", "headers": {"X-User": f"pool_burst_user_{i}"}} for i in range(20)]
+
+    app, close = fake_app(dsn, games)
+    server, base_url = app.start()
+    try:
+        report = run_burst(base_url, dsn, identities, games, "NBA", browse=False, interval=0.01)
+    finally:
+        server.shutdown()
+        server.server_close()
+        close()
+        with psycopg.connect(dsn) as conn:
+            conn.execute('DELETE FROM "Game" WHERE id = ANY(%s)', ([g["id"] for g in games],))
+
+    connections = report["connections"]
+    assert report["picks"] == {"confirmed": 60, "failed": 0}
+    assert connections["samples"] > 0
+    assert 0 < connections["peak_app"] <= 3
+    assert connections["pool"]["max"] == 3
+    assert connections["pool"]["acquires"] == 20
+    assert check_connections(connections) == []
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import aiohttp
+
+from pusher_fanout_bench import CHANNEL, entries_per_event, run, run_events, trigger_batch
+from pusher_standin import KEY, MAX_EVENT_BYTES, PusherStandin, signed_query
+
+
+@pytest.fixture
+def standin():
+    pusher = PusherStandin(seed=1)
+    stop, base_url = pusher.start()
+    yield pusher, base_url
+    stop()
+
+
+def post(base_url, path, payload, secret="standin-secret"):
+    body = json.dumps(payload).encode()
+    request = urllib.request.Request(f"{base_url}{path}?{signed_query(KEY, secret, path, body)}", data=body,
+                                     method="POST")
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_http_api_checks_signatures_and_pusher_limits(standin):
+    pusher, base_url = standin
+    event = {"name": "entries-patch", "channels": [CHANNEL], "data": "{}"}
+
+    assert post(base_url, "/apps/standin/events", event) == 200
+    assert post(base_url, "/apps/standin/events", event, secret="wrong") == 401
+    assert post(base_url, "/apps/standin/events", {**event, "data": "x" * (MAX_EVENT_BYTES + 1)}) == 413
+    batch = [{"name": "entries-patch", "channel": CHANNEL, "data": "{}"}] * 11
+    assert post(base_url, "/apps/standin/batch_events", {"batch": batch}) == 400
+    assert post(base_url, "/apps/standin/batch_events", {"batch": batch[:10]}) == 200
+
+    stats = pusher.stats()
+    assert stats["events"] == 11
+    assert stats["rejected"] == {"401": 1, "413": 1, "400": 1}
+
+
+def test_subscribers_get_events_in_order_and_other_channels_do_not(standin):
+    pusher, base_url = standin
+    ws_url = base_url.replace("http", "ws") + f"/app/{KEY}?protocol=7"
+
+    async def scenario():
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(ws_url) as ws, session.ws_connect(ws_url) as other:
+                for socket, channel in ((ws, CHANNEL), (other, "leaderboard-NFL-12")):
+                    assert json.loads((await socket.receive()).data)["event"] == "pusher:connection_established"
+                    await socket.send_str(json.dumps({"event": "pusher:subscribe", "data": {"channel": channel}}))
+                    assert json.loads((await socket.receive()).data)["event"] == "pusher_internal:subscription_succeeded"
+
+                await ws.send_str(json.dumps({"event": "pusher:ping", "data": {}}))
+                assert json.loads((await ws.receive()).data)["event"] == "pusher:pong"
+
+                events = [{"channel": CHANNEL, "data": {"part": part}} for part in range(12)]
+                await asyncio.to_thread(trigger_batch, base_url, events[:10])
+                await asyncio.to_thread(trigger_batch, base_url, events[10:])
+                frames = [json.loads((await ws.receive()).data) for _ in events]
+                assert [json.loads(f["data"])["part"] for f in frames] == list(range(12))
+                assert {f["channel"] for f in frames} == {CHANNEL}
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(other.receive(), timeout=0.3)
+
+    asyncio.run(scenario())
+    assert pusher.stats()["delivered"] == 12
+
+
+def test_patch_events_fit_pushers_size_limit():
+    per_event = entries_per_event()
+    events = run_events(0, per_event * 2 + 1, per_event)
+
+    assert [len(e["entries"]) for e in events] == [per_event, per_event, 1]
+    for event in events:
+        data = json.dumps({**event, "run": 99, "sentAt": 1.7e12})
+        assert len(data) < MAX_EVENT_BYTES
+
+
+def test_benchmark_delivers_every_patch_to_every_client(standin):
+    _, base_url = standin
+    results = run(base_url, clients=30, runs=2, changed=entries_per_event() + 5, workers=2, interval=0.05, grace=20)
+
+    assert results["connected"] == 30
+    assert results["events"] == 4
+    assert results["delivered"] == 120
+    assert results["lost"] == 0 and results["out_of_order"] == 0
+    assert results["latency_p50_ms"] > 0
+    assert results["patch_kb_per_client"] < results["refetch_kb_per_client"]
@@ -0,0 +1,140 @@
+import json
+import os
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+
+import pytest
+
+from clerk_standin import ClerkStandin, resize_directory
+from reminder_bench import check_deliveries, expected_recipients, prepare_database
+from sendgrid_standin import SendgridStandin
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(standin):
+        server, base_url = standin.start()
+        servers.append(server)
+        return base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def send(base_url, mail, key="SG.standin"):
+    """POST /v3/mail/send the way @sendgrid/mail does; returns (status, headers)."""
+    request = urllib.request.Request(f"{base_url}/v3/mail/send", method="POST", data=json.dumps(mail).encode(),
+                                     headers={"Content-Type": "application/json",
+                                              **({"Authorization": f"Bearer {key}"} if key else {})})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, dict(response.headers)
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers)
+
+
+def batch(emails, games=1):
+    return {
+        "from": {"email": "olivegardencsus@gmail.com"},
+        "template_id": "d-standin",
+        "personalizations": [{"to": [{"email": email}], "dynamic_template_data": {"games": ["A vs B"] * games}}
+                             for email in emails],
+    }
+
+
+def get(base_url, path):
+    with urllib.request.urlopen(f"{base_url}{path}", timeout=5) as response:
+        return json.loads(response.read())
+
+
+def test_batch_sends_record_every_recipient(serve):
+    base_url = serve(SendgridStandin())
+
+    assert send(base_url, batch(["a@x.test", "b@x.test"]))[0] == 202
+    assert send(base_url, batch(["b@x.test"]))[0] == 202
+    assert send(base_url, batch([f"{i}@x.test" for i in range(1001)]))[0] == 400
+    assert send(base_url, batch(["c@x.test"]), key=None)[0] == 401
+
+    stats = get(base_url, "/__sendgrid/stats")
+    assert stats["statuses"] == {"202": 2, "400": 1, "401": 1}
+    assert (stats["recipients"], stats["deliveries"], stats["duplicates"]) == (2, 3, 1)
+    assert stats["largest_batch"] == 2
+
+
+def test_rate_limit_answers_429_with_retry_after(serve):
+    base_url = serve(SendgridStandin(rate_limit=2))
+
+    statuses = [send(base_url, batch(["a@x.test"])) for _ in range(3)]
+
+    # The window is one wall-clock second, so a burst can straddle two windows
+    assert [s for s, _ in statuses].count(202) >= 2
+    for status, headers in statuses:
+        if status == 429:
+            assert 0 < float(headers["Retry-After"]) <= 1
+            assert headers["X-RateLimit-Limit"] == "2"
+
+
+def test_delivery_check_flags_missing_duplicate_and_wrong_reminders(serve):
+    base_url = serve(SendgridStandin())
+    expected = expected_recipients(30, games=3)
+    emails = list(expected)
+
+    send(base_url, batch(emails[2:], games=3))
+    send(base_url, batch([emails[2]], games=3))
+    send(base_url, batch(["seed_user_10@example.test"], games=3))
+
+    check = check_deliveries(base_url, expected, sample=len(expected))
+    assert (check["missing"], check["unexpected"], check["duplicates"]) == (2, 1, 1)
+    # seed_user_5, _15, ... only get reminded of the 2 games they haven't picked
+    assert check["wrong_games"] == sum(1 for games in expected.values() if games == 2)
+
+
+def test_expected_recipients_follow_the_opt_out_and_pick_pattern():
+    expected = expected_recipients(70, games=3)
+
+    assert "seed_user_10@example.test" not in expected  # opted out
+    assert "seed_user_7@example.test" not in expected  # picked everything
+    assert expected["seed_user_5@example.test"] == 2  # picked the first game only
+    assert expected["seed_user_1@example.test"] == 3
+    assert len(expected) == 70 - 7 - 10 + 1  # user 70 is both
+
+
+def test_clerk_directory_can_be_resized_between_sizes(serve):
+    pytest.importorskip("cryptography")
+    base_url = serve(ClerkStandin(users=10))
+
+    assert resize_directory(base_url, 1200) == {"users": 1200}
+    pages = [get(base_url, f"/v1/users?limit=500&offset={offset}") for offset in (0, 500, 1000)]
+    assert [len(page) for page in pages] == [500, 500, 200]
+    assert pages[2][-1]["email_addresses"][0]["email_address"] == "seed_user_1200@example.test"
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_prepare_database_matches_expected_recipients():
+    psycopg = pytest.importorskip("psycopg")
+    dsn = os.environ["TEST_DATABASE_URL"]
+    start = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0) + timedelta(minutes=90)
+
+    prepare_database(dsn, 200, 3, start)
+    prepare_database(dsn, 200, 3, start)  # repeatable
+
+    expected = expected_recipients(200, 3)
+    with psycopg.connect(dsn) as conn:
+        # Same question the route asks: who has not opted out and still has a game to pick
+        reminded = conn.execute("""
+            SELECT COUNT(*) FROM generate_series(1, 200) AS i
+            CROSS JOIN LATERAL (SELECT 'user_seed_' || lpad(i::text, 7, '0') AS id) u
+            WHERE NOT EXISTS (SELECT 1 FROM "UserPreferences" pref
+                              WHERE pref."userId" = u.id AND NOT pref."emailNotifications")
+              AND (SELECT COUNT(*) FROM "Pick" p
+                   WHERE p."userId" = u.id AND p."gameId" LIKE 'reminder_bench_%%') < 3
+        """).fetchone()[0]
+        games = conn.execute("""SELECT COUNT(*) FROM "Game" WHERE id LIKE 'reminder_bench_%%'
+                                AND "gameDate" = CURRENT_DATE AND status != 'COMPLETED'""").fetchone()[0]
+    assert reminded == len(expected)
+    assert games == 3
@@ -0,0 +1,127 @@
+import os
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+import scoring
+from scoring import compare, expected_changes, forget_scored_games, load_state, new_game_ids, score
+from seed_db import SeedConfig, seed, week_of
+
+ROUTE = Path(__file__).resolve().parents[2] / "src/app/api/leaderboard-entries/updateEntryPoints/route.ts"
+PATCH_LIB = Path(__file__).resolve().parents[2] / "src/lib/leaderboardPatch/leaderboardPatch.ts"
+MONDAY = date(2025, 3, 3)
+TUESDAY = MONDAY + timedelta(days=1)
+
+
+def game(day, won, underdog_win=False, underdog=None):
+    return {"day": day, "won": won, "is_underdog_win": underdog_win, "underdog_team_id": underdog}
+
+
+@pytest.fixture
+def games():
+    return {
+        "a": game(MONDAY, 0),
+        "b": game(MONDAY, 1, underdog_win=True, underdog="1"),
+        "c": game(TUESDAY, 1),
+        "d": game(TUESDAY, None),
+    }
+
+
+def test_correct_picks_score_underdog_and_best_pick_bonuses(games):
+    picks = [("u1", "c", 1, True), ("u2", "c", 0, True), ("u3", "d", 1, False)]
+
+    gained = score(games, picks, {"c"})
+
+    # Tuesday still has an undecided game, so no day bonuses yet
+    assert gained == {"u1": [1 + 3, 1], "u2": [0, 1]}
+
+
+def test_completed_day_adds_all_correct_and_best_pick_max_points(games):
+    picks = [
+        ("all_right", "a", 0, False), ("all_right", "b", 1, True),
+        ("one_wrong", "a", 1, False), ("one_wrong", "b", 1, False),
+        ("half_slate", "b", 1, False),
+    ]
+
+    gained = score(games, picks, {"a", "b"})
+
+    # 1 + (1 + 2 underdog + 3 best) + 3 all correct; max 2 games + 3 bonus + 3 best pick
+    assert gained["all_right"] == [10, 8]
+    assert gained["one_wrong"] == [3, 5]
+    # Picking only part of the slate never earns the all-correct bonus
+    assert gained["half_slate"] == [3, 4]
+
+
+def test_incremental_mode_skips_scored_games_and_the_rest_of_the_week(games):
+    week = {MONDAY + timedelta(days=i) for i in range(7)}
+    games["e"] = game(MONDAY + timedelta(days=7), 0)
+
+    assert new_game_ids(games, {"a"}, week, TUESDAY) == {"b", "c"}
+    assert new_game_ids(games, {"a"}, week, TUESDAY, incremental=False) == {"c"}
+
+
+def test_compare_reports_entry_user_and_max_point_differences():
+    before = {"u1": (10, 50, 20), "u2": (0, 0, 0)}
+    after = {"u1": (14, 54, 21), "u2": (3, 4, 8)}
+
+    mismatches = compare(before, after, {"u1": (4, 1), "u2": (3, 8)})
+
+    assert mismatches == [{"clerk_id": "u2", "expected": [3, 3, 8], "actual": [3, 4, 8]}]
+
+
+def route_sql():
+    """SCORE_ENTRIES_SQL from the route, with its point constants filled in."""
+    source = ROUTE.read_text()
+    sql = re.search(r"const SCORE_ENTRIES_SQL = `(.*?)`;", source, re.S).group(1)
+    constants = {"MAXPOINTSPERGAME": scoring.MAX_POINTS_PER_GAME, "BONUSPOINTS": scoring.BONUS_POINTS,
+                 "BESTPICKPOINTS": scoring.BEST_PICK_POINTS, "UNDERDOGPOINTS": scoring.UNDERDOG_POINTS}
+    for name, value in constants.items():
+        assert re.search(rf"const {name} = {value};", source), f"{name} differs between route and scoring.py"
+    constants["MAX_PATCH_ENTRIES"] = re.search(r"export const MAX_PATCH_ENTRIES = (\d+);", PATCH_LIB.read_text()).group(1)
+    return re.sub(r"\$\{(\w+)\}", lambda m: str(constants[m.group(1)]), sql)
+
+
+def test_route_constants_match_the_reference():
+    assert "${" not in route_sql()
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_route_sql_matches_the_reference_on_seeded_data():
+    psycopg = pytest.importorskip("psycopg")
+    dsn = os.environ["TEST_DATABASE_URL"]
+    config = SeedConfig(users=300, sports=["NBA"])
+    week = week_of(config.today)
+    config.weeks = [week]
+    seed(dsn, config, truncate=True, jobs=1, log=lambda *_: None)
+
+    def run_route_sql(state):
+        with psycopg.connect(dsn) as conn:
+            cur = psycopg.RawCursor(conn)
+            cur.execute(route_sql(), ["NBA", state["leaderboard_id"], True])
+            return cur.fetchone()
+
+    forget_scored_games(dsn, load_state(dsn, "NBA", week)["leaderboard_id"])
+    before = load_state(dsn, "NBA", week)
+    new_ids, expected = expected_changes(before)
+    assert new_ids and any(points for points, _ in expected.values())
+
+    games, _, entries, changed_entries, changed_users, entry_changes, user_changes, game_results = \
+        run_route_sql(before)
+    after = load_state(dsn, "NBA", week)
+    assert games == len(new_ids)
+    assert after["scored"] == new_ids
+    assert compare(before["entries"], after["entries"], expected) == []
+
+    # The pushed diff holds exactly the entries whose points moved, with their new points
+    moved = {clerk_id for clerk_id, (points, _) in expected.items() if points}
+    assert changed_entries == changed_users == len(entry_changes) == len(user_changes) == len(moved)
+    assert sorted(delta for _, _, delta in entry_changes) == sorted(expected[c][0] for c in moved)
+    assert sorted(points for _, points, _ in entry_changes) == sorted(after["entries"][c][0] for c in moved)
+    assert sorted(points for _, points, _ in user_changes) == sorted(after["entries"][c][1] for c in moved)
+    assert {g["id"] for g in game_results} == new_ids
+
+    # A second incremental run has nothing left to score
+    assert run_route_sql(after)[0] == 0
+    assert load_state(dsn, "NBA", week)["entries"] == after["entries"]
@@ -0,0 +1,87 @@
+import os
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+from scenarios import current_week
+from seed_db import (PICK_COLUMNS, SeedConfig, build_games, copy_value, parse_weeks, pick_rows, seed, week_days,
+                     week_of)
+
+TODAY = date(2025, 4, 12)
+
+
+@pytest.fixture(scope="module")
+def config():
+    return SeedConfig(users=300, sports=["NBA", "EPL"], weeks=parse_weeks("2", TODAY), today=TODAY, seed=7)
+
+
+@pytest.fixture(scope="module")
+def slates(config):
+    return build_games(config)
+
+
+def test_weeks_follow_the_app_calendar():
+    for day in (date(2025, 1, 1), date(2025, 1, 7), date(2025, 1, 8), TODAY, date(2024, 12, 31)):
+        assert week_of(day) == current_week(day)
+        assert day in week_days(day.year, week_of(day))
+
+    assert parse_weeks("3", TODAY) == [13, 14, 15]
+    assert parse_weeks("1", date(2025, 1, 2)) == [1]
+    assert parse_weeks("4-6", TODAY) == [4, 5, 6]
+    with pytest.raises(ValueError):
+        parse_weeks("6-4", TODAY)
+
+
+def test_games_cover_every_day_including_tomorrow(config, slates):
+    assert TODAY + timedelta(days=1) in config.days
+    assert set(slates) == {(sport, day) for sport in config.sports for day in config.days}
+
+    past = [g for (_, day), games in slates.items() if day < TODAY for g in games]
+    assert past and all(g.row[8] is not None or g.sport == "EPL" for g in past)
+    future = [g for (_, day), games in slates.items() if day > TODAY for g in games]
+    assert future and all(g.row[8] is None for g in future)
+
+
+def test_picks_are_deterministic_and_shaped_like_daily_picks(config, slates):
+    rows = list(pick_rows(config, slates))
+    assert rows == list(pick_rows(config, slates))
+    assert all(len(row) == len(PICK_COLUMNS) for row in rows)
+
+    games = {g.id: g for games in slates.values() for g in games}
+    assert all(row[2] in games for row in rows)
+    assert max(games[row[2]].day for row in rows) <= TODAY + timedelta(days=1)
+    assert len({row[0] for row in rows}) == len(rows)
+    assert len({(row[1], row[2]) for row in rows}) == len(rows)
+
+    # One best pick per user per slate
+    best = Counter((row[1], games[row[2]].sport, games[row[2]].day) for row in rows if row[6])
+    slates_played = {(row[1], games[row[2]].sport, games[row[2]].day) for row in rows}
+    assert set(best) == slates_played and set(best.values()) == {1}
+
+
+def test_pick_rows_split_across_workers(config, slates):
+    whole = list(pick_rows(config, slates))
+    parts = list(pick_rows(config, slates, 1, 120)) + list(pick_rows(config, slates, 121, 300))
+    assert parts == whole
+
+
+def test_copy_value_escapes_text_format():
+    assert copy_value(None) == "\\N"
+    assert copy_value(True) == "t"
+    assert copy_value(0) == "0"
+    assert copy_value("a\tb\\c\nd") == "a\\tb\\\\c\\nd"
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a disposable Postgres")
+def test_seed_round_trip(config):
+    psycopg = pytest.importorskip("psycopg")
+
+    counts = seed(os.environ["TEST_DATABASE_URL"], config, truncate=True, jobs=2, log=lambda *_: None)
+
+    with psycopg.connect(os.environ["TEST_DATABASE_URL"]) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM "Pick"').fetchone()[0] == counts["Pick"]
+        assert conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == config.users
+        entries, points = conn.execute("SELECT COUNT(*), SUM(points) FROM leaderboard_entries").fetchone()
+        assert entries == counts["leaderboard_entries"] > 0
+        assert points == conn.execute("SELECT SUM(points) FROM users").fetchone()[0]
@@ -0,0 +1,22 @@
+from server_timing import parse_server_timing
+
+
+def test_parses_the_apps_header():
+    header = 'db;dur=41.2;desc="3 calls", clerk;dur=120.4, json;dur=2.1, total;dur=170.3'
+
+    assert parse_server_timing(header) == {
+        "db": {"ms": 41.2, "count": 3},
+        "clerk": {"ms": 120.4, "count": 1},
+        "json": {"ms": 2.1, "count": 1},
+        "total": {"ms": 170.3, "count": 1},
+    }
+
+
+def test_tolerates_missing_and_foreign_entries():
+    assert parse_server_timing(None) == {}
+    assert parse_server_timing("") == {}
+    # Entries from a CDN or proxy: no duration, other descriptions, repeated names
+    assert parse_server_timing("cdn-cache;desc=HIT, edge;dur=1.5, edge;dur=2") == {
+        "cdn-cache": {"ms": 0.0, "count": 1},
+        "edge": {"ms": 3.5, "count": 2},
+    }
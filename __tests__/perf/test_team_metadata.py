@@ -0,0 +1,61 @@
+import json
+
+from espn_standin import EspnStandin, FixtureStore, LEAGUES, synthetic_teams
+from team_metadata import build_table, load_payloads, record_payloads, team_entries
+
+
+def test_entries_keep_every_name_the_app_looks_teams_up_by():
+    teams = team_entries(synthetic_teams("NBA", "http://standin"))
+    boston = next(t for t in teams if t["abbreviation"] == "BOS")
+
+    assert len(teams) == 30
+    assert set(boston) == {"id", "name", "displayName", "shortDisplayName", "abbreviation", "logo"}
+    assert boston["logo"] == "http://standin/logos/nba/bos.png"
+
+
+def test_builds_hashed_logos_and_a_stable_version(tmp_path):
+    logos = {}
+
+    def fetch(url):
+        if url.endswith("/atl.png"):
+            raise OSError("not found")
+        return logos.setdefault(url, url.encode())
+
+    payloads = {"NBA": synthetic_teams("NBA", "http://standin"), "EPL": synthetic_teams("EPL", "http://standin")}
+    table, failed = build_table(payloads, tmp_path, fetch)
+    again, _ = build_table(payloads, tmp_path, fetch)
+
+    assert list(table["leagues"]) == ["EPL", "NBA"]
+    assert table["version"] == again["version"]
+    assert len(failed) == 2
+    teams = {t["abbreviation"]: t for t in table["leagues"]["NBA"]["teams"]}
+    assert teams["ATL"]["logo"] == "http://standin/logos/nba/atl.png"
+    assert teams["BOS"]["logo"].startswith("/team-logos/nba/bos.")
+    assert (tmp_path / "nba" / teams["BOS"]["logo"].rsplit("/", 1)[1]).read_bytes() == b"http://standin/logos/nba/bos.png"
+    assert len(list((tmp_path / "nba").glob("*.png"))) == 29
+
+    # A changed logo gets a new file name, and the old file goes
+    logos["http://standin/logos/nba/bos.png"] = b"new"
+    changed, _ = build_table(payloads, tmp_path, fetch)
+    new = next(t["logo"] for t in changed["leagues"]["NBA"]["teams"] if t["abbreviation"] == "BOS")
+    assert new != teams["BOS"]["logo"]
+    assert changed["version"] != table["version"]
+    assert len(list((tmp_path / "nba").glob("bos.*.png"))) == 1
+
+
+def test_records_and_loads_every_league_from_the_standin(tmp_path):
+    server, base_url = EspnStandin().start()
+    try:
+        store = FixtureStore(tmp_path)
+        record_payloads(store, base_url, {"NHL": LEAGUES["NHL"]})
+        payloads, missing = load_payloads(store)
+        table, failed = build_table(payloads, tmp_path / "logos")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert list(payloads) == ["NHL"]
+    assert set(missing) == set(LEAGUES) - {"NHL"}
+    assert failed == []
+    assert len(table["leagues"]["NHL"]["teams"]) == 30
+    assert json.loads(json.dumps(table)) == table
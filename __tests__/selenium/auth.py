@@ -0,0 +1,224 @@
+import fcntl
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Programmatic sign-in for Selenium tests, replacing manual logins.
+#
+# Two modes (SELENIUM_AUTH):
+#   clerk    a real Clerk instance. A sign-in token for the test user is requested from
+#            the Backend API (CLERK_SECRET_KEY) and redeemed in the page with
+#            Clerk.signIn.create({ strategy: 'ticket' }), which is the same flow as a
+#            magic link. The whole UI sees a signed-in user.
+#   standin  the Clerk stand-in (__tests__/perf/clerk_standin.py). A session token is
+#            minted locally and set as the __session cookie. The app must run with the
+#            stand-in's CLERK_JWT_KEY. Only server-side auth (API routes, server
+#            components) sees the user, because clerk-js has no frontend API to load from.
+#
+# Either way the resulting cookies are cached per user in SESSION_CACHE and restored
+# through CDP on later tests, so signing in costs one cookie write instead of a
+# round trip through Clerk. Each pytest-xdist worker (and CI shard) gets its own user,
+# so parallel workers never share or wait on an account.
+#
+# Environment knobs:
+#   SELENIUM_AUTH               clerk | standin (default: clerk if CLERK_SECRET_KEY is set)
+#   SELENIUM_CLERK_USERS        comma-separated Clerk user ids, one per worker (default:
+#                               find or create selenium_worker_<n>+clerk_test@example.com)
+#   CLERK_API_URL               Backend API (default https://api.clerk.com)
+#   CLERK_STANDIN_KEY           signing key of the stand-in (default: its own default)
+#   SELENIUM_SESSION_CACHE      cache file (default __tests__/perf/results/selenium-sessions.json)
+#   SELENIUM_SESSION_MAX_AGE    seconds a cached session is reused (default 43200)
+
+AUTH_MODE = os.environ.get("SELENIUM_AUTH") or ("clerk" if os.environ.get("CLERK_SECRET_KEY") else "standin")
+CLERK_API_URL = os.environ.get("CLERK_API_URL", "https://api.clerk.com").rstrip("/")
+SESSION_CACHE = Path(os.environ.get("SELENIUM_SESSION_CACHE")
+                     or Path(__file__).resolve().parent.parent / "perf" / "results" / "selenium-sessions.json")
+SESSION_MAX_AGE = float(os.environ.get("SELENIUM_SESSION_MAX_AGE", str(12 * 3600)))
+
+CLERK_READY_JS = "return !!(window.Clerk && window.Clerk.loaded)"
+
+REDEEM_TICKET_JS = """
+const [ticket, done] = arguments;
+window.Clerk.client.signIn.create({ strategy: 'ticket', ticket })
+  .then((attempt) => window.Clerk.setActive({ session: attempt.createdSessionId }))
+  .then(() => done(null))
+  .catch((e) => done((e && e.errors && e.errors[0] && e.errors[0].longMessage) || String(e)));
+"""
+
+
+class AuthError(Exception):
+    pass
+
+
+def worker_slot():
+    """1-based user slot unique to this xdist worker on this CI shard."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    index = int(worker[2:]) if worker.startswith("gw") and worker[2:].isdigit() else 0
+    return int(os.environ.get("SHARD_ID", "0")) * 100 + index + 1
+
+
+class SessionCache:
+    """JSON file of {key: {"cookies": [...], "expires": ts}} shared by every worker.
+
+    Reads and writes hold an exclusive flock, so workers started together don't
+    clobber each other's entries.
+    """
+
+    def __init__(self, path=SESSION_CACHE):
+        self.path = Path(path)
+
+    def _locked(self, update=None):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                entries = json.loads(f.read() or "{}")
+            except ValueError:
+                entries = {}
+            if update is not None:
+                update(entries)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(entries))
+            return entries
+
+    def get(self, key, now=None):
+        entry = self._locked().get(key)
+        if entry and entry["expires"] > (now or time.time()):
+            return entry["cookies"]
+        return None
+
+    def put(self, key, cookies, expires):
+        def update(entries):
+            now = time.time()
+            for stale in [k for k, e in entries.items() if e["expires"] <= now]:
+                del entries[stale]
+            entries[key] = {"cookies": cookies, "expires": expires}
+        self._locked(update)
+
+    def drop(self, key):
+        self._locked(lambda entries: entries.pop(key, None))
+
+
+def _clerk_api(method, path, body=None):
+    secret = os.environ.get("CLERK_SECRET_KEY")
+    if not secret:
+        raise AuthError("SELENIUM_AUTH=clerk needs CLERK_SECRET_KEY")
+    request = urllib.request.Request(
+        f"{CLERK_API_URL}{path}", method=method,
+        data=json.dumps(body).encode() if body is not None else None,
+        headers={"Authorization": f"Bearer {secret}", "Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=15) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        raise AuthError(f"Clerk {method} {path} failed with {e.code}: {e.read().decode(errors='replace')}") from e
+
+
+def clerk_test_user(slot):
+    """Clerk user id for `slot`: from SELENIUM_CLERK_USERS, else found or created by email."""
+    configured = [u for u in os.environ.get("SELENIUM_CLERK_USERS", "").split(",") if u]
+    if configured:
+        return configured[(slot - 1) % len(configured)]
+
+    # +clerk_test addresses are Clerk's test-mode emails: no real mail is ever sent
+    email = f"selenium_worker_{slot}+clerk_test@example.com"
+    found = _clerk_api("GET", f"/v1/users?email_address={urllib.request.quote(email)}")
+    if found:
+        return found[0]["id"]
+    return _clerk_api("POST", "/v1/users", {"email_address": [email], "skip_password_requirement": True})["id"]
+
+
+def standin_user(slot):
+    from seed_db import clerk_id
+
+    return clerk_id(slot)
+
+
+def _app_cookie(base_url, name, value, expires):
+    parts = urlsplit(base_url)
+    return {"name": name, "value": value, "domain": parts.hostname, "path": "/",
+            "secure": parts.scheme == "https", "httpOnly": False, "sameSite": "Lax", "expires": expires}
+
+
+def standin_cookies(base_url, user_id):
+    """Cookies the Clerk middleware accepts as a signed-in request; returns (cookies, expires)."""
+    from clerk_standin import DEFAULT_KEY, ClerkStandin
+
+    standin = ClerkStandin(key_path=os.environ.get("CLERK_STANDIN_KEY") or DEFAULT_KEY)
+    now = int(time.time())
+    expires = now + standin.token_ttl
+    cookies = [
+        _app_cookie(base_url, "__session", standin.session_token(user_id, now), expires),
+        _app_cookie(base_url, "__client_uat", str(now), expires),
+        # Development instances hand out a dev-browser token first; any value skips the handshake
+        _app_cookie(base_url, "__clerk_db_jwt", "dvb_standin", expires),
+    ]
+    return cookies, expires
+
+
+def clerk_sign_in(driver, base_url, user_id, timeout=15):
+    """Sign `user_id` in through the page's clerk-js; returns (all browser cookies, expires)."""
+    ticket = _clerk_api("POST", "/v1/sign_in_tokens", {"user_id": user_id, "expires_in_seconds": 300})["token"]
+    driver.get(base_url)
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script(CLERK_READY_JS), "Clerk did not load")
+    driver.set_script_timeout(timeout)
+    error = driver.execute_async_script(REDEEM_TICKET_JS, ticket)
+    if error:
+        raise AuthError(f"Signing in {user_id} failed: {error}")
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.get_cookie("__session"), "No __session cookie after sign-in")
+    # clerk-js keeps refreshing the 60s __session from the longer-lived client, so the
+    # cached cookies stay usable for as long as the Clerk session does
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    return cookies, time.time() + SESSION_MAX_AGE
+
+
+def restore_cookies(driver, cookies):
+    allowed = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+    driver.execute_cdp_cmd("Network.setCookies", {
+        "cookies": [{k: c[k] for k in allowed if k in c and c[k] not in (None, -1)} for c in cookies],
+    })
+
+
+def sign_in(driver, base_url, user_id, mode=AUTH_MODE, cache=None):
+    """Put `driver` in a signed-in state for `user_id`, reusing cached cookies when possible.
+
+    Returns True when the cookies came from the cache. Call it before the first page
+    load of the test (the driver pool leaves each test on about:blank).
+    """
+    cache = cache or SessionCache()
+    key = f"{mode}:{urlsplit(base_url).netloc}:{user_id}"
+    cookies = cache.get(key)
+    if cookies is not None:
+        restore_cookies(driver, cookies)
+        return True
+
+    if mode == "clerk":
+        cookies, expires = clerk_sign_in(driver, base_url, user_id)
+    elif mode == "standin":
+        cookies, expires = standin_cookies(base_url, user_id)
+        restore_cookies(driver, cookies)
+    else:
+        raise AuthError(f"Unknown SELENIUM_AUTH mode: {mode}")
+    cache.put(key, cookies, min(expires, time.time() + SESSION_MAX_AGE))
+    return False
+
+
+def is_signed_in(driver, timeout=10):
+    """True once clerk-js reports a user; only meaningful in clerk mode."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(CLERK_READY_JS))
+    except Exception:
+        return False
+    return bool(driver.execute_script("return !!window.Clerk.user"))
@@ -0,0 +1,175 @@
+import os
+import weakref
+
+import pytest
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate
+from leaderboard_scale import THRESHOLDS as API_THRESHOLDS, format_scaling, measure_routes
+from network import monitor_for
+from seed_db import SeedConfig, seed_leaderboard, week_of
+from vitals import request_metrics, runtime_metrics
+from waits import wait_for_page_ready
+
+# Leaderboard scale benchmark, browser half: reseeds the database at each size, then
+# measures the leaderboard API routes (leaderboard_scale.measure_routes) and the
+# /leaderboards page itself: time until the first row is in the DOM, time until every
+# row is, DOM size / heap, and frame times while scrolling the whole list.
+#
+#   SELENIUM_BENCHMARK=1 LEADERBOARD_SCALE_DSN=postgresql://localhost/tallysight \
+#       pytest __tests__/selenium/benchmark/test_leaderboard_browser_scale.py -s
+#
+# The DSN must be the local database the app under test reads; it is truncated and
+# reseeded for every size. The scaling table (metric ~ size^k) is printed at the end.
+#
+# Environment knobs:
+#   SELENIUM_BENCHMARK=1          enable (skipped otherwise)
+#   LEADERBOARD_SCALE_DSN         database to seed (skipped when unset)
+#   LEADERBOARD_SIZES             comma-separated entry counts (default 1000,10000,100000)
+#   LEADERBOARD_SPORT             sport of the seeded weekly leaderboard (default NBA)
+#   BENCHMARK_UPDATE_BASELINE=1   accept this run as the new baseline
+
+ENABLED = os.environ.get("SELENIUM_BENCHMARK", "") not in ("", "0", "false")
+DSN = os.environ.get("LEADERBOARD_SCALE_DSN")
+SIZES = [int(s) for s in os.environ.get("LEADERBOARD_SIZES", "1000,10000,100000").split(",")]
+SPORT = os.environ.get("LEADERBOARD_SPORT", "NBA")
+UPDATE_BASELINE = os.environ.get("BENCHMARK_UPDATE_BASELINE", "") not in ("", "0", "false")
+
+SUITE = "leaderboard-scale"
+HISTORY = RESULTS_DIR / f"{SUITE}.jsonl"
+BASELINE = BASELINES_DIR / f"{SUITE}.json"
+
+# First match wins; the API route thresholds come after the page ones
+THRESHOLDS = {
+    "*.page.update_performance_posts": Threshold(relative=0, absolute=0),
+    "*.page.rows_rendered": None,
+    "*.page.scroll_frames": None,
+    "*.page.scroll_janky_frames": Threshold(relative=0.25, absolute=5),
+    "*.page.js_heap_mb": Threshold(relative=0.25, absolute=5),
+    "*.page.dom_nodes": Threshold(relative=0.25, absolute=200),
+    "*.page.js_event_listeners": None,
+    **API_THRESHOLDS,
+}
+
+ROW_SELECTOR = "#profile [class*='_profile__']"
+# Large lists can take minutes to arrive and render before the fix this benchmark is for
+RENDER_TIMEOUT = 600
+
+pytestmark = [
+    pytest.mark.skipif(not ENABLED, reason="set SELENIUM_BENCHMARK=1 to run benchmarks"),
+    pytest.mark.skipif(not DSN, reason="set LEADERBOARD_SCALE_DSN to a local database to seed"),
+]
+
+# Records when the first leaderboard row appears, relative to navigation start
+FIRST_ROW_OBSERVER_JS = """
+window.__firstRow = null;
+new MutationObserver((mutations, observer) => {
+  if (document.querySelector("%s")) {
+    window.__firstRow = performance.now();
+    observer.disconnect();
+  }
+}).observe(document, { childList: true, subtree: true });
+""" % ROW_SELECTOR
+
+# Scrolls the document to the bottom in viewport-sized steps, one per animation frame,
+# and reports the frame-to-frame deltas plus any long tasks seen along the way.
+SCROLL_JANK_JS = """
+const done = arguments[arguments.length - 1];
+const longTasks = [];
+let observer = null;
+try {
+  observer = new PerformanceObserver((list) => longTasks.push(...list.getEntries().map(e => e.duration)));
+  observer.observe({ type: 'longtask' });
+} catch (e) {}
+const frames = [];
+const step = window.innerHeight;
+let last = performance.now();
+const started = last;
+function tick(now) {
+  frames.push(now - last);
+  last = now;
+  const atBottom = window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 1;
+  if (atBottom || now - started > 120000) {
+    if (observer) observer.disconnect();
+    frames.shift();
+    frames.sort((a, b) => a - b);
+    const pick = (p) => frames.length ? frames[Math.min(frames.length - 1, Math.floor(p * frames.length))] : 0;
+    done({
+      scroll_frames: frames.length,
+      scroll_frame_p95_ms: pick(0.95),
+      scroll_frame_max_ms: frames.length ? frames[frames.length - 1] : 0,
+      scroll_janky_frames: frames.filter(f => f > 50).length,
+      scroll_long_task_ms: longTasks.reduce((a, b) => a + b, 0),
+    });
+    return;
+  }
+  window.scrollBy(0, step);
+  requestAnimationFrame(tick);
+}
+requestAnimationFrame(tick);
+"""
+
+_results = {}
+_installed = weakref.WeakSet()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def scaling_report():
+    yield
+    if len(_results) > 1:
+        print("\n📈 Leaderboard scaling (metric ~ size^k)")
+        print(format_scaling(_results))
+
+
+def measure_leaderboard_page(driver, url, expected_rows):
+    if driver not in _installed:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": FIRST_ROW_OBSERVER_JS})
+        driver.execute_cdp_cmd("Performance.enable", {})
+        _installed.add(driver)
+    monitor = monitor_for(driver)
+    since = monitor.mark()
+
+    driver.get(url)
+    driver.set_script_timeout(RENDER_TIMEOUT)
+    metrics = {
+        "time_to_first_row_ms": driver.execute_async_script("""
+            const done = arguments[arguments.length - 1];
+            (function check() { window.__firstRow !== null ? done(window.__firstRow) : setTimeout(check, 50); })();
+        """),
+        "time_to_all_rows_ms": driver.execute_async_script("""
+            const [selector, expected, done] = arguments;
+            (function check() {
+              document.querySelectorAll(selector).length >= expected ? done(performance.now()) : setTimeout(check, 100);
+            })();
+        """, ROW_SELECTOR, expected_rows),
+    }
+    wait_for_page_ready(driver, timeout=RENDER_TIMEOUT)
+    metrics["rows_rendered"] = driver.execute_script(f"return document.querySelectorAll(\"{ROW_SELECTOR}\").length")
+    metrics.update(runtime_metrics(driver))
+    metrics.update(driver.execute_async_script(SCROLL_JANK_JS))
+
+    monitor.poll()
+    requests = monitor.matching("", since)
+    api = request_metrics(requests)
+    metrics["requests"] = api["requests"]
+    metrics["transfer_kb"] = api["transfer_kb"]
+    metrics["update_performance_posts"] = api.get("api./api/user/updatePerformance.count", 0)
+    return {f"page.{k}": round(v, 2) if isinstance(v, float) else v for k, v in metrics.items() if v is not None}
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_leaderboard_scale(driver, base_url, size):
+    config = SeedConfig(users=size, sports=[SPORT])
+    config.weeks = [week_of(config.today)]
+    seed_leaderboard(DSN, config)
+
+    metrics = measure_routes(base_url, SPORT, config.weeks[0], runs=3, timeout=RENDER_TIMEOUT)
+    metrics.update(measure_leaderboard_page(driver, f"{base_url}/leaderboards", size))
+    _results[size] = metrics
+
+    print(f"\n📊 /leaderboards with {size:,} entries")
+    for name, value in sorted(metrics.items()):
+        print(f"   {name:<45} {value}")
+
+    scoped = {f"{size}.{name}": value for name, value in metrics.items()}
+    regressions = gate(SUITE, scoped, BASELINE, HISTORY, THRESHOLDS, update=UPDATE_BASELINE, scope=f"{size}.")
+    assert not regressions, f"❌ {size:,} entries regressed:\n" + "\n".join(f"  {r}" for r in regressions)
@@ -0,0 +1,87 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from benchstore import RESULTS_DIR, append_history
+from soak import PicksPageSession, ResourceSampler, check_soak, format_soak, install_timer_probe, soak_report
+from waits import wait_for_page_ready
+
+# Soak mode for the picks pages users keep open through a game day: opens the page once,
+# then keeps toggling picks and the best pick and switching sports for SOAK_DURATION,
+# sampling JS heap, DOM nodes, listeners, timers, requests and CPU every SOAK_INTERVAL
+# (see soak.py). Fails when a metric keeps growing after the warm-up, which is what a
+# leaked interval, listener or polling loop looks like.
+#
+#   SELENIUM_SOAK=1 SOAK_DURATION=3600 pytest __tests__/selenium/benchmark/test_picks_soak.py -s
+#
+# Run it against a production build backed by the ESPN stand-in, with SELENIUM_AUTH set up
+# for the signed-in driver. The samples are appended to SOAK_RESULTS (default
+# __tests__/perf/results/picks-soak-samples.jsonl) and the growth rates to the benchmark history.
+#
+# Environment knobs:
+#   SELENIUM_SOAK=1      enable (skipped otherwise)
+#   SOAK_DURATION        seconds per page (default 1800)
+#   SOAK_INTERVAL        seconds between samples (default 30)
+#   SOAK_WARMUP          seconds before growth is measured (default 120)
+#   SOAK_ACTION_PAUSE    seconds between interactions (default 2)
+#   SOAK_SPORTS          sports to switch between (default NBA,NHL,MLB,NFL)
+
+ENABLED = os.environ.get("SELENIUM_SOAK", "") not in ("", "0", "false")
+DURATION = float(os.environ.get("SOAK_DURATION", "1800"))
+INTERVAL = float(os.environ.get("SOAK_INTERVAL", "30"))
+WARMUP = float(os.environ.get("SOAK_WARMUP", "120"))
+ACTION_PAUSE = float(os.environ.get("SOAK_ACTION_PAUSE", "2"))
+SPORTS = os.environ.get("SOAK_SPORTS", "NBA,NHL,MLB,NFL").split(",")
+
+SUITE = "picks-soak"
+HISTORY = RESULTS_DIR / f"{SUITE}.jsonl"
+SAMPLES = Path(os.environ.get("SOAK_RESULTS") or RESULTS_DIR / f"{SUITE}-samples.jsonl")
+
+PAGES = ["/daily-picks", "/tomorrow-picks"]
+
+pytestmark = pytest.mark.skipif(not ENABLED, reason="set SELENIUM_SOAK=1 to run soak tests")
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_picks_page_soak(signed_in_driver, base_url, page):
+    driver = signed_in_driver
+    install_timer_probe(driver)
+    driver.get(f"{base_url}{page}?sport={SPORTS[0]}")
+    wait_for_page_ready(driver, timeout=30)
+
+    session = PicksPageSession(driver, base_url, page, SPORTS)
+    sampler = ResourceSampler(driver)
+    sampler.sample("start")
+    started = time.monotonic()
+    next_sample = started + INTERVAL
+    while time.monotonic() - started < DURATION:
+        session.step()
+        time.sleep(ACTION_PAUSE)
+        if time.monotonic() >= next_sample:
+            sample = sampler.sample()
+            next_sample += INTERVAL
+            print(f"   {sample['elapsed_s']:>7.0f}s  heap {sample['js_heap_mb']} MB, {sample['dom_nodes']} nodes, "
+                  f"{sample['js_event_listeners']} listeners, {sample['intervals']} intervals, "
+                  f"{sample.get('cpu_pct')}% CPU")
+
+    report = soak_report(sampler.samples, warmup_s=WARMUP)
+    report["actions"] = session.actions
+    print(f"\n🧪 {page} soak: {format_soak(report)}")
+    print(f"   actions: {session.actions}")
+
+    SAMPLES.parent.mkdir(parents=True, exist_ok=True)
+    with open(SAMPLES, "a") as f:
+        f.write(json.dumps({"page": page, "samples": sampler.samples}) + "\n")
+    metrics = {f"{page}.{metric}.per_hour": g["per_hour"] for metric, g in report["growth"].items()}
+    if "cpu_pct" in report:
+        metrics[f"{page}.cpu_pct.mean"] = report["cpu_pct"]["mean"]
+    append_history(HISTORY, SUITE, metrics, extra={"scope": f"{page}.", "duration_s": report["duration_s"]})
+
+    if session.actions["reload"]:
+        print(f"⚠️ {session.actions['reload']} sport switches fell back to a full navigation; "
+              "heap growth only covers the time since the last one")
+    problems = check_soak(report)
+    assert not problems, f"❌ {page} kept growing:\n" + "\n".join(f"  {p}" for p in problems)
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from benchstore import BASELINES_DIR, RESULTS_DIR, Threshold, gate, median_metrics
+from vitals import measure_page
+
+# Benchmark mode for the Selenium suite: loads each page several times, records the
+# median Web Vitals / runtime / API timings to a JSON-lines history and fails when a
+# metric regresses past its threshold against the stored baseline. API timings come with
+# the server-side spans from each route's Server-Timing header, recorded but not gated.
+#
+#   SELENIUM_BENCHMARK=1 pytest __tests__/selenium/benchmark -s
+#
+# Run it against a production build (`SERVER_TIMING=1 npm start` after `npm run build`) backed
+# by the ESPN stand-in and a seeded database, otherwise dev-mode compilation dominates the
+# numbers. Without SERVER_TIMING=1 the routes send no spans to record.
+#
+# Environment knobs:
+#   SELENIUM_BENCHMARK=1          enable (skipped otherwise)
+#   BENCHMARK_RUNS                measured loads per page, after one warm-up (default 5)
+#   BENCHMARK_UPDATE_BASELINE=1   accept this run as the new baseline
+#   BENCHMARK_RESULTS_DIR         history location (default __tests__/perf/results)
+#   BENCHMARK_BASELINES_DIR       baseline location (default __tests__/perf/baselines)
+
+ENABLED = os.environ.get("SELENIUM_BENCHMARK", "") not in ("", "0", "false")
+RUNS = int(os.environ.get("BENCHMARK_RUNS", "5"))
+UPDATE_BASELINE = os.environ.get("BENCHMARK_UPDATE_BASELINE", "") not in ("", "0", "false")
+
+SUITE = "web-vitals"
+HISTORY = RESULTS_DIR / f"{SUITE}.jsonl"
+BASELINE = BASELINES_DIR / f"{SUITE}.json"
+
+PAGES = ["/", "/daily-picks", "/tomorrow-picks", "/myPicks", "/leaderboards"]
+
+# First match wins. Absolute floors keep small values from failing on noise.
+THRESHOLDS = {
+    "*.api.*.count": Threshold(relative=0, absolute=0),  # any extra call to an API route
+    "*.failed_requests": Threshold(relative=0, absolute=0),
+    "*.api.*.server.*": None,  # where an API route's time went; its total is gated below
+    "*.api.*.ms": Threshold(relative=0.3, absolute=50),
+    "*.cls": Threshold(relative=0.25, absolute=0.05),
+    "*.js_heap_mb": Threshold(relative=0.25, absolute=5),
+    "*.dom_nodes": Threshold(relative=0.25, absolute=200),
+    "*.requests": Threshold(relative=0.2, absolute=3),
+    "*.transfer_kb": Threshold(relative=0.2, absolute=50),
+    "*_ms": Threshold(relative=0.2, absolute=100),
+    "*.js_event_listeners": None,
+}
+
+pytestmark = pytest.mark.skipif(not ENABLED, reason="set SELENIUM_BENCHMARK=1 to run benchmarks")
+
+
+def measure(driver, url):
+    # Every measured load is a first visit: no HTTP cache carried over from the last one
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.get("about:blank")
+    return measure_page(driver, url)
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_page_vitals(driver, base_url, page):
+    url = f"{base_url}{page}"
+    measure(driver, url)  # warm-up: server-side caches, lazy route compilation
+    runs = [measure(driver, url) for _ in range(RUNS)]
+
+    metrics = {f"{page}.{name}": value for name, value in median_metrics(runs).items()}
+    print(f"\n📊 {page} (median of {RUNS})")
+    for name, value in metrics.items():
+        print(f"   {name:<55} {value}")
+
+    regressions = gate(SUITE, metrics, BASELINE, HISTORY, THRESHOLDS, update=UPDATE_BASELINE, scope=f"{page}.")
+    assert not regressions, f"❌ {page} regressed:\n" + "\n".join(f"  {r}" for r in regressions)
@@ -0,0 +1,194 @@
+import os
+import queue
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from auth import AUTH_MODE, clerk_test_user, sign_in, standin_user, worker_slot
+from network import reset_monitor
+
+# Shared perf tooling (benchstore, stand-ins) lives in __tests__/perf
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "perf"))
+
+# Shared Selenium setup for every suite under __tests__/selenium.
+#
+# Chrome cold-starts dominated the old per-test `webdriver.Chrome()` fixtures, so
+# browsers now live in a per-process pool and are wiped (cookies + storage) between
+# tests instead of being relaunched. Each pytest-xdist worker owns its own pool, so
+#   pytest -n auto --dist loadfile
+# fans the suite out across every core, and SHARD_ID/NUM_SHARDS split it across CI
+# machines on top of that.
+#
+# Environment knobs:
+#   TALLYSIGHT_BASE_URL   app under test (default http://localhost:3000)
+#   SELENIUM_POOL_SIZE    max browsers per worker process (default 1)
+#   SELENIUM_HEADED=1     show the browser window (needed for manual login flows)
+#   SHARD_ID, NUM_SHARDS  run only this machine's share of the test files
+#   SELENIUM_AUTH         clerk | standin, how `signed_in_driver` logs in (see auth.py)
+
+BASE_URL = os.environ.get("TALLYSIGHT_BASE_URL", "http://localhost:3000").rstrip("/")
+POOL_SIZE = int(os.environ.get("SELENIUM_POOL_SIZE", "1"))
+HEADED = os.environ.get("SELENIUM_HEADED", "") not in ("", "0", "false")
+SHARD_ID = int(os.environ.get("SHARD_ID", "0"))
+NUM_SHARDS = int(os.environ.get("NUM_SHARDS", "1"))
+ACQUIRE_TIMEOUT = 120
+
+
+def build_chrome_options(headed=HEADED):
+    chrome_options = Options()
+    if not headed:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    # CDP Network.* events for network.NetworkMonitor / waits.wait_for_network_idle
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+def new_chrome_driver():
+    driver = webdriver.Chrome(options=build_chrome_options())
+    if HEADED:
+        driver.maximize_window()
+    return driver
+
+
+class DriverPool:
+    """Bounded pool of reusable WebDriver sessions.
+
+    Drivers are created lazily up to `size`, handed out LIFO so the warmest
+    browser is reused first, and reset before going back into the pool. A driver
+    that fails to reset (crashed tab, dead session) is quit and replaced on the
+    next acquire.
+    """
+
+    def __init__(self, factory, size=1, base_url=BASE_URL):
+        self._factory = factory
+        self._size = max(1, size)
+        self._base_url = base_url
+        self._idle = queue.LifoQueue()
+        self._created = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._created) < self._size:
+                driver = self._factory()
+                self._created.append(driver)
+                return driver
+
+        return self._idle.get(timeout=ACQUIRE_TIMEOUT)
+
+    def release(self, driver):
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            print(f"⚠️ Discarding browser that failed to reset: {e.msg}")
+            self.discard(driver)
+            return
+        self._idle.put(driver)
+
+    def discard(self, driver):
+        with self._lock:
+            if driver in self._created:
+                self._created.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def reset(self, driver):
+        # Close any extra tabs/windows a test opened and keep the first one
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # delete_all_cookies() only covers the current domain; CDP clears every
+        # origin (Clerk sets cookies on its own frontend API domain too)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": self._base_url,
+            "storageTypes": "local_storage,session_storage,indexeddb,cache_storage,service_workers",
+        })
+        driver.get("about:blank")
+        reset_monitor(driver)
+
+    def close(self):
+        with self._lock:
+            drivers, self._created = self._created, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+
+def pytest_collection_modifyitems(config, items):
+    if NUM_SHARDS <= 1:
+        return
+    if not 0 <= SHARD_ID < NUM_SHARDS:
+        raise pytest.UsageError(f"SHARD_ID must be in [0, {NUM_SHARDS}), got {SHARD_ID}")
+
+    # Shard by file so module-scoped state and `--dist loadfile` stay together.
+    # Files are dealt round-robin in sorted order, which every machine agrees on.
+    modules = sorted({item.nodeid.split("::", 1)[0] for item in items})
+    owned = set(modules[SHARD_ID::NUM_SHARDS])
+
+    selected, deselected = [], []
+    for item in items:
+        if item.nodeid.split("::", 1)[0] in owned:
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    return BASE_URL
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    pool = DriverPool(new_chrome_driver, size=POOL_SIZE)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(driver_pool):
+    driver = driver_pool.acquire()
+    yield driver
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def test_user():
+    """Clerk user id owned by this worker (see auth.py for SELENIUM_AUTH)."""
+    slot = worker_slot()
+    return clerk_test_user(slot) if AUTH_MODE == "clerk" else standin_user(slot)
+
+
+@pytest.fixture
+def signed_in_driver(driver, base_url, test_user):
+    """A pooled driver already signed in as `test_user`; open any page next."""
+    sign_in(driver, base_url, test_user)
+    yield driver
@@ -1,41 +1,79 @@
+import os
+from contextlib import contextmanager, nullcontext
+
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
-import time
+
+from benchstore import RESULTS_DIR
+from netprofile import NetworkProfiler, format_profile
+from network import monitor_for
+from waits import carousel_update, wait_for_carousel_ready
+
+# CAROUSEL_PROFILE=1 records every request each selection and refresh triggers and
+# prints a per-sport report (duplicates, refresh re-fetches, sequential API calls);
+# the full waterfall goes to CAROUSEL_PROFILE_JSON (default __tests__/perf/results/carousel-profile.json).
+PROFILE = os.environ.get("CAROUSEL_PROFILE", "") not in ("", "0", "false")
+PROFILE_JSON = os.environ.get("CAROUSEL_PROFILE_JSON") or RESULTS_DIR / "carousel-profile.json"
+
+SOCCER_LEAGUES = ["MLS", "EPL", "LALIGA", "BUNDESLIGA", "SERIE_A", "LIGUE_1"]
+
+# Browser-side wall time of loading every soccer league the old way (one request per
+# league, as carouselWithGames.tsx used to) and through the aggregated endpoint
+SOCCER_FETCH_TIMING_JS = """
+const leagues = arguments[0];
+const done = arguments[arguments.length - 1];
+const timed = async (urls) => {
+  const started = performance.now();
+  await Promise.all(urls.map((url) => fetch(url, { cache: "no-store" }).then((r) => r.json())));
+  return performance.now() - started;
+};
+(async () => {
+  const perLeague = await timed(leagues.map((l) => `/api/all-espn-games?sport=${l}&day=today`));
+  const aggregated = await timed([`/api/all-espn-games/leagues?sports=${leagues.join(",")}&day=today`]);
+  done({ perLeague, aggregated });
+})().catch((e) => done({ error: String(e) }));
+"""
+
+_profiler = None
 
 @pytest.fixture
-def setup():
-    chrome_options = Options()
-    chrome_options.add_argument("--log-level=3")
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.get('http://localhost:3000')  # Update URL if needed
-    driver.maximize_window()
-    time.sleep(3)  # Allow page to load
+def setup(driver, base_url):
+    global _profiler
+    driver.get(base_url)
+    wait_for_carousel_ready(driver)
+    _profiler = NetworkProfiler(driver) if PROFILE else None
     yield driver
-    driver.quit()
+    if _profiler is not None:
+        print("\n=== 📡 Carousel network profile ===")
+        print(format_profile(_profiler.report()))
+        print(f"📝 Waterfalls written to {_profiler.write_json(PROFILE_JSON)}")
+    _profiler = None
+
+@contextmanager
+def carousel_action(driver, label, action):
+    with _profiler.step(label, action) if _profiler is not None else nullcontext():
+        with carousel_update(driver):
+            yield
 
 def select_sport_from_dropdown(driver, sport_name):
     wait = WebDriverWait(driver, 10)
     dropdown = wait.until(EC.visibility_of_element_located((By.TAG_NAME, "select")))
     select = Select(dropdown)
-    select.select_by_value(sport_name)
+    with carousel_action(driver, sport_name, "select"):
+        select.select_by_value(sport_name)
     print(f"🔵 Selected sport: {sport_name}")
-    time.sleep(2)  # Allow carousel update
 
 def select_soccer_league(driver, league_name):
     try:
         wait = WebDriverWait(driver, 10)
         dropdown = wait.until(EC.visibility_of_element_located((By.ID, "soccer-league")))
         select = Select(dropdown)
-        select.select_by_value(league_name)
+        with carousel_action(driver, league_name or "Soccer", "select"):
+            select.select_by_value(league_name)
         print(f"⚽ Selected soccer league: {league_name or 'All Leagues'}")
-        time.sleep(2)  # allow update
     except TimeoutException:
         print(f"⚠️ Could not find soccer league dropdown for league: {league_name}")
 
@@ -47,9 +85,9 @@ def click_sport_button(driver, sport_name):
                 (By.XPATH, f"//button[.//span[text()='{sport_name}']]")
             )
         )
-        sport_button.click()
+        with carousel_action(driver, sport_name, "button"):
+            sport_button.click()
         print(f"🟢 Clicked home page sport button: {sport_name}")
-        time.sleep(2)
     except TimeoutException:
         print(f"⚠️ Sport button for {sport_name} not found on home page.")
 
@@ -69,12 +107,27 @@ def get_carousel_game_count(driver):
         print("⚠️ No carousel or games loaded within timeout.")
         return 0
 
-def click_refresh_button(driver):
+def click_refresh_button(driver, label):
     wait = WebDriverWait(driver, 10)
     refresh_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[title='Refresh Games']")))
-    refresh_button.click()
+    with carousel_action(driver, label, "refresh"):
+        refresh_button.click()
     print("🔄 Clicked refresh button")
-    time.sleep(2)  # Allow carousel reload
+
+def games_api_calls(driver, action):
+    """Runs `action` (which waits for the carousel) and returns the games API requests it caused."""
+    monitor = monitor_for(driver)
+    since = monitor.mark()
+    action()
+    monitor.poll()
+    return monitor.matching("/api/all-espn-games", since)
+
+def time_soccer_fetches(driver, repeats=3):
+    """Best of `repeats` browser-side timings of the per-league fan-out vs one aggregated request."""
+    runs = [driver.execute_async_script(SOCCER_FETCH_TIMING_JS, SOCCER_LEAGUES) for _ in range(repeats)]
+    errors = [run["error"] for run in runs if "error" in run]
+    assert not errors, f"Soccer fetch timing failed: {errors}"
+    return {key: min(run[key] for run in runs) for key in ("perLeague", "aggregated")}
 
 def test_sport_dropdown_and_refresh_functionality(setup):
     driver = setup
@@ -92,7 +145,7 @@ def test_sport_dropdown_and_refresh_functionality(setup):
             print(f"⚠️ No games initially loaded for {sport} (possible offseason or no games today)")
 
 
-        click_refresh_button(driver)
+        click_refresh_button(driver, sport)
         refreshed_game_count = get_carousel_game_count(driver)
         print(f"♻️ Refreshed game count: {refreshed_game_count}")
 
@@ -106,7 +159,7 @@ def test_sport_dropdown_and_refresh_functionality(setup):
         else:
             print(f"⚠️ No games initially loaded for {sport} (possible offseason or no games today)")
 
-        click_refresh_button(driver)
+        click_refresh_button(driver, sport)
         refreshed_game_count = get_carousel_game_count(driver)
         if refreshed_game_count > 0:
             print(f"✅ Games loaded after refresh for {sport} (button): {refreshed_game_count}")
@@ -117,10 +170,13 @@ def test_sport_dropdown_and_refresh_functionality(setup):
     print("\n=== ⚽ Testing Soccer League Dropdown ===")
     click_sport_button(driver, "Soccer")  # Make sure soccer is active first
 
-    soccer_leagues = ["", "MLS", "EPL", "LALIGA", "BUNDESLIGA", "SERIE_A", "LIGUE_1"]
+    soccer_leagues = [""] + SOCCER_LEAGUES
 
     for league in soccer_leagues:
-        select_soccer_league(driver, league)
+        # One games request per carousel load, whether it shows one league or all of them
+        # (re-selecting the league that is already active loads nothing)
+        calls = games_api_calls(driver, lambda: select_soccer_league(driver, league))
+        assert len(calls) <= 1, f"{league or 'All Soccer Leagues'}: {len(calls)} games requests {[c.url for c in calls]}"
 
         league_game_count = get_carousel_game_count(driver)
         if league_game_count > 0:
@@ -129,7 +185,16 @@ def test_sport_dropdown_and_refresh_functionality(setup):
             print(f"⚠️ No games initially loaded for {league or 'All Soccer Leagues'} (possible offseason or no games today)")
 
 
-        click_refresh_button(driver)
+        calls = games_api_calls(driver, lambda: click_refresh_button(driver, league or "Soccer"))
+        assert len(calls) == 1, f"Refreshing {league or 'All Soccer Leagues'} made {len(calls)} games requests"
+        if not league:
+            assert "/api/all-espn-games/leagues" in calls[0].url
+            duration = calls[0].duration
+            print(f"⏱️ All Soccer Leagues refresh: 1 request"
+                  f"{f', {duration * 1000:.0f} ms' if duration is not None else ''}")
+            timing = time_soccer_fetches(driver)
+            print(f"⏱️ Loading all {len(SOCCER_LEAGUES)} leagues: {timing['perLeague']:.0f} ms as "
+                  f"{len(SOCCER_LEAGUES)} requests, {timing['aggregated']:.0f} ms as one")
 
         refreshed_count = get_carousel_game_count(driver)
         if refreshed_count > 0:
@@ -1,17 +1,12 @@
 import pytest
-import time
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 @pytest.fixture
-def setup():
-    driver = webdriver.Chrome()
-    driver.get('http://localhost:3000/leaderboards')
-    driver.maximize_window()
+def setup(driver, base_url):
+    driver.get(f"{base_url}/leaderboards")
     yield driver
-    driver.quit()
 
 def test_signup_buttons(setup):
     driver = setup
@@ -25,8 +20,6 @@ def test_signup_buttons(setup):
 
     # Click "Sign Up" button 
     sign_up_button.click()
-    
-    time.sleep(5)
 
     # Wait until the URL contains the link
     WebDriverWait(driver, 10).until(
@@ -47,8 +40,6 @@ def test_login_buttons(setup):
 
     # Click "Log In" button
     log_in_button.click()
-    
-    time.sleep(5)
 
     # Wait until the URL contains the link for log in
     WebDriverWait(driver, 10).until(
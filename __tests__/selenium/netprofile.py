@@ -0,0 +1,153 @@
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from network import monitor_for
+from waits import wait_for_network_idle
+
+# Per-action network profiles: every request an action (a dropdown change, a refresh
+# click) caused, reduced to what request deduplication and caching decisions need:
+#   - count and bytes, split into API calls / images / everything else
+#   - duplicates: the same URL fetched more than once by one action
+#   - refetched: URLs the previous action for the same selection already fetched
+#     (a refresh re-downloading data that was just loaded)
+#   - sequential chains: API calls that only started once another one finished, which
+#     is what a waterfall of awaits looks like compared to a single Promise.all
+#   - the waterfall itself, relative to the first request of the action
+#
+#   profiler = NetworkProfiler(driver)
+#   with profiler.step("NBA", "select"):
+#       Select(dropdown).select_by_value("NBA")
+#   print(format_profile(profiler.report()))
+
+# A call starting within this long after another one finished is treated as waiting on it
+CHAIN_GAP_MS = 50
+
+
+def _kind(request):
+    path = urlsplit(request.url).path
+    if path.startswith("/api/"):
+        return "api"
+    if request.resource_type == "Image" or path.startswith("/_next/image"):
+        return "image"
+    return "other"
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+def waterfall(requests):
+    """[(start_ms, end_ms, kind, url)] relative to the first request, in start order."""
+    if not requests:
+        return []
+    origin = min(r.started for r in requests)
+    rows = []
+    for r in sorted(requests, key=lambda r: r.started):
+        end = _ms(r.finished - origin) if r.finished is not None else None
+        rows.append((_ms(r.started - origin), end, _kind(r), r.url))
+    return rows
+
+
+def sequential_chains(requests, gap_ms=CHAIN_GAP_MS):
+    """Longest run of API calls where each starts right after the previous one finished."""
+    calls = sorted((r for r in requests if _kind(r) == "api" and r.finished is not None), key=lambda r: r.started)
+    best = {}
+    for i, call in enumerate(calls):
+        chain = [call]
+        for prev in calls[:i]:
+            gap = (call.started - prev.finished) * 1000
+            if 0 <= gap <= gap_ms and len(best[prev.request_id]) + 1 > len(chain):
+                chain = best[prev.request_id] + [call]
+        best[call.request_id] = chain
+    longest = max(best.values(), key=len, default=[])
+    return [r.url for r in longest] if len(longest) > 1 else []
+
+
+def profile_requests(requests, previous=None):
+    """Summary of one action's requests; `previous` is the last action's requests for the same selection."""
+    kinds = Counter(_kind(r) for r in requests)
+    urls = Counter(r.url for r in requests)
+    finished = [r for r in requests if r.finished is not None]
+    span = (max(r.finished for r in finished) - min(r.started for r in requests)) if finished else 0.0
+    busy = sum(r.duration for r in finished)
+    previous_urls = {r.url for r in previous or []}
+    refetched = sorted({r.url for r in requests if r.url in previous_urls and not r.from_cache})
+    return {
+        "requests": len(requests),
+        "api_requests": kinds["api"],
+        "image_requests": kinds["image"],
+        "other_requests": kinds["other"],
+        "bytes": sum(r.encoded_bytes for r in requests),
+        "api_bytes": sum(r.encoded_bytes for r in requests if _kind(r) == "api"),
+        "from_cache": sum(1 for r in requests if r.from_cache),
+        "failed": sum(1 for r in requests if r.failed or (r.status or 0) >= 400),
+        "span_ms": _ms(span),
+        # >1 means requests overlapped; 1 means they ran one after another
+        "parallelism": round(busy / span, 2) if span else 0.0,
+        "duplicates": {url: n for url, n in urls.items() if n > 1},
+        "refetched": refetched,
+        "sequential_chain": sequential_chains(requests),
+        "waterfall": waterfall(requests),
+    }
+
+
+class NetworkProfiler:
+    def __init__(self, driver, idle_time=0.5, timeout=30):
+        self.driver = driver
+        self.idle_time = idle_time
+        self.timeout = timeout
+        self.steps = []
+        self._last_by_label = {}
+
+    @contextmanager
+    def step(self, label, action):
+        """Profile everything `action` on selection `label` fetches, until the network is idle."""
+        monitor = monitor_for(self.driver)
+        since = monitor.mark()
+        started = time.monotonic()
+        yield
+        wait_for_network_idle(self.driver, idle_time=self.idle_time, timeout=self.timeout)
+        requests = monitor.matching("", since)
+        profile = profile_requests(requests, self._last_by_label.get(label))
+        profile["wall_ms"] = _ms(time.monotonic() - started)
+        self._last_by_label[label] = requests
+        self.steps.append({"label": label, "action": action, **profile})
+
+    def report(self):
+        """Per-selection totals plus every step; `flags` lists what looks redundant."""
+        selections = {}
+        for step in self.steps:
+            entry = selections.setdefault(step["label"], {"steps": 0, "requests": 0, "api_requests": 0,
+                                                          "bytes": 0, "flags": []})
+            entry["steps"] += 1
+            entry["requests"] += step["requests"]
+            entry["api_requests"] += step["api_requests"]
+            entry["bytes"] += step["bytes"]
+            if step["duplicates"]:
+                entry["flags"].append(f"{step['action']}: {sum(step['duplicates'].values())} duplicate requests")
+            api_refetched = [u for u in step["refetched"] if urlsplit(u).path.startswith("/api/")]
+            if step["action"] == "refresh" and api_refetched:
+                entry["flags"].append(f"refresh: re-fetched {len(api_refetched)} API URLs")
+            if step["sequential_chain"]:
+                entry["flags"].append(f"{step['action']}: {len(step['sequential_chain'])} API calls in sequence")
+        return {"selections": selections, "steps": self.steps}
+
+    def write_json(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2))
+        return path
+
+
+def format_profile(report):
+    header = f"{'selection':<14} {'steps':>5} {'reqs':>5} {'api':>5} {'KB':>9}  flags"
+    lines = [header, "-" * len(header)]
+    for label, s in report["selections"].items():
+        flags = "; ".join(s["flags"]) or "-"
+        lines.append(f"{label or 'All':<14} {s['steps']:>5} {s['requests']:>5} {s['api_requests']:>5} "
+                     f"{s['bytes'] / 1024:>9.1f}  {flags}")
+    return "\n".join(lines)
@@ -0,0 +1,168 @@
+import json
+import time
+import weakref
+
+# Network activity for a Chrome session, read from the CDP events Chrome writes to the
+# "performance" log (enabled via goog:loggingPrefs in conftest.build_chrome_options).
+#
+# get_log("performance") drains the buffer, so every consumer must go through the one
+# NetworkMonitor per driver returned by monitor_for() instead of reading the log itself.
+
+# Long-lived connections that never "finish" and would keep the page from going idle
+DEFAULT_IGNORE = ("/_next/webpack-hmr", "sockjs", "pusher.com", "data:", "blob:")
+
+
+class Request:
+    __slots__ = ("request_id", "url", "method", "resource_type", "seq", "started",
+                 "finished", "status", "encoded_bytes", "from_cache", "failed", "initiator", "server_timing")
+
+    def __init__(self, request_id, url, method, resource_type, seq, started, initiator):
+        self.request_id = request_id
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+        self.seq = seq
+        self.started = started
+        self.finished = None
+        self.status = None
+        self.encoded_bytes = 0
+        self.from_cache = False
+        self.failed = None
+        self.initiator = initiator
+        # Raw Server-Timing response header (the app's API routes send one), or None
+        self.server_timing = None
+
+    @property
+    def done(self):
+        return self.finished is not None
+
+    @property
+    def duration(self):
+        if self.finished is None:
+            return None
+        return self.finished - self.started
+
+    def to_dict(self):
+        return {
+            "url": self.url,
+            "method": self.method,
+            "type": self.resource_type,
+            "status": self.status,
+            "bytes": self.encoded_bytes,
+            "from_cache": self.from_cache,
+            "failed": self.failed,
+            "started": self.started,
+            "finished": self.finished,
+            "duration_ms": None if self.duration is None else round(self.duration * 1000, 2),
+            "initiator": self.initiator,
+            "server_timing": self.server_timing,
+        }
+
+
+class NetworkMonitor:
+    """Tracks every request a driver issues, keyed on CDP Network.* events.
+
+    Timestamps are CDP monotonic seconds, so they can be compared with each other
+    but not with time.monotonic(); idleness is measured against the wall clock of
+    when this process last saw activity.
+    """
+
+    def __init__(self, driver, ignore=DEFAULT_IGNORE):
+        self.driver = driver
+        self.ignore = tuple(ignore)
+        self.requests = {}
+        self.history = []
+        self.last_activity = time.monotonic()
+
+    def _ignored(self, url):
+        return any(part in url for part in self.ignore)
+
+    def poll(self):
+        entries = self.driver.get_log("performance")
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            self._handle(message.get("method", ""), message.get("params", {}))
+        return len(entries)
+
+    def _handle(self, method, params):
+        request_id = params.get("requestId")
+
+        if method == "Network.requestWillBeSent":
+            url = params["request"]["url"]
+            if self._ignored(url):
+                return
+            self.last_activity = time.monotonic()
+            existing = self.requests.get(request_id)
+            if existing is not None and params.get("redirectResponse"):
+                # Redirect hops reuse the requestId; follow the final URL
+                existing.url = url
+                return
+            initiator = params.get("initiator", {})
+            request = Request(
+                request_id, url, params["request"].get("method", "GET"),
+                params.get("type", "Other"), len(self.history), params.get("timestamp", 0.0),
+                initiator.get("url") or initiator.get("type"),
+            )
+            self.requests[request_id] = request
+            self.history.append(request)
+            return
+
+        request = self.requests.get(request_id)
+        if request is None:
+            return
+
+        if method == "Network.responseReceived":
+            response = params.get("response", {})
+            request.status = response.get("status")
+            request.from_cache = bool(response.get("fromDiskCache") or response.get("fromServiceWorker"))
+            # CDP keeps the server's header name casing (HTTP/2 lowercases it)
+            request.server_timing = next(
+                (v for k, v in response.get("headers", {}).items() if k.lower() == "server-timing"), None)
+        elif method == "Network.loadingFinished":
+            request.finished = params.get("timestamp", request.started)
+            request.encoded_bytes = int(params.get("encodedDataLength", 0))
+            self.last_activity = time.monotonic()
+        elif method == "Network.loadingFailed":
+            request.finished = params.get("timestamp", request.started)
+            request.failed = params.get("errorText", "failed")
+            self.last_activity = time.monotonic()
+
+    def mark(self):
+        """Position in the request history; pass as `since` to only look at newer requests."""
+        self.poll()
+        return len(self.history)
+
+    def matching(self, url_part="", since=0):
+        return [r for r in self.history[since:] if url_part in r.url]
+
+    def inflight(self, url_part=""):
+        return [r for r in self.history if not r.done and url_part in r.url]
+
+    def idle_for(self):
+        return time.monotonic() - self.last_activity
+
+    def clear(self):
+        self.poll()
+        self.requests.clear()
+        self.history.clear()
+        self.last_activity = time.monotonic()
+
+
+_monitors = weakref.WeakKeyDictionary()
+
+
+def monitor_for(driver):
+    monitor = _monitors.get(driver)
+    if monitor is None:
+        monitor = NetworkMonitor(driver)
+        _monitors[driver] = monitor
+    return monitor
+
+
+def reset_monitor(driver):
+    # Drain whatever the previous test left in the log so it isn't attributed to the next one
+    monitor = _monitors.pop(driver, None)
+    if monitor is not None:
+        monitor.clear()
+    else:
+        driver.get_log("performance")
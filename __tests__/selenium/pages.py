@@ -0,0 +1,271 @@
+import random
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from waits import POLL_INTERVAL, carousel_update, wait_for_network_idle, wait_for_page_ready
+
+# Page objects for the home, picks and My Picks pages, keyed on the data-testid attributes
+# the components expose (sport-tab, contest-card, pick-team, best-pick, my-pick, ...).
+#
+# Selectors are compiled once into Query specs at import time. A page reads everything an
+# assertion needs with ONE execute_script call: QUERY_JS runs each query's
+# querySelectorAll and returns text, data-* attributes and (when asked) the elements
+# themselves, so a check costs one WebDriver round trip instead of a page_source dump or a
+# find_element + get_attribute call per element.
+#
+#   picks = DailyPicksPage(driver, base_url).open("NBA")
+#   chosen = picks.pick_all(random.Random(0))
+#   picks.submit()
+#   assert MyPicksPage(driver, base_url).open().has_picks(chosen)
+
+QUERY_JS = """
+const [queries, scope] = arguments;
+const root = scope || document;
+const read = (el, attr) => {
+  const value = el.getAttribute(attr);
+  return value === 'true' ? true : value === 'false' ? false : value;
+};
+const out = {};
+for (const q of queries) {
+  out[q.name] = Array.from(root.querySelectorAll(q.selector), el => {
+    const row = {};
+    if (q.text) row.text = el.innerText.trim();
+    for (const [key, attr] of q.attrs) row[key] = read(el, attr);
+    for (const [key, selector] of q.children) {
+      const child = el.querySelector(selector);
+      row[key] = child ? child.innerText.trim() : null;
+    }
+    if ('disabled' in el) row.enabled = !el.disabled;
+    if (q.element) row.element = el;
+    return row;
+  });
+}
+return out;
+"""
+
+
+def testid(name, **attrs):
+    """CSS selector for [data-testid=name], narrowed by data-* attributes (game_id -> data-game-id)."""
+    selector = f"[data-testid='{name}']"
+    for key, value in attrs.items():
+        selector += f"[data-{key.replace('_', '-')}='{value}']"
+    return selector
+
+
+class Query:
+    """One precompiled selector and the fields read from every element it matches.
+
+    `attrs` are data-* attribute names, returned under their snake_case key
+    ("data-game-id" -> "game_id"); "true"/"false" come back as booleans. `children` maps a
+    key to a selector whose first match's text is read inside each element.
+    """
+
+    def __init__(self, name, selector, text=False, attrs=(), children=None, element=False):
+        self.name = name
+        self.selector = selector
+        self.spec = {
+            "name": name,
+            "selector": selector,
+            "text": text,
+            "attrs": [[attr.removeprefix("data-").replace("-", "_"), attr] for attr in attrs],
+            "children": [[key, child] for key, child in (children or {}).items()],
+            "element": element,
+        }
+
+
+def query(driver, *queries, scope=None):
+    """Run every query in one round trip; returns {query name: [row, ...]}."""
+    return driver.execute_script(QUERY_JS, [q.spec for q in queries], scope)
+
+
+SPORT_TABS = Query("sports", testid("sport-tab"), attrs=("data-sport",), element=True)
+CONTESTS = Query("contests", testid("contest-card"), attrs=("data-contest", "data-sport"),
+                 children={"title": testid("contest-title")})
+CONTEST_PLAY = {
+    kind: Query("play", f"{testid('contest-card', contest=kind)} {testid('contest-play')}",
+                text=True, element=True)
+    for kind in ("featured", "upcoming")
+}
+
+PICKS_TITLE = Query("title", testid("picks-title"), text=True)
+PICK_TEAMS = Query("teams", testid("pick-team"), attrs=("data-game-id", "data-side", "data-team", "data-selected"),
+                   element=True)
+BEST_PICKS = Query("best_picks", testid("best-pick"), attrs=("data-game-id", "data-selected"), element=True)
+SUBMIT = Query("submit", testid("submit-picks"), element=True)
+
+MY_PICKS = Query("picks", testid("my-pick"), attrs=("data-game-id", "data-team", "data-best-pick"))
+MY_PICKS_EMPTY = Query("empty", testid("my-picks-empty"), text=True)
+
+
+class Page:
+    path = "/"
+
+    def __init__(self, driver, base_url):
+        self.driver = driver
+        self.base_url = base_url
+
+    def query(self, *queries):
+        return query(self.driver, *queries)
+
+    def wait_until(self, read, timeout=10, message=None):
+        """Poll `read()` (one round trip per poll) until it returns something truthy, and return it."""
+        return WebDriverWait(self.driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda _: read(), message or f"{type(self).__name__} did not reach the expected state")
+
+    def click(self, element):
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element)
+
+    def wait_for_path(self, path, timeout=15):
+        WebDriverWait(self.driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: path in d.current_url, f"Did not navigate to {path}")
+
+
+class HomePage(Page):
+    path = "/"
+
+    def open(self):
+        self.driver.get(f"{self.base_url}{self.path}")
+        wait_for_page_ready(self.driver)
+        self.wait_until(lambda: self.query(SPORT_TABS)["sports"], message="No sport tabs on the home page")
+        return self
+
+    def select_sport(self, sport):
+        tabs = self.query(SPORT_TABS)["sports"]
+        tab = next((t for t in tabs if t["sport"] == sport), None)
+        assert tab is not None, f"No {sport} tab; found {[t['sport'] for t in tabs]}"
+        with carousel_update(self.driver):
+            self.click(tab["element"])
+
+    def contests(self, kind=None):
+        """[{contest: featured|upcoming, sport, title}] for the contest cards on screen."""
+        cards = self.query(CONTESTS)["contests"]
+        return [c for c in cards if kind is None or c["contest"] == kind]
+
+    def play(self, kind="featured"):
+        """Open the first `kind` contest; returns the picks page it leads to."""
+        buttons = self.wait_until(lambda: self.query(CONTEST_PLAY[kind])["play"],
+                                  message=f"No {kind} contest to open")
+        page = DailyPicksPage if kind == "featured" else TomorrowPicksPage
+        self.click(buttons[0]["element"])
+        self.wait_for_path(page.path)
+        picks = page(self.driver, self.base_url)
+        picks.wait_loaded()
+        return picks
+
+
+class PicksPage(Page):
+    """/daily-picks and /tomorrow-picks: one pick-team button per side of every game."""
+
+    def open(self, sport=None):
+        url = f"{self.base_url}{self.path}" + (f"?sport={sport}" if sport else "")
+        self.driver.get(url)
+        self.wait_loaded()
+        return self
+
+    def wait_loaded(self, timeout=20):
+        wait_for_page_ready(self.driver, timeout=timeout)
+        return self.wait_until(lambda: self.query(PICKS_TITLE)["title"], timeout=timeout,
+                               message=f"{self.path} did not render its games")
+
+    def state(self):
+        """Title, team buttons, best-pick buttons and the submit button, in one round trip."""
+        result = self.query(PICKS_TITLE, PICK_TEAMS, BEST_PICKS, SUBMIT)
+        return {
+            "title": result["title"][0]["text"] if result["title"] else None,
+            "teams": result["teams"],
+            "best_picks": result["best_picks"],
+            "submit": result["submit"][0]["element"] if result["submit"] else None,
+        }
+
+    def title(self):
+        return self.state()["title"]
+
+    def games(self, teams=None):
+        """{game_id: {"away": team row, "home": team row}}"""
+        games = {}
+        for team in self.state()["teams"] if teams is None else teams:
+            # Without it every button would land in one game
+            assert team["game_id"] is not None, f"pick-team button for {team['team']} has no data-game-id"
+            games.setdefault(team["game_id"], {})[team["side"]] = team
+        return games
+
+    def pick(self, game_id, side):
+        """Pick `side` of `game_id` and wait for the page to mark it selected; returns the team name."""
+        team = self.games()[game_id][side]
+        assert team["enabled"], f"Game {game_id} is locked"
+        if not team["selected"]:
+            self.click(team["element"])
+            self.wait_until(lambda: self.games()[game_id][side]["selected"],
+                            message=f"{team['team']} was not selected")
+        return team["team"]
+
+    def pick_all(self, rng=None):
+        """Pick a random side of every open game that has no pick yet; returns {game_id: team}."""
+        rng = rng or random.Random()
+        chosen = {}
+        for game_id, sides in self.games().items():
+            picked = next((t for t in sides.values() if t["selected"]), None)
+            if picked is not None:
+                chosen[game_id] = picked["team"]
+            elif all(t["enabled"] for t in sides.values()):
+                chosen[game_id] = self.pick(game_id, rng.choice(sorted(sides)))
+        return chosen
+
+    def best_pick(self, game_id=None):
+        """Toggle the best pick on `game_id` (default: the first game) and return its new state."""
+        buttons = self.state()["best_picks"]
+        assert buttons, f"No best-pick buttons on {self.path}"
+        button = next(b for b in buttons if game_id is None or b["game_id"] == game_id)
+        self.click(button["element"])
+        self.wait_until(lambda: self.best_pick_selected(button["game_id"]) != button["selected"],
+                        message=f"Best pick on game {button['game_id']} did not toggle")
+        return not button["selected"]
+
+    def best_pick_selected(self, game_id):
+        return next(b["selected"] for b in self.state()["best_picks"] if b["game_id"] == game_id)
+
+    def submit(self, timeout=15):
+        """Submit the picks; returns once the app has moved on to /myPicks."""
+        button = self.wait_until(lambda: self.state()["submit"],
+                                 message="Submit button did not appear; every game needs a pick")
+        self.click(button)
+        self.wait_for_path(MyPicksPage.path, timeout=timeout)
+        return MyPicksPage(self.driver, self.base_url).wait_loaded()
+
+
+class DailyPicksPage(PicksPage):
+    path = "/daily-picks"
+
+
+class TomorrowPicksPage(PicksPage):
+    path = "/tomorrow-picks"
+
+
+class MyPicksPage(Page):
+    path = "/myPicks"
+
+    def open(self, sport=None):
+        url = f"{self.base_url}{self.path}" + (f"?sport={sport}" if sport else "")
+        self.driver.get(url)
+        return self.wait_loaded()
+
+    def wait_loaded(self, timeout=20):
+        wait_for_network_idle(self.driver, timeout=timeout)
+        # Either a list of picks or the empty state, never the loading skeleton
+        self.wait_until(lambda: any(self.query(MY_PICKS, MY_PICKS_EMPTY).values()), timeout=timeout,
+                        message="My Picks did not finish loading")
+        return self
+
+    def picks(self):
+        """[{game_id, team, best_pick}] for every pick listed."""
+        return self.query(MY_PICKS)["picks"]
+
+    def has_picks(self, game_ids, timeout=10):
+        """Wait until every game in `game_ids` shows up as a pick."""
+        wanted = {str(game_id) for game_id in game_ids}
+        try:
+            self.wait_until(lambda: wanted <= {p["game_id"] for p in self.picks()}, timeout=timeout)
+        except TimeoutException:
+            return False
+        return True
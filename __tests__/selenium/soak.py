@@ -0,0 +1,253 @@
+import random
+import time
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from network import monitor_for
+from pages import BEST_PICKS, PICK_TEAMS
+from waits import wait_for_network_idle
+
+# Long-session profiling for pages users leave open for hours (/daily-picks,
+# /tomorrow-picks on game days). A soak keeps one page open, keeps interacting with it
+# and samples every `interval` seconds, after a forced GC:
+#   - JS heap, DOM nodes, event listeners and documents from CDP Performance.getMetrics
+#   - main-thread CPU: the growth of the TaskDuration counter over the wall time
+#   - intervals and timeouts still scheduled, from a probe wrapping the timer functions
+#   - requests the page made since the previous sample (polling that speeds up)
+#
+# soak_report() fits a line through the samples taken after the warm-up; a metric that
+# keeps climbing at more than its GrowthLimit fails check_soak().
+#
+#   sampler = ResourceSampler(driver)
+#   sampler.sample()
+#   ... interact ...
+#   problems = check_soak(soak_report(sampler.samples, warmup_s=120))
+
+# Installed before any page script runs, so every timer the app schedules is seen
+TIMER_PROBE_JS = """
+(() => {
+  const intervals = new Set();
+  const timeouts = new Set();
+  const { setInterval, clearInterval, setTimeout, clearTimeout } = window;
+  const clear = (id) => { intervals.delete(id); timeouts.delete(id); };
+  window.setInterval = function (...args) {
+    const id = setInterval.apply(this, args);
+    intervals.add(id);
+    return id;
+  };
+  window.setTimeout = function (fn, ...rest) {
+    let id;
+    const run = typeof fn === 'function' ? function (...args) { timeouts.delete(id); return fn.apply(this, args); } : fn;
+    id = setTimeout.call(this, run, ...rest);
+    timeouts.add(id);
+    return id;
+  };
+  window.clearInterval = function (id) { clear(id); return clearInterval.call(this, id); };
+  window.clearTimeout = function (id) { clear(id); return clearTimeout.call(this, id); };
+  window.__soakTimers = () => ({ intervals: intervals.size, timeouts: timeouts.size });
+})();
+"""
+
+TIMERS_JS = "return window.__soakTimers ? window.__soakTimers() : null"
+
+
+class GrowthLimit:
+    """How fast a metric may keep growing once the page has warmed up.
+
+    A metric fails when its fitted slope exceeds `per_hour` AND it grew by more than
+    `absolute` over the measured window, so short soaks don't fail on GC noise.
+    """
+
+    def __init__(self, per_hour, absolute):
+        self.per_hour = per_hour
+        self.absolute = absolute
+
+    def exceeded(self, growth):
+        return growth["per_hour"] > self.per_hour and growth["delta"] > self.absolute
+
+
+LIMITS = {
+    "js_heap_mb": GrowthLimit(per_hour=10, absolute=5),
+    "dom_nodes": GrowthLimit(per_hour=1000, absolute=500),
+    "js_event_listeners": GrowthLimit(per_hour=200, absolute=100),
+    "documents": GrowthLimit(per_hour=2, absolute=2),
+    "intervals": GrowthLimit(per_hour=2, absolute=2),
+    "timeouts": GrowthLimit(per_hour=50, absolute=20),
+    # Sport switches come in bursts, so only a steady climb counts
+    "requests_per_min": GrowthLimit(per_hour=10, absolute=20),
+}
+
+
+_probed = weakref.WeakSet()
+
+
+def install_timer_probe(driver):
+    """Count the page's live timers on every future document of this driver (once per driver)."""
+    if driver in _probed:
+        return
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TIMER_PROBE_JS})
+    driver.execute_cdp_cmd("Performance.enable", {})
+    _probed.add(driver)
+
+
+class ResourceSampler:
+    def __init__(self, driver, gc=True):
+        self.driver = driver
+        self.gc = gc
+        self.samples = []
+        self.started = time.monotonic()
+        self._monitor = monitor_for(driver)
+        self._since = self._monitor.mark()
+
+    def sample(self, label=None):
+        if self.gc:
+            self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        metrics = {m["name"]: m["value"]
+                   for m in self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+        timers = self.driver.execute_script(TIMERS_JS) or {}
+        now = time.monotonic()
+
+        since, self._since = self._since, self._monitor.mark()
+        requests = self._since - since
+        sample = {
+            "elapsed_s": round(now - self.started, 2),
+            "label": label,
+            "js_heap_mb": round(metrics.get("JSHeapUsedSize", 0) / (1024 * 1024), 3),
+            "dom_nodes": metrics.get("Nodes"),
+            "js_event_listeners": metrics.get("JSEventListeners"),
+            "documents": metrics.get("Documents"),
+            "task_s": metrics.get("TaskDuration", 0.0),
+            "script_s": metrics.get("ScriptDuration", 0.0),
+            "intervals": timers.get("intervals"),
+            "timeouts": timers.get("timeouts"),
+            "requests": requests,
+        }
+        previous = self.samples[-1] if self.samples else None
+        if previous is not None:
+            wall = sample["elapsed_s"] - previous["elapsed_s"]
+            sample["cpu_pct"] = round((sample["task_s"] - previous["task_s"]) / wall * 100, 2) if wall else 0.0
+            sample["requests_per_min"] = round(requests / wall * 60, 2) if wall else 0.0
+        self.samples.append(sample)
+        return sample
+
+
+def growth(points):
+    """Least-squares slope per hour through [(elapsed_s, value)], plus first/last/peak."""
+    points = [(t, v) for t, v in points if v is not None]
+    if len(points) < 2:
+        return None
+    n = len(points)
+    mean_t = sum(t for t, _ in points) / n
+    mean_v = sum(v for _, v in points) / n
+    spread = sum((t - mean_t) ** 2 for t, _ in points)
+    slope = sum((t - mean_t) * (v - mean_v) for t, v in points) / spread if spread else 0.0
+    return {
+        "first": points[0][1],
+        "last": points[-1][1],
+        "peak": max(v for _, v in points),
+        "delta": round(points[-1][1] - points[0][1], 3),
+        "per_hour": round(slope * 3600, 3),
+    }
+
+
+def soak_report(samples, warmup_s=0.0, metrics=tuple(LIMITS)):
+    """Growth of each metric over the samples taken after `warmup_s`, and CPU use."""
+    steady = [s for s in samples if s["elapsed_s"] >= warmup_s]
+    report = {
+        "samples": len(samples),
+        "measured_samples": len(steady),
+        "duration_s": samples[-1]["elapsed_s"] if samples else 0.0,
+        "warmup_s": warmup_s,
+        "growth": {},
+    }
+    for metric in metrics:
+        fitted = growth([(s["elapsed_s"], s.get(metric)) for s in steady])
+        if fitted is not None:
+            report["growth"][metric] = fitted
+    cpu = [s["cpu_pct"] for s in steady if "cpu_pct" in s]
+    if cpu:
+        report["cpu_pct"] = {"mean": round(sum(cpu) / len(cpu), 2), "max": max(cpu)}
+    return report
+
+
+def check_soak(report, limits=None, min_samples=3):
+    """What kept growing past its limit; empty when the page stayed flat."""
+    limits = LIMITS if limits is None else limits
+    if report["measured_samples"] < min_samples:
+        return [f"only {report['measured_samples']} samples after the warm-up; soak longer or sample more often"]
+    problems = []
+    for metric, fitted in report["growth"].items():
+        limit = limits.get(metric)
+        if limit is not None and limit.exceeded(fitted):
+            problems.append(f"{metric} grew {fitted['first']} -> {fitted['last']} ({fitted['per_hour']:+}/h, "
+                            f"limit {limit.per_hour}/h)")
+    return problems
+
+
+def format_soak(report):
+    lines = [f"{report['duration_s']:.0f}s, {report['measured_samples']} of {report['samples']} samples "
+             f"after a {report['warmup_s']:.0f}s warm-up"]
+    for metric, g in report["growth"].items():
+        lines.append(f"   {metric:<20} {g['first']:>10} -> {g['last']:>10}  peak {g['peak']:>10}  {g['per_hour']:>+10}/h")
+    if "cpu_pct" in report:
+        lines.append(f"   {'cpu_pct':<20} mean {report['cpu_pct']['mean']}%, max {report['cpu_pct']['max']}%")
+    return "\n".join(lines)
+
+
+class PicksPageSession:
+    """Keeps a picks page busy the way a game-day user does: toggling picks and the best
+    pick, and switching sports through the app's client-side router (a full navigation
+    would throw away the very heap the soak is watching)."""
+
+    def __init__(self, driver, base_url, path, sports, seed=0):
+        self.driver = driver
+        self.base_url = base_url
+        self.path = path
+        self.sports = list(sports)
+        self.rng = random.Random(seed)
+        self.actions = {"pick": 0, "best_pick": 0, "sport": 0, "reload": 0}
+
+    def _click_random(self, selector):
+        buttons = [b for b in self.driver.find_elements(By.CSS_SELECTOR, selector) if b.is_enabled()]
+        if not buttons:
+            return False
+        try:
+            self.rng.choice(buttons).click()
+        except WebDriverException:
+            # Re-rendered under us (percentages or scores came in); try again next round
+            return False
+        return True
+
+    def toggle_pick(self):
+        if self._click_random(PICK_TEAMS.selector):
+            self.actions["pick"] += 1
+
+    def toggle_best_pick(self):
+        if self._click_random(BEST_PICKS.selector):
+            self.actions["best_pick"] += 1
+
+    def switch_sport(self, sport=None):
+        sport = sport or self.rng.choice(self.sports)
+        url = f"{self.path}?sport={sport}"
+        routed = self.driver.execute_script(
+            "const router = window.next && window.next.router;"
+            "if (!router || !router.push) return false;"
+            "router.push(arguments[0]); return true;", url)
+        if not routed:
+            self.driver.get(f"{self.base_url}{url}")
+            self.actions["reload"] += 1
+        self.actions["sport"] += 1
+        wait_for_network_idle(self.driver, timeout=30)
+        return sport
+
+    def step(self):
+        """One round of interaction, weighted towards pick toggles."""
+        roll = self.rng.random()
+        if roll < 0.6:
+            self.toggle_pick()
+        elif roll < 0.9:
+            self.toggle_best_pick()
+        else:
+            self.switch_sport()
@@ -0,0 +1,111 @@
+import weakref
+from urllib.parse import urlsplit
+
+from network import monitor_for
+from server_timing import parse_server_timing
+from waits import wait_for_page_ready
+
+# Page-level performance metrics for a Chrome session:
+#   - Navigation Timing (TTFB, DOMContentLoaded, load) and First Contentful Paint
+#   - Largest Contentful Paint and Cumulative Layout Shift from PerformanceObservers
+#     registered before any page script runs
+#   - JS heap and DOM size from CDP Performance.getMetrics
+#   - every request the page made, from network.NetworkMonitor, and for API routes the
+#     server-side spans from their Server-Timing headers
+#
+# measure_page() flattens all of that into {metric: number} for benchstore.
+
+VITALS_OBSERVER_JS = """
+window.__vitals = { lcp: null, cls: 0 };
+try {
+  new PerformanceObserver((list) => {
+    const entries = list.getEntries();
+    const last = entries[entries.length - 1];
+    if (last) window.__vitals.lcp = last.renderTime || last.loadTime || last.startTime;
+  }).observe({ type: 'largest-contentful-paint', buffered: true });
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      if (!entry.hadRecentInput) window.__vitals.cls += entry.value;
+    }
+  }).observe({ type: 'layout-shift', buffered: true });
+} catch (e) {}
+"""
+
+COLLECT_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+const vitals = window.__vitals || {};
+return {
+  ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+  dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+  load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+  fcp_ms: fcp ? fcp.startTime : null,
+  lcp_ms: vitals.lcp,
+  cls: vitals.cls === undefined ? null : vitals.cls,
+};
+"""
+
+_installed = weakref.WeakSet()
+
+
+def install_vitals(driver):
+    """Register the LCP/CLS observers on every future document of this driver (once per driver)."""
+    if driver in _installed:
+        return
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": VITALS_OBSERVER_JS})
+    driver.execute_cdp_cmd("Performance.enable", {})
+    _installed.add(driver)
+
+
+def runtime_metrics(driver):
+    metrics = {m["name"]: m["value"] for m in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+    return {
+        "js_heap_mb": round(metrics.get("JSHeapUsedSize", 0) / (1024 * 1024), 3),
+        "dom_nodes": metrics.get("Nodes"),
+        "js_event_listeners": metrics.get("JSEventListeners"),
+    }
+
+
+def request_metrics(requests):
+    """Totals for every request plus the slowest duration per API route.
+
+    API responses with a Server-Timing header add `api.{path}.server.{span}.ms`, the span's
+    duration in the slowest of them, so a slow route shows whether the time went to the
+    database, an upstream API or the route itself.
+    """
+    metrics = {
+        "requests": len(requests),
+        "transfer_kb": round(sum(r.encoded_bytes for r in requests) / 1024, 3),
+        "failed_requests": sum(1 for r in requests if r.failed or (r.status or 0) >= 400),
+    }
+    for request in requests:
+        path = urlsplit(request.url).path
+        if not path.startswith("/api/") or request.duration is None:
+            continue
+        key = f"api.{path}.ms"
+        ms = round(request.duration * 1000, 2)
+        metrics[f"api.{path}.count"] = metrics.get(f"api.{path}.count", 0) + 1
+        if ms < metrics.get(key, 0):
+            continue
+        metrics[key] = ms
+        for name in [k for k in metrics if k.startswith(f"api.{path}.server.")]:
+            del metrics[name]
+        for name, span in parse_server_timing(request.server_timing).items():
+            metrics[f"api.{path}.server.{name}.ms"] = round(span["ms"], 2)
+    return metrics
+
+
+def measure_page(driver, url, timeout=30):
+    """Load `url` in a fresh navigation and return its flattened metrics."""
+    install_vitals(driver)
+    monitor = monitor_for(driver)
+    since = monitor.mark()
+
+    driver.get(url)
+    wait_for_page_ready(driver, timeout=timeout)
+
+    metrics = {k: v for k, v in driver.execute_script(COLLECT_JS).items() if v is not None}
+    metrics.update(runtime_metrics(driver))
+    monitor.poll()
+    metrics.update(request_metrics(monitor.matching("", since)))
+    return {k: round(v, 3) if isinstance(v, float) else v for k, v in metrics.items()}
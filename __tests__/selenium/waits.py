@@ -0,0 +1,113 @@
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from network import monitor_for
+
+# Readiness waits that return as soon as the app is ready instead of sleeping a fixed
+# amount of time. Each wait polls a concrete signal from the page:
+#   - document.readyState
+#   - network activity (CDP events via network.NetworkMonitor)
+#   - the rendered carousel's [data-testid='game-card'] set settling
+#
+# Typical use around an action that reloads the carousel:
+#   with carousel_update(driver):
+#       Select(dropdown).select_by_value("NBA")
+
+POLL_INTERVAL = 0.05
+
+CAROUSEL_STATE_JS = """
+const list = document.querySelector('.react-multi-carousel-list');
+if (!list) return null;
+const cards = list.querySelectorAll("[data-testid='game-card']");
+const ids = Array.from(cards, c => c.getAttribute('data-game-id')).join(',');
+return ids + '|' + cards.length + '|' + (list.querySelector('.no-games-card') ? 'empty' : '');
+"""
+
+
+def _wait(driver, timeout):
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL)
+
+
+def wait_for_document_ready(driver, timeout=10):
+    _wait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete",
+        "Document did not finish loading",
+    )
+
+
+def wait_for_network_idle(driver, idle_time=0.5, timeout=15, url_part=""):
+    """Block until no matching request is in flight and nothing new started for `idle_time`."""
+    monitor = monitor_for(driver)
+
+    def idle(_):
+        monitor.poll()
+        return not monitor.inflight(url_part) and monitor.idle_for() >= idle_time
+
+    _wait(driver, timeout).until(idle, f"Network did not go idle within {timeout}s")
+
+
+def wait_for_requests(driver, url_part, since, timeout=15, start_grace=1.0):
+    """Block until every request matching `url_part` issued after `since` has finished.
+
+    If nothing matching starts within `start_grace` seconds the action didn't trigger a
+    fetch (e.g. re-selecting the current sport), so there is nothing to wait for.
+    """
+    monitor = monitor_for(driver)
+    started_at = time.monotonic()
+
+    def finished(_):
+        monitor.poll()
+        requests = monitor.matching(url_part, since)
+        if not requests:
+            return time.monotonic() - started_at >= start_grace
+        return all(r.done for r in requests)
+
+    _wait(driver, timeout).until(finished, f"Requests to {url_part} did not complete within {timeout}s")
+    return monitor.matching(url_part, since)
+
+
+def wait_for_stable(driver, script, stable_for=0.25, timeout=10):
+    """Block until `script` returns the same non-null value for `stable_for` seconds."""
+    state = {"value": None, "since": None}
+
+    def settled(d):
+        value = d.execute_script(script)
+        now = time.monotonic()
+        if value is None or value != state["value"]:
+            state["value"], state["since"] = value, now
+            return False
+        return now - state["since"] >= stable_for
+
+    _wait(driver, timeout).until(settled, "Page content did not settle")
+    return state["value"]
+
+
+def wait_for_carousel_ready(driver, timeout=15):
+    """Block until the home carousel has rendered and its game-card set has stopped changing."""
+    return wait_for_stable(driver, CAROUSEL_STATE_JS, timeout=timeout)
+
+
+def wait_for_page_ready(driver, timeout=20):
+    wait_for_document_ready(driver, timeout)
+    wait_for_network_idle(driver, timeout=timeout)
+
+
+@contextmanager
+def expect_requests(driver, url_part, timeout=15):
+    since = monitor_for(driver).mark()
+    yield
+    wait_for_requests(driver, url_part, since, timeout=timeout)
+
+
+@contextmanager
+def carousel_update(driver, timeout=15):
+    """Wrap an action that reloads the carousel; returns once the new games are on screen."""
+    with expect_requests(driver, "/api/all-espn-games", timeout=timeout):
+        yield
+    try:
+        wait_for_carousel_ready(driver, timeout=timeout)
+    except TimeoutException:
+        print("⚠️ Carousel did not settle after update")
@@ -12,6 +12,16 @@ const nextConfig = {
             'cdn.prod.website-files.com'
         ],
     },
+    async headers() {
+        return [
+            {
+                // Team logos built by __tests__/perf/team_metadata.py carry a content hash in their
+                // file names, so a changed logo gets a new URL and these can be cached for good
+                source: '/team-logos/:path*',
+                headers: [{ key: 'Cache-Control', value: 'public, max-age=31536000, immutable' }],
+            },
+        ];
+    },
 };
 
 export default nextConfig;
@@ -0,0 +1,27 @@
+import dotenv from 'dotenv';
+import { closeDbPool, db } from '@/lib/dbPool/dbPool';
+import { installPickCounts } from '@/lib/pickCounts/pickCounts';
+
+// Database objects prisma/schema.prisma can't describe (triggers, backfills). Run once per
+// database after `npx prisma db push`, and again whenever one of them changes:
+//   npm run db:setup
+// Requests only read what this sets up; they never run DDL.
+dotenv.config({ path: '.env.local' });
+dotenv.config();
+
+async function main() {
+    const client = await db.connect();
+    try {
+        await installPickCounts(client);
+        console.log('Installed the "GamePickCounts" triggers and recounted every game');
+    } finally {
+        client.release();
+    }
+}
+
+main()
+    .catch((error) => {
+        console.error('Database setup failed:', error);
+        process.exitCode = 1;
+    })
+    .finally(closeDbPool);
@@ -1,8 +1,9 @@
 import { NextRequest, NextResponse } from "next/server";
 import { auth } from "@clerk/nextjs/server";
-import { sql } from "@vercel/postgres";
+import { sql } from "@/lib/dbPool/dbPool";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
 
-export async function DELETE(req: NextRequest) {
+export const DELETE = withServerTiming(async function DELETE(req: NextRequest) {
   try {
     const { userId } = await auth();
 
@@ -50,4 +51,4 @@ export async function DELETE(req: NextRequest) {
     console.error("Error deleting user:", error);
     return NextResponse.json({ error: "Internal Server Error" }, { status: 500 });
   }
-}
+});
@@ -1,7 +1,8 @@
 import { NextResponse } from "next/server";
 import { auth } from "@clerk/nextjs/server";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
 
-export async function GET() {
+export const GET = withServerTiming(async function GET() {
   try {
     const { userId } = await auth();
 
@@ -66,4 +67,4 @@ export async function GET() {
       { status: 500 }
     );
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,9 +1,10 @@
 import { NextResponse } from "next/server";
 import sgMail from "@sendgrid/mail";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
 
 sgMail.setApiKey(process.env.SENDGRID_API_KEY!);
 
-export async function POST(req: Request) {
+export const POST = withServerTiming(async function POST(req: Request) {
   try {
     const { subject, body, recipients } = await req.json();
 
@@ -26,4 +27,4 @@ export async function POST(req: Request) {
     console.error("Error sending emails:", error);
     return NextResponse.json({ error: "Failed to send emails" }, { status: 500 });
   }
-}
+});
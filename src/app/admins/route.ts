@@ -0,0 +1,16 @@
+import { NextResponse } from "next/server";
+import { sql } from "@/lib/dbPool/dbPool";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
+
+// An admin by id, e.g. /admins?admin_id=3. Served here rather than from server.js so it goes
+// through the shared pool and its connection limit.
+export const GET = withServerTiming(async function GET(req: Request) {
+  const adminId = new URL(req.url).searchParams.get("admin_id");
+  try {
+    const result = await sql`SELECT * FROM Admins WHERE admin_id = ${adminId}`;
+    return NextResponse.json(result.rows);
+  } catch (err) {
+    console.error(err);
+    return NextResponse.json({ error: "Database error" }, { status: 500 });
+  }
+});
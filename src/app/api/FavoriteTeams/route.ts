@@ -1,4 +1,5 @@
 import { NextResponse, NextRequest } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 
 
@@ -82,7 +83,7 @@ const NBA_TEAM_LOGOS: TeamLogos = {
     'Washington Wizards': 'https://a.espncdn.com/i/teamlogos/nba/500/wsh.png'
 };
 // this function is used to get the teams
-export async function GET(req: NextRequest) {
+export const GET = withServerTiming(async function GET(req: NextRequest) {
     try {
         //get teams
         const searchParams = req.nextUrl.searchParams;
@@ -123,5 +124,5 @@ export async function GET(req: NextRequest) {
             message: error instanceof Error ? error.message : 'Unknown error'
         }, { status: 500 });
     }
-}
+});
 
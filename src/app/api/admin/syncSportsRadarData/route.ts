@@ -1,44 +1,15 @@
-/* eslint-disable @typescript-eslint/no-unused-vars */
 /* eslint-disable @typescript-eslint/no-explicit-any */
 import { NextRequest, NextResponse } from "next/server";
-import { sql } from "@vercel/postgres";
+import { db } from "@/lib/dbPool/dbPool";
+import { BASE_URLS } from "../../all-espn-games/baseUrls";
+import { forEachWithConcurrency } from "@/lib/concurrency/concurrency";
+import { SyncEvent, readEvent, syncDates, syncEvents } from "@/lib/espnSync/espnSync";
+import { timed, withServerTiming } from "@/lib/serverTiming/serverTiming";
 
-// Define interfaces for type safety
-interface ESPNGame {
-  id: string;
-  status: {
-    type: {
-      state: string;
-      completed: boolean;
-    };
-  };
-  sport: string;
-  date: string;
-  competitions: Array<{
-    id: string;
-    competitors: Array<{
-      id: string;
-      homeAway: string;
-      team: {
-        displayName: string;
-      };
-      score: string;
-    }>;
-  }>;
-}
+const SPORTS = ["NBA", "MLB", "NFL", "NHL", "MLS", "EPL", "LALIGA", "BUNDESLIGA", "SERIE_A", "LIGUE_1"];
 
-interface DatabaseGame {
-  id: string;
-  team1Name: string;
-  team2Name: string;
-  team1Score?: number;
-  team2Score?: number;
-  winner?: number;
-  gameDate: Date;
-  espnId?: string;
-  sport: string;
-  // other fields
-}
+// How many scoreboards are fetched at the same time; a season backfill asks for hundreds
+const FETCH_CONCURRENCY = Number(process.env.ESPN_SYNC_FETCH_CONCURRENCY) || 8;
 
 // Add error handling and timeout to the fetch request
 const fetchESPNData = async (url: string) => {
@@ -46,12 +17,12 @@ const fetchESPNData = async (url: string) => {
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), 15000); // 15 second timeout
 
-    const response = await fetch(url, {
+    const response = await timed("espn", () => fetch(url, {
       signal: controller.signal,
       headers: {
         Accept: "application/json",
       },
-    });
+    }));
 
     clearTimeout(timeoutId);
 
@@ -69,418 +40,73 @@ const fetchESPNData = async (url: string) => {
   }
 };
 
-// Common team name mappings - moved outside both functions
-const teamMappings: Record<string, string[]> = {
-  lakers: ["los angeles lakers", "la lakers"],
-  clippers: ["los angeles clippers", "la clippers"],
-  warriors: ["golden state warriors", "golden state"],
-  knicks: ["new york knicks", "new york"],
-  nets: ["brooklyn nets", "brooklyn"],
-  celtics: ["boston celtics", "boston"],
-  bulls: ["chicago bulls", "chicago"],
-  heat: ["miami heat", "miami"],
-  bucks: ["milwaukee bucks", "milwaukee"],
-  magic: ["orlando magic", "orlando"],
-  pistons: ["detroit pistons", "detroit"],
-  pacers: ["indiana pacers", "indiana"],
-  hawks: ["atlanta hawks", "atlanta"],
-  wizards: ["washington wizards", "washington"],
-  raptors: ["toronto raptors", "toronto"],
-  hornets: ["charlotte hornets", "charlotte"],
-  rockets: ["houston rockets", "houston"],
-  pelicans: ["new orleans pelicans", "new orleans"],
-  spurs: ["san antonio spurs", "san antonio"],
-  mavericks: ["dallas mavericks", "dallas"],
-  nuggets: ["denver nuggets", "denver"],
-  timberwolves: ["minnesota timberwolves", "minnesota"],
-  thunder: ["oklahoma city thunder", "oklahoma city", "okc"],
-  "trail blazers": ["portland trail blazers", "portland"],
-  jazz: ["utah jazz", "utah"],
-  suns: ["phoenix suns", "phoenix"],
-  kings: ["sacramento kings", "sacramento"],
-  grizzlies: ["memphis grizzlies", "memphis"],
-  "76ers": ["philadelphia 76ers", "philadelphia", "philly"],
-  cavaliers: ["cleveland cavaliers", "cleveland"],
-};
-
-function getLocalDateStrings(timeZone = "America/Los_Angeles") {
-  const format = (shiftDays = 0) => {
-    const date = new Date();
-    date.setDate(date.getDate() + shiftDays);
-    return new Intl.DateTimeFormat("en-CA", {
-      timeZone,
-      year: "numeric",
-      month: "2-digit",
-      day: "2-digit",
-    })
-      .format(date)
-      .replace(/-/g, "");
-  };
-
-  return [format(-1), format(0), format(1)];
-}
-
-const dateStrings = getLocalDateStrings();
-
-const fetchScoreboardsForDates = async (baseUrl: string) => {
-  const results = await Promise.allSettled(
-    dateStrings.map((date) => fetchESPNData(`${baseUrl}?dates=${date}`))
-  );
-
-  const failures = results.filter((r) => r.status === "rejected");
+// The completed events of every sport's scoreboards for `dates`, in sport order
+const fetchCompletedEvents = async (sports: string[], dates: string[]) => {
+  const requests = sports.flatMap((sport) => dates.map((date) => ({ sport, date })));
+  const events: SyncEvent[][] = [];
+  let failures = 0;
+
+  await forEachWithConcurrency(requests.map((r, i) => ({ ...r, i })), FETCH_CONCURRENCY, async ({ sport, date, i }) => {
+    // A range can hold more events than ESPN's default page
+    const url = `${BASE_URLS[sport]}/scoreboard?dates=${date}${date.includes("-") ? "&limit=1000" : ""}`;
+    try {
+      const data = await fetchESPNData(url);
+      events[i] = (data.events ?? []).flatMap((event: any) => readEvent(event, sport) ?? []);
+    } catch {
+      failures++;
+    }
+  });
 
-  if (failures.length > 0) {
+  if (failures > 0) {
     throw new Error("Failed to fetch ESPN data");
   }
-
-  // Combine successful results and flatten their `events`
-  return results
-    .filter((r) => r.status === "fulfilled" && r.value.events)
-    .flatMap((r: any) => r.value.events);
+  return events.flat();
 };
 
-export async function POST(req: NextRequest) {
+// Writes the final scores of completed ESPN games into "Game". Events that have not changed
+// since the last sync are skipped (see src/lib/espnSync). Optional body fields:
+//   gameIds  only these ESPN events, synced even when unchanged
+//   dates    YYYYMMDD or YYYYMMDD-YYYYMMDD instead of yesterday, today and tomorrow
+//   sports   sport keys instead of every sport
+//   force    ignore what earlier syncs saw
+export const POST = withServerTiming(async function POST(req: NextRequest) {
+  let client;
+
   try {
-    // Parse request body to get gameIds to sync
     const body = await req.json();
-    const { gameIds } = body;
-    console.log(`Request Body Received:`, body);
-
-    // Fetch both NBA and MLB data
-    const [
-      nbaGames,
-      mlbGames,
-      nflGames,
-      nhlGames,
-      mlsGames,
-      eplGames,
-      laligaGames,
-      bundesligaGames,
-      serieaGames,
-      ligue1Games,
-    ] = await Promise.all([
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/soccer/usa.1/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/soccer/esp.1/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/soccer/ger.1/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/soccer/ita.1/scoreboard"
-      ),
-      fetchScoreboardsForDates(
-        "https://site.api.espn.com/apis/site/v2/sports/soccer/fra.1/scoreboard"
-      ),
-    ]);
-    // Combine NBA & MLB data and tag each with a sport identifier
-    const combinedGames = [
-      ...nbaGames.map((game: any) => ({ ...game, sport: "NBA" })),
-      ...mlbGames.map((game: any) => ({ ...game, sport: "MLB" })),
-      ...nflGames.map((game: any) => ({ ...game, sport: "NFL" })),
-      ...nhlGames.map((game: any) => ({ ...game, sport: "NHL" })),
-      ...mlsGames.map((game: any) => ({ ...game, sport: "MLS" })),
-      ...eplGames.map((game: any) => ({ ...game, sport: "EPL" })),
-      ...laligaGames.map((game: any) => ({ ...game, sport: "LALIGA" })),
-      ...bundesligaGames.map((game: any) => ({ ...game, sport: "BUNDESLIGA" })),
-      ...serieaGames.map((game: any) => ({ ...game, sport: "SERIE_A" })),
-      ...ligue1Games.map((game: any) => ({ ...game, sport: "LIGUE_1" })),
-    ];
-
-    // Filter to only include completed games
-    const filteredGames = combinedGames.filter(
-      (game: ESPNGame & { sport: string }) => {
-        if (gameIds && gameIds.length > 0) {
-          return (
-            gameIds.includes(game.id) && game.status.type.completed === true
-          );
-        }
-        return game.status.type.completed === true;
-      }
-    );
+    const { gameIds, force } = body;
 
-    // Get all games from the database
-    const allGames = await sql<DatabaseGame>`
-      SELECT * FROM "Game" 
-      ORDER BY "gameDate" DESC
-      LIMIT 200
-    `;
-
-    console.log(`Found ${allGames.rows.length} recent games in database`);
-
-    // Check if there are any games with these specific teams
-    const teamExamples = [
-      "Chicago",
-      "Miami",
-      "Lakers",
-      "Boston",
-      "Orlando",
-      "Milwaukee",
-    ];
-    console.log("Searching for specific teams in database:");
-    teamExamples.forEach((team) => {
-      const matches = allGames.rows.filter(
-        (g) =>
-          g.team1Name.toLowerCase().includes(team.toLowerCase()) ||
-          g.team2Name.toLowerCase().includes(team.toLowerCase())
+    const dates = syncDates(body.dates);
+    if (!dates) {
+      return NextResponse.json(
+        { success: false, error: "dates must be YYYYMMDD or a YYYYMMDD-YYYYMMDD range" },
+        { status: 400 }
       );
-      console.log(`Found ${matches.length} games with "${team}" in team names`);
-      if (matches.length > 0) {
-        matches.slice(0, 3).forEach((g) => {
-          console.log(
-            `  Match: "${g.team1Name}" vs "${g.team2Name}", Date: ${g.gameDate}`
-          );
-        });
-      }
-    });
-
-    // Process each completed game from ESPN
-    const updateResults = await Promise.all(
-      filteredGames.map(async (espnGame: ESPNGame) => {
-        const competition = espnGame.competitions[0];
-        const homeTeam = competition.competitors.find(
-          (c) => c.homeAway === "home"
-        )?.team.displayName;
-        const awayTeam = competition.competitors.find(
-          (c) => c.homeAway === "away"
-        )?.team.displayName;
-        const gameDate = new Date(espnGame.date);
-        const dateStr = gameDate.toISOString().split("T")[0];
-
-        console.log(
-          `Processing completed game: ${awayTeam} @ ${homeTeam} on ${dateStr}, ESPN ID: ${espnGame.id}`
-        );
-
-        // Improved team name normalization function
-        const normalizeTeamName = (name: string) => {
-          if (!name) return "";
-
-          // Normalize the name
-          const normalized = name
-            .toLowerCase()
-            .replace(/^the /, "") // Remove leading "The"
-            .trim();
-
-          // Return the normalized name
-          return normalized;
-        };
-
-        // Check if two team names match
-        const teamsMatch = (name1: string, name2: string) => {
-          const norm1 = normalizeTeamName(name1);
-          const norm2 = normalizeTeamName(name2);
-
-          // Direct match
-          if (norm1 === norm2) return true;
-
-          // Check if one contains the other
-          if (norm1.includes(norm2) || norm2.includes(norm1)) return true;
-
-          // Check common variations
-          for (const [key, variations] of Object.entries(teamMappings)) {
-            if (
-              (norm1.includes(key) ||
-                variations.some((v) => norm1.includes(v))) &&
-              (norm2.includes(key) || variations.some((v) => norm2.includes(v)))
-            ) {
-              return true;
-            }
-          }
-
-          return false;
-        };
-
-        // Normalize ESPN team names
-        const normHomeTeam = normalizeTeamName(homeTeam || "");
-        const normAwayTeam = normalizeTeamName(awayTeam || "");
-
-        console.log(
-          `Normalized team names: "${normAwayTeam}" @ "${normHomeTeam}"`
-        );
-
-        // First try to find by direct ID match if your DB has ESPN IDs
-        let dbGame = allGames.rows.find((g) => g.id === espnGame.id);
-
-        // If not found by ID, fall back to team name matching
-        if (!dbGame) {
-          dbGame = allGames.rows.find((g) => {
-            // Safely handle potentially undefined values
-            const team1 = (g?.team1Name || "").trim();
-            const team2 = (g?.team2Name || "").trim();
-
-            // Skip empty team names
-            if (!team1 || !team2) return false;
-
-            // Check if teams match in either order
-            const teamsMatchCorrectOrder =
-              teamsMatch(team1, homeTeam || "") &&
-              teamsMatch(team2, awayTeam || "");
-            const teamsMatchReversedOrder =
-              teamsMatch(team1, awayTeam || "") &&
-              teamsMatch(team2, homeTeam || "");
-
-            // If we're looking for specific game IDs, we should be more lenient with matching
-            // and not require dates to be close
-            const isMatch = teamsMatchCorrectOrder || teamsMatchReversedOrder;
-
-            if (isMatch) {
-              console.log(
-                `Found matching game in DB: ${team1} vs ${team2}, ID: ${g.id}`
-              );
-
-              // Log the dates for debugging but don't use them for matching
-              const dbDate = new Date(g.gameDate);
-              const espnDate = new Date(espnGame.date);
-              console.log(
-                `Date info (not used for matching): DB date=${dbDate.toISOString()}, ESPN date=${espnDate.toISOString()}`
-              );
-
-              const dbDateOnly = dbDate.toISOString().split("T")[0];
-              const espnDateOnly = espnDate.toISOString().split("T")[0];
-
-              if (dbDateOnly !== espnDateOnly) return false;
-              // Return true based on team name matching only
-              return isMatch;
-            }
-
-            return false;
-          });
-        }
-
-        if (!dbGame) {
-          console.log(
-            `No matching game found for ${awayTeam} @ ${homeTeam} on ${dateStr}`
-          );
-          return {
-            espnId: espnGame.id,
-            status: "not_found",
-            message: `No matching game found for ${awayTeam} @ ${homeTeam} on ${dateStr}`,
-          };
-        }
-
-        // Extract scores
-        const homeCompetitor = competition.competitors.find(
-          (c) => c.homeAway === "home"
-        );
-        const awayCompetitor = competition.competitors.find(
-          (c) => c.homeAway === "away"
-        );
-
-        const homeScore = homeCompetitor
-          ? parseInt(homeCompetitor.score)
-          : undefined;
-        const awayScore = awayCompetitor
-          ? parseInt(awayCompetitor.score)
-          : undefined;
-
-        // Validate scores are present
-        if (
-          homeScore === undefined ||
-          awayScore === undefined ||
-          isNaN(homeScore) ||
-          isNaN(awayScore)
-        ) {
-          return {
-            id: dbGame.id,
-            espnId: espnGame.id,
-            status: "invalid_data",
-            message: "Game scores are missing or invalid",
-          };
-        }
-
-        // Determine which team won based on our database structure
-        // We need to figure out if team1 or team2 in our database corresponds to home or away in ESPN
-        const team1IsHome = teamsMatch(dbGame.team1Name, homeTeam || "");
-
-        // If team1 is home, then winner is true when away team wins (team2)
-        // If team1 is away, then winner is true when home team wins (team2)
-        const winnerBoolean = team1IsHome
-          ? awayScore > homeScore
-          : homeScore > awayScore;
-
-        // Ensure final score is in the correct order (team1Score-team2Score)
-        const team1Score = team1IsHome ? homeScore : awayScore;
-        const team2Score = team1IsHome ? awayScore : homeScore;
-        const finalScoreStr = `${team1Score}-${team2Score}`;
-
-        console.log(
-          `Updating game ${dbGame.id}: ${dbGame.team1Name} vs ${dbGame.team2Name}`
-        );
-        console.log(
-          `Team1 is ${team1IsHome ? "home" : "away"
-          }, scores: ${team1Score}-${team2Score}`
-        );
-        console.log(
-          `Setting winner to ${winnerBoolean} (true=team2 won, false=team1 won)`
-        );
-
-        // Try with explicit transaction
-        await sql`BEGIN`;
-        try {
-          const updateResult = await sql`
-          UPDATE "Game"
-          SET 
-            "winner" = ${winnerBoolean},
-            "won" = ${Number(winnerBoolean)},
-            "final_score" = ${finalScoreStr},
-            "sport" = ${espnGame.sport}
-          WHERE "id" = ${dbGame.id} AND "sport" = ${espnGame.sport}
-        `;
-
-          await sql`COMMIT`;
-
-          console.log(
-            `Database update result: ${updateResult.rowCount} rows affected`
-          );
+    }
+    const sports: string[] = body.sports ?? SPORTS;
+    if (!Array.isArray(sports) || sports.some((sport) => !SPORTS.includes(sport))) {
+      return NextResponse.json(
+        { success: false, error: `sports must be some of ${SPORTS.join(", ")}` },
+        { status: 400 }
+      );
+    }
 
-          // Check after commit
-          const checkResult = await sql`
-          SELECT id, "team1Name", "team2Name", winner, won, final_score
-          FROM "Game"
-          WHERE "id" = ${dbGame.id}
-        `;
+    const explicit = Array.isArray(gameIds) && gameIds.length > 0;
+    const completed = await fetchCompletedEvents(sports, dates);
+    const events = explicit ? completed.filter((e) => gameIds.includes(e.espnId)) : completed;
 
-          console.log(`Direct check of game ${dbGame.id} after update:`);
-          if (checkResult.rows.length > 0) {
-            const game = checkResult.rows[0];
-            console.log(
-              `Current DB state: winner=${game.winner}, won=${game.won}, final_score=${game.final_score}`
-            );
-          }
+    client = await db.connect();
+    const { results, stats } = await syncEvents(client, events, explicit || force === true);
 
-          return {
-            id: dbGame.id,
-            espnId: espnGame.id,
-            status: "updated",
-            message: `Updated game with score ${team1Score}-${team2Score}, winner: ${winnerBoolean}`,
-          };
-        } catch (dbError) {
-          await sql`ROLLBACK`;
-          throw dbError;
-        }
-      })
+    console.log(
+      `ESPN sync: ${stats.events} completed events, ${stats.unchanged} unchanged, ${stats.updated} updated, ` +
+      `${stats.current} current, ${stats.not_found} not found, ${stats.invalid_data} invalid`
     );
 
     return NextResponse.json({
       success: true,
-      results: updateResults,
+      results,
+      stats,
     });
   } catch (error) {
     console.error("Error in sync endpoint:", error);
@@ -491,5 +117,7 @@ export async function POST(req: NextRequest) {
       },
       { status: 500 }
     );
+  } finally {
+    if (client) client.release();
   }
-}
+});
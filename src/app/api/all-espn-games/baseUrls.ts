@@ -1,14 +1,20 @@
+// Upstream hosts can be overridden to point at a local stand-in (see __tests__/perf/espn_standin.py)
+export const ESPN_API_BASE_URL = process.env.ESPN_API_BASE_URL || 'https://site.api.espn.com';
+export const ODDS_API_BASE_URL = process.env.ODDS_API_BASE_URL || 'https://api.the-odds-api.com';
+
+const SPORTS_URL = `${ESPN_API_BASE_URL}/apis/site/v2/sports`;
+
 export const BASE_URLS: Record<string, string> = {
-    MLB: 'https://site.api.espn.com/apis/site/v2/sports/baseball/mlb',
-    NBA: 'https://site.api.espn.com/apis/site/v2/sports/basketball/nba',
-    NFL: 'https://site.api.espn.com/apis/site/v2/sports/football/nfl',
-    NHL: 'https://site.api.espn.com/apis/site/v2/sports/hockey/nhl',
+    MLB: `${SPORTS_URL}/baseball/mlb`,
+    NBA: `${SPORTS_URL}/basketball/nba`,
+    NFL: `${SPORTS_URL}/football/nfl`,
+    NHL: `${SPORTS_URL}/hockey/nhl`,
     
     // Soccer Leagues
-    MLS: 'https://site.api.espn.com/apis/site/v2/sports/soccer/usa.1',     // Major League Soccer
-    EPL: 'https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1',      // English Premier League
-    LALIGA: 'https://site.api.espn.com/apis/site/v2/sports/soccer/esp.1',   // La Liga
-    BUNDESLIGA: 'https://site.api.espn.com/apis/site/v2/sports/soccer/ger.1', // Bundesliga
-    SERIE_A: 'https://site.api.espn.com/apis/site/v2/sports/soccer/ita.1',  // Serie A
-    LIGUE_1: 'https://site.api.espn.com/apis/site/v2/sports/soccer/fra.1'   // Ligue 1
+    MLS: `${SPORTS_URL}/soccer/usa.1`,     // Major League Soccer
+    EPL: `${SPORTS_URL}/soccer/eng.1`,      // English Premier League
+    LALIGA: `${SPORTS_URL}/soccer/esp.1`,   // La Liga
+    BUNDESLIGA: `${SPORTS_URL}/soccer/ger.1`, // Bundesliga
+    SERIE_A: `${SPORTS_URL}/soccer/ita.1`,  // Serie A
+    LIGUE_1: `${SPORTS_URL}/soccer/fra.1`   // Ligue 1
 };
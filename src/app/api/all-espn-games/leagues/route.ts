@@ -0,0 +1,93 @@
+import { NextResponse } from "next/server";
+
+import { BASE_URLS } from "../baseUrls";
+import { loadGames, SportGames } from "../loadGames";
+import { timedJson, withServerTiming } from "@/lib/serverTiming/serverTiming";
+
+type LeagueGames = SportGames & { sport: string; error?: boolean };
+
+// Several leagues' games in one response, loaded concurrently on the server (the carousel's
+// "All Soccer Leagues" view used to make one request per league):
+//   GET /api/all-espn-games/leagues?sports=MLS,EPL,LALIGA&day=today
+// `day` and `specificDate` work like /api/all-espn-games. With `stream=1` the response is
+// NDJSON, one {sport, games, message} line per league as soon as that league is loaded.
+export const GET = withServerTiming(async function GET(request: Request) {
+  const { searchParams } = new URL(request.url);
+  const dayParam = searchParams.get("day");
+  const specificDateParam = searchParams.get("specificDate");
+  const sports = [
+    ...new Set(
+      (searchParams.get("sports") || "")
+        .split(",")
+        .map((s) => s.trim().toUpperCase())
+        .filter(Boolean)
+    ),
+  ];
+
+  if (specificDateParam && !/^\d{4}-\d{2}-\d{2}$/.test(specificDateParam)) {
+    return NextResponse.json(
+      { games: [], message: "Invalid date format. Use YYYY-MM-DD." },
+      { status: 400 }
+    );
+  }
+
+  if (!sports.length || sports.some((sport) => !BASE_URLS[sport])) {
+    return NextResponse.json(
+      {
+        games: [],
+        message: `Invalid sports selected. Use a comma-separated list of ${Object.keys(BASE_URLS).join(", ")}.`,
+      },
+      { status: 400 }
+    );
+  }
+
+  // One league failing must not take the others down with it
+  const load = (sport: string): Promise<LeagueGames> =>
+    loadGames(sport, dayParam, specificDateParam).then(
+      (result) => ({ sport, ...result }),
+      (error) => {
+        console.error(`Error fetching ${sport} games:`, error);
+        return { sport, games: [], message: "Error fetching games", error: true };
+      }
+    );
+
+  if (searchParams.get("stream") === "1") {
+    const encoder = new TextEncoder();
+    const stream = new ReadableStream({
+      async start(controller) {
+        await Promise.all(
+          sports.map(async (sport) => {
+            controller.enqueue(encoder.encode(JSON.stringify(await load(sport)) + "\n"));
+          })
+        );
+        controller.close();
+      },
+    });
+    return new Response(stream, {
+      headers: { "Content-Type": "application/x-ndjson; charset=utf-8" },
+    });
+  }
+
+  const results = await Promise.all(sports.map(load));
+  const games = results
+    .flatMap((result) => result.games)
+    .sort((a, b) => new Date(a.fullDate).getTime() - new Date(b.fullDate).getTime());
+  const leagues = Object.fromEntries(
+    results.map(({ sport, games, message, error }) => [sport, { count: games.length, message, ...(error && { error }) }])
+  );
+  const failed = results.filter((result) => result.error).length;
+
+  return timedJson(
+    {
+      games,
+      leagues,
+      message:
+        games.length > 0
+          ? `Games retrieved successfully for ${dayParam || "today"}`
+          : failed === results.length
+            ? "Error fetching games"
+            : `No games scheduled for ${dayParam || "today"}`,
+    },
+    { status: failed === results.length ? 500 : 200 }
+  );
+});
@@ -1,7 +1,8 @@
 // Import necessary modules
 import { NextRequest, NextResponse } from "next/server";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
 
-export async function GET(req: NextRequest) {
+export const GET = withServerTiming(async function GET(req: NextRequest) {
   // Authorization check
   const authHeader = req.headers.get("Authorization");
   const expectedToken = `Bearer ${process.env.CRON_SECRET}`;
@@ -36,4 +37,4 @@ export async function GET(req: NextRequest) {
       { status: 500 }
     );
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,8 +1,9 @@
 // Import necessary modules
 import { NextRequest, NextResponse } from "next/server";
 import { handleAllGamesDone } from '@/lib/handleAllGamesDone/handleAllGamesDone';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-export async function GET(req: NextRequest) {
+export const GET = withServerTiming(async function GET(req: NextRequest) {
   // Authorization check
   const authHeader = req.headers.get("Authorization");
   const expectedToken = `Bearer ${process.env.CRON_SECRET}`;
@@ -42,7 +43,7 @@ export async function GET(req: NextRequest) {
       { status: 500 }
     );
   }
-}
+});
 
 function delay(ms: number) {
   return new Promise(resolve => setTimeout(resolve, ms));
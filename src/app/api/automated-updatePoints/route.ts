@@ -8,8 +8,9 @@
 */
 import { NextRequest, NextResponse } from 'next/server';
 import { handleAllGamesDone } from '@/lib/handleAllGamesDone/handleAllGamesDone';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-export async function GET(req: NextRequest) {
+export const GET = withServerTiming(async function GET(req: NextRequest) {
     // Authorization check
     /*
     const authHeader = req.headers.get("Authorization");
@@ -35,4 +36,4 @@ export async function GET(req: NextRequest) {
             { status: 500 }
         );
     }
-}
+});
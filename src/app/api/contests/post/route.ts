@@ -1,7 +1,8 @@
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
  
-export async function POST(req: Request) {
+export const POST = withServerTiming(async function POST(req: Request) {
   let client;
   try{
     client = await db.connect();
@@ -22,4 +23,4 @@ export async function POST(req: Request) {
   } finally {
     if(client) client = await db.connect();
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
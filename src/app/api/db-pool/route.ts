@@ -0,0 +1,8 @@
+import { NextResponse } from 'next/server';
+import { dbPoolStats } from '@/lib/dbPool/dbPool';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
+
+// Connections of the shared database pool, acquire latency and the latest slow queries, for monitoring
+export const GET = withServerTiming(async function GET() {
+    return NextResponse.json(dbPoolStats());
+});
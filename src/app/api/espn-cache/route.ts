@@ -0,0 +1,10 @@
+import { NextResponse } from 'next/server';
+import { espnCacheStats } from '@/lib/espnCache/espnCache';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
+import { teamMetadataInfo } from '@/lib/teamMetadata/teamMetadata';
+
+// Hit/miss/upstream latency counters of the shared ESPN scoreboard cache, and the prebuilt team
+// table in use, for monitoring
+export const GET = withServerTiming(async function GET() {
+    return NextResponse.json({ ...espnCacheStats(), teamMetadata: teamMetadataInfo() });
+});
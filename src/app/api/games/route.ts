@@ -3,9 +3,11 @@
 //
 /* eslint-disable @typescript-eslint/no-explicit-any */
 import { NextResponse } from 'next/server';
+import { BASE_URLS } from '../all-espn-games/baseUrls';
 import { toZonedTime, format } from 'date-fns-tz';
+import { timed, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-const BASE_URL = 'https://site.api.espn.com/apis/site/v2/sports/basketball/nba';
+const BASE_URL = BASE_URLS.NBA;
 
 function getTeamLogo(teamName: string | undefined): string {
   if (!teamName) {
@@ -73,12 +75,12 @@ interface Game {
   clock: string;
 }
 
-export async function GET() {
+export const GET = withServerTiming(async function GET() {
   try {
     const url = `${BASE_URL}/scoreboard`;
    //console.log('Fetching URL:', url);
     
-    const response = await fetch(url);
+    const response = await timed('espn', () => fetch(url));
     
     if (!response.ok) {
      //console.error('API Response Error:', response.status, response.statusText);
@@ -188,4 +190,4 @@ export async function GET() {
       { status: 500 }
     );
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,10 +1,11 @@
 /* eslint-disable @typescript-eslint/no-unused-vars */
 import { clerkClient, User } from '@clerk/clerk-sdk-node';
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { timed, timedJson, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 // get users for specific sport and week leaderboard
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   let client;
 
   try {
@@ -179,7 +180,7 @@ export async function GET(req: Request) {
 
     let clerkUsers: { data: User[] } | undefined;
     if (clerkIds.length > 0) {
-      const response = await clerkClient.users.getUserList({ userId: clerkIds });
+      const response = await timed('clerk', () => clerkClient.users.getUserList({ userId: clerkIds }));
 
       if (Array.isArray(response?.data)) {  // Access the data property
           clerkUsers = response;
@@ -200,7 +201,7 @@ export async function GET(req: Request) {
       };
     });
 
-    return NextResponse.json({ success: true, data: mergedUsers }, { status: 200 });
+    return timedJson({ success: true, data: mergedUsers }, { status: 200 });
   } catch (error) {
     console.error(`Error fetching user entries: ${error}`);
 
@@ -208,4 +209,4 @@ export async function GET(req: Request) {
   } finally {
     if(client) client.release();
   }
-}
+});
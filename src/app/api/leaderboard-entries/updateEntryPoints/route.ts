@@ -1,14 +1,131 @@
-/* eslint-disable @typescript-eslint/no-unused-vars */
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { MAX_PATCH_ENTRIES } from '@/lib/leaderboardPatch/leaderboardPatch';
+import { pushScoreDiff } from '@/lib/leaderboardPush/leaderboardPush';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 const MAXPOINTSPERGAME = 1;
 const BONUSPOINTS = 3;
 const BESTPICKPOINTS = 3;
 const UNDERDOGPOINTS = 2; // New constant for underdog bonus points
 
+// Scoring rules (mirrored by __tests__/perf/scoring.py, which cross-checks this route):
+//   - every decided game a user picked: +MAXPOINTSPERGAME max points
+//   - correct pick: +MAXPOINTSPERGAME, +UNDERDOGPOINTS if it was the underdog winning,
+//     +BESTPICKPOINTS if it was the user's best pick
+//   - once every game of a day is decided, each user who picked that day gets
+//     +BONUSPOINTS max points (+BONUSPOINTS if all of the day's games were picked correctly)
+//     and +BESTPICKPOINTS max points if they made a best pick that day
+// Games are scored by one statement for all entries at once. Scored games are recorded per
+// leaderboard in leaderboard_scored_games so a game is only ever scored once.
+//
+// Modes:
+//   default      today's decided games (yesterday's before 7am UTC), like the old per-user loop
+//   incremental  every decided game of the leaderboard's week that has not been scored yet;
+//                what the points cron uses, so reruns only touch entries of newly finalized games.
+//                The cron also runs it for the previous week's board (`year` picks the board
+//                across New Year), so a late game decided after the week rolled over still counts
+const SCORE_ENTRIES_SQL = `
+WITH board AS (
+    SELECT leaderboard_id, make_date(year, 1, 1) + (week - 1) * 7 AS first_day
+    FROM leaderboards
+    WHERE leaderboard_id = $2
+),
+new_games AS (
+    SELECT g.id, g."gameDate", g.won::int AS won, g.is_underdog_win, g.underdog_team_id, g.winner, g.final_score
+    FROM "Game" g, board b
+    WHERE g.sport = $1 AND g.won IS NOT NULL
+      AND CASE WHEN $3::boolean
+               THEN g."gameDate" >= b.first_day AND g."gameDate" < b.first_day + 7
+                    AND NOT EXISTS (SELECT 1 FROM leaderboard_scored_games s
+                                    WHERE s.leaderboard_id = b.leaderboard_id AND s.game_id = g.id)
+               ELSE g."gameDate" = (CASE WHEN EXTRACT(HOUR FROM NOW()) BETWEEN 0 AND 6
+                                         THEN CURRENT_DATE - 1 ELSE CURRENT_DATE END)
+          END
+),
+-- Days whose last undecided game is among the new games
+completed_days AS (
+    SELECT DISTINCT ng."gameDate" AS day
+    FROM new_games ng
+    WHERE NOT EXISTS (SELECT 1 FROM "Game" g
+                      WHERE g.sport = $1 AND g."gameDate" = ng."gameDate" AND g.won IS NULL)
+),
+day_games AS (
+    SELECT g.id, g."gameDate", g.won::int AS won, COUNT(*) OVER (PARTITION BY g."gameDate") AS day_count
+    FROM "Game" g
+    JOIN completed_days d ON d.day = g."gameDate"
+    WHERE g.sport = $1
+),
+pick_scores AS (
+    SELECT p."userId" AS clerk_id,
+           SUM(CASE WHEN ng.won = p."teamIndex"
+                    THEN ${MAXPOINTSPERGAME}
+                         + CASE WHEN ng.is_underdog_win AND ng.underdog_team_id = p."teamIndex"::text
+                                THEN ${UNDERDOGPOINTS} ELSE 0 END
+                         + CASE WHEN p."bestPick" THEN ${BESTPICKPOINTS} ELSE 0 END
+                    ELSE 0 END) AS points,
+           COUNT(*) * ${MAXPOINTSPERGAME} AS max_points
+    FROM "Pick" p
+    JOIN new_games ng ON ng.id = p."gameId"
+    GROUP BY p."userId"
+),
+day_scores AS (
+    SELECT clerk_id,
+           SUM(CASE WHEN correct = day_count THEN ${BONUSPOINTS} ELSE 0 END) AS points,
+           SUM(${BONUSPOINTS} + CASE WHEN best_picked THEN ${BESTPICKPOINTS} ELSE 0 END) AS max_points
+    FROM (
+        SELECT p."userId" AS clerk_id, dg."gameDate", MAX(dg.day_count) AS day_count,
+               COUNT(*) FILTER (WHERE dg.won = p."teamIndex") AS correct,
+               BOOL_OR(COALESCE(p."bestPick", false)) AS best_picked
+        FROM "Pick" p
+        JOIN day_games dg ON dg.id = p."gameId"
+        GROUP BY p."userId", dg."gameDate"
+    ) AS per_day
+    GROUP BY clerk_id
+),
+scores AS (
+    SELECT u.user_id, SUM(s.points)::int AS points, SUM(s.max_points)::int AS max_points
+    FROM (SELECT * FROM pick_scores UNION ALL SELECT * FROM day_scores) AS s
+    JOIN users u ON u.clerk_id = s.clerk_id
+    JOIN leaderboard_entries le ON le.user_id = u.user_id AND le.leaderboard_id = $2
+    GROUP BY u.user_id
+),
+scored_games AS (
+    INSERT INTO leaderboard_scored_games (leaderboard_id, game_id)
+    SELECT $2, id FROM new_games
+    ON CONFLICT (leaderboard_id, game_id) DO NOTHING
+),
+updated_entries AS (
+    UPDATE leaderboard_entries le
+    SET points = COALESCE(le.points, 0) + s.points
+    FROM scores s
+    WHERE le.user_id = s.user_id AND le.leaderboard_id = $2
+    RETURNING le.user_id, le.points, s.points AS delta
+),
+updated_users AS (
+    UPDATE users u
+    SET points = COALESCE(u.points, 0) + s.points,
+        max_points = u.max_points + s.max_points
+    FROM scores s
+    WHERE u.user_id = s.user_id
+    RETURNING u.user_id, u.points, s.points AS delta
+)
+SELECT (SELECT COUNT(*) FROM new_games)::int AS games,
+       (SELECT COUNT(*) FROM completed_days)::int AS completed_days,
+       (SELECT COUNT(*) FROM updated_entries)::int AS entries,
+       -- What changed, for the pages showing it (leaderboardPush); entries whose points
+       -- did not move are left out, and past MAX_PATCH_ENTRIES only the count is needed
+       (SELECT COUNT(*) FROM updated_entries WHERE delta <> 0)::int AS changed_entries,
+       (SELECT COUNT(*) FROM updated_users WHERE delta <> 0)::int AS changed_users,
+       (SELECT COALESCE(json_agg(json_build_array(user_id, points, delta)), '[]')
+        FROM (SELECT * FROM updated_entries WHERE delta <> 0 LIMIT ${MAX_PATCH_ENTRIES}) e) AS entry_changes,
+       (SELECT COALESCE(json_agg(json_build_array(user_id, points, delta)), '[]')
+        FROM (SELECT * FROM updated_users WHERE delta <> 0 LIMIT ${MAX_PATCH_ENTRIES}) u) AS user_changes,
+       (SELECT COALESCE(json_agg(json_build_object('id', id, 'winner', winner, 'final_score', final_score)), '[]')
+        FROM new_games) AS game_results`;
+
 // Will update all user who entered that day's contest for specific sport and week
-export async function POST(req: Request) {
+export const POST = withServerTiming(async function POST(req: Request) {
     let client;
 
     try{
@@ -16,173 +133,60 @@ export async function POST(req: Request) {
         await client.query('BEGIN'); // Make into atomic transaction for rollbacks
 
         const data = await req.json();
-        const { sport, week } = data;
+        const { sport, week, year, incremental = false } = data;
 
         if (!sport || !week) {
+            await client.query('ROLLBACK');
             return NextResponse.json(
                 { success: false, message: 'Required Fields: sport, week'},
                 { status: 400}
             );
         }
 
-        // Get users with entries into that week's leaderboard
-        const enteredUsers = await client.query(
-            `SELECT le.entry_id, le.user_id, u.clerk_id, le.points
-            FROM leaderboard_entries le 
-            INNER JOIN users u ON le.user_id = u.user_id
-            WHERE le.leaderboard_id = (SELECT leaderboard_id FROM leaderboards 
-                                    WHERE sport = $1 AND week = $2 AND year = EXTRACT(YEAR FROM NOW())) 
-            `, [sport , week]);
-        
-        // Get the games from today/yesterday depending on UTC time
-        const games = await client.query(`
-            SELECT * 
-            FROM "Game"
-            WHERE sport = $1 AND "gameDate" = (
-                CASE 
-                    WHEN EXTRACT(HOUR FROM NOW()) BETWEEN 0 AND 6 
-                    THEN (CURRENT_DATE - INTERVAL '1 day') 
-                    ELSE CURRENT_DATE 
-                END);`
-        , [sport]);
-
-        /*
-        console.log("games to update?");
-        for(let i = 0; i < games.rows.length; i++){
-            console.log(games.rows[i]);
-        }
-            */
+        // Locking the leaderboard row makes overlapping runs for the same week take turns,
+        // so the second one sees the games the first one scored
+        const leaderboard = await client.query(
+            `SELECT leaderboard_id FROM leaderboards
+            WHERE sport = $1 AND week = $2 AND year = COALESCE($3::int, EXTRACT(YEAR FROM NOW()))
+            FOR UPDATE`
+        , [sport, week, year ?? null]);
 
-        if(games.rows.length === 0){
+        if (leaderboard.rows.length === 0) {
+            await client.query('ROLLBACK');
             return NextResponse.json(
-                { success: false, message: 'No games found for the selected date.' },
+                { success: false, message: `Leaderboard not found for given ${sport}  ${week}` },
                 { status: 404 }
             );
         }
 
-        const gamesIds = games.rows.map(game => game.id);
+        const result = await client.query(SCORE_ENTRIES_SQL, [sport, leaderboard.rows[0].leaderboard_id, Boolean(incremental)]);
+        const { games, completed_days, entries, ...changes } = result.rows[0];
 
-        // Get users that made picks
-        const usersPicked = await client.query(
-            `SELECT "userId", "gameId", "teamIndex", "bestPick"
-            FROM "Pick" 
-            WHERE "gameId" = ANY($1)`
-        , [gamesIds]);
-
-        /*
-        console.log("games to update?; users who made picks for these");
-        for(let i = 0; i < usersPicked.rows.length; i++){
-            console.log(usersPicked.rows[i]);
-        }
-            */
-
-        // No users made picks for the games
-        if (usersPicked.rows.length === 0 ){
+        if (games === 0 && !incremental) {
+            await client.query('ROLLBACK');
             return NextResponse.json(
-                { success: false, message: `No user picks found for todays games ${games.rows[0].gameDate}`},
-                { status: 404}
+                { success: false, message: 'No games found for the selected date.' },
+                { status: 404 }
             );
         }
 
-        // Make based on won column
-        const gameResults = (games.rows || games).map(game => ({
-            gameId: game.id,
-            won: game.won,
-            is_underdog_win: game.is_underdog_win,
-            underdog_team_id: game.underdog_team_id
-        }));
-
-        console.log(gameResults);
-
-       //console.log('Game Results:', JSON.stringify(gameResults, null, 2));
- 
-        // For every row update their points
-        for (const user of enteredUsers.rows){
-            let gainedPoints = 0; // Points gained from picking correct team
-            let gamesWon = 0; // Number of games won overall
-            let maxPoints = 0;
-            let bestPicked = false;
-
-            console.log("user entry id: "+user.entry_id);
-
-            for(const picked of usersPicked.rows){
-                const game = gameResults.find(g => g.gameId.toString() === picked.gameId.toString());  // Get the first row
-                // Only update if the right user and game.won is not null
-                if (game && game.won !== null && game.won !== undefined && user.clerk_id === picked.userId) {
-                    maxPoints += MAXPOINTSPERGAME;
-                    if (game.won.toString() === picked.teamIndex.toString()) {
-                        gainedPoints += MAXPOINTSPERGAME; // Point for picking correct team
-                        gamesWon += 1;
-
-                        // Check if this was an underdog pick that won
-                        if (game.is_underdog_win && game.underdog_team_id === picked.teamIndex.toString()) {
-                            gainedPoints += UNDERDOGPOINTS; // Add underdog bonus points
-                        }
-
-                        if (picked.bestPick) // Game was their best pick
-                            gainedPoints += BESTPICKPOINTS; // Add best pick points
-                    }
-                }
-
-                // Update max points if best picks made
-                if(picked.bestPick)
-                    bestPicked = true;
-            }
-
-            if(bestPicked)
-                maxPoints += BONUSPOINTS;
-
-            // 3 Bonus points for getting all correct
-            if (gamesWon === games.rows.length)
-                gainedPoints += BONUSPOINTS;
-
-            // Bonus max point add
-            maxPoints += BESTPICKPOINTS;
-
-            const totalPoints = user.points+gainedPoints;
-
-            console.log("current amount: " + user.points + " gained:" + gainedPoints);
-
-            const leUpdate = await client.query(
-                `UPDATE leaderboard_entries SET points = $1 WHERE entry_id = $2`
-            , [totalPoints, user.entry_id]);
-
-            if(leUpdate.rowCount === 0){
-                console.warn(`Couldn't update leaderboard entry for entry_id ${user.entry_id}`);
-            }
-
-           //console.log(`Updating points for entry_id: ${user.entry_id}, totalPoints: ${totalPoints}`);
-
-            // Call updatePoints api to post total points to user
-            const BASE_URL = process.env.NEXT_PUBLIC_BASE_URL || 'http://localhost:3000';
-
-            const res = await fetch(`${BASE_URL}/api/user/updatePoints`, {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json' },
-                body: JSON.stringify({ clerk_id: user.clerk_id, points: gainedPoints })
-            });
-
-           //console.log(`User ${user.clerk_id} gained ${gainedPoints} points`);
-
-            if (!res.ok) {
-                await client.query('ROLLBACK');
-                return NextResponse.json({ success: false, message: data.message || 'Failed to update user total points after entry points update'}, { status: res.status });
-            }
-
-            const res2 = await fetch(`${BASE_URL}/api/user/updateMaxPoints`, {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json' },
-                body: JSON.stringify({ clerk_id: user.clerk_id, max_points: maxPoints })
-            });
-
-            if (!res2.ok) {
-                await client.query('ROLLBACK');
-                return NextResponse.json({ success: false, message: data.message || 'Failed to update user total points after entry points update'}, { status: res2.status });
-            }
-        }
-        
         await client.query('COMMIT');
-        return NextResponse.json({ success: true, message: 'Entry points for all users updated successfully'}, {status: 200 });
+
+        // Only after the commit, so no page is patched with scores that were rolled back
+        await pushScoreDiff({
+            sport,
+            week: Number(week),
+            entries: changes.entry_changes ?? [],
+            users: changes.user_changes ?? [],
+            changedEntries: changes.changed_entries ?? 0,
+            changedUsers: changes.changed_users ?? 0,
+            games: changes.game_results ?? [],
+        });
+
+        return NextResponse.json(
+            { success: true, message: 'Entry points for all users updated successfully', games, completed_days, entries },
+            { status: 200 }
+        );
     } catch (error) {
         if (client) await client.query('ROLLBACK');
         console.error(`Error updating entry points: `, error);
@@ -190,4 +194,4 @@ export async function POST(req: Request) {
     } finally {
         if (client) client.release();
     }
-}
\ No newline at end of file
+});
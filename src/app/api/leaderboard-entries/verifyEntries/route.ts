@@ -0,0 +1,84 @@
+import { db } from '@/lib/dbPool/dbPool';
+import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
+
+// Bulk version of verifyEntry: makes sure every user who picked this sport this week has an
+// entry in the week's leaderboard, with one set-based insert instead of a request per user.
+// Pass clerk_ids to limit it to those users; otherwise everyone with a pick on a game this
+// week (same set as /api/userPicks/getUsersMadePicks) is entered.
+export const POST = withServerTiming(async function POST(req: Request) {
+  let client;
+
+  try {
+    client = await db.connect();
+    const data = await req.json();
+    const { sport, week, clerk_ids } = data;
+
+    if (!week || !sport) {
+      return NextResponse.json(
+        { success: false, message: 'Required Fields: week, sport' },
+        { status: 400 }
+      );
+    }
+
+    if (clerk_ids !== undefined && !Array.isArray(clerk_ids)) {
+      return NextResponse.json(
+        { success: false, message: 'clerk_ids must be an array' },
+        { status: 400 }
+      );
+    }
+
+    const leaderboardResult = await client.query(
+      `SELECT leaderboard_id FROM leaderboards WHERE sport = $1 AND week = $2 AND year = EXTRACT(YEAR FROM NOW())`,
+      [sport, week]
+    );
+
+    if (leaderboardResult.rows.length === 0) {
+      return NextResponse.json(
+        { success: false, message: `Leaderboard not found for given ${sport}  ${week}` },
+        { status: 404 }
+      );
+    }
+    const leaderboard_id = leaderboardResult.rows[0].leaderboard_id;
+
+    // A range on "gameDate" (this Monday up to next Monday) instead of EXTRACT(WEEK ...)
+    // so the Game date index can be used
+    const result = await client.query(
+      `WITH pickers AS (
+         SELECT DISTINCT p."userId" AS clerk_id
+         FROM "Pick" p
+         JOIN "Game" g ON p."gameId" = g.id
+         WHERE p.sport = $1
+           AND g."gameDate" >= date_trunc('week', CURRENT_DATE)
+           AND g."gameDate" < date_trunc('week', CURRENT_DATE) + INTERVAL '7 days'
+           AND ($3::text[] IS NULL OR p."userId" = ANY($3::text[]))
+       ),
+       inserted AS (
+         INSERT INTO leaderboard_entries (user_id, leaderboard_id, rank, points, start_date)
+         SELECT u.user_id, $2, 0, 0, NOW()
+         FROM pickers
+         JOIN users u ON u.clerk_id = pickers.clerk_id
+         ON CONFLICT (user_id, leaderboard_id) DO NOTHING
+         RETURNING 1
+       )
+       SELECT (SELECT COUNT(*) FROM pickers)::int AS pickers,
+              (SELECT COUNT(*) FROM inserted)::int AS created`,
+      [sport, leaderboard_id, clerk_ids ?? null]
+    );
+
+    const { pickers, created } = result.rows[0];
+    return NextResponse.json(
+      { success: true, message: 'Leaderboard entries verified/created successfully', leaderboard_id, pickers, created },
+      { status: 201 }
+    );
+
+  } catch (error) {
+    console.error('Error bulk inserting into leaderboard entries:', error);
+    return NextResponse.json(
+      { success: false, message: 'Internal Server Error', error },
+      { status: 500 }
+    );
+  } finally {
+    if (client) client.release();
+  }
+});
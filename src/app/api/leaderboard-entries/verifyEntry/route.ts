@@ -1,9 +1,10 @@
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 
 // Checks for user entry in week's leaderboard
-export async function POST(req: Request) {
+export const POST = withServerTiming(async function POST(req: Request) {
   let client;
 
   try {
@@ -72,4 +73,4 @@ export async function POST(req: Request) {
   } finally {
     if (client) client.release();
   }
-}
+});
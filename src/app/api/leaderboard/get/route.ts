@@ -1,8 +1,9 @@
 /* eslint-disable @typescript-eslint/no-unused-vars */
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   let client;
 
   try {
@@ -39,4 +40,4 @@ export async function GET(req: Request) {
   } finally {
     if(client) client.release();
   }
-}
+});
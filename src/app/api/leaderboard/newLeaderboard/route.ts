@@ -1,10 +1,11 @@
 /* eslint-disable @typescript-eslint/no-unused-vars */
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 const Sport = ['NBA', 'NFL', 'MLB', 'NHL', 'MLS', 'EPL', 'LALIGA', 'LIGUE_1', 'BUNDESLIGA', 'SERIE_A'];
  
-export async function POST(req: Request) {
+export const POST = withServerTiming(async function POST(req: Request) {
   let client;
   
   try{
@@ -39,7 +40,7 @@ export async function POST(req: Request) {
   } finally {
     if(client) client.release();
   }
-}
+});
 
 // Function to calculate current week of the year
 function getCurrentWeek(): number {
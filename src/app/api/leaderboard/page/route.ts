@@ -0,0 +1,40 @@
+import { db } from '@/lib/dbPool/dbPool';
+import { NextResponse } from 'next/server';
+import { DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decodeCursor, fetchPage, parseBoard, withImages } from '@/lib/leaderboardPage/leaderboardPage';
+import { timedJson, withServerTiming } from '@/lib/serverTiming/serverTiming';
+
+// One page of a leaderboard: ?sport=SELECT&week=0 (overall) or ?sport=NBA&week=12, with
+// ?limit= rows and the nextCursor of the previous page as ?cursor=
+export const GET = withServerTiming(async function GET(req: Request) {
+  let client;
+
+  try {
+    const { searchParams } = new URL(req.url);
+    const board = parseBoard(searchParams.get('sport'), searchParams.get('week'));
+    if (!board) {
+      return NextResponse.json({ success: false, message: 'Pages are available for sport=SELECT&week=0 or a sport and week' }, { status: 400 });
+    }
+
+    const limitParam = searchParams.get('limit');
+    const limit = limitParam === null ? DEFAULT_PAGE_SIZE : Number(limitParam);
+    if (!Number.isInteger(limit) || limit < 1 || limit > MAX_PAGE_SIZE) {
+      return NextResponse.json({ success: false, message: `limit must be between 1 and ${MAX_PAGE_SIZE}` }, { status: 400 });
+    }
+
+    const cursorParam = searchParams.get('cursor');
+    const cursor = cursorParam ? decodeCursor(cursorParam) : null;
+    if (cursorParam && !cursor) {
+      return NextResponse.json({ success: false, message: 'Invalid cursor' }, { status: 400 });
+    }
+
+    client = await db.connect();
+    const page = await fetchPage(client, board, limit, cursor);
+
+    return timedJson({ success: true, data: await withImages(page.rows), nextCursor: page.nextCursor }, { status: 200 });
+  } catch (error) {
+    console.error('Error fetching leaderboard page:', error);
+    return NextResponse.json({ success: false, message: 'Internal Server Error: ' + error }, { status: 500 });
+  } finally {
+    if (client) client.release();
+  }
+});
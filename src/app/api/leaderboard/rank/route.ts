@@ -0,0 +1,37 @@
+import { db } from '@/lib/dbPool/dbPool';
+import { NextResponse } from 'next/server';
+import { MAX_PAGE_SIZE, fetchRanks, parseBoard, withImages } from '@/lib/leaderboardPage/leaderboardPage';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
+
+// Where the given users stand on a leaderboard: ?sport=SELECT&week=0 (overall) or
+// ?sport=NBA&week=12, and ?user_id=1,2,3 and/or ?clerk_id=user_abc. Users without points on
+// it are left out.
+export const GET = withServerTiming(async function GET(req: Request) {
+  let client;
+
+  try {
+    const { searchParams } = new URL(req.url);
+    const board = parseBoard(searchParams.get('sport'), searchParams.get('week'));
+    if (!board) {
+      return NextResponse.json({ success: false, message: 'Ranks are available for sport=SELECT&week=0 or a sport and week' }, { status: 400 });
+    }
+
+    const list = (name: string) => [...new Set((searchParams.get(name) || '').split(',').map((id) => id.trim()).filter(Boolean))];
+    const userIds = list('user_id');
+    const clerkIds = list('clerk_id');
+    const count = userIds.length + clerkIds.length;
+    if (count === 0 || count > MAX_PAGE_SIZE || !userIds.every((id) => /^\d+$/.test(id))) {
+      return NextResponse.json({ success: false, message: `Between 1 and ${MAX_PAGE_SIZE} numeric user_ids or clerk_ids are required` }, { status: 400 });
+    }
+
+    client = await db.connect();
+    const rows = await fetchRanks(client, board, userIds.map(Number), clerkIds);
+
+    return NextResponse.json({ success: true, data: await withImages(rows) }, { status: 200 });
+  } catch (error) {
+    console.error('Error fetching leaderboard ranks:', error);
+    return NextResponse.json({ success: false, message: 'Internal Server Error: ' + error }, { status: 500 });
+  } finally {
+    if (client) client.release();
+  }
+});
@@ -3,8 +3,11 @@
 //
 /* eslint-disable @typescript-eslint/no-explicit-any */
 import { NextResponse } from 'next/server';
+import { BASE_URLS } from '../all-espn-games/baseUrls';
+import { getScoreboard } from '@/lib/espnCache/espnCache';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-const BASE_URL = 'https://site.api.espn.com/apis/site/v2/sports/basketball/nba';
+const BASE_URL = BASE_URLS.NBA;
 
 function getTeamLogo(teamName: string | undefined): string {
   if (!teamName) {
@@ -48,7 +51,7 @@ function getTeamLogo(teamName: string | undefined): string {
   return `https://a.espncdn.com/combiner/i?img=/i/teamlogos/nba/500/${abbreviation}.png`;
 }
 
-export async function GET(request: Request) {
+export const GET = withServerTiming(async function GET(request: Request) {
     try {
         const { searchParams } = new URL(request.url);
         const dayParam = searchParams.get('day');
@@ -87,17 +90,11 @@ export async function GET(request: Request) {
                 : estNow.toLocaleDateString('en-CA');
         }
         
-        // Use the calendar endpoint
+        // Use the calendar endpoint, through the shared ESPN cache
         const url = `${BASE_URL}/scoreboard?dates=${dateStr}`;
         console.log('Fetching URL:', url);
 
-        const response = await fetch(url, {
-            headers: {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json'
-            },
-            next: { revalidate: 0 }
-        });
+        const response = await getScoreboard('NBA', dateStr);
 
         if (!response.ok) {
             console.error(`API Error: ${response.status} for URL: ${url}`);
@@ -107,7 +104,7 @@ export async function GET(request: Request) {
             });
         }
 
-        const data = await response.json();
+        const data = response.data;
         
         if (!data.events || data.events.length === 0) {
             return NextResponse.json({
@@ -240,4 +237,4 @@ export async function GET(request: Request) {
             message: 'Error fetching games'
         });
     }
-}
\ No newline at end of file
+});
\ No newline at end of file
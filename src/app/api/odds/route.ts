@@ -1,5 +1,8 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
 import { NextResponse } from 'next/server';
+import { ODDS_API_BASE_URL } from '../all-espn-games/baseUrls';
+import { getScoreboard, getScoreboardEvent } from '@/lib/espnCache/espnCache';
+import { timed, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 // ESPN CDN URLs for NFL team logos
 const NFL_TEAM_LOGOS: { [key: string]: string } = {
@@ -92,7 +95,7 @@ const TEAM_NAME_MAPPING: { [key: string]: string } = {
   'warriors': 'golden state warriors'
 };
 
-export async function GET(request: Request) {
+export const GET = withServerTiming(async function GET(request: Request) {
   const url = new URL(request.url);
   const gameId = url.searchParams.get('gameId');
   const requestedHomeTeam = url.searchParams.get('requestedHomeTeam') || url.searchParams.get('homeTeam');
@@ -120,7 +123,7 @@ export async function GET(request: Request) {
       { status: 500 }
     );
   }
-}
+});
 
 // Function to handle specific game requests (for the preview dialog)
 async function handleSpecificGameRequest(gameId: string | null, requestedHomeTeam: string | null, requestedAwayTeam: string | null) {
@@ -185,9 +188,9 @@ async function handleSpecificGameRequest(gameId: string | null, requestedHomeTea
     try {
       // First try to fetch the specific game by ID
       if (gameId) {
-        const specificGameResponse = await fetch(`https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard/events/${gameId}`);
+        const specificGameResponse = await getScoreboardEvent('NBA', gameId);
         if (specificGameResponse.ok) {
-          const specificGameData = await specificGameResponse.json();
+          const specificGameData = specificGameResponse.data;
           console.log('Found specific game by ID:', specificGameData);
           foundGame = specificGameData;
         }
@@ -215,9 +218,9 @@ async function handleSpecificGameRequest(gameId: string | null, requestedHomeTea
           
           console.log(`Fetching games for date: ${year}-${month}-${day}`);
           
-          const response = await fetch(`https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates=${dateStr}`);
+          const response = await getScoreboard('NBA', dateStr);
           if (response.ok) {
-            const data = await response.json();
+            const data = response.data;
             console.log(`Found ${data.events?.length || 0} games for ${year}-${month}-${day}`);
             
             // Look for matching game
@@ -347,10 +350,10 @@ async function handleSpecificGameRequest(gameId: string | null, requestedHomeTea
       if (API_KEY  && !homeSpread && !awaySpread) {
         try {
           console.log('Fetching odds from The Odds API');
-          const oddsResponse = await fetch(
-            `https://api.the-odds-api.com/v4/sports/basketball_nba/odds/?apiKey=${API_KEY}&regions=us&markets=spreads&oddsFormat=american&bookmakers=fanduel`,
+          const oddsResponse = await timed('odds', () => fetch(
+            `${ODDS_API_BASE_URL}/v4/sports/basketball_nba/odds/?apiKey=${API_KEY}&regions=us&markets=spreads&oddsFormat=american&bookmakers=fanduel`,
             { cache: 'no-store' }
-          );
+          ));
           
           if (oddsResponse.ok) {
             const oddsData = await oddsResponse.json();
@@ -459,11 +462,11 @@ async function handleNFLOddsRequest() {
 
     try {
       const [oddsResponse, espnResponse] = await Promise.all([
-        fetch(
-          `https://api.the-odds-api.com/v4/sports/basketball_nba/odds/?apiKey=${API_KEY}&regions=us&markets=spreads&oddsFormat=american&bookmakers=fanduel`,
+        timed('odds', () => fetch(
+          `${ODDS_API_BASE_URL}/v4/sports/basketball_nba/odds/?apiKey=${API_KEY}&regions=us&markets=spreads&oddsFormat=american&bookmakers=fanduel`,
           { cache: 'no-store' }
-        ),
-        fetch('https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard')
+        )),
+        getScoreboard('NBA')
       ]);
 
       // If Odds API fails, fall back to ESPN data only
@@ -472,7 +475,7 @@ async function handleNFLOddsRequest() {
         
         // Process ESPN data only
         if (espnResponse.ok) {
-          const espnData = await espnResponse.json();
+          const espnData = espnResponse.data;
           // Format ESPN data without odds information
           // ... (implement fallback logic here)
           return NextResponse.json({ 
@@ -486,7 +489,7 @@ async function handleNFLOddsRequest() {
 
       // Continue with normal processing if both APIs succeed
       const rawData = await oddsResponse.json();
-      const espnData = await espnResponse.json();
+      const espnData = espnResponse.data;
       
       // Get current date
       const now = new Date();
@@ -1,16 +1,10 @@
 import { NextResponse } from "next/server";
-import Pusher from "pusher";
+import { getPusher } from "@/lib/leaderboardPush/leaderboardPush";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
 
-const pusher = new Pusher({
-  appId: process.env.PUSHER_APP_ID || "",
-  key: process.env.PUSHER_KEY || "",
-  secret: process.env.PUSHER_SECRET || "",
-  cluster: process.env.PUSHER_CLUSTER || "",
-  useTLS: true
-});
-
-export async function POST(req: Request) {
+export const POST = withServerTiming(async function POST(req: Request) {
   try {
+    const pusher = getPusher();
     const body = await req.json();
 
     if (body.type === "bulk-update" && Array.isArray(body.updates)) {
@@ -38,4 +32,4 @@ export async function POST(req: Request) {
     console.error("Error triggering Pusher:", error);
     return NextResponse.json({ error: "Failed to send update" }, { status: 500 });
   }
-}
+});
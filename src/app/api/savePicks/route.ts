@@ -4,8 +4,9 @@
 
 import { NextRequest, NextResponse } from 'next/server';
 import { getAuth } from '@clerk/nextjs/server';
-import { sql } from '@vercel/postgres';
+import { sql } from '@/lib/dbPool/dbPool';
 import crypto from 'crypto';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 interface Pick {
   gameId: string;
@@ -28,7 +29,7 @@ interface Pick {
   underdog_team_id?: string;
 }
 
-export async function POST(req: NextRequest) {
+export const POST = withServerTiming(async function POST(req: NextRequest) {
   try {
     const { userId } = getAuth(req);
     if (!userId) {
@@ -187,6 +188,7 @@ export async function POST(req: NextRequest) {
             ${sport},
             ${pick.underdog_team_id || null}
           )
+          ON CONFLICT (id) DO NOTHING -- a concurrent submission may have created it since the check
         `;
       } else if (pick.underdog_team_id) {
         // Update underdog information if available
@@ -259,4 +261,4 @@ export async function POST(req: NextRequest) {
       error: error instanceof Error ? error.message : 'Unknown error'
     }, { status: 500 });
   }
-}
+});
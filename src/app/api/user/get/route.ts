@@ -1,7 +1,8 @@
-import { sql } from "@vercel/postgres";
+import { sql } from "@/lib/dbPool/dbPool";
 import { NextResponse } from "next/server";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
 
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   try {
     // Extract clerkId from query parameters
     const url = new URL(req.url);
@@ -35,4 +36,4 @@ export async function GET(req: Request) {
       { status: 500 }
     );
   }
-}
+});
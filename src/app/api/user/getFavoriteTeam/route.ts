@@ -1,9 +1,10 @@
-import { sql } from '@vercel/postgres';
+import { sql } from '@/lib/dbPool/dbPool';
 import { NextResponse, NextRequest } from 'next/server';
 import { getAuth } from '@clerk/nextjs/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 
-export async function GET(req: NextRequest) {
+export const GET = withServerTiming(async function GET(req: NextRequest) {
   try {//get favorite team
     const { userId } = getAuth(req);
     
@@ -39,4 +40,4 @@ export async function GET(req: NextRequest) {
       error: error instanceof Error ? error.message : 'Unknown error'
     }, { status: 500 });
   }
-} 
\ No newline at end of file
+});
\ No newline at end of file
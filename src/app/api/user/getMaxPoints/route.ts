@@ -1,8 +1,9 @@
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 // Get user max point for one user to display on website
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   let client;
 
   try {
@@ -29,4 +30,4 @@ export async function GET(req: Request) {
   } finally {
     if (client) client.release();
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,8 +1,9 @@
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { timedJson, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 // Get user point for multiple users to display on website
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   let client;
 
   try {
@@ -31,11 +32,11 @@ export async function GET(req: Request) {
       return NextResponse.json({ success: false, message: 'No users found' }, { status: 404 });
     }
 
-    return NextResponse.json({ success: true, data: userPoints.rows }, { status: 200 });
+    return timedJson({ success: true, data: userPoints.rows }, { status: 200 });
   } catch (error) {
     console.error("Error fetching points for users", error);
     return NextResponse.json({ success: false, message: 'Internal Server Error: ' + error }, { status: 500 });
   } finally {
     if (client) client.release();
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,9 +1,10 @@
 import { clerkClient, User } from '@clerk/clerk-sdk-node';
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { timed, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 // Get users' points for a specific sport (all-time or by week)
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   let client;
 
   try {
@@ -116,7 +117,7 @@ export async function GET(req: Request) {
 
     let clerkUsers: { data: User[] } | undefined;
     if (clerkIds.length > 0) {
-      const response = await clerkClient.users.getUserList({ userId: clerkIds });
+      const response = await timed('clerk', () => clerkClient.users.getUserList({ userId: clerkIds }));
 
       if (Array.isArray(response?.data)) {
         clerkUsers = response;
@@ -144,4 +145,4 @@ export async function GET(req: Request) {
   } finally {
     if (client) client.release();
   }
-}
+});
@@ -1,7 +1,8 @@
 import { clerkClient } from '@clerk/clerk-sdk-node';
 import { NextResponse } from 'next/server';
+import { timed, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   try {
     const { searchParams } = new URL(req.url);
     const clerkId = searchParams.get('clerkId');
@@ -14,7 +15,7 @@ export async function GET(req: Request) {
     }
 
     // Fetch user data from Clerk
-    const user = await clerkClient.users.getUser(clerkId);
+    const user = await timed('clerk', () => clerkClient.users.getUser(clerkId));
 
     if (!user) {
       return NextResponse.json(
@@ -50,4 +51,4 @@ export async function GET(req: Request) {
       { status: 500 }
     );
   }
-} 
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,9 +1,10 @@
 import { clerkClient, User } from '@clerk/clerk-sdk-node';
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { timed, timedJson, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 // get all users for total leaderboard
-export async function GET(req: Request) {
+export const GET = withServerTiming(async function GET(req: Request) {
   let client;
 
   try {
@@ -45,7 +46,7 @@ export async function GET(req: Request) {
 
     let clerkUsers: { data: User[] } | undefined;
     if (clerkIds.length > 0) {
-      const response = await clerkClient.users.getUserList({ userId: clerkIds });
+      const response = await timed('clerk', () => clerkClient.users.getUserList({ userId: clerkIds }));
 
       if (Array.isArray(response?.data)) {  // Access the data property
           clerkUsers = response;
@@ -66,11 +67,11 @@ export async function GET(req: Request) {
       };
     });
 
-    return NextResponse.json({ success: true, data: mergedUsers }, { status: 200 });
+    return timedJson({ success: true, data: mergedUsers }, { status: 200 });
   } catch (error) {
     console.error("Error fetching leaderboard:", error);
     return NextResponse.json({ success: false, message: 'Internal Server Error: ' + error }, { status: 500 });
   } finally {
     if (client) client.release();
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
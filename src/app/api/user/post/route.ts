@@ -1,8 +1,9 @@
 // /api/user/postClerk-Database.ts
-import { sql } from '@vercel/postgres';
+import { sql } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-export async function POST(req: Request) {
+export const POST = withServerTiming(async function POST(req: Request) {
   try {
     const data = await req.json();
     const { clerkId, email, username } = data;
@@ -46,4 +47,4 @@ export async function POST(req: Request) {
       { status: 500 }
     );
   }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,9 +1,10 @@
-import { sql } from '@vercel/postgres';
+import { sql } from '@/lib/dbPool/dbPool';
 import { NextResponse, NextRequest } from 'next/server';
 import { getAuth } from '@clerk/nextjs/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 //update favorite team
-export async function POST(req: NextRequest) {
+export const POST = withServerTiming(async function POST(req: NextRequest) {
   try {
     const { userId } = getAuth(req);
     
@@ -35,4 +36,4 @@ export async function POST(req: NextRequest) {
       error: error instanceof Error ? error.message : 'Unknown error'
     }, { status: 500 });
   }
-} 
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,10 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getAuth } from '@clerk/nextjs/server';
-import { PrismaClient } from '@prisma/client';
+import { sql } from '@/lib/dbPool/dbPool';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-const prisma = new PrismaClient();
-
-export async function POST(req: NextRequest) {
+export const POST = withServerTiming(async function POST(req: NextRequest) {
   try {
     const { userId } = getAuth(req);
     if (!userId) {
@@ -14,14 +13,9 @@ export async function POST(req: NextRequest) {
     const data = await req.json();
 
     // First get the user_id from users table
-    const user = await prisma.users.findUnique({
-      where: {
-        clerk_id: userId
-      },
-      select: {
-        user_id: true
-      }
-    });
+    const { rows: [user] } = await sql<{ user_id: number }>`
+      SELECT user_id FROM users WHERE clerk_id = ${userId}
+    `;
 
     if (!user) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
@@ -29,18 +23,11 @@ export async function POST(req: NextRequest) {
 
     const socialLinksString = JSON.stringify(data.socialLinks);
 
-    await prisma.influencers.upsert({
-      where: {
-        user_id: user.user_id
-      },
-      update: {
-        // user_handle: socialLinksString
-      },
-      create: {
-        user_id: user.user_id,
-        // user_handle: socialLinksString
-      }
-    });
+    await sql`
+      INSERT INTO influencers (user_id)
+      VALUES (${user.user_id})
+      ON CONFLICT (user_id) DO NOTHING
+    `;
 
     return NextResponse.json({ success: true });
   } catch (error) {
@@ -50,4 +37,4 @@ export async function POST(req: NextRequest) {
       { status: 500 }
     );
   }
-} 
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,8 +1,26 @@
 import { NextResponse } from "next/server";
-import { sql } from "@vercel/postgres"; // Ensure this is correct for your setup
+import { db } from "@/lib/dbPool/dbPool";
+import { countsForDates, countsForGames, hasTwoPickers, pickCountsInstalled } from "@/lib/pickCounts/pickCounts";
+import { timedJson, withServerTiming } from "@/lib/serverTiming/serverTiming";
+
+// Most game IDs one request may ask for
+const MAX_GAME_IDS = 200;
+
+// Today's and tomorrow's games by default; ?gameIds=a,b,c asks for specific games instead
+export const GET = withServerTiming(async function GET(req?: Request) {
+  let client;
 
-export async function GET() {
   try {
+    const gameIds = req
+      ? [...new Set((new URL(req.url).searchParams.get("gameIds") || "").split(",").map((id) => id.trim()).filter(Boolean))]
+      : [];
+    if (gameIds.length > MAX_GAME_IDS) {
+      return NextResponse.json(
+        { error: `At most ${MAX_GAME_IDS} game IDs per request` },
+        { status: 400 }
+      );
+    }
+
     const now = new Date();
 
     // Convert UTC time to EST (UTC-5)
@@ -26,64 +44,46 @@ export async function GET() {
       .toISOString()
       .split("T")[0];
 
-    const userCountResult = await sql`
-    SELECT COUNT(DISTINCT p."userId") AS uniqueUsers
-    FROM "Pick" p
-    JOIN "Game" g ON p."gameId" = g.id
-    WHERE DATE(g."gameDate") = ${today}
-    OR DATE(g."gameDate") = ${tomorrow}
-;
-  `;
+    client = await db.connect();
 
-    const uniqueUsers = userCountResult.rows[0]?.uniqueusers || 0;
+    // Pick counts are maintained per game as picks are written (see lib/pickCounts)
+    const counts = gameIds.length
+      ? await countsForGames(client, gameIds)
+      : await countsForDates(client, [today, tomorrow]);
 
-    if (uniqueUsers < 2) {
+    if (!(await hasTwoPickers(client, counts))) {
+      // Also what a database without the counting triggers looks like; that one is logged
+      await pickCountsInstalled(client);
       return NextResponse.json({
         message: "There is not enough data",
         data: [],
       });
     }
 
-    // Query to get all game picks for today's games
-    const picksData = await sql`
-        SELECT 
-          g.id AS gameId,
-          g."team1Name" AS homeTeamId,
-          g."team2Name" AS awayTeamId,
-          COUNT(CASE WHEN recent_picks."teamIndex" = 0 THEN 1 END) AS homePicks,
-          COUNT(CASE WHEN recent_picks."teamIndex" = 1 THEN 1 END) AS awayPicks,
-          COUNT(recent_picks.id) AS totalPicks
-        FROM "Game" g
-        JOIN (
-            SELECT DISTINCT ON (p."userId", p."gameId") 
-                p.id, p."gameId", p."userId", p."teamIndex", p."createdAt"
-            FROM "Pick" p
-            ORDER BY p."userId", p."gameId", p."createdAt" DESC
-        ) AS recent_picks ON g.id = recent_picks."gameId"
-        WHERE DATE(g."gameDate") = ${today} 
-            OR DATE(g."gameDate") = ${tomorrow}
-        GROUP BY g.id, g."team1Name", g."team2Name";
-        `;
-
     // Transform data into percentages
-    const percentageData = picksData.rows.map((row) => ({
-      gameId: row.gameid,
-      homeTeamPercentage:
-        row.totalpicks > 0
-          ? ((row.homepicks / row.totalpicks) * 100).toFixed(2) + "%"
-          : "0%",
-      awayTeamPercentage:
-        row.totalpicks > 0
-          ? ((row.awaypicks / row.totalpicks) * 100).toFixed(2) + "%"
-          : "0%",
-    }));
+    const percentageData = counts.map((row) => {
+      const totalPicks = row.homePicks + row.awayPicks;
+      return {
+        gameId: row.gameId,
+        homeTeamPercentage:
+          totalPicks > 0
+            ? ((row.homePicks / totalPicks) * 100).toFixed(2) + "%"
+            : "0%",
+        awayTeamPercentage:
+          totalPicks > 0
+            ? ((row.awayPicks / totalPicks) * 100).toFixed(2) + "%"
+            : "0%",
+      };
+    });
 
-    return NextResponse.json({ data: percentageData });
+    return timedJson({ data: percentageData });
   } catch (error) {
     console.error("Error fetching pick percentages:", error);
     return NextResponse.json(
       { error: "Failed to retrieve pick percentages" },
       { status: 500 }
     );
+  } finally {
+    if (client) client.release();
   }
-}
+});
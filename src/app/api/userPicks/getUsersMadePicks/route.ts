@@ -1,7 +1,8 @@
-import { db } from '@vercel/postgres';
+import { db } from '@/lib/dbPool/dbPool';
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/serverTiming/serverTiming';
 
-export async function GET(req: Request){
+export const GET = withServerTiming(async function GET(req: Request){
     let client;
 
     try {
@@ -40,4 +41,4 @@ export async function GET(req: Request){
     } finally {
         if (client) client.release();
     }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -2,8 +2,9 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
 import { NextRequest, NextResponse } from 'next/server';
 import { getAuth } from '@clerk/nextjs/server';
-import { sql } from '@vercel/postgres';
+import { sql } from '@/lib/dbPool/dbPool';
 import { format, parseISO, isAfter, isToday, differenceInMinutes } from 'date-fns';
+import { timedJson, withServerTiming } from '@/lib/serverTiming/serverTiming';
 
 // Define an interface for the database row
 interface PickRow {
@@ -25,7 +26,7 @@ interface PickRow {
     sport: string | null;
 }
 
-export async function GET(req: NextRequest) {
+export const GET = withServerTiming(async function GET(req: NextRequest) {
     try {
         const { userId } = getAuth(req);
         if (!userId) {
@@ -327,7 +328,7 @@ export async function GET(req: NextRequest) {
         
         //console.log('Returning sorted picks:', sortedPicks.length);
         
-        return NextResponse.json(sortedPicks);
+        return timedJson(sortedPicks);
 
     } catch (error) {
         //console.error('Error in GET request:', error);
@@ -340,4 +341,4 @@ export async function GET(req: NextRequest) {
             { status: 500 }
         );
     }
-}
\ No newline at end of file
+});
\ No newline at end of file
@@ -14,10 +14,10 @@ export default function ContestCard({ contest, isActive, userResult }: ContestCa
     const [showPicksModal, setShowPicksModal] = useState(false);
 
     return (
-        <div className="border rounded-lg p-4 hover:shadow-lg transition-shadow bg-gradient-to-r from-gray-900 to-black text-white h-full flex flex-col">
+        <div data-testid="contest-card" data-contest-id={contest.id} className="border rounded-lg p-4 hover:shadow-lg transition-shadow bg-gradient-to-r from-gray-900 to-black text-white h-full flex flex-col">
             {/* Header section contest title and category badge */}
             <div className="flex justify-between items-start mb-2">
-                <h2 className="text-xl font-bold text-white">{contest.title}</h2>
+                <h2 data-testid="contest-title" className="text-xl font-bold text-white">{contest.title}</h2>
                 {/* Display the contest category */}
                 <span className="text-sm font-semibold bg-blue-600 text-white px-2 py-1 rounded">
                     {contest.category}
@@ -54,6 +54,7 @@ export default function ContestCard({ contest, isActive, userResult }: ContestCa
                     <>
                         {/* Button to open the GamePicksModal */}
                         <button 
+                            data-testid="contest-play"
                             className="w-full mt-6 bg-blue-600 text-white py-3 px-4 rounded-lg hover:bg-blue-700 transition-colors font-semibold"
                             onClick={() => setShowPicksModal(true)} // Show the modal when clicked
                         >
@@ -123,7 +123,7 @@ export const GameCard = ({ game, userTimeZone }: { game: Game, userTimeZone: str
                 />
               )}
             </div>
-            <div className="team-info">
+            <div className="team-info" data-testid="game-team" data-side="away" data-team={game.awayTeam.name}>
               <span className="team-name font-medium text-black dark:text-white hidden md:block">
                 {shortenTeamName(game.awayTeam.name)}
               </span>
@@ -149,7 +149,7 @@ export const GameCard = ({ game, userTimeZone }: { game: Game, userTimeZone: str
 
           {/* Home Team */}
           <div className="team-container justify-end">
-            <div className="team-info items-end">
+            <div className="team-info items-end" data-testid="game-team" data-side="home" data-team={game.homeTeam.name}>
               <span className="team-name font-medium text-black dark:text-white text-right hidden md:block">
                 {shortenTeamName(game.homeTeam.name)}
               </span>
@@ -185,7 +185,7 @@ export const GameCard = ({ game, userTimeZone }: { game: Game, userTimeZone: str
         </div>
 
         {/* Game Status */}
-        <div className="text-xs sm:text-sm text-gray-500 mt-2">
+        <div data-testid="game-status" data-status={game.status} className="text-xs sm:text-sm text-gray-500 mt-2">
           {(() => {
             switch (game.status?.toLowerCase()) {
               case 'status_final': return 'Final';
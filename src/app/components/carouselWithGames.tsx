@@ -104,27 +104,15 @@ const carouselWithGames: React.FC<CarouselWithGamesProps> = ({ refreshKey, onDat
         };
 
         if (carouselSport === 'Soccer' && selectedSoccerLeague === '') {
-          // Fetch all soccer games when "All Soccer Leagues" is selected
-          const leagueUrls = [
-            '/api/all-espn-games?sport=MLS&day=today',
-            '/api/all-espn-games?sport=EPL&day=today',
-            '/api/all-espn-games?sport=LALIGA&day=today',
-            '/api/all-espn-games?sport=BUNDESLIGA&day=today',
-            '/api/all-espn-games?sport=SERIE_A&day=today',
-            '/api/all-espn-games?sport=LIGUE_1&day=today'
-          ];
-
-          const responses = await Promise.all(leagueUrls.map(url => fetch(url)));
-          const data = await Promise.all(responses.map(res => res.json()));
-
-          // Combine games from all leagues
-          const combinedGames = data.flatMap(response => response.games || []);
-          combinedGames.sort((a, b) => {
-            const dateA = new Date(a.fullDate).getTime(); // use fullDate from the API
-            const dateB = new Date(b.fullDate).getTime();
-            return dateA - dateB;
-          });
-          setGames(sortGames(combinedGames));
+          // Fetch all soccer games when "All Soccer Leagues" is selected, in one request;
+          // the server loads the leagues concurrently and combines them
+          const leagues = ['MLS', 'EPL', 'LALIGA', 'BUNDESLIGA', 'SERIE_A', 'LIGUE_1'];
+
+          const response = await fetch(`/api/all-espn-games/leagues?sports=${leagues.join(',')}&day=today`);
+          const data = await response.json();
+
+          // Already combined and in start time order
+          setGames(sortGames(data.games || []));
         } else {
           const response = await fetch(`/api/all-espn-games?sport=${carouselSport}`);
           const data = await response.json();
@@ -1,17 +1,41 @@
 /* eslint-disable prefer-const */
 "use client";
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
+import Pusher from 'pusher-js';
+import { useUser } from '@clerk/nextjs';
 import LeaderboardProfiles from '../components/leaderboardProfiles';
+import {
+    EntriesPatch, OVERALL_CHANNEL, PATCH_EVENT, RESET_EVENT, applyEntriesPatch, boardChannel, pusherClientOptions,
+} from '@/lib/leaderboardPatch/leaderboardPatch';
 
 type Sport = 'NBA' | 'NFL' | 'MLB' | 'NHL' | 'MLS' | 'EPL' | 'LALIGA' | 'LIGUE_1' | 'BUNDESLIGA' | 'SERIE_A' | 'SELECT';
 
+const SPORTS: Sport[] = ['NBA', 'NFL', 'MLB', 'NHL', 'MLS', 'EPL', 'LALIGA', 'LIGUE_1', 'BUNDESLIGA', 'SERIE_A'];
+
 type LeaderboardEntry = {
     user_id: number;
+    clerk_id?: string;
     username: string;
     points: number;
 };
 
+// Rows per request on the boards /api/leaderboard/page serves (the overall one and a sport's
+// week): they come a page at a time however big the board gets. The summed views (all
+// sports in one week, one sport all time) have no index to page on and still come whole.
+const PAGE_SIZE = 50;
+
+const isPagedBoard = (sport: Sport, week: number | null) =>
+    sport === 'SELECT' ? week === 0 : week !== null && week > 0;
+
+// On a paged board, a user who is not loaded yet only matters once their new points put them
+// among the loaded rows; anyone below those comes with a later page anyway
+function climbedIntoView(rows: LeaderboardEntry[], missing: number[], entries: EntriesPatch['entries']) {
+    const lowest = rows.length > 0 ? Number(rows[rows.length - 1].points) : 0;
+    const points = new Map(entries.map(([userId, newPoints]) => [userId, newPoints]));
+    return missing.filter(userId => (points.get(userId) ?? 0) >= lowest);
+}
+
 const Leaderboard: React.FC = () => {
     const [leaderboard, setLeaderboard] = useState<LeaderboardEntry[]>([]);
     const [loading, setLoading] = useState(true);
@@ -20,6 +44,18 @@ const Leaderboard: React.FC = () => {
     const [selectedSport, setSelectedSport] = useState<Sport>("SELECT"); // Default to nba can be changed if needed
     const [selectedWeek, setSelectedWeek] = useState<number | null>(0); // Defaults to all time
     const [isInitialRender] = useState(true);
+    const [reloadCount, setReloadCount] = useState(0); // Bumped when a pushed change cannot be patched in
+    const [nextCursor, setNextCursor] = useState<string | null>(null); // Where the next page starts, if there is one
+    const [loadingMore, setLoadingMore] = useState(false);
+    const [me, setMe] = useState<LeaderboardEntry | null>(null); // The signed-in user's row when no loaded page has it
+    const { user } = useUser();
+    const clerkId = user?.id;
+    const leaderboardRef = useRef<LeaderboardEntry[]>([]);
+    leaderboardRef.current = leaderboard;
+    const hasMoreRef = useRef(false);
+    hasMoreRef.current = nextCursor !== null;
+    const boardRef = useRef('');
+    boardRef.current = `${selectedSport}-${selectedWeek}`;
 
     // Updating Weekly Items
     useEffect(() => {
@@ -42,21 +78,23 @@ const Leaderboard: React.FC = () => {
 
             setLoading(true);
             setError('');
+            setNextCursor(null);
 
             try {
 
-                const endpoint = selectedSport === 'SELECT'
-                    ? `/api/leaderboard-entries/getEntriesForLeaderboard?sport=${selectedSport}&week=${selectedWeek}`
-                    // new route for specific sport selection
-                    : `/api/user/getSportPoints?sport=${selectedSport}&week=${selectedWeek}`;
+                const endpoint = isPagedBoard(selectedSport, selectedWeek)
+                    ? `/api/leaderboard/page?sport=${selectedSport}&week=${selectedWeek}&limit=${PAGE_SIZE}`
+                    : selectedSport === 'SELECT'
+                        ? `/api/leaderboard-entries/getEntriesForLeaderboard?sport=${selectedSport}&week=${selectedWeek}`
+                        // new route for specific sport selection
+                        : `/api/user/getSportPoints?sport=${selectedSport}&week=${selectedWeek}`;
 
                 const res = await fetch(endpoint);
                 const data = await res.json();
 
-                console.log("API response:", data);
-
                 if (res.ok) {
                     setLeaderboard(data.data);
+                    setNextCursor(data.nextCursor ?? null);
                 } else {
                     setError(data.message || "Failed to load leaderboard");
                 }
@@ -71,7 +109,92 @@ const Leaderboard: React.FC = () => {
 
         // Force a fetch on initial render
         fetchLeaderboard();
-    }, [selectedSport, selectedWeek, isInitialRender]);
+    }, [selectedSport, selectedWeek, isInitialRender, reloadCount]);
+
+    // Scoring runs push what changed (leaderboardPush); the shown board is patched in place
+    // rather than fetched again. A single board takes the new points, a summed one
+    // (all sports in a week, one sport all time) adds the gains.
+    useEffect(() => {
+        if (selectedWeek === null || selectedWeek < 0 || currentWeek === null) return;
+
+        let channels: string[];
+        let mode: 'set' | 'add' = 'add';
+        if (selectedSport === 'SELECT') {
+            channels = selectedWeek === 0 ? [OVERALL_CHANNEL] : SPORTS.map(sport => boardChannel(sport, selectedWeek));
+            if (selectedWeek === 0) mode = 'set';
+        } else {
+            channels = [boardChannel(selectedSport, selectedWeek === 0 ? currentWeek : selectedWeek)];
+            if (selectedWeek !== 0) mode = 'set';
+        }
+
+        const pusher = new Pusher(process.env.NEXT_PUBLIC_PUSHER_KEY!, pusherClientOptions());
+        const subscriptions = channels.map(name => {
+            const channel = pusher.subscribe(name);
+            channel.bind(PATCH_EVENT, (patch: EntriesPatch) => {
+                const { rows, missing } = applyEntriesPatch(leaderboardRef.current, patch.entries, mode);
+                leaderboardRef.current = rows;
+                setLeaderboard(rows);
+                const unknown = hasMoreRef.current && mode === 'set' ? climbedIntoView(rows, missing, patch.entries) : missing;
+                if (unknown.length > 0) setReloadCount(count => count + 1);
+            });
+            channel.bind(RESET_EVENT, () => setReloadCount(count => count + 1));
+            return channel;
+        });
+
+        return () => {
+            subscriptions.forEach(channel => channel.unsubscribe());
+            pusher.disconnect();
+        };
+    }, [selectedSport, selectedWeek, currentWeek]);
+
+    // Where the signed-in user stands when they are further down than the loaded pages: one
+    // index-only count (/api/leaderboard/rank) instead of loading every page above them
+    const hasMore = nextCursor !== null;
+    const meLoaded = clerkId !== undefined && leaderboard.some(row => row.clerk_id === clerkId);
+    useEffect(() => {
+        setMe(null);
+        if (!clerkId || loading || !hasMore || meLoaded || !isPagedBoard(selectedSport, selectedWeek)) return;
+
+        let cancelled = false;
+        fetch(`/api/leaderboard/rank?sport=${selectedSport}&week=${selectedWeek}&clerk_id=${encodeURIComponent(clerkId)}`)
+            .then(res => (res.ok ? res.json() : null))
+            .then(data => {
+                if (!cancelled && data?.data?.length) setMe(data.data[0]);
+            })
+            .catch(error => console.error('Error fetching your rank:', error));
+        return () => {
+            cancelled = true;
+        };
+    }, [clerkId, loading, hasMore, meLoaded, selectedSport, selectedWeek]);
+
+    const loadMore = async () => {
+        if (!nextCursor || loadingMore) return;
+        const board = boardRef.current;
+        setLoadingMore(true);
+
+        try {
+            const res = await fetch(`/api/leaderboard/page?sport=${selectedSport}&week=${selectedWeek}&limit=${PAGE_SIZE}&cursor=${encodeURIComponent(nextCursor)}`);
+            const data = await res.json();
+            // The selection changed while the page was on its way
+            if (board !== boardRef.current) return;
+
+            if (res.ok) {
+                setLeaderboard(rows => {
+                    const loaded = new Set(rows.map(row => row.user_id));
+                    return [...rows, ...data.data.filter((row: LeaderboardEntry) => !loaded.has(row.user_id))];
+                });
+                setNextCursor(data.nextCursor ?? null);
+            } else {
+                setError(data.message || "Failed to load more of the leaderboard");
+            }
+        } catch (error) {
+            setError(`Network error fetching leaderboard: ${error}`);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
+    const shownRows = useMemo(() => (me ? [...leaderboard, me] : leaderboard), [leaderboard, me]);
 
     // recovery mechanism if loading gets stuck
     useEffect(() => {
@@ -210,11 +333,18 @@ const Leaderboard: React.FC = () => {
                                         <LeaderboardProfiles
                                             sport={selectedSport}
                                             week={selectedWeek}
-                                            userIds={leaderboard.map(entry => entry.user_id)}
-                                            userData={leaderboard}
+                                            userData={shownRows}
                                         />
                                     </div>
                                 )}
+                                {nextCursor && (
+                                    <button
+                                        className='w-full mt-4 accent-button text-white py-2 px-4 rounded-lg transition duration-200 text-sm sm:text-base'
+                                        disabled={loadingMore}
+                                        onClick={loadMore}>
+                                        {loadingMore ? 'Loading...' : 'Show more'}
+                                    </button>
+                                )}
                             </div>
                         )}
                     </div>
@@ -1,7 +1,7 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
 'use client'
 
-import React, { useCallback, useEffect, useState } from 'react';
+import React, { useCallback, useEffect, useRef, useState } from 'react';
 import Image from 'next/image'
 import styles from '../styles/leaderboardProfiles.module.css';
 
@@ -32,12 +32,10 @@ type Sport = 'NBA' | 'NFL' | 'MLB' | 'NHL' | 'MLS' | 'EPL' | 'LALIGA' | 'LIGUE_1
 interface leaderboardProfileProps {
     sport: Sport;
     week: number | null;
-    userIds: number[];
     userData?: any[];
 }
 
-//export default function LeaderboardProfiles({ userIds = []}: leaderboardProfileProps) {
-export default function LeaderboardProfiles({ sport, week, userIds = [], userData = [] }: leaderboardProfileProps) {
+export default function LeaderboardProfiles({ sport, week, userData = [] }: leaderboardProfileProps) {
     const [users, setUsers] = useState<user[]>([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState('');
@@ -46,104 +44,62 @@ export default function LeaderboardProfiles({ sport, week, userIds = [], userDat
     const [socialLinks, setSocialLinks] = useState<SocialLinks | null>(null);
     const [loadingSocial, setLoadingSocial] = useState(false);
 
+    // Rows come from the leaderboard's loaded pages. The performance column needs each user's
+    // all-time points: overall rows carry them already, otherwise they are fetched for the users
+    // not seen yet (or whose points moved), so loading another page asks about that page only.
+    const totals = useRef(new Map<number, number>());
+    const seenPoints = useRef(new Map<number, number>());
+
     useEffect(() => {
-		if (userData && userData.length > 0) {
-            const processedUsers = userData.map(user => ({
-                ...user,
-                imageUrl: user.imageUrl || "/default-profile.png"
-            }));
-            linkTotalPoints(processedUsers);
-
-            setUsers(processedUsers);
+        const rows: user[] = userData.map(user => ({
+            ...user,
+            imageUrl: user.imageUrl || "/default-profile.png"
+        }));
+        const overall = sport === 'SELECT' && week === 0;
+        rows.forEach(row => {
+            if (overall) {
+                totals.current.set(row.user_id, Number(row.points));
+            } else if (seenPoints.current.get(row.user_id) !== Number(row.points)) {
+                totals.current.delete(row.user_id);
+            }
+            seenPoints.current.set(row.user_id, Number(row.points));
+        });
+        const withTotals = () => rows.map(row => ({ ...row, totalPoints: totals.current.get(row.user_id) || 0 }));
+
+        const unknown = rows.map(row => row.user_id).filter(userId => !totals.current.has(userId));
+        if (unknown.length === 0) {
+            setUsers(withTotals());
             setLoading(false);
             return;
         }
 
-        if ((sport === 'SELECT' && (week === -1 || week === null)) || week === 0) {
-            if (userIds.length === 0) {
-                setLoading(false);
-                setError('No user_ids provided');
-                return;
-            }
-    
-            const fetchUsers = async () => {
-                try {
-                    const queryStr = `user_id=${userIds.join(',')}`;
-                    const res = await fetch(`/api/user/getUsersLeaderboard?${queryStr}`); // For total leaderboard
-                    const data = await res.json();
-    
-                    if (res.ok) {
-                        const updatedUsers = data.data.filter((user: user) => user.points !== 0).map((user: user) => ({
-                            ...user,
-                            imageUrl: user.imageUrl || "/default-profile.png",
-                        })) || [];
-    
-                        await linkTotalPoints(updatedUsers); // merge and set inside
-                    } else {
-                        setError(data.message || 'Users Fetch: Failed');
-                        setLoading(false);
-                    }
-                } catch (error) {
-                    setError(`Network error fetching users: ${error}`);
-                    setLoading(false);
-                }
-            };
-    
-            fetchUsers();
-        } else {
-            const fetchSpecificLeaderboardUsers = async () => {
-                try {
-                    const res = await fetch(`/api/leaderboard-entries/getEntriesForLeaderboard?sport=${sport}&week=${week}`);
-                    const data = await res.json();
-    
-                    if (res.ok) {
-                        const updatedUsers = data.data.filter((user: user) => user.points !== 0).map((user: user) => ({
-                            ...user,
-                            imageUrl: user.imageUrl || "/default-profile.png",
-                        })) || [];
-    
-                        await linkTotalPoints(updatedUsers);
-                    } else {
-                        setError(data.message || 'User Fetch for Specific Leaderboard: Failed');
-                        setLoading(false);
-                    }
-                } catch (error) {
-                    setError(`Network error fetching users for specific leaderboard: ${error}`);
-                    setLoading(false);
-                }
-            };
-    
-            fetchSpecificLeaderboardUsers();
-        }
-    
-        async function linkTotalPoints(baseUsers: user[]) {
+        let cancelled = false;
+        const linkTotalPoints = async () => {
             try {
-                const queryStr = `user_id=${userIds.join(',')}`;
-                const res = await fetch(`/api/user/getMultiUserPoints?${queryStr}`);
+                const res = await fetch(`/api/user/getMultiUserPoints?user_id=${unknown.join(',')}`);
                 const data = await res.json();
-    
+                if (cancelled) return;
+
                 if (res.ok) {
-                    const totalsMap = new Map<number, number>();
                     data.data.forEach((entry: { user_id: number; points: number }) => {
-                        totalsMap.set(entry.user_id, entry.points);
+                        totals.current.set(entry.user_id, entry.points);
                     });
-    
-                    const mergedUsers = baseUsers.map((u) => ({
-                        ...u,
-                        totalPoints: totalsMap.get(u.user_id) || 0,
-                    }));
-    
-                    setUsers(mergedUsers);
+                    setUsers(withTotals());
                 } else {
                     setError(data.message || 'Failed to fetch total points');
                 }
             } catch (error) {
                 setError(`Network error fetching total points: ${error}`);
             } finally {
-                setLoading(false);
+                if (!cancelled) setLoading(false);
             }
-        }
-    }, [sport, userData, userIds, week]);
+        };
+
+        linkTotalPoints();
+        return () => {
+            cancelled = true;
+        };
+    }, [sport, userData, week]);
 
     // Close profile popout when clicking outside
     useEffect(() => {
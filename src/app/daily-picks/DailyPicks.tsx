@@ -549,6 +549,9 @@ export default function DailyPicks() {
     const BestPickButton: React.FC<BestPickButtonProps> = ({ gameId, isSelected }) => (
         <div>
             <button
+                data-testid="best-pick"
+                data-game-id={gameId}
+                data-selected={isSelected}
                 onClick={() => handleBestPickSelect(gameId)}
                 className={`text-gray-400 hover:text-gray-600 ${isSelected ? "font-medium text-yellow-500" : ""}`}>
                 Best Pick ★
@@ -832,7 +835,7 @@ export default function DailyPicks() {
                     </div>
                     <div className="mt-4 inline-block">
                         <div className="bg-[#333] rounded-full px-4 py-2 text-sm">
-                            <span className="text-white">Today&apos;s {selectedSport} Games</span>
+                            <span data-testid="picks-title" className="text-white">Today&apos;s {selectedSport} Games</span>
                             <span className="text-gray-400 ml-2">All times ET</span>
                         </div>
                     </div>
@@ -889,7 +892,7 @@ export default function DailyPicks() {
                 </div>
                 <div className="mt-4 inline-block">
                     <div className="bg-[#333] rounded-full px-4 py-2 text-sm">
-                        <span className="text-white">Today&apos;s {selectedSport} Games</span>
+                        <span data-testid="picks-title" className="text-white">Today&apos;s {selectedSport} Games</span>
                         <span className="text-gray-400 ml-2">All times ET</span>
                     </div>
                 </div>
@@ -944,7 +947,7 @@ export default function DailyPicks() {
                             const homePercentage = parseFloat(pickPercentages[game.id]?.home) || 0;
                             const awayIsHigher = awayPercentage > homePercentage;
                             return (
-                                <div key={game.id} className={`bg-white rounded-lg shadow border ${gameIsLocked ? 'border-red-200' : 'border-gray-200'}`}>
+                                <div key={game.id} data-testid="pick-card" data-game-id={game.id} className={`bg-white rounded-lg shadow border ${gameIsLocked ? 'border-red-200' : 'border-gray-200'}`}>
                                     <div className="flex justify-between items-center p-3 border-b">
                                         <div className="text-sm text-gray-500">
                                             <span>{game.gameTime}</span>
@@ -983,6 +986,11 @@ export default function DailyPicks() {
                                     </div>
                                     <div className="p-4 space-y-3">
                                         <button
+                                            data-testid="pick-team"
+                                            data-game-id={game.id}
+                                            data-side="away"
+                                            data-team={game.awayTeam.name}
+                                            data-selected={selectedPicks.has(`${game.id}-away`)}
                                             onClick={() => handleTeamSelect(game.id, 'away')}
                                             disabled={gameIsLocked} // Disable when this specific game is locked
                                             className={`w-full flex items-center justify-between p-3 rounded-lg transition-all border 
@@ -1122,6 +1130,11 @@ export default function DailyPicks() {
                                         )}
 
                                         <button
+                                            data-testid="pick-team"
+                                            data-game-id={game.id}
+                                            data-side="home"
+                                            data-team={game.homeTeam.name}
+                                            data-selected={selectedPicks.has(`${game.id}-home`)}
                                             onClick={() => handleTeamSelect(game.id, 'home')}
                                             disabled={gameIsLocked} // Disable when this specific game is locked
                                             className={`w-full flex items-center justify-between p-3 rounded-lg transition-all border 
@@ -1266,6 +1279,7 @@ export default function DailyPicks() {
                                         ? 'bg-gray-600 text-gray-300 cursor-not-allowed'
                                         : 'accent-button text-white'
                                         }`}
+                                    data-testid="submit-picks"
                                     disabled={submitting}
                                     onClick={handleSubmitPicks}
                                 >
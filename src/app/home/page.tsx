@@ -347,6 +347,8 @@ export default function ContestsPage() {
                 {sortedSports.map(({ sport, logo }) => (
                     <button
                         key={sport}
+                        data-testid="sport-tab"
+                        data-sport={sport}
                         onClick={() => {
                             handleSportButtonClick(sport as 'NBA' | 'MLB' | 'NFL' | 'NHL' | 'Soccer');
                             if (sport !== 'Soccer') {
@@ -436,13 +438,16 @@ export default function ContestsPage() {
                                 games.length > 0 && (
                                     <div
                                         key={title}
+                                        data-testid="contest-card"
+                                        data-contest={tomorrow ? 'upcoming' : 'featured'}
+                                        data-sport={sport}
                                         className="rounded-lg sm:rounded-xl shadow-lg overflow-hidden bg-gradient-to-r from-white to-gray-100 dark:from-gray-900 dark:to-gray-950"
                                     >
                                         <div className="p-3 sm:p-4 md:p-8">
                                             <div className="uppercase tracking-wide text-xs sm:text-sm text-black dark:text-white font-semibold">
                                                 {tomorrow ? 'Upcoming Contest' : 'Featured Contest'}
                                             </div>
-                                            <h1 className="block mt-1 text-base sm:text-lg leading-tight font-medium text-black dark:text-white">
+                                            <h1 data-testid="contest-title" className="block mt-1 text-base sm:text-lg leading-tight font-medium text-black dark:text-white">
                                                 {title} ({games.length} games)
                                             </h1>
                                             <p className="mt-2 text-sm sm:text-base text-slate-500">
@@ -451,6 +456,7 @@ export default function ContestsPage() {
                                                     : `Make your picks for today's ${sport} matchups!`}
                                             </p>
                                             <button
+                                                data-testid="contest-play"
                                                 onClick={() =>
                                                     router.push(
                                                         `${tomorrow ? '/tomorrow-picks' : '/daily-picks'}?sport=${sport}`
@@ -469,18 +475,19 @@ export default function ContestsPage() {
                 })()
             ) : (
                 <div className="flex flex-col gap-3 sm:gap-4 md:gap-8 max-w-4xl mx-auto">
-                    <div className="rounded-lg sm:rounded-xl shadow-lg overflow-hidden bg-gradient-to-r from-white to-gray-100 dark:from-gray-900 dark:to-gray-950">
+                    <div data-testid="contest-card" data-contest="featured" data-sport={selectedSoccerLeague || selectedSport} className="rounded-lg sm:rounded-xl shadow-lg overflow-hidden bg-gradient-to-r from-white to-gray-100 dark:from-gray-900 dark:to-gray-950">
                         <div className="p-3 sm:p-4 md:p-8">
                             <div className="uppercase tracking-wide text-xs sm:text-sm text-black dark:text-white font-semibold">
                                 Featured Contest
                             </div>
-                            <h1 className="block mt-1 text-base sm:text-lg leading-tight font-medium text-black dark:text-white">
+                            <h1 data-testid="contest-title" className="block mt-1 text-base sm:text-lg leading-tight font-medium text-black dark:text-white">
                                 Today&apos;s {selectedSoccerLeague} {selectedSport} Games ({renderTodayGames().length} games)
                             </h1>
                             <p className="mt-2 text-sm sm:text-base text-slate-500">
                                 Make your picks for today&apos;s {selectedSport} matchups!
                             </p>
                             <button
+                                data-testid="contest-play"
                                 onClick={handleTodayPlayNow}
                                 className="mt-3 sm:mt-4 w-full accent-button text-white py-2 px-4 rounded-lg transition duration-200 text-sm sm:text-base"
                             >
@@ -489,18 +496,19 @@ export default function ContestsPage() {
                         </div>
                     </div>
 
-                    <div className="rounded-lg sm:rounded-xl shadow-lg overflow-hidden bg-gradient-to-r from-white to-gray-100 dark:from-gray-900 dark:to-gray-950">
+                    <div data-testid="contest-card" data-contest="upcoming" data-sport={selectedSoccerLeague || selectedSport} className="rounded-lg sm:rounded-xl shadow-lg overflow-hidden bg-gradient-to-r from-white to-gray-100 dark:from-gray-900 dark:to-gray-950">
                         <div className="p-3 sm:p-4 md:p-8">
                             <div className="uppercase tracking-wide text-xs sm:text-sm text-black dark:text-white font-semibold">
                                 Upcoming Contest
                             </div>
-                            <h1 className="block mt-1 text-base sm:text-lg leading-tight font-medium text-black dark:text-white">
+                            <h1 data-testid="contest-title" className="block mt-1 text-base sm:text-lg leading-tight font-medium text-black dark:text-white">
                                 Tomorrow&apos;s {selectedSoccerLeague} {selectedSport} Games ({renderTomorrowGames().length} games)
                             </h1>
                             <p className="mt-2 text-sm sm:text-base text-slate-500">
                                 Get ready for tomorrow&apos;s {selectedSport} matchups!
                             </p>
                             <button
+                                data-testid="contest-play"
                                 onClick={handleTomorrowPlayNow}
                                 className="mt-3 sm:mt-4 w-full accent-button text-white py-2 px-4 rounded-lg transition duration-200 text-sm sm:text-base"
                             >
@@ -9,10 +9,10 @@ import { Skeleton } from '../components/ui/skeleton';
 import { format, parseISO, compareDesc, formatDistanceToNow, isAfter } from 'date-fns';
 import { toZonedTime } from 'date-fns-tz';
 import { isTomorrow, isToday } from 'date-fns';
-import { PrismaClient } from '@prisma/client';
 import { PcCaseIcon } from 'lucide-react';
 import BackToTop from '../components/BackToTop';
-const prisma = new PrismaClient();
+import Pusher from 'pusher-js';
+import { GAMES_CHANNEL, GAMES_EVENT, GamesFinal, pusherClientOptions } from '@/lib/leaderboardPatch/leaderboardPatch';
 
 
 //TODO: Add a history button to the picks page
@@ -174,6 +174,34 @@ export default function MyPicksPage() {
         fetchGamesData();
     }, []);
 
+    // Results of finished games are pushed when they are scored (leaderboardPush); only the
+    // picks on those games change, so they are patched instead of fetching every pick again
+    useEffect(() => {
+        if (!isSignedIn) return;
+
+        const pusher = new Pusher(process.env.NEXT_PUBLIC_PUSHER_KEY!, pusherClientOptions());
+        const channel = pusher.subscribe(GAMES_CHANNEL);
+        channel.bind(GAMES_EVENT, ({ games }: GamesFinal) => {
+            const results = new Map(games.map(game => [game.id, game]));
+            setUserPicks(prev => {
+                if (!prev.some(pick => results.has(pick.Game.id))) return prev;
+                const updated = prev.map(pick => {
+                    const result = results.get(pick.Game.id);
+                    return result
+                        ? { ...pick, Game: { ...pick.Game, winner: result.winner, final_score: result.final_score, status: 'STATUS_FINAL' } }
+                        : pick;
+                });
+                setGroupedPicks(groupPicksByDate(updated));
+                return updated;
+            });
+        });
+
+        return () => {
+            channel.unsubscribe();
+            pusher.disconnect();
+        };
+    }, [isSignedIn]);
+
     // Set current week on component mount
     useEffect(() => {
         const week = getCurrentWeek();
@@ -636,32 +664,6 @@ export default function MyPicksPage() {
         }
     };
 
-    // 1. First, update your API endpoint that creates or updates games
-    // This would be in a separate file like src/app/api/games/route.ts
-    async function updateGameWithTime(gameId: string, gameDate: string, gameTime: string) {
-        try {
-            // Combine date and time into a single ISO string
-            const [year, month, day] = gameDate.split('-').map(Number);
-            const [hours, minutes] = gameTime.split(':').map(Number);
-
-            // Create a Date object in UTC
-            const gameDateTime = new Date(Date.UTC(year, month - 1, day, hours, minutes));
-
-            // Update the game in your database
-            await prisma.game.update({
-                where: { id: gameId },
-                data: {
-                    gameDate: gameDateTime.toISOString()
-                }
-            });
-
-            return { success: true };
-        } catch (error) {
-            //console.error("Error updating game time:", error);
-            return { success: false, error };
-        }
-    }
-
     // 2. In your UI, you might add a form to update game times
     // This could be in an admin component
     function GameTimeEditor({ game }: GameEditorProps) {
@@ -963,6 +965,10 @@ export default function MyPicksPage() {
                                         <div className="space-y-4">
                                             {groupedPicks[date].map((pick, index) => (
                                                 <div key={`${pick.gameId}-${index}`}
+                                                    data-testid="my-pick"
+                                                    data-game-id={pick.gameId}
+                                                    data-team={pick.teamIndex === 0 ? pick.Game.team1Name : pick.Game.team2Name}
+                                                    data-best-pick={pick.bestPick}
                                                     className="pick-item bg-gray-300/50 dark:bg-gray-800/50 p-4 rounded-lg">
                                                     <div className="pick-details flex items-center justify-between">
                                                         {/* Team 1 */}
@@ -1010,7 +1016,7 @@ export default function MyPicksPage() {
                                     </div>
                                 ))
                             ) : (
-                                <div className="text-center text-white text-xl font-bold bg-gray-800/50 p-4 rounded-lg">
+                                <div data-testid="my-picks-empty" className="text-center text-white text-xl font-bold bg-gray-800/50 p-4 rounded-lg">
                                     {isSignedIn
                                         ? `No picks made for ${selectedSport || 'this sport'}.`
                                         : "Sign in to make picks."}
@@ -303,6 +303,9 @@ export default function TomorrowPicks() {
     const BestPickButton: React.FC<BestPickButtonProps> = ({ gameId, isSelected }) => (
         <div>
             <button
+                data-testid="best-pick"
+                data-game-id={gameId}
+                data-selected={isSelected}
                 onClick={() => handleBestPickSelect(gameId)}
                 className={`text-gray-400 hover:text-gray-600 ${isSelected ? "font-medium text-yellow-500" : ""}`}>
                 Best Pick ★
@@ -415,7 +418,7 @@ export default function TomorrowPicks() {
                     </div>
                     <div className="mt-4 inline-block">
                         <div className="bg-[#333] rounded-full px-4 py-2 text-sm">
-                            <span className="text-white">Tomorrow&apos;s {selectedSport} Games</span>
+                            <span data-testid="picks-title" className="text-white">Tomorrow&apos;s {selectedSport} Games</span>
                             <span className="text-gray-400 ml-2">All times ET</span>
                         </div>
                     </div>
@@ -472,7 +475,7 @@ export default function TomorrowPicks() {
                 </div>
                 <div className="mt-4 inline-block">
                     <div className="bg-[#333] rounded-full px-4 py-2 text-sm">
-                        <span className="text-white">Tomorrow&apos;s {selectedSport} Games</span>
+                        <span data-testid="picks-title" className="text-white">Tomorrow&apos;s {selectedSport} Games</span>
                         <span className="text-gray-400 ml-2">All times ET</span>
                     </div>
                 </div>
@@ -492,7 +495,7 @@ export default function TomorrowPicks() {
                             const homePercentage = parseFloat(pickPercentages[game.id]?.home) || 0;
                             const awayIsHigher = awayPercentage > homePercentage;
                             return (
-                                <div key={game.id} className="bg-white rounded-lg shadow border border-gray-200">
+                                <div key={game.id} data-testid="pick-card" data-game-id={game.id} className="bg-white rounded-lg shadow border border-gray-200">
                                     <div className="flex justify-between items-center p-3 border-b">
                                         <div className="text-sm text-gray-500">
                                             <span>{game.gameTime}</span>
@@ -526,6 +529,11 @@ export default function TomorrowPicks() {
                                     </div>
                                     <div className="p-4 space-y-3">
                                         <button
+                                            data-testid="pick-team"
+                                            data-game-id={game.id}
+                                            data-side="away"
+                                            data-team={game.awayTeam.name}
+                                            data-selected={selectedPicks.has(`${game.id}-away`)}
                                             onClick={() => handleTeamSelect(game.id, 'away')}
                                             className={`w-full flex items-center justify-between p-3 rounded-lg transition-all border ${selectedPicks.has(`${game.id}-away`)
                                                 ? 'accent-bg-light border-2 accent-border'
@@ -661,6 +669,11 @@ export default function TomorrowPicks() {
                                         )}
 
                                         <button
+                                            data-testid="pick-team"
+                                            data-game-id={game.id}
+                                            data-side="home"
+                                            data-team={game.homeTeam.name}
+                                            data-selected={selectedPicks.has(`${game.id}-home`)}
                                             onClick={() => handleTeamSelect(game.id, 'home')}
                                             className={`w-full flex items-center justify-between p-3 rounded-lg transition-all border ${selectedPicks.has(`${game.id}-home`)
                                                 ? 'accent-bg-light border-2 accent-border'
@@ -802,6 +815,7 @@ export default function TomorrowPicks() {
                                         ? 'bg-gray-600 text-gray-300 cursor-not-allowed'
                                         : 'accent-button text-white'
                                         }`}
+                                    data-testid="submit-picks"
                                     disabled={submitting}
                                     onClick={handleSubmitPicks}
                                 >
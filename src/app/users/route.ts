@@ -0,0 +1,16 @@
+import { NextResponse } from "next/server";
+import { sql } from "@/lib/dbPool/dbPool";
+import { withServerTiming } from "@/lib/serverTiming/serverTiming";
+
+// A user by username, e.g. /users?username=John. Served here rather than from server.js so it
+// goes through the shared pool and its connection limit.
+export const GET = withServerTiming(async function GET(req: Request) {
+  const username = new URL(req.url).searchParams.get("username");
+  try {
+    const result = await sql`SELECT * FROM Users WHERE username = ${username}`;
+    return NextResponse.json(result.rows);
+  } catch (err) {
+    console.error(err);
+    return NextResponse.json({ error: "Database error" }, { status: 500 });
+  }
+});
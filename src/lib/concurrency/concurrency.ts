@@ -0,0 +1,10 @@
+// Runs task over items with at most `limit` running at once
+export async function forEachWithConcurrency<T>(items: T[], limit: number, task: (item: T) => Promise<void>) {
+    let next = 0;
+    const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+        while (next < items.length) {
+            await task(items[next++]);
+        }
+    });
+    await Promise.all(workers);
+}
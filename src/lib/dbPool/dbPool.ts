@@ -0,0 +1,199 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { Pool, PoolClient, QueryResult, QueryResultRow } from 'pg';
+import { recordSpan } from '@/lib/serverTiming/serverTiming';
+
+export type SlowQuery = {
+    text: string;
+    ms: number;
+    at: string;
+};
+
+// Every route shares this one pool, so these bound the app's connections to Postgres per
+// server instance. A pick-deadline burst queues for a connection (waiting) instead of
+// opening more; the statement timeout keeps one stuck query from holding a slot forever.
+const POOL_MAX = Number(process.env.DB_POOL_MAX) || 10;
+const IDLE_TIMEOUT_MS = Number(process.env.DB_POOL_IDLE_TIMEOUT_MS) || 10 * 1000;
+const CONNECT_TIMEOUT_MS = Number(process.env.DB_POOL_CONNECT_TIMEOUT_MS) || 10 * 1000;
+const STATEMENT_TIMEOUT_MS = Number(process.env.DB_STATEMENT_TIMEOUT_MS) || 15 * 1000;
+const SLOW_QUERY_MS = Number(process.env.DB_SLOW_QUERY_MS) || 500;
+
+// How many of the latest slow queries the stats keep
+const SLOW_LOG_SIZE = 50;
+
+let pool: Pool | undefined;
+
+const acquire = { count: 0, errors: 0, totalMs: 0, maxMs: 0, peakWaiting: 0 };
+const queries = { count: 0, errors: 0, totalMs: 0, slow: 0 };
+const slowLog: SlowQuery[] = [];
+const instrumented = new WeakSet<PoolClient>();
+
+// TLS to Postgres. An sslmode in the connection string decides (pg reads it, e.g.
+// sslmode=disable for a local database). Without one, DB_SSL does: "disable" for no TLS,
+// "no-verify" for TLS that accepts any server certificate, and by default TLS with the
+// certificate verified.
+export function dbSslConfig(connectionString = '', flag = process.env.DB_SSL) {
+    if (/[?&]sslmode=/.test(connectionString)) return undefined;
+    switch (flag) {
+        case 'disable':
+            return false;
+        case 'no-verify':
+            return { rejectUnauthorized: false };
+        default:
+            return { rejectUnauthorized: true };
+    }
+}
+
+// Created on first use so importing a route (next build) does not need a database
+function sharedPool() {
+    if (!pool) {
+        const connectionString = process.env.POSTGRES_URL ?? process.env.POSTGRES_PRISMA_URL;
+        pool = new Pool({
+            connectionString,
+            ssl: dbSslConfig(connectionString),
+            max: POOL_MAX,
+            idleTimeoutMillis: IDLE_TIMEOUT_MS,
+            connectionTimeoutMillis: CONNECT_TIMEOUT_MS,
+            statement_timeout: STATEMENT_TIMEOUT_MS,
+            application_name: 'tallysight',
+        });
+        // An idle client losing its connection must not take the server down
+        pool.on('error', (error) => console.error('Idle database client error:', error));
+    }
+    return pool;
+}
+
+function recordQuery(text: string, started: number, failed: boolean) {
+    const elapsed = Date.now() - started;
+    queries.count++;
+    queries.totalMs += elapsed;
+    if (failed) queries.errors++;
+    if (elapsed >= SLOW_QUERY_MS) {
+        queries.slow++;
+        const statement = text.replace(/\s+/g, ' ').trim().slice(0, 200);
+        slowLog.push({ text: statement, ms: elapsed, at: new Date().toISOString() });
+        if (slowLog.length > SLOW_LOG_SIZE) slowLog.shift();
+        console.warn(`Slow query (${elapsed} ms): ${statement}`);
+    }
+}
+
+// Times every promise-returning query of a pooled client. Clients are reused, so each one is
+// wrapped once.
+function instrument(client: PoolClient) {
+    if (instrumented.has(client)) return client;
+    instrumented.add(client);
+
+    const query = client.query.bind(client) as (...args: unknown[]) => unknown;
+    client.query = ((...args: unknown[]) => {
+        const result = query(...args);
+        if (!(result instanceof Promise)) return result;
+
+        const text = typeof args[0] === 'string' ? args[0] : String((args[0] as { text?: string })?.text ?? '');
+        const started = Date.now();
+        const start = performance.now();
+        return result.then(
+            (value) => {
+                recordSpan('db', start);
+                recordQuery(text, started, false);
+                return value;
+            },
+            (error) => {
+                recordSpan('db', start);
+                recordQuery(text, started, true);
+                throw error;
+            }
+        );
+    }) as PoolClient['query'];
+    return client;
+}
+
+// A client from the shared pool; release() it in a finally block
+async function connect(): Promise<PoolClient> {
+    const shared = sharedPool();
+    const started = Date.now();
+    const start = performance.now();
+    try {
+        const pending = shared.connect();
+        // A full pool queues the request synchronously, so this counts it
+        acquire.peakWaiting = Math.max(acquire.peakWaiting, shared.waitingCount);
+        return instrument(await pending);
+    } catch (error) {
+        acquire.errors++;
+        throw error;
+    } finally {
+        // Time spent waiting for a connection, separate from the queries it then runs
+        recordSpan('db-acquire', start);
+        const elapsed = Date.now() - started;
+        acquire.count++;
+        acquire.totalMs += elapsed;
+        acquire.maxMs = Math.max(acquire.maxMs, elapsed);
+    }
+}
+
+// One statement on a pooled client, released right after
+async function query<R extends QueryResultRow = any>(text: string, params?: unknown[]): Promise<QueryResult<R>> {
+    const client = await connect();
+    try {
+        return await client.query<R>(text, params);
+    } finally {
+        client.release();
+    }
+}
+
+// Same shape as @vercel/postgres: db.connect() for transactions and several statements
+export const db = { connect, query };
+
+// Tagged template like @vercel/postgres's sql: values become $n parameters
+export function sql<R extends QueryResultRow = any>(
+    strings: TemplateStringsArray,
+    ...values: unknown[]
+): Promise<QueryResult<R>> {
+    const text = strings.reduce((out, part, i) => `${out}$${i}${part}`);
+    return query<R>(text, values);
+}
+
+// Pool occupancy plus acquire and query timings, for monitoring (GET /api/db-pool)
+export function dbPoolStats() {
+    const total = pool?.totalCount ?? 0;
+    const idle = pool?.idleCount ?? 0;
+    return {
+        total,
+        active: total - idle,
+        idle,
+        waiting: pool?.waitingCount ?? 0,
+        acquire: {
+            count: acquire.count,
+            errors: acquire.errors,
+            avgMs: acquire.count ? Math.round(acquire.totalMs / acquire.count) : 0,
+            maxMs: acquire.maxMs,
+            peakWaiting: acquire.peakWaiting,
+        },
+        queries: {
+            count: queries.count,
+            errors: queries.errors,
+            avgMs: queries.count ? Math.round(queries.totalMs / queries.count) : 0,
+            slow: queries.slow,
+        },
+        slowQueries: [...slowLog],
+        config: {
+            max: POOL_MAX,
+            idleTimeoutMs: IDLE_TIMEOUT_MS,
+            connectTimeoutMs: CONNECT_TIMEOUT_MS,
+            statementTimeoutMs: STATEMENT_TIMEOUT_MS,
+            slowQueryMs: SLOW_QUERY_MS,
+        },
+    };
+}
+
+// Closes the shared pool so a script can exit (prisma/setup.ts)
+export async function closeDbPool() {
+    const closing = pool;
+    pool = undefined;
+    await closing?.end();
+}
+
+// Zeroes the counters and forgets the slow queries (tests and benchmarks)
+export function resetDbPoolStats() {
+    Object.assign(acquire, { count: 0, errors: 0, totalMs: 0, maxMs: 0, peakWaiting: 0 });
+    Object.assign(queries, { count: 0, errors: 0, totalMs: 0, slow: 0 });
+    slowLog.length = 0;
+}
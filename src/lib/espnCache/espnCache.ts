@@ -0,0 +1,160 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { BASE_URLS } from '@/app/api/all-espn-games/baseUrls';
+import { timed } from '@/lib/serverTiming/serverTiming';
+
+export type EspnResult = {
+    ok: boolean;
+    status: number;
+    data: any;
+};
+
+type Entry = { result: EspnResult; expires: number };
+
+type Counters = { hits: number; misses: number; coalesced: number };
+
+// Scoreboards for today and later change while games are played; past days (and team lists) are final
+const LIVE_TTL_MS = Number(process.env.ESPN_CACHE_LIVE_TTL_MS) || 15 * 1000;
+const PAST_TTL_MS = Number(process.env.ESPN_CACHE_PAST_TTL_MS) || 6 * 60 * 60 * 1000;
+const MAX_ENTRIES = Number(process.env.ESPN_CACHE_MAX_ENTRIES) || 500;
+
+const entries = new Map<string, Entry>();
+const inFlight = new Map<string, Promise<EspnResult>>();
+
+const bySport: Record<string, Counters> = {};
+const upstream = { calls: 0, errors: 0, totalMs: 0, maxMs: 0 };
+
+function counters(sport: string) {
+    return (bySport[sport] ??= { hits: 0, misses: 0, coalesced: 0 });
+}
+
+// Today's date in ESPN's YYYYMMDD format, on the East Coast like the rest of the app
+function todayEst(now = new Date()) {
+    return now.toLocaleDateString('en-CA', { timeZone: 'America/New_York' }).replace(/-/g, '');
+}
+
+function ttlFor(dates?: string) {
+    return dates && dates < todayEst() ? PAST_TTL_MS : LIVE_TTL_MS;
+}
+
+async function fetchUpstream(url: string): Promise<EspnResult> {
+    const started = Date.now();
+    upstream.calls++;
+    try {
+        // Our cache decides freshness, so keep Next's data cache out of it
+        const response = await timed('espn', () => fetch(url, {
+            headers: {
+                Accept: 'application/json',
+                'Content-Type': 'application/json',
+            },
+            cache: 'no-store',
+        }));
+        if (!response.ok) {
+            upstream.errors++;
+            return { ok: false, status: response.status, data: null };
+        }
+        return { ok: true, status: response.status, data: await response.json() };
+    } catch (error) {
+        upstream.errors++;
+        throw error;
+    } finally {
+        const elapsed = Date.now() - started;
+        upstream.totalMs += elapsed;
+        upstream.maxMs = Math.max(upstream.maxMs, elapsed);
+    }
+}
+
+function store(key: string, result: EspnResult, ttl: number) {
+    const now = Date.now();
+    if (entries.size >= MAX_ENTRIES) {
+        for (const [k, entry] of entries) {
+            if (entry.expires <= now) entries.delete(k);
+        }
+        // Still full: drop the oldest entries (Maps iterate in insertion order)
+        for (const k of entries.keys()) {
+            if (entries.size < MAX_ENTRIES) break;
+            entries.delete(k);
+        }
+    }
+    entries.set(key, { result, expires: now + ttl });
+}
+
+// Serves `url` from the cache while fresh. Concurrent misses for the same key share one
+// upstream request, and only successful responses are cached.
+async function cached(sport: string, key: string, url: string, ttl: number): Promise<EspnResult> {
+    const stats = counters(sport);
+    const entry = entries.get(key);
+    if (entry && entry.expires > Date.now()) {
+        stats.hits++;
+        return entry.result;
+    }
+
+    const pending = inFlight.get(key);
+    if (pending) {
+        stats.coalesced++;
+        return pending;
+    }
+
+    stats.misses++;
+    const request = fetchUpstream(url)
+        .then((result) => {
+            if (result.ok) store(key, result, ttl);
+            return result;
+        })
+        .finally(() => inFlight.delete(key));
+    inFlight.set(key, request);
+    return request;
+}
+
+// A league's scoreboard, for one day (YYYYMMDD) or ESPN's current slate when `dates` is omitted
+export function getScoreboard(sport: string, dates?: string): Promise<EspnResult> {
+    const baseUrl = BASE_URLS[sport];
+    if (!baseUrl) throw new Error(`Unsupported sport: ${sport}`);
+
+    const url = dates ? `${baseUrl}/scoreboard?dates=${dates}` : `${baseUrl}/scoreboard`;
+    return cached(sport, `${sport}:scoreboard:${dates ?? 'current'}`, url, ttlFor(dates));
+}
+
+export function getScoreboardEvent(sport: string, eventId: string): Promise<EspnResult> {
+    const baseUrl = BASE_URLS[sport];
+    if (!baseUrl) throw new Error(`Unsupported sport: ${sport}`);
+
+    return cached(sport, `${sport}:event:${eventId}`, `${baseUrl}/scoreboard/events/${eventId}`, LIVE_TTL_MS);
+}
+
+// A league's teams, which change about as rarely as past scoreboards
+export function getTeams(sport: string): Promise<EspnResult> {
+    const baseUrl = BASE_URLS[sport];
+    if (!baseUrl) throw new Error(`Unsupported sport: ${sport}`);
+
+    return cached(sport, `${sport}:teams`, `${baseUrl}/teams`, PAST_TTL_MS);
+}
+
+export function espnCacheStats() {
+    const totals = Object.values(bySport).reduce(
+        (sum, c) => ({ hits: sum.hits + c.hits, misses: sum.misses + c.misses, coalesced: sum.coalesced + c.coalesced }),
+        { hits: 0, misses: 0, coalesced: 0 }
+    );
+    const requests = totals.hits + totals.misses + totals.coalesced;
+    return {
+        ...totals,
+        hitRate: requests ? Number(((totals.hits + totals.coalesced) / requests).toFixed(4)) : 0,
+        entries: entries.size,
+        inFlight: inFlight.size,
+        upstream: {
+            calls: upstream.calls,
+            errors: upstream.errors,
+            avgMs: upstream.calls ? Math.round(upstream.totalMs / upstream.calls) : 0,
+            maxMs: upstream.maxMs,
+        },
+        bySport,
+        ttlMs: { live: LIVE_TTL_MS, past: PAST_TTL_MS },
+    };
+}
+
+// Empties the cache and zeroes the counters (tests and benchmarks)
+export function clearEspnCache() {
+    entries.clear();
+    inFlight.clear();
+    for (const sport of Object.keys(bySport)) delete bySport[sport];
+    Object.assign(upstream, { calls: 0, errors: 0, totalMs: 0, maxMs: 0 });
+}
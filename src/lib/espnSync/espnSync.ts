@@ -0,0 +1,379 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { createHash } from 'crypto';
+import type { PoolClient } from 'pg';
+
+// A completed ESPN event, reduced to what the sync writes
+export type SyncEvent = {
+    espnId: string;
+    sport: string;
+    home: string;
+    away: string;
+    homeScore: number;
+    awayScore: number;
+    days: string[]; // YYYY-MM-DD on the East Coast, where savePicks dates games, then in UTC
+    hash: string;
+};
+
+export type SyncResult = {
+    id?: string;
+    espnId: string;
+    status: 'updated' | 'current' | 'not_found' | 'invalid_data';
+    message: string;
+};
+
+export type SyncStats = {
+    events: number;
+    unchanged: number;  // same content as the last sync, skipped
+    updated: number;
+    current: number;    // matched, but the game already had this result
+    not_found: number;
+    invalid_data: number;
+    writes: { games: number; state: number };
+};
+
+type GameRow = {
+    id: string;
+    team1Name: string;
+    team2Name: string;
+    gameDate: string | Date;
+    sport: string;
+    syncedEvent?: string | null; // the event an earlier sync matched the game with
+};
+
+// Longest range one scoreboard request covers when syncing a date range, and the longest
+// range a sync takes (a season and then some)
+export const SYNC_WINDOW_DAYS = 7;
+export const MAX_SYNC_DAYS = 400;
+
+// The content hash of every event synced into a game. Rows go with their game, so a
+// deleted and re-created game is synced again. The table is in prisma/schema.prisma; this
+// copy only creates it on databases that were not pushed (benchmarks).
+export const SYNC_STATE_SCHEMA_SQL = `
+CREATE TABLE IF NOT EXISTS espn_sync_state (
+    sport TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    game_id TEXT NOT NULL REFERENCES "Game"(id) ON DELETE CASCADE,
+    synced_at TIMESTAMPTZ(6) NOT NULL DEFAULT now(),
+    PRIMARY KEY (sport, event_id)
+);
+CREATE INDEX IF NOT EXISTS espn_sync_state_game_idx ON espn_sync_state (game_id);
+`;
+
+export const SYNCED_HASHES_SQL = `
+    SELECT s.sport, s.event_id, s.content_hash
+    FROM espn_sync_state s
+    JOIN unnest($1::text[], $2::text[]) AS e(sport, event_id) USING (sport, event_id)
+`;
+
+// Games an event may belong to: its own ID, or a game of the same sport on one of its days
+export const CANDIDATE_GAMES_SQL = `
+    SELECT g.id, g."team1Name", g."team2Name", to_char(g."gameDate", 'YYYY-MM-DD') AS "gameDate", g.sport,
+           (SELECT MIN(s.event_id) FROM espn_sync_state s WHERE s.game_id = g.id) AS "syncedEvent"
+    FROM "Game" g
+    WHERE g.id = ANY($1::text[])
+       OR (g."gameDate" = ANY($2::date[]) AND g.sport = ANY($3::text[]))
+`;
+
+// Only rows whose result actually changes are written
+export const UPDATE_GAMES_SQL = `
+    UPDATE "Game" g
+    SET winner = u.winner, won = u.winner, final_score = u.final_score
+    FROM unnest($1::text[], $2::boolean[], $3::text[]) AS u(id, winner, final_score)
+    WHERE g.id = u.id
+      AND (g.winner IS DISTINCT FROM u.winner
+           OR g.won IS DISTINCT FROM u.winner
+           OR g.final_score IS DISTINCT FROM u.final_score)
+    RETURNING g.id
+`;
+
+export const SAVE_HASHES_SQL = `
+    INSERT INTO espn_sync_state (sport, event_id, content_hash, game_id)
+    SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[])
+    ON CONFLICT (sport, event_id) DO UPDATE
+    SET content_hash = EXCLUDED.content_hash, game_id = EXCLUDED.game_id, synced_at = now()
+    WHERE espn_sync_state.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+       OR espn_sync_state.game_id IS DISTINCT FROM EXCLUDED.game_id
+`;
+
+// Common team name mappings
+const teamMappings: Record<string, string[]> = {
+    lakers: ['los angeles lakers', 'la lakers'],
+    clippers: ['los angeles clippers', 'la clippers'],
+    warriors: ['golden state warriors', 'golden state'],
+    knicks: ['new york knicks', 'new york'],
+    nets: ['brooklyn nets', 'brooklyn'],
+    celtics: ['boston celtics', 'boston'],
+    bulls: ['chicago bulls', 'chicago'],
+    heat: ['miami heat', 'miami'],
+    bucks: ['milwaukee bucks', 'milwaukee'],
+    magic: ['orlando magic', 'orlando'],
+    pistons: ['detroit pistons', 'detroit'],
+    pacers: ['indiana pacers', 'indiana'],
+    hawks: ['atlanta hawks', 'atlanta'],
+    wizards: ['washington wizards', 'washington'],
+    raptors: ['toronto raptors', 'toronto'],
+    hornets: ['charlotte hornets', 'charlotte'],
+    rockets: ['houston rockets', 'houston'],
+    pelicans: ['new orleans pelicans', 'new orleans'],
+    spurs: ['san antonio spurs', 'san antonio'],
+    mavericks: ['dallas mavericks', 'dallas'],
+    nuggets: ['denver nuggets', 'denver'],
+    timberwolves: ['minnesota timberwolves', 'minnesota'],
+    thunder: ['oklahoma city thunder', 'oklahoma city', 'okc'],
+    'trail blazers': ['portland trail blazers', 'portland'],
+    jazz: ['utah jazz', 'utah'],
+    suns: ['phoenix suns', 'phoenix'],
+    kings: ['sacramento kings', 'sacramento'],
+    grizzlies: ['memphis grizzlies', 'memphis'],
+    '76ers': ['philadelphia 76ers', 'philadelphia', 'philly'],
+    cavaliers: ['cleveland cavaliers', 'cleveland'],
+};
+
+// Every known spelling of a team, built once, so resolving a name is a map lookup
+const TEAM_ALIASES = new Map<string, string>(
+    Object.entries(teamMappings).flatMap(([key, variations]) => [[key, key], ...variations.map((v) => [v, key])] as [string, string][])
+);
+
+export function normalizeTeamName(name: string): string {
+    return (name || '')
+        .normalize('NFD')
+        .replace(/[\u0300-\u036f]/g, '')
+        .toLowerCase()
+        .replace(/^the /, '')
+        .replace(/[^a-z0-9]+/g, ' ')
+        .trim();
+}
+
+const teamKeys = new Map<string, string>();
+
+// One key per team: "LA Lakers", "Los Angeles Lakers" and "Lakers" all give "lakers".
+// Names no mapping knows are keyed by their normalized form.
+export function teamKey(name: string): string {
+    let key = teamKeys.get(name);
+    if (key === undefined) {
+        const normalized = normalizeTeamName(name);
+        const words = normalized.split(' ');
+        const nickname = [words.slice(-2).join(' '), words[words.length - 1]].find((n) => TEAM_ALIASES.get(n) === n);
+        key = TEAM_ALIASES.get(normalized) ?? nickname ?? normalized;
+        teamKeys.set(name, key);
+    }
+    return key;
+}
+
+// How well a team name from the database fits one from ESPN: 2 for the same team key,
+// 1 when one name is contained in the other ("Bruins" and "Boston Bruins")
+function fit(dbName: string, espnName: string): number {
+    const a = teamKey(dbName);
+    const b = teamKey(espnName);
+    if (a === b) return 2;
+    return ` ${a} `.includes(` ${b} `) || ` ${b} `.includes(` ${a} `) ? 1 : 0;
+}
+
+function day(value: string | Date): string {
+    return typeof value === 'string' ? value.slice(0, 10) : value.toISOString().slice(0, 10);
+}
+
+function parseDay(value: string): Date | null {
+    if (!/^\d{8}$/.test(value)) return null;
+    const date = new Date(Date.UTC(+value.slice(0, 4), +value.slice(4, 6) - 1, +value.slice(6, 8)));
+    return formatDay(date) === value ? date : null;
+}
+
+function formatDay(date: Date): string {
+    return date.toISOString().slice(0, 10).replace(/-/g, '');
+}
+
+// The scoreboard `dates` to fetch: yesterday, today and tomorrow on the West Coast when
+// `value` is omitted, a single YYYYMMDD day, or a YYYYMMDD-YYYYMMDD range split into
+// windows of SYNC_WINDOW_DAYS. Null when `value` is none of these.
+export function syncDates(value?: string, now = new Date()): string[] | null {
+    if (value === undefined) {
+        return [-1, 0, 1].map((shift) => {
+            const date = new Date(now);
+            date.setDate(date.getDate() + shift);
+            return date.toLocaleDateString('en-CA', { timeZone: 'America/Los_Angeles' }).replace(/-/g, '');
+        });
+    }
+
+    const [first, last = first, ...rest] = String(value).split('-');
+    const start = parseDay(first);
+    const end = parseDay(last);
+    if (!start || !end || rest.length || end < start) return null;
+    if (first === last) return [first];
+
+    const days = Math.round((end.getTime() - start.getTime()) / 86400000) + 1;
+    if (days > MAX_SYNC_DAYS) return null;
+    const windows = [];
+    for (let offset = 0; offset < days; offset += SYNC_WINDOW_DAYS) {
+        const from = formatDay(new Date(start.getTime() + offset * 86400000));
+        const to = formatDay(new Date(start.getTime() + (Math.min(offset + SYNC_WINDOW_DAYS, days) - 1) * 86400000));
+        windows.push(from === to ? from : `${from}-${to}`);
+    }
+    return windows;
+}
+
+// A completed event as the sync sees it, or null when it is still being played. The hash
+// covers only what ends up in "Game", so odds or records changing do not count as news.
+export function readEvent(event: any, sport: string): SyncEvent | null {
+    if (event?.status?.type?.completed !== true) return null;
+
+    const competitors = event.competitions?.[0]?.competitors ?? [];
+    const home = competitors.find((c: any) => c.homeAway === 'home');
+    const away = competitors.find((c: any) => c.homeAway === 'away');
+    const start = new Date(event.date);
+    const days = isNaN(start.getTime())
+        ? []
+        : [...new Set([start.toLocaleDateString('en-CA', { timeZone: 'America/New_York' }), start.toISOString().slice(0, 10)])];
+
+    const synced = {
+        espnId: String(event.id),
+        sport,
+        home: home?.team?.displayName ?? '',
+        away: away?.team?.displayName ?? '',
+        homeScore: parseInt(home?.score),
+        awayScore: parseInt(away?.score),
+        days,
+    };
+    const hash = createHash('sha1').update(JSON.stringify(synced)).digest('hex');
+    return { ...synced, hash };
+}
+
+// Finds games by ID, or by sport, day and both team keys, without comparing every event
+// with every game
+export function indexGames(games: GameRow[]) {
+    const byId = new Map<string, GameRow>();
+    const byTeams = new Map<string, GameRow[]>();
+    const byDay = new Map<string, GameRow[]>();
+    const push = (map: Map<string, GameRow[]>, key: string, game: GameRow) => {
+        const list = map.get(key);
+        if (list) list.push(game);
+        else map.set(key, [game]);
+    };
+
+    for (const game of games) {
+        byId.set(game.id, game);
+        const slot = `${game.sport}|${day(game.gameDate)}`;
+        const [a, b] = [teamKey(game.team1Name), teamKey(game.team2Name)].sort();
+        push(byTeams, `${slot}|${a}|${b}`, game);
+        push(byDay, slot, game);
+    }
+    return { byId, byTeams, byDay };
+}
+
+// `claimed` holds the games already taken in this run, including every game that a pending
+// event owns by ID, so a doubleheader's second event cannot take the first one's game
+function findGame(index: ReturnType<typeof indexGames>, event: SyncEvent, claimed: Set<string>): GameRow | undefined {
+    const own = index.byId.get(event.espnId);
+    if (own && own.sport === event.sport) return own;
+
+    // Nor one an earlier sync gave to another event
+    const free = (g: GameRow) => !claimed.has(g.id) && (!g.syncedEvent || g.syncedEvent === event.espnId);
+
+    const [a, b] = [teamKey(event.home), teamKey(event.away)].sort();
+    for (const d of event.days) {
+        const game = index.byTeams.get(`${event.sport}|${d}|${a}|${b}`)?.find(free);
+        if (game) return game;
+    }
+
+    // Names without a shared key ("Bruins" against "Boston Bruins"): only that day's games
+    for (const d of event.days) {
+        const game = index.byDay.get(`${event.sport}|${d}`)?.find((g) => free(g) && (
+            (fit(g.team1Name, event.home) && fit(g.team2Name, event.away)) ||
+            (fit(g.team1Name, event.away) && fit(g.team2Name, event.home))
+        ));
+        if (game) return game;
+    }
+    return undefined;
+}
+
+// Writes the results of `events` into their games. Events whose hash matches the last sync
+// are skipped unless `force` is set; the rest are matched in memory against one query's
+// worth of candidate games and written with one UPDATE and one upsert.
+export async function syncEvents(client: PoolClient, events: SyncEvent[], force = false) {
+    // An event can show up on two scoreboards (a date range and a single day)
+    const unique = [...new Map(events.map((e) => [`${e.sport}|${e.espnId}`, e])).values()];
+    const stats: SyncStats = {
+        events: unique.length, unchanged: 0, updated: 0, current: 0, not_found: 0, invalid_data: 0,
+        writes: { games: 0, state: 0 },
+    };
+
+    let pending = unique;
+    if (!force && unique.length) {
+        const { rows } = await client.query(SYNCED_HASHES_SQL, [unique.map((e) => e.sport), unique.map((e) => e.espnId)]);
+        const synced = new Map(rows.map((r) => [`${r.sport}|${r.event_id}`, r.content_hash]));
+        pending = unique.filter((e) => synced.get(`${e.sport}|${e.espnId}`) !== e.hash);
+        stats.unchanged = unique.length - pending.length;
+    }
+    if (!pending.length) return { results: [] as SyncResult[], stats };
+
+    const { rows: games } = await client.query(CANDIDATE_GAMES_SQL, [
+        pending.map((e) => e.espnId),
+        [...new Set(pending.flatMap((e) => e.days))],
+        [...new Set(pending.map((e) => e.sport))],
+    ]);
+    const index = indexGames(games);
+
+    const claimed = new Set(pending.filter((e) => index.byId.get(e.espnId)?.sport === e.sport).map((e) => e.espnId));
+    const matched: { result: SyncResult; event: SyncEvent; gameId: string; winner: boolean; finalScore: string }[] = [];
+    const results = pending.map((event): SyncResult => {
+        const game = findGame(index, event, claimed);
+        if (!game) {
+            return {
+                espnId: event.espnId,
+                status: 'not_found',
+                message: `No matching game found for ${event.away} @ ${event.home} on ${event.days[0]}`,
+            };
+        }
+        if (isNaN(event.homeScore) || isNaN(event.awayScore)) {
+            return { id: game.id, espnId: event.espnId, status: 'invalid_data', message: 'Game scores are missing or invalid' };
+        }
+        claimed.add(game.id);
+
+        // winner is true when team2 won; savePicks stores the home team as team1
+        const team1IsHome = fit(game.team1Name, event.home) + fit(game.team2Name, event.away) >=
+            fit(game.team1Name, event.away) + fit(game.team2Name, event.home);
+        const [team1Score, team2Score] = team1IsHome
+            ? [event.homeScore, event.awayScore]
+            : [event.awayScore, event.homeScore];
+        // The status is settled once the UPDATE has said which games changed
+        const result: SyncResult = { id: game.id, espnId: event.espnId, status: 'current', message: '' };
+        matched.push({ result, event, gameId: game.id, winner: team2Score > team1Score, finalScore: `${team1Score}-${team2Score}` });
+        return result;
+    });
+
+    if (matched.length) {
+        await client.query('BEGIN');
+        try {
+            const updated = await client.query(UPDATE_GAMES_SQL, [
+                matched.map((m) => m.gameId),
+                matched.map((m) => m.winner),
+                matched.map((m) => m.finalScore),
+            ]);
+            const saved = await client.query(SAVE_HASHES_SQL, [
+                matched.map((m) => m.event.sport),
+                matched.map((m) => m.event.espnId),
+                matched.map((m) => m.event.hash),
+                matched.map((m) => m.gameId),
+            ]);
+            await client.query('COMMIT');
+
+            const updatedIds = new Set(updated.rows.map((r) => r.id));
+            stats.writes = { games: updated.rows.length, state: saved.rowCount ?? 0 };
+            for (const { result, gameId, winner, finalScore } of matched) {
+                if (updatedIds.has(gameId)) {
+                    result.status = 'updated';
+                    result.message = `Updated game with score ${finalScore}, winner: ${winner}`;
+                } else {
+                    result.message = `Game already has score ${finalScore}`;
+                }
+            }
+        } catch (error) {
+            await client.query('ROLLBACK');
+            throw error;
+        }
+    }
+
+    for (const result of results) stats[result.status]++;
+    return { results, stats };
+}
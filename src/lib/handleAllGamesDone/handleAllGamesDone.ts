@@ -1,13 +1,18 @@
+import { forEachWithConcurrency } from '@/lib/concurrency/concurrency';
+
 type Sport = 'NBA' | 'NFL' | 'MLB' | 'NHL' | 'MLS' | 'EPL' | 'LALIGA' | 'LIGUE_1' | 'BUNDESLIGA' | 'SERIE_A'
 
-export async function handleAllGamesDone() {
-    const getCurrentWeek = () => {
-        const date: Date = new Date();
-        const startDate: Date = new Date(date.getFullYear(), 0, 1);
-        const days: number = Math.floor((date.getTime() - startDate.getTime()) / (24 * 60 * 60 * 1000));
-        return Math.ceil((days + 1) / 7);
-    };
+// How many sports are updated at the same time; each one holds a DB transaction in updateEntryPoints
+const SPORT_CONCURRENCY = Number(process.env.POINTS_SPORT_CONCURRENCY) || 3;
 
+// Leaderboard week of `date` (days 1-7 of the year are week 1, and so on), with its year
+export function weekOf(date: Date) {
+    const startDate: Date = new Date(date.getFullYear(), 0, 1);
+    const days: number = Math.floor((date.getTime() - startDate.getTime()) / (24 * 60 * 60 * 1000));
+    return { week: Math.ceil((days + 1) / 7), year: date.getFullYear() };
+}
+
+export async function handleAllGamesDone() {
     // Sports to cycle through
     const sports: Sport[] = [
         'NBA', 'NFL', 'MLB', 'NHL', 'MLS',
@@ -15,59 +20,51 @@ export async function handleAllGamesDone() {
     ];
 
     const BASE_URL = process.env.NEXT_PUBLIC_BASE_URL || 'http://localhost:3000';
+    const current = weekOf(new Date());
+    // The board of the day before this week started. Its last day's night games end after the
+    // week rolls over, so its unscored games keep being picked up from here
+    const previous = weekOf(new Date(current.year, 0, (current.week - 1) * 7));
+
+    // Score the games finalized since the last run; already scored games are skipped
+    // (a 404 is a week without a board for the sport, which `missingOk` allows)
+    const scoreBoard = async (sport: Sport, board: { week: number; year: number }, missingOk = false) => {
+        const updateUserPointsResponse = await fetch(`${BASE_URL}/api/leaderboard-entries/updateEntryPoints`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ sport, ...board, incremental: true }),
+        });
+
+        const updateUserPointsData = await updateUserPointsResponse.json();
+        if (missingOk && updateUserPointsResponse.status === 404) return;
+        if (!updateUserPointsResponse.ok) {
+            throw new Error(updateUserPointsData.message || 'Failed to update user total & entry points');
+        }
+    };
 
     // Update points for all sports
-    for(const currSport of sports){
+    await forEachWithConcurrency(sports, SPORT_CONCURRENCY, async (currSport) => {
         try {
-            // Get list of users who made picks 
-            const usersMadePicksRes = await fetch(`${BASE_URL}/api/userPicks/getUsersMadePicks?sport=${currSport}`);
-            const madePicksClerkIds = await usersMadePicksRes.json();
+            // Before the pickers check: early in a week nobody has picked for it yet
+            await scoreBoard(currSport, previous, true);
 
-            let clerkIds;
-            if(usersMadePicksRes.status !== 404 && !usersMadePicksRes.ok){
-                throw new Error('Failed to get users who made picks this week');
-            } else if(usersMadePicksRes.status === 404) {
-                console.warn("No users found who made picks for this sport and week");
-                continue;
-            } else {
-                clerkIds = madePicksClerkIds.data;
-            }
+            // Make sure everyone who picked this week has a leaderboard entry, in one request
+            const verifyEntriesResponse = await fetch(`${BASE_URL}/api/leaderboard-entries/verifyEntries`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ sport: currSport, week: current.week }),
+            });
 
-            if(clerkIds.length !== 0){
-                for(let i = 0; i < clerkIds.length; i++){
-                    try{
-                        // Check if each user has leaderboard entry, if not create one
-                        const updateEntryResponse = await fetch(`${BASE_URL}/api/leaderboard-entries/verifyEntry`, {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({ clerk_id: clerkIds[i].clerkId, sport: currSport, week: getCurrentWeek() }),
-                        });
-
-                        const updateEntryData = await updateEntryResponse.json();
-                        if (!updateEntryResponse.ok) {
-                            throw new Error(updateEntryData.message || 'Failed to update user entry in leaderboard');
-                        }
-                    } catch(error){
-                        console.error('Error in verifying/creating leaderboard entries', error instanceof Error ? error.message : 'Failed to verify/create user leaderboard entry');
-                    }
-                }
+            const verifyEntriesData = await verifyEntriesResponse.json();
+            if (!verifyEntriesResponse.ok) {
+                throw new Error(verifyEntriesData.message || 'Failed to verify/create user leaderboard entries');
+            } else if (verifyEntriesData.pickers === 0) {
+                console.warn(`No users found who made picks for ${currSport} this week`);
+                return;
             }
 
-            // Execute points updates
-            const [updateUserPointsResponse] = await Promise.all([
-                fetch(`${BASE_URL}/api/leaderboard-entries/updateEntryPoints`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ sport: currSport, week: getCurrentWeek() }),
-                }),
-            ]);
-
-            const updateUserPointsData = await updateUserPointsResponse.json();
-            if (!updateUserPointsResponse.ok) {
-                throw new Error(updateUserPointsData.message || 'Failed to update user total & entry points');
-            }
+            await scoreBoard(currSport, current);
         } catch (error) {
-            console.error('Error in handleAllGamesDone:', error instanceof Error ? error.message : 'Failed to submit picks');
+            console.error(`Error in handleAllGamesDone (${currSport}):`, error instanceof Error ? error.message : 'Failed to submit picks');
         }
-    }
+    });
 }
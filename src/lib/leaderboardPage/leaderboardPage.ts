@@ -0,0 +1,138 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { clerkClient } from '@clerk/clerk-sdk-node';
+import type { PoolClient } from 'pg';
+import { timed } from '@/lib/serverTiming/serverTiming';
+
+// Which ranking a page comes from: the overall one (users.points) or one leaderboard's entries
+export type Board = { kind: 'overall' } | { kind: 'leaderboard'; sport: string; week: number };
+
+// Where the previous page ended: the last row's points and user_id (the keyset) and its
+// rank, so ranks carry on across pages
+export type Cursor = { points: number; userId: number; rank: number };
+
+export const DEFAULT_PAGE_SIZE = 50;
+export const MAX_PAGE_SIZE = 100;
+
+// Rows are ordered by points (highest first), then user_id. Both orderings are backed by
+// indexes (idx_users_points, idx_entries_board_points in prisma/schema.prisma), so a page
+// is an index range scan of `limit` rows however deep it is. Ranks are dense (1, 1, 2) like
+// every other leaderboard route: DENSE_RANK() over the page, carried on from the cursor's
+// rank (a page starting with the cursor's points continues that rank) rather than a window
+// over the whole board.
+const PAGE_COLUMNS = `u.user_id, u.clerk_id, u.username, u.performance, u.bio, u.fav_team, u.max_points`;
+
+// A leaderboard is the sport's week of the current year, like getEntriesForLeaderboard
+const BOARD_ID = `(SELECT leaderboard_id FROM leaderboards
+                   WHERE sport = $1 AND week = $2 AND year = EXTRACT(YEAR FROM NOW()))`;
+
+const OVERALL_PAGE_SQL = `
+    SELECT page.*,
+           ($3::int + DENSE_RANK() OVER (ORDER BY page.points DESC)
+                - CASE WHEN MAX(page.points) OVER () = $1::int THEN 1 ELSE 0 END)::int AS rank
+    FROM (
+        SELECT ${PAGE_COLUMNS}, u.points
+        FROM users u
+        WHERE u.points > 0
+          AND ($1::int IS NULL OR (u.points <= $1::int AND (u.points < $1::int OR u.user_id > $2::int)))
+        ORDER BY u.points DESC, u.user_id
+        LIMIT $4
+    ) page
+    ORDER BY page.points DESC, page.user_id`;
+
+const LEADERBOARD_PAGE_SQL = `
+    SELECT page.*,
+           ($5::int + DENSE_RANK() OVER (ORDER BY page.points DESC)
+                - CASE WHEN MAX(page.points) OVER () = $3::int THEN 1 ELSE 0 END)::int AS rank
+    FROM (
+        SELECT ${PAGE_COLUMNS}, le.points
+        FROM leaderboard_entries le
+        JOIN users u ON u.user_id = le.user_id
+        WHERE le.leaderboard_id = ${BOARD_ID}
+          AND le.points > 0
+          AND ($3::int IS NULL OR (le.points <= $3::int AND (le.points < $3::int OR le.user_id > $4::int)))
+        ORDER BY le.points DESC, le.user_id
+        LIMIT $6
+    ) page
+    ORDER BY page.points DESC, page.user_id`;
+
+// A user's dense rank is one more than the number of distinct scores above theirs, counted
+// from the index
+const OVERALL_RANK_SQL = `
+    SELECT ${PAGE_COLUMNS}, u.points,
+           1 + (SELECT COUNT(DISTINCT o.points) FROM users o WHERE o.points > u.points)::int AS rank
+    FROM users u
+    WHERE (u.user_id = ANY($1::int[]) OR u.clerk_id = ANY($2::text[])) AND u.points > 0
+    ORDER BY u.points DESC, u.user_id`;
+
+const LEADERBOARD_RANK_SQL = `
+    SELECT ${PAGE_COLUMNS}, le.points,
+           1 + (SELECT COUNT(DISTINCT o.points) FROM leaderboard_entries o
+                WHERE o.leaderboard_id = le.leaderboard_id AND o.points > le.points)::int AS rank
+    FROM leaderboard_entries le
+    JOIN users u ON u.user_id = le.user_id
+    WHERE le.leaderboard_id = ${BOARD_ID}
+      AND (le.user_id = ANY($3::int[]) OR u.clerk_id = ANY($4::text[])) AND le.points > 0
+    ORDER BY le.points DESC, le.user_id`;
+
+export function encodeCursor(cursor: Cursor): string {
+    return Buffer.from(JSON.stringify([cursor.points, cursor.userId, cursor.rank])).toString('base64url');
+}
+
+// null when `value` is not a cursor this module handed out
+export function decodeCursor(value: string): Cursor | null {
+    try {
+        const parts = JSON.parse(Buffer.from(value, 'base64url').toString());
+        if (!Array.isArray(parts) || parts.length !== 3 || !parts.every(Number.isInteger)) return null;
+        const [points, userId, rank] = parts;
+        return { points, userId, rank };
+    } catch {
+        return null;
+    }
+}
+
+// The board behind ?sport=&week=, or null for the summed views (all sports in a week, one
+// sport all time), which cannot be served from an index
+export function parseBoard(sport: string | null, week: string | null): Board | null {
+    if (!sport || !week || !/^\d+$/.test(week)) return null;
+    const weekNumber = Number(week);
+    if (sport === 'SELECT') return weekNumber === 0 ? { kind: 'overall' } : null;
+    return weekNumber > 0 ? { kind: 'leaderboard', sport, week: weekNumber } : null;
+}
+
+export async function fetchPage(client: PoolClient, board: Board, limit: number, cursor: Cursor | null) {
+    const keyset = [cursor?.points ?? null, cursor?.userId ?? null, cursor?.rank ?? 0];
+    // One extra row tells whether there is a next page
+    const { rows } = board.kind === 'overall'
+        ? await client.query(OVERALL_PAGE_SQL, [...keyset, limit + 1])
+        : await client.query(LEADERBOARD_PAGE_SQL, [board.sport, board.week, ...keyset, limit + 1]);
+
+    const page = rows.slice(0, limit);
+    const last = page[page.length - 1];
+    const nextCursor = rows.length > limit
+        ? encodeCursor({ points: last.points, userId: last.user_id, rank: last.rank })
+        : null;
+    return { rows: page, nextCursor };
+}
+
+// The users are picked by user_id, or by clerk_id for a page that only knows who is signed in
+export async function fetchRanks(client: PoolClient, board: Board, userIds: number[], clerkIds: string[] = []) {
+    const { rows } = board.kind === 'overall'
+        ? await client.query(OVERALL_RANK_SQL, [userIds, clerkIds])
+        : await client.query(LEADERBOARD_RANK_SQL, [board.sport, board.week, userIds, clerkIds]);
+    return rows;
+}
+
+// Adds each row's Clerk profile image; one Clerk call for the whole page
+export async function withImages(rows: any[]) {
+    const clerkIds = rows.map((row) => row.clerk_id).filter((id) => id && id !== '-1');
+    const images = new Map<string, string>();
+    if (clerkIds.length > 0) {
+        const response = await timed('clerk', () => clerkClient.users.getUserList({ userId: clerkIds, limit: clerkIds.length }));
+        if (Array.isArray(response?.data)) {
+            response.data.forEach((user) => images.set(user.id, user.imageUrl));
+        } else {
+            console.error('Unexpected Clerk API response:', response);
+        }
+    }
+    return rows.map((row) => ({ ...row, imageUrl: images.get(row.clerk_id) || '/default-profile.png' }));
+}
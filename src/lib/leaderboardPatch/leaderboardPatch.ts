@@ -0,0 +1,84 @@
+// Messages pushed after a scoring run, shared by the server (leaderboardPush) and the pages
+// that apply them. Only what changed is sent: a page that already shows a leaderboard
+// patches its rows instead of fetching the whole board again.
+
+// [user_id, points after the run, points gained in the run]
+export type EntryChange = [number, number, number];
+
+export type EntriesPatch = {
+    channel: string;
+    entries: EntryChange[];
+    part: number;   // a run's changes are split over several events when there are many
+    parts: number;
+    sentAt: number; // ms since the epoch, for end-to-end latency
+};
+
+// More changes than a patch is worth: pages should fetch the board again
+export type EntriesReset = { channel: string; changed: number; sentAt: number };
+
+export type GameResult = { id: string; winner: boolean | null; final_score: string | null };
+
+export type GamesFinal = { sport: string; games: GameResult[]; sentAt: number };
+
+export const PATCH_EVENT = 'entries-patch';
+export const RESET_EVENT = 'entries-reset';
+export const GAMES_EVENT = 'games-final';
+export const GAMES_CHANNEL = 'game-results';
+export const OVERALL_CHANNEL = 'leaderboard-overall';
+
+// Pusher rejects events over 10KB; an entry is at most ~30 bytes of JSON
+export const ENTRIES_PER_EVENT = 300;
+// Past this many changed entries a reset is cheaper than the patches
+export const MAX_PATCH_ENTRIES = 20000;
+
+// The weekly leaderboard of one sport (the current year's, like updateEntryPoints)
+export function boardChannel(sport: string, week: number): string {
+    return `leaderboard-${sport}-${week}`;
+}
+
+// pusher-js options; NEXT_PUBLIC_PUSHER_HOST/NEXT_PUBLIC_PUSHER_PORT point pages at another
+// Pusher-compatible server, such as __tests__/perf/pusher_standin.py
+export function pusherClientOptions() {
+    const cluster = process.env.NEXT_PUBLIC_PUSHER_CLUSTER!;
+    if (!process.env.NEXT_PUBLIC_PUSHER_HOST) return { cluster };
+    return {
+        cluster,
+        wsHost: process.env.NEXT_PUBLIC_PUSHER_HOST,
+        wsPort: Number(process.env.NEXT_PUBLIC_PUSHER_PORT) || 80,
+        forceTLS: false,
+    };
+}
+
+export function chunkEntries(entries: EntryChange[], size = ENTRIES_PER_EVENT): EntryChange[][] {
+    const chunks = [];
+    for (let i = 0; i < entries.length; i += size) {
+        chunks.push(entries.slice(i, i + size));
+    }
+    return chunks;
+}
+
+type Row = { user_id: number; points: number; rank?: number };
+
+// Applies a patch to the rows a page shows and re-ranks them densely (1, 1, 2), as every
+// leaderboard route ranks, the summed views (DENSE_RANK()) and the paged boards alike. `mode` is 'set' when the page shows the patched board itself
+// and 'add' when it shows a sum over boards (all sports in a week, one sport all time).
+// Users the page does not know yet come back in `missing`: the page needs their
+// profiles, so it should fetch the board again.
+export function applyEntriesPatch<T extends Row>(rows: T[], entries: EntryChange[], mode: 'set' | 'add') {
+    const changes = new Map(entries.map(([userId, points, delta]) => [userId, mode === 'set' ? points : delta]));
+    const patched = rows.map((row) => {
+        const change = changes.get(Number(row.user_id));
+        if (change === undefined) return row;
+        changes.delete(Number(row.user_id));
+        return { ...row, points: mode === 'set' ? change : Number(row.points) + change };
+    });
+    const missing = [...changes.keys()];
+
+    patched.sort((a, b) => b.points - a.points || Number(a.user_id) - Number(b.user_id));
+    let rank = 0;
+    const ranked = patched.map((row, i) => {
+        if (i === 0 || row.points !== patched[i - 1].points) rank++;
+        return row.rank === rank ? row : { ...row, rank };
+    });
+    return { rows: ranked, missing };
+}
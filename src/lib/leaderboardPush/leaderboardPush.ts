@@ -0,0 +1,77 @@
+import Pusher from 'pusher';
+import {
+    EntryChange, GameResult, GAMES_CHANNEL, GAMES_EVENT, MAX_PATCH_ENTRIES, OVERALL_CHANNEL, PATCH_EVENT, RESET_EVENT,
+    boardChannel, chunkEntries,
+} from '@/lib/leaderboardPatch/leaderboardPatch';
+import { timed } from '@/lib/serverTiming/serverTiming';
+
+// Pusher accepts up to 10 events per batch request
+const EVENTS_PER_BATCH = 10;
+
+let pusher: Pusher | null = null;
+
+// PUSHER_HOST/PUSHER_PORT point the app at another Pusher-compatible server, such as
+// __tests__/perf/pusher_standin.py
+export function getPusher(): Pusher {
+    pusher ??= new Pusher({
+        appId: process.env.PUSHER_APP_ID || "",
+        key: process.env.PUSHER_KEY || "",
+        secret: process.env.PUSHER_SECRET || "",
+        cluster: process.env.PUSHER_CLUSTER || "",
+        ...(process.env.PUSHER_HOST
+            ? { host: process.env.PUSHER_HOST, port: Number(process.env.PUSHER_PORT) || undefined, useTLS: process.env.PUSHER_USE_TLS === 'true' }
+            : { useTLS: true }),
+    });
+    return pusher;
+}
+
+export type ScoreDiff = {
+    sport: string;
+    week: number;
+    entries: EntryChange[]; // the week's leaderboard entries whose points changed
+    users: EntryChange[];   // the same users' overall points
+    changedEntries: number; // may be more than `entries` holds (MAX_PATCH_ENTRIES)
+    changedUsers: number;
+    games: GameResult[];    // games scored for the first time
+};
+
+type Event = { channel: string; name: string; data: object };
+
+function boardEvents(channel: string, entries: EntryChange[], changed: number, sentAt: number): Event[] {
+    if (changed === 0) return [];
+    if (changed > MAX_PATCH_ENTRIES) {
+        return [{ channel, name: RESET_EVENT, data: { channel, changed, sentAt } }];
+    }
+    const chunks = chunkEntries(entries);
+    return chunks.map((chunk, part) => ({
+        channel,
+        name: PATCH_EVENT,
+        data: { channel, entries: chunk, part, parts: chunks.length, sentAt },
+    }));
+}
+
+export function scoreDiffEvents(diff: ScoreDiff, sentAt = Date.now()): Event[] {
+    const events = [
+        ...boardEvents(boardChannel(diff.sport, diff.week), diff.entries, diff.changedEntries, sentAt),
+        ...boardEvents(OVERALL_CHANNEL, diff.users, diff.changedUsers, sentAt),
+    ];
+    if (diff.games.length > 0) {
+        events.unshift({ channel: GAMES_CHANNEL, name: GAMES_EVENT, data: { sport: diff.sport, games: diff.games, sentAt } });
+    }
+    return events;
+}
+
+// Broadcasts what a scoring run changed. Pushing is best effort: the scores are already
+// committed, and a page that misses a patch still has the full board on its next load.
+export async function pushScoreDiff(diff: ScoreDiff): Promise<number> {
+    const events = scoreDiffEvents(diff);
+    try {
+        for (let i = 0; i < events.length; i += EVENTS_PER_BATCH) {
+            await timed('pusher', () => getPusher().triggerBatch(events.slice(i, i + EVENTS_PER_BATCH)));
+        }
+        return events.length;
+    } catch (error) {
+        console.error('Error pushing score changes:', error);
+        return 0;
+    }
+}
@@ -0,0 +1,168 @@
+import type { PoolClient } from 'pg';
+
+export type PickCounts = {
+    gameId: string;
+    homePicks: number;
+    awayPicks: number;
+};
+
+// Per-game pick counts kept up to date by triggers on "Pick", so reading a game's split is
+// one primary key lookup instead of aggregating its picks. Triggers rather than savePicks
+// keep the counts right for every writer (deleteUser, cascades from "Game", raw SQL).
+// The table and index are in prisma/schema.prisma; they are repeated here so the setup also
+// works on a database that was not pushed (benchmarks).
+export const PICK_COUNTS_SCHEMA_SQL = `
+CREATE TABLE IF NOT EXISTS "GamePickCounts" (
+    "gameId" TEXT PRIMARY KEY REFERENCES "Game"(id) ON DELETE CASCADE,
+    "homePicks" INTEGER NOT NULL DEFAULT 0,
+    "awayPicks" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMPTZ(6) NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS game_gamedate_idx ON "Game" ("gameDate");
+
+-- One statement-level firing per write, summed per game from the transition tables, so a
+-- bulk write or a cascading delete touches each game's row once instead of once per pick
+CREATE OR REPLACE FUNCTION game_pick_counts_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO "GamePickCounts" ("gameId", "homePicks", "awayPicks")
+        SELECT "gameId", COUNT(*) FILTER (WHERE "teamIndex" = 0), COUNT(*) FILTER (WHERE "teamIndex" = 1)
+        FROM new_picks
+        GROUP BY "gameId"
+        ORDER BY "gameId"
+        ON CONFLICT ("gameId") DO UPDATE
+        SET "homePicks" = "GamePickCounts"."homePicks" + EXCLUDED."homePicks",
+            "awayPicks" = "GamePickCounts"."awayPicks" + EXCLUDED."awayPicks",
+            "updatedAt" = now();
+    ELSIF TG_OP = 'DELETE' THEN
+        -- An update rather than an upsert: the game itself may be going (ON DELETE CASCADE)
+        UPDATE "GamePickCounts" c
+        SET "homePicks" = c."homePicks" - d.home,
+            "awayPicks" = c."awayPicks" - d.away,
+            "updatedAt" = now()
+        FROM (SELECT "gameId", COUNT(*) FILTER (WHERE "teamIndex" = 0) AS home,
+                     COUNT(*) FILTER (WHERE "teamIndex" = 1) AS away
+              FROM old_picks
+              GROUP BY "gameId") d
+        WHERE c."gameId" = d."gameId";
+    ELSE
+        -- savePicks re-saves unchanged picks; only a change of side (or game) moves a count
+        INSERT INTO "GamePickCounts" ("gameId", "homePicks", "awayPicks")
+        SELECT "gameId", SUM(home), SUM(away)
+        FROM (SELECT "gameId", ("teamIndex" = 0)::int AS home, ("teamIndex" = 1)::int AS away FROM new_picks
+              UNION ALL
+              SELECT "gameId", -("teamIndex" = 0)::int, -("teamIndex" = 1)::int FROM old_picks) delta
+        GROUP BY "gameId"
+        HAVING SUM(home) <> 0 OR SUM(away) <> 0
+        ORDER BY "gameId"
+        ON CONFLICT ("gameId") DO UPDATE
+        SET "homePicks" = "GamePickCounts"."homePicks" + EXCLUDED."homePicks",
+            "awayPicks" = "GamePickCounts"."awayPicks" + EXCLUDED."awayPicks",
+            "updatedAt" = now();
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS game_pick_counts_insert ON "Pick";
+CREATE TRIGGER game_pick_counts_insert
+    AFTER INSERT ON "Pick" REFERENCING NEW TABLE AS new_picks
+    FOR EACH STATEMENT EXECUTE FUNCTION game_pick_counts_apply();
+
+DROP TRIGGER IF EXISTS game_pick_counts_delete ON "Pick";
+CREATE TRIGGER game_pick_counts_delete
+    AFTER DELETE ON "Pick" REFERENCING OLD TABLE AS old_picks
+    FOR EACH STATEMENT EXECUTE FUNCTION game_pick_counts_apply();
+
+DROP TRIGGER IF EXISTS game_pick_counts_update ON "Pick";
+CREATE TRIGGER game_pick_counts_update
+    AFTER UPDATE ON "Pick" REFERENCING OLD TABLE AS old_picks NEW TABLE AS new_picks
+    FOR EACH STATEMENT EXECUTE FUNCTION game_pick_counts_apply();
+`;
+
+// Recounts every game from scratch; only run while pick writes are locked out. Mirrored in
+// __tests__/perf/seed_db.py, which loads picks with triggers disabled.
+export const PICK_COUNTS_BACKFILL_SQL = `
+DELETE FROM "GamePickCounts";
+INSERT INTO "GamePickCounts" ("gameId", "homePicks", "awayPicks")
+SELECT "gameId", COUNT(*) FILTER (WHERE "teamIndex" = 0), COUNT(*) FILTER (WHERE "teamIndex" = 1)
+FROM "Pick"
+GROUP BY "gameId";
+`;
+
+// The counts of games played on either day, through the "Game"("gameDate") index
+export const COUNTS_BY_DATE_SQL = `
+    SELECT c."gameId", c."homePicks", c."awayPicks"
+    FROM "Game" g
+    JOIN "GamePickCounts" c ON c."gameId" = g.id
+    WHERE g."gameDate" IN ($1::date, $2::date)
+      AND c."homePicks" + c."awayPicks" > 0
+`;
+
+export const COUNTS_BY_ID_SQL = `
+    SELECT c."gameId", c."homePicks", c."awayPicks"
+    FROM "GamePickCounts" c
+    WHERE c."gameId" = ANY($1::text[])
+      AND c."homePicks" + c."awayPicks" > 0
+`;
+
+// How many of the counting triggers are installed and enabled on "Pick"; all three come from
+// `npm run db:setup`, which neither `npm run build` nor `npx prisma db push` runs
+export const PICK_COUNTS_TRIGGERS_SQL = `
+    SELECT COUNT(*)::int AS triggers
+    FROM pg_trigger
+    WHERE tgrelid = '"Pick"'::regclass
+      AND tgname IN ('game_pick_counts_insert', 'game_pick_counts_delete', 'game_pick_counts_update')
+      AND tgenabled <> 'D'
+`;
+
+// Installs the counting triggers and recounts every game, once per database: run by
+// `npm run db:setup` (prisma/setup.ts) after `npx prisma db push`, never from a request. Pick
+// writes wait on the lock while it runs, so the recount can't miss or double-count one.
+export async function installPickCounts(client: PoolClient) {
+    await client.query('BEGIN');
+    try {
+        await client.query('LOCK TABLE "Pick" IN SHARE ROW EXCLUSIVE MODE');
+        await client.query(PICK_COUNTS_SCHEMA_SQL);
+        await client.query(PICK_COUNTS_BACKFILL_SQL);
+        await client.query('COMMIT');
+    } catch (error) {
+        await client.query('ROLLBACK');
+        throw error;
+    }
+}
+
+export async function countsForDates(client: PoolClient, dates: [string, string]): Promise<PickCounts[]> {
+    const { rows } = await client.query(COUNTS_BY_DATE_SQL, dates);
+    return rows;
+}
+
+export async function countsForGames(client: PoolClient, gameIds: string[]): Promise<PickCounts[]> {
+    const { rows } = await client.query(COUNTS_BY_ID_SQL, [gameIds]);
+    return rows;
+}
+
+// Whether the picks behind `counts` come from at least two different users. Picks are
+// unique per user and game, so any game with two picks settles it; otherwise there is at
+// most one pick per game left to look at.
+export async function hasTwoPickers(client: PoolClient, counts: PickCounts[]): Promise<boolean> {
+    const totals = counts.map((c) => c.homePicks + c.awayPicks);
+    if (totals.some((total) => total >= 2)) return true;
+    if (totals.reduce((sum, total) => sum + total, 0) < 2) return false;
+
+    const { rows } = await client.query(
+        `SELECT COUNT(DISTINCT "userId")::int AS users FROM "Pick" WHERE "gameId" = ANY($1::text[])`,
+        [counts.map((c) => c.gameId)]
+    );
+    return rows[0].users >= 2;
+}
+
+// Whether picks are being counted at all. Without the triggers "GamePickCounts" stays empty
+// (or goes stale) and every read looks like a day nobody has picked yet, so callers check
+// this when the counts come back short and say so in the logs.
+export async function pickCountsInstalled(client: PoolClient): Promise<boolean> {
+    const { rows } = await client.query(PICK_COUNTS_TRIGGERS_SQL);
+    if (rows[0]?.triggers === 3) return true;
+    console.error('❌ The "GamePickCounts" triggers are missing or disabled, so pick percentages stay empty; run `npm run db:setup` against this database');
+    return false;
+}
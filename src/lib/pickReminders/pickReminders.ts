@@ -0,0 +1,249 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import sgClient from '@sendgrid/client';
+import sgMail, { MailDataRequired } from '@sendgrid/mail';
+import type { PoolClient } from 'pg';
+import { timed } from '@/lib/serverTiming/serverTiming';
+
+export type ReminderGame = {
+    id: string;
+    team1Name: string;
+    team2Name: string;
+    gameTime: string;
+};
+
+type ClerkUser = {
+    id: string;
+    first_name?: string | null;
+    email_addresses?: { email_address: string }[];
+};
+
+type Recipient = {
+    userId: string;
+    email: string;
+    name: string;
+    games: string[];
+};
+
+export type ReminderResult = {
+    totalUsers: number;
+    pages: number;
+    emailsSent: number;
+    errors: number;
+    batches: number;
+    retries: number;
+    splits: number;
+};
+
+const CLERK_PAGE_SIZE = 500; // Largest page the Clerk Backend API returns
+const BATCH_SIZE = Number(process.env.REMINDER_BATCH_SIZE) || 1000; // SendGrid allows 1000 personalizations per request
+const SEND_CONCURRENCY = Number(process.env.REMINDER_SEND_CONCURRENCY) || 4;
+const MAX_SEND_ATTEMPTS = 3;
+const RETRY_BASE_MS = Number(process.env.REMINDER_RETRY_BASE_MS) || 1000;
+
+sgMail.setApiKey(process.env.SENDGRID_API_KEY || '');
+// Lets benchmarks point SendGrid at __tests__/perf/sendgrid_standin.py
+if (process.env.SENDGRID_API_URL) {
+    sgClient.setDefaultRequest('baseUrl', process.env.SENDGRID_API_URL);
+}
+
+// Opt-outs and picks for a whole page of users in one query
+const PAGE_STATUS_SQL = `
+    SELECT u.id AS "userId",
+           pref."emailNotifications" AS "emailNotifications",
+           COALESCE(ARRAY_AGG(p."gameId") FILTER (WHERE p."gameId" IS NOT NULL), '{}') AS "pickedGameIds"
+    FROM UNNEST($1::text[]) AS u(id)
+    LEFT JOIN "UserPreferences" pref ON pref."userId" = u.id
+    LEFT JOIN "Pick" p ON p."userId" = u.id AND p."gameId" = ANY($2::text[])
+    GROUP BY u.id, pref."emailNotifications"`;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+const gameStart = (game: ReminderGame, now: Date) => new Date(`${now.toDateString()} ${game.gameTime}`);
+
+// Games starting in 1-2 hours, the only ones reminders are sent for
+export function upcomingGames(games: ReminderGame[], now: Date) {
+    return games.filter((g) => {
+        const diff = gameStart(g, now).getTime() - now.getTime();
+        return diff > 60 * 60 * 1000 && diff <= 2 * 60 * 60 * 1000;
+    });
+}
+
+// Every user in the Clerk directory, a page at a time, oldest first so users signing up
+// while we page don't shift the offsets
+export async function* clerkUserPages(pageSize = CLERK_PAGE_SIZE): AsyncGenerator<ClerkUser[]> {
+    const baseUrl = process.env.CLERK_API_URL || 'https://api.clerk.com';
+
+    for (let offset = 0; ; offset += pageSize) {
+        const userRes = await timed('clerk', () => fetch(`${baseUrl}/v1/users?limit=${pageSize}&offset=${offset}&order_by=%2Bcreated_at`, {
+            headers: {
+                Authorization: `Bearer ${process.env.CLERK_SECRET_KEY}`,
+            },
+        }));
+
+        if (!userRes.ok) {
+            throw new Error('Failed to fetch users from Clerk');
+        }
+
+        const users: ClerkUser[] = await userRes.json();
+        if (users.length) yield users;
+        if (users.length < pageSize) return;
+    }
+}
+
+const isRetryable = (error: any) => !error?.code || error.code === 429 || error.code >= 500;
+
+// SendGrid turns down a whole request for one bad personalization (say a malformed address
+// from the directory, 400) or for its size (413); the other recipients are fine on their own
+const isRejectedRequest = (error: any) => error?.code === 400 || error?.code === 413;
+
+// Exponential backoff, unless SendGrid said when to come back
+function retryDelay(attempt: number, error: any) {
+    const retryAfter = Number(error?.response?.headers?.['retry-after']);
+    return Number.isFinite(retryAfter) && retryAfter > 0 ? retryAfter * 1000 : RETRY_BASE_MS * 2 ** (attempt - 1);
+}
+
+type Batch = { recipients: Recipient[]; attempt: number; split?: boolean };
+
+// Groups recipients into SendGrid batch sends (one personalization each) and keeps at most
+// `concurrency` of them in flight. Batches failing with 429/5xx go to a retry queue and are
+// sent again after a backoff, without holding a slot while they wait. A batch SendGrid
+// rejects (400/413) is sent again as two halves, and so on down to single recipients, so
+// only the recipients it actually rejects are lost and counted as errors.
+export class ReminderDispatcher {
+    emailsSent = 0;
+    errors = 0;
+    batches = 0;
+    retries = 0;
+    splits = 0;
+
+    private pending: Recipient[] = [];
+    private inFlight = new Set<Promise<void>>();
+    private retrying = new Set<Promise<void>>();
+
+    constructor(private batchSize = BATCH_SIZE, private concurrency = SEND_CONCURRENCY) {}
+
+    async add(recipient: Recipient) {
+        this.pending.push(recipient);
+        if (this.pending.length >= this.batchSize) {
+            await this.submit({ recipients: this.pending.splice(0), attempt: 1 });
+        }
+    }
+
+    async drain() {
+        if (this.pending.length) {
+            await this.submit({ recipients: this.pending.splice(0), attempt: 1 });
+        }
+        while (this.inFlight.size || this.retrying.size) {
+            await Promise.race([...this.inFlight, ...this.retrying]);
+        }
+    }
+
+    private async submit(batch: Batch) {
+        while (this.inFlight.size >= this.concurrency) {
+            await Promise.race(this.inFlight);
+        }
+        const sending = this.send(batch).finally(() => this.inFlight.delete(sending));
+        this.inFlight.add(sending);
+    }
+
+    private async send(batch: Batch) {
+        if (batch.attempt === 1 && !batch.split) this.batches++;
+        try {
+            await timed('sendgrid', () => sgMail.send(this.message(batch.recipients)));
+            this.emailsSent += batch.recipients.length;
+        } catch (error: any) {
+            if (batch.attempt < MAX_SEND_ATTEMPTS && isRetryable(error)) {
+                this.retries++;
+                const retry = sleep(retryDelay(batch.attempt, error))
+                    .then(() => this.submit({ ...batch, attempt: batch.attempt + 1 }))
+                    .finally(() => this.retrying.delete(retry));
+                this.retrying.add(retry);
+                return;
+            }
+            if (batch.recipients.length > 1 && isRejectedRequest(error)) {
+                this.splits++;
+                const half = Math.ceil(batch.recipients.length / 2);
+                const halves = [batch.recipients.slice(0, half), batch.recipients.slice(half)];
+                // Queued like a retry so this send gives up its slot first
+                const resend = Promise.resolve()
+                    .then(async () => {
+                        for (const recipients of halves) await this.submit({ recipients, attempt: 1, split: true });
+                    })
+                    .finally(() => this.retrying.delete(resend));
+                this.retrying.add(resend);
+                return;
+            }
+            console.error(`❌ Failed to send ${batch.recipients.length} reminder emails:`, error?.response?.body || error.message);
+            this.errors += batch.recipients.length;
+        }
+    }
+
+    private message(recipients: Recipient[]): MailDataRequired {
+        return {
+            from: process.env.SENDGRID_SENDER_EMAIL || 'olivegardencsus@gmail.com',
+            templateId: process.env.SENDGRID_TEMPLATE_ID!,
+            personalizations: recipients.map(({ userId, email, name, games }) => ({
+                to: email,
+                dynamicTemplateData: {
+                    name,
+                    games,
+                    picksLink: 'https://tallysight-og.vercel.app/daily-picks',
+                    unsubscribeLink: `https://tallysight-og.vercel.app/unsubscribe?userId=${userId}`,
+                },
+            })),
+        };
+    }
+}
+
+// Streams the Clerk directory page by page: one query per page for opt-outs and picks,
+// and reminders for the page's users are handed to the dispatcher while the next page loads
+export async function sendPickReminders(client: PoolClient, games: ReminderGame[], now: Date): Promise<ReminderResult> {
+    const gameIds = games.map((g) => g.id);
+    const gameLines = new Map(games.map((g) => {
+        const timeStr = gameStart(g, now).toLocaleTimeString([], {
+            hour: '2-digit',
+            minute: '2-digit',
+            timeZoneName: 'short'
+        });
+        return [g.id, `${g.team1Name} vs ${g.team2Name} at ${timeStr}`];
+    }));
+
+    const dispatcher = new ReminderDispatcher();
+    let totalUsers = 0;
+    let pages = 0;
+
+    for await (const users of clerkUserPages()) {
+        pages++;
+        totalUsers += users.length;
+
+        const { rows } = await client.query<{ userId: string; emailNotifications: boolean | null; pickedGameIds: string[] }>(
+            PAGE_STATUS_SQL,
+            [users.map((u) => u.id), gameIds]
+        );
+        const statusByUser = new Map(rows.map((row) => [row.userId, row]));
+
+        for (const user of users) {
+            const email = user.email_addresses?.[0]?.email_address;
+            const status = statusByUser.get(user.id);
+            // No address, or opted out of notifications
+            if (!email || status?.emailNotifications === false) continue;
+
+            const picked = new Set(status?.pickedGameIds ?? []);
+            const missed = gameIds.filter((id) => !picked.has(id));
+            if (!missed.length) continue;
+
+            await dispatcher.add({
+                userId: user.id,
+                email,
+                name: user.first_name || 'there',
+                games: missed.map((id) => gameLines.get(id)!),
+            });
+        }
+    }
+
+    await dispatcher.drain();
+
+    const { emailsSent, errors, batches, retries, splits } = dispatcher;
+    console.log(`Process completed. Sent ${emailsSent} emails in ${batches} batches (${retries} retries, ${splits} splits) with ${errors} errors`);
+    return { totalUsers, pages, emailsSent, errors, batches, retries, splits };
+}
@@ -0,0 +1,157 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { AsyncLocalStorage } from 'async_hooks';
+import { randomBytes } from 'crypto';
+import { appendFile } from 'fs/promises';
+import { NextResponse } from 'next/server';
+
+export type Span = {
+    name: string;
+    start: number;
+    end: number;
+};
+
+type RequestTiming = {
+    spans: Span[];
+    start: number;
+    startedAt: number;
+};
+
+const enabled = (value: string | undefined) => !['', '0', 'false'].includes(value ?? '');
+
+// Where the timings go, all off by default: SERVER_TIMING=1 answers with a Server-Timing
+// header (it shows clients where the server spent its time, so only for benchmarks and
+// debugging), SERVER_TIMING_LOG=1 logs one JSON line per request, SERVER_TIMING_OTLP_FILE
+// appends each request as an OTLP/JSON trace (what the OpenTelemetry collector's
+// otlpjsonfile receiver reads)
+const headerEnabled = () => enabled(process.env.SERVER_TIMING);
+const LOG = enabled(process.env.SERVER_TIMING_LOG);
+const OTLP_FILE = process.env.SERVER_TIMING_OTLP_FILE;
+
+// A request fanning out over many games stops recording after this many spans
+const MAX_SPANS = 1000;
+
+const requests = new AsyncLocalStorage<RequestTiming>();
+
+// Adds a span that started at `start` (performance.now()) to the current request, if any
+export function recordSpan(name: string, start: number, end = performance.now()) {
+    const timing = requests.getStore();
+    if (timing && timing.spans.length < MAX_SPANS) timing.spans.push({ name, start, end });
+}
+
+// Runs `work` as a span of the current request: a DB query ("db"), an upstream call ("espn",
+// "clerk", ...). Outside a request it only runs `work`.
+export async function timed<T>(name: string, work: () => Promise<T>): Promise<T> {
+    const start = performance.now();
+    try {
+        return await work();
+    } finally {
+        recordSpan(name, start);
+    }
+}
+
+// NextResponse.json inside a "json" span, for routes whose responses are big enough for
+// serializing them to show up (leaderboards, game lists)
+export function timedJson<T>(body: T, init?: ResponseInit) {
+    const start = performance.now();
+    try {
+        return NextResponse.json(body, init);
+    } finally {
+        recordSpan('json', start);
+    }
+}
+
+// Total time and count per span name, in the order the names first appeared
+export function summarizeSpans(spans: Span[]) {
+    const totals = new Map<string, { ms: number; count: number }>();
+    for (const span of spans) {
+        const total = totals.get(span.name) ?? { ms: 0, count: 0 };
+        total.ms += span.end - span.start;
+        total.count++;
+        totals.set(span.name, total);
+    }
+    return totals;
+}
+
+// Concurrent spans of one name overlap, so their sum can exceed the request's total
+export function serverTimingHeader(spans: Span[], totalMs: number) {
+    const entries = [...summarizeSpans(spans)].map(
+        ([name, { ms, count }]) => `${name};dur=${ms.toFixed(1)}${count > 1 ? `;desc="${count} calls"` : ''}`
+    );
+    entries.push(`total;dur=${totalMs.toFixed(1)}`);
+    return entries.join(', ');
+}
+
+function otlpTrace(method: string, route: string, status: number, timing: RequestTiming, end: number) {
+    const traceId = randomBytes(16).toString('hex');
+    const rootId = randomBytes(8).toString('hex');
+    // performance.now() offsets on top of the request's wall clock start, in ns
+    const nanos = (at: number) => ((timing.startedAt + at - timing.start) * 1e6).toFixed(0);
+    const span = (spanId: string, name: string, start: number, stop: number, extra: object) => ({
+        traceId,
+        spanId,
+        name,
+        startTimeUnixNano: nanos(start),
+        endTimeUnixNano: nanos(stop),
+        ...extra,
+    });
+    return {
+        resourceSpans: [{
+            resource: { attributes: [{ key: 'service.name', value: { stringValue: 'tallysight' } }] },
+            scopeSpans: [{
+                scope: { name: 'serverTiming' },
+                spans: [
+                    span(rootId, `${method} ${route}`, timing.start, end, {
+                        kind: 2,
+                        attributes: [
+                            { key: 'http.request.method', value: { stringValue: method } },
+                            { key: 'http.route', value: { stringValue: route } },
+                            { key: 'http.response.status_code', value: { intValue: status } },
+                        ],
+                    }),
+                    ...timing.spans.map((s) =>
+                        span(randomBytes(8).toString('hex'), s.name, s.start, s.end, { parentSpanId: rootId, kind: 1 })
+                    ),
+                ],
+            }],
+        }],
+    };
+}
+
+function report(request: unknown, status: number, timing: RequestTiming, end: number) {
+    if (!LOG && !OTLP_FILE) return;
+
+    const url = request instanceof Request ? new URL(request.url) : null;
+    const method = request instanceof Request ? request.method : 'GET';
+    const route = url?.pathname ?? 'unknown';
+    if (LOG) {
+        const spans = Object.fromEntries(
+            [...summarizeSpans(timing.spans)].map(([name, { ms, count }]) => [name, { ms: Number(ms.toFixed(1)), count }])
+        );
+        console.log(JSON.stringify({
+            serverTiming: { method, route, status, totalMs: Number((end - timing.start).toFixed(1)), spans },
+        }));
+    }
+    if (OTLP_FILE) {
+        const line = JSON.stringify(otlpTrace(method, route, status, timing, end)) + '\n';
+        appendFile(OTLP_FILE, line).catch((error) => console.error('Failed to write server timing trace:', error));
+    }
+}
+
+// Wraps a route handler so the DB queries, upstream calls and JSON serialization it does are
+// recorded per request and, with SERVER_TIMING=1, returned as a Server-Timing header (see timed()).
+export function withServerTiming<A extends any[], R>(handler: (...args: A) => Promise<R>) {
+    return async (...args: A): Promise<R> => {
+        const timing: RequestTiming = { spans: [], start: performance.now(), startedAt: Date.now() };
+        const response = await requests.run(timing, () => handler(...args));
+        const end = performance.now();
+        if (response instanceof Response && headerEnabled()) {
+            try {
+                response.headers.set('Server-Timing', serverTimingHeader(timing.spans, end - timing.start));
+            } catch {
+                // Responses passed through from fetch() have immutable headers
+            }
+        }
+        report(args[0], (response as any)?.status ?? 200, timing, end);
+        return response;
+    };
+}
@@ -0,0 +1,50 @@
+import table from './teams.json';
+
+export type TeamData = {
+    abbreviation: string;
+    logo: string;
+};
+
+type TeamEntry = {
+    id: string;
+    name?: string | null;
+    displayName: string;
+    shortDisplayName?: string | null;
+    abbreviation: string;
+    logo?: string | null;
+};
+
+export const DEFAULT_TEAM_LOGO = 'https://a.espncdn.com/combiner/i?img=/i/teamlogos/default-team-logo-500.png';
+
+// Every name a game can refer to a team by ("Oklahoma City Thunder", "OKC", "Thunder"), to its
+// abbreviation and logo. Shared by the prebuilt table and the live ESPN fallback.
+export function indexTeams(teams: TeamEntry[]) {
+    const index = new Map<string, TeamData>();
+    for (const team of teams) {
+        const data = { abbreviation: team.abbreviation || team.id, logo: team.logo || DEFAULT_TEAM_LOGO };
+        for (const key of [team.displayName, data.abbreviation, team.shortDisplayName, team.name]) {
+            if (key && !index.has(key)) index.set(key, data);
+        }
+    }
+    return index;
+}
+
+// Built once per server process from src/lib/teamMetadata/teams.json, which
+// __tests__/perf/team_metadata.py generates from recorded ESPN team lists; logos point at the
+// static copies under public/team-logos
+const leagues = new Map<string, Map<string, TeamData>>(
+    Object.entries(table.leagues as Record<string, { teams: TeamEntry[] }>).map(([sport, { teams }]) => [
+        sport,
+        indexTeams(teams),
+    ])
+);
+
+// A team from the prebuilt table, or undefined when its league or the team isn't in it
+export function prebuiltTeam(sport: string, teamName: string): TeamData | undefined {
+    return leagues.get(sport)?.get(teamName);
+}
+
+// Which table this process loaded, for monitoring (GET /api/espn-cache)
+export function teamMetadataInfo() {
+    return { version: table.version, generatedAt: table.generatedAt, leagues: [...leagues.keys()] };
+}